@@ -496,6 +496,49 @@ ORDER BY ctb.expression_fold_change DESC;
 -- This patient would benefit from adding immunotherapy to chemotherapy.
 
 
+-- ========================================================================
+-- QUERY 7: RECURRENT OVEREXPRESSION ACROSS THE WHOLE COHORT
+-- ========================================================================
+-- Clinical Question: "Which genes are overexpressed in many of my patients?"
+--
+-- public.expression_long holds the sparse fold changes of every patient
+-- schema in one table, partitioned by patient (refresh it with
+-- src/db/cohort_expression.py). Cohort-wide filters are one indexed query
+-- instead of a UNION ALL branch per patient schema.
+-- ========================================================================
+
+\echo '\n\n=== QUERY 7: Genes >2x in at Least 2 Patients (expression_long) ==='
+
+-- Run this on the shared core database (patient schemas + public)
+\c mbase
+
+SELECT
+    g.gene_symbol,
+    COUNT(DISTINCT e.patient_id) AS patients,
+    ARRAY_AGG(DISTINCT e.patient_id) AS patient_ids,
+    MAX(e.fold_change) AS max_fold_change
+FROM expression_long e
+JOIN transcripts t ON t.transcript_id = e.transcript_id
+JOIN genes g ON g.gene_id = t.gene_id
+WHERE e.fold_change > 2.0
+GROUP BY g.gene_symbol
+HAVING COUNT(DISTINCT e.patient_id) >= 2
+ORDER BY patients DESC, max_fold_change DESC
+LIMIT 50;
+
+-- One gene across all patients (baseline 1.0 for patients without a row)
+SELECT
+    p.patient_id,
+    COALESCE(e.fold_change, 1.0) AS fold_change
+FROM expression_long_patients p
+CROSS JOIN transcripts t
+JOIN genes g ON g.gene_id = t.gene_id
+LEFT JOIN expression_long e
+    ON e.patient_id = p.patient_id AND e.transcript_id = t.transcript_id
+WHERE g.gene_symbol = 'ERBB2'
+ORDER BY fold_change DESC;
+
+
 -- ========================================================================
 -- SUMMARY TABLE: TREATMENT RECOMMENDATIONS BY PATIENT
 -- ========================================================================
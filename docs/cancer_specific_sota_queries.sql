@@ -11,6 +11,8 @@
 --
 -- v0.6.0.2 Enhancements:
 --   - PMID evidence integration via gene_publications table (47M+ gene-publication links)
+--   - Publication counts and evidence tiers read from the gene_literature_stats rollup
+--     (one row per gene) instead of re-aggregating gene_publications per query
 --   - Publication count and evidence level for all therapeutic targets
 --   - Evidence tiers: Extensively studied (100K+), Well-studied (10K+), Moderate (1K+), Limited (<1K)
 --
@@ -54,13 +56,8 @@ SELECT
     g.gene_name,
     pe.expression_fold_change,
     g.chromosome,
-    COALESCE(COUNT(DISTINCT gp.pmid), 0) as publication_count,
-    CASE
-        WHEN COUNT(DISTINCT gp.pmid) >= 100000 THEN 'Extensively studied'
-        WHEN COUNT(DISTINCT gp.pmid) >= 10000 THEN 'Well-studied'
-        WHEN COUNT(DISTINCT gp.pmid) >= 1000 THEN 'Moderate evidence'
-        ELSE 'Limited publications'
-    END as evidence_level,
+    COALESCE(gls.publication_count, 0) as publication_count,
+    COALESCE(gls.evidence_tier, 'Limited publications') as evidence_level,
     CASE
         WHEN g.gene_symbol = 'ERBB2' AND pe.expression_fold_change >= 5.0
             THEN '🎯 PRIMARY TARGET: Trastuzumab + Pertuzumab (High Priority)'
@@ -75,11 +72,11 @@ SELECT
 FROM patient_synthetic_her2.expression_data pe
 JOIN public.transcripts t ON pe.transcript_id = t.transcript_id
 JOIN public.genes g ON t.gene_id = g.gene_id
-LEFT JOIN public.gene_publications gp ON g.gene_id = gp.gene_id
+LEFT JOIN public.gene_literature_stats gls ON g.gene_id = gls.gene_id
 WHERE
     (g.gene_symbol IN ('ERBB2', 'GRB7', 'PGAP3', 'PNMT', 'STARD3', 'CDK12')
     OR (g.chromosome = '17' AND pe.expression_fold_change > 3.0))
-GROUP BY g.gene_symbol, g.gene_name, pe.expression_fold_change, g.chromosome
+GROUP BY g.gene_symbol, g.gene_name, pe.expression_fold_change, g.chromosome, gls.publication_count, gls.evidence_tier
 ORDER BY publication_count DESC, pe.expression_fold_change DESC
 LIMIT 20;
 
@@ -99,13 +96,8 @@ SELECT
     g.gene_symbol,
     g.gene_name,
     pe.expression_fold_change,
-    COALESCE(COUNT(DISTINCT gp.pmid), 0) as publication_count,
-    CASE
-        WHEN COUNT(DISTINCT gp.pmid) >= 100000 THEN 'Extensively studied'
-        WHEN COUNT(DISTINCT gp.pmid) >= 10000 THEN 'Well-studied'
-        WHEN COUNT(DISTINCT gp.pmid) >= 1000 THEN 'Moderate evidence'
-        ELSE 'Limited publications'
-    END as evidence_level,
+    COALESCE(gls.publication_count, 0) as publication_count,
+    COALESCE(gls.evidence_tier, 'Limited publications') as evidence_level,
     CASE
         WHEN g.gene_symbol = 'PIK3CA' AND pe.expression_fold_change > 2.5
             THEN '🔴 RESISTANCE RISK: Consider Alpelisib (PI3K inhibitor)'
@@ -129,14 +121,14 @@ SELECT
 FROM patient_synthetic_her2.expression_data pe
 JOIN public.transcripts t ON pe.transcript_id = t.transcript_id
 JOIN public.genes g ON t.gene_id = g.gene_id
-LEFT JOIN public.gene_publications gp ON g.gene_id = gp.gene_id
+LEFT JOIN public.gene_literature_stats gls ON g.gene_id = gls.gene_id
 WHERE g.gene_symbol IN (
     'PIK3CA', 'PIK3CB', 'PIK3CD', 'PIK3CG',
     'AKT1', 'AKT2', 'AKT3',
     'MTOR', 'RICTOR', 'RAPTOR',
     'PTEN', 'TSC1', 'TSC2'
 )
-GROUP BY g.gene_symbol, g.gene_name, pe.expression_fold_change
+GROUP BY g.gene_symbol, g.gene_name, pe.expression_fold_change, gls.publication_count, gls.evidence_tier
 ORDER BY publication_count DESC, pe.expression_fold_change DESC;
 
 -- Expected Results:
@@ -154,13 +146,8 @@ ORDER BY publication_count DESC, pe.expression_fold_change DESC;
 SELECT
     g.gene_symbol,
     pe.expression_fold_change,
-    COALESCE(COUNT(DISTINCT gp.pmid), 0) as publication_count,
-    CASE
-        WHEN COUNT(DISTINCT gp.pmid) >= 100000 THEN 'Extensively studied'
-        WHEN COUNT(DISTINCT gp.pmid) >= 10000 THEN 'Well-studied'
-        WHEN COUNT(DISTINCT gp.pmid) >= 1000 THEN 'Moderate evidence'
-        ELSE 'Limited publications'
-    END as evidence_level,
+    COALESCE(gls.publication_count, 0) as publication_count,
+    COALESCE(gls.evidence_tier, 'Limited publications') as evidence_level,
     CASE
         WHEN g.gene_symbol = 'ESR1' AND pe.expression_fold_change >= 2.0
             THEN '✅ ER-POSITIVE: Add Endocrine Therapy (Letrozole/Tamoxifen)'
@@ -180,9 +167,9 @@ SELECT
 FROM patient_synthetic_her2.expression_data pe
 JOIN public.transcripts t ON pe.transcript_id = t.transcript_id
 JOIN public.genes g ON t.gene_id = g.gene_id
-LEFT JOIN public.gene_publications gp ON g.gene_id = gp.gene_id
+LEFT JOIN public.gene_literature_stats gls ON g.gene_id = gls.gene_id
 WHERE g.gene_symbol IN ('ESR1', 'PGR', 'GATA3', 'FOXA1')
-GROUP BY g.gene_symbol, pe.expression_fold_change
+GROUP BY g.gene_symbol, pe.expression_fold_change, gls.publication_count, gls.evidence_tier
 ORDER BY g.gene_symbol;
 
 -- Expected Results:
@@ -244,13 +231,8 @@ ORDER BY g.gene_symbol;
 SELECT
     g.gene_symbol,
     COALESCE(pe.expression_fold_change, 1.0) as fold_change,
-    COALESCE(COUNT(DISTINCT gp.pmid), 0) as publication_count,
-    CASE
-        WHEN COUNT(DISTINCT gp.pmid) >= 100000 THEN 'Extensively studied'
-        WHEN COUNT(DISTINCT gp.pmid) >= 10000 THEN 'Well-studied'
-        WHEN COUNT(DISTINCT gp.pmid) >= 1000 THEN 'Moderate evidence'
-        ELSE 'Limited publications'
-    END as evidence_level,
+    COALESCE(gls.publication_count, 0) as publication_count,
+    COALESCE(gls.evidence_tier, 'Limited publications') as evidence_level,
     CASE
         WHEN g.gene_symbol = 'BRCA1' AND COALESCE(pe.expression_fold_change, 1.0) < 0.5
             THEN '🎯 BRCA1 DEFICIENCY: PARP inhibitor (Olaparib/Talazoparib) HIGH PRIORITY'
@@ -273,14 +255,14 @@ SELECT
 FROM public.genes g
 JOIN public.transcripts t ON g.gene_id = t.gene_id
 LEFT JOIN patient_synthetic_tnbc.expression_data pe ON t.transcript_id = pe.transcript_id
-LEFT JOIN public.gene_publications gp ON g.gene_id = gp.gene_id
+LEFT JOIN public.gene_literature_stats gls ON g.gene_id = gls.gene_id
 WHERE g.gene_symbol IN (
     'BRCA1', 'BRCA2', 'PALB2',
     'RAD51', 'RAD51C', 'RAD51D',
     'FANCA', 'FANCF', 'ATM', 'ATR',
     'TP53', 'CHEK2'
 )
-GROUP BY g.gene_symbol, pe.expression_fold_change
+GROUP BY g.gene_symbol, pe.expression_fold_change, gls.publication_count, gls.evidence_tier
 ORDER BY COALESCE(pe.expression_fold_change, 1.0) ASC;
 
 -- Expected Results:
@@ -298,13 +280,8 @@ ORDER BY COALESCE(pe.expression_fold_change, 1.0) ASC;
 SELECT
     g.gene_symbol,
     COALESCE(pe.expression_fold_change, 1.0) as fold_change,
-    COALESCE(COUNT(DISTINCT gp.pmid), 0) as publication_count,
-    CASE
-        WHEN COUNT(DISTINCT gp.pmid) >= 100000 THEN 'Extensively studied'
-        WHEN COUNT(DISTINCT gp.pmid) >= 10000 THEN 'Well-studied'
-        WHEN COUNT(DISTINCT gp.pmid) >= 1000 THEN 'Moderate evidence'
-        ELSE 'Limited publications'
-    END as evidence_level,
+    COALESCE(gls.publication_count, 0) as publication_count,
+    COALESCE(gls.evidence_tier, 'Limited publications') as evidence_level,
     CASE
         WHEN g.gene_symbol = 'CD274' AND COALESCE(pe.expression_fold_change, 1.0) >= 2.0
             THEN '🎯 PD-L1 HIGH: Pembrolizumab + Chemotherapy (FDA approved)'
@@ -327,7 +304,7 @@ SELECT
 FROM public.genes g
 JOIN public.transcripts t ON g.gene_id = t.gene_id
 LEFT JOIN patient_synthetic_tnbc.expression_data pe ON t.transcript_id = pe.transcript_id
-LEFT JOIN public.gene_publications gp ON g.gene_id = gp.gene_id
+LEFT JOIN public.gene_literature_stats gls ON g.gene_id = gls.gene_id
 WHERE g.gene_symbol IN (
     'CD274',  -- PD-L1
     'PDCD1',  -- PD-1
@@ -335,7 +312,7 @@ WHERE g.gene_symbol IN (
     'CTLA4', 'LAG3', 'TIM3',  -- Immune checkpoints
     'IFNG', 'GZMB'  -- Immune activation
 )
-GROUP BY g.gene_symbol, pe.expression_fold_change
+GROUP BY g.gene_symbol, pe.expression_fold_change, gls.publication_count, gls.evidence_tier
 ORDER BY publication_count DESC, COALESCE(pe.expression_fold_change, 1.0) DESC;
 
 -- Expected Results:
@@ -361,13 +338,8 @@ SELECT
     g.gene_symbol,
     g.gene_name,
     pe.expression_fold_change,
-    COALESCE(COUNT(DISTINCT gp.pmid), 0) as publication_count,
-    CASE
-        WHEN COUNT(DISTINCT gp.pmid) >= 100000 THEN 'Extensively studied'
-        WHEN COUNT(DISTINCT gp.pmid) >= 10000 THEN 'Well-studied'
-        WHEN COUNT(DISTINCT gp.pmid) >= 1000 THEN 'Moderate evidence'
-        ELSE 'Limited publications'
-    END as evidence_level,
+    COALESCE(gls.publication_count, 0) as publication_count,
+    COALESCE(gls.evidence_tier, 'Limited publications') as evidence_level,
     CASE
         WHEN g.gene_symbol = 'EGFR' AND pe.expression_fold_change >= 4.0
             THEN '🎯 PRIMARY TARGET: Osimertinib 80mg daily (first-line)'
@@ -382,12 +354,12 @@ SELECT
 FROM patient_synthetic_luad.expression_data pe
 JOIN public.transcripts t ON pe.transcript_id = t.transcript_id
 JOIN public.genes g ON t.gene_id = g.gene_id
-LEFT JOIN public.gene_publications gp ON g.gene_id = gp.gene_id
+LEFT JOIN public.gene_literature_stats gls ON g.gene_id = gls.gene_id
 WHERE g.gene_symbol IN (
     'EGFR', 'ERBB2', 'ERBB3', 'ERBB4',
     'KRAS', 'BRAF', 'ALK', 'ROS1'  -- Exclusionary markers
 )
-GROUP BY g.gene_symbol, g.gene_name, pe.expression_fold_change
+GROUP BY g.gene_symbol, g.gene_name, pe.expression_fold_change, gls.publication_count, gls.evidence_tier
 ORDER BY publication_count DESC, pe.expression_fold_change DESC;
 
 -- Expected Results:
@@ -405,13 +377,8 @@ ORDER BY publication_count DESC, pe.expression_fold_change DESC;
 SELECT
     g.gene_symbol,
     pe.expression_fold_change,
-    COALESCE(COUNT(DISTINCT gp.pmid), 0) as publication_count,
-    CASE
-        WHEN COUNT(DISTINCT gp.pmid) >= 100000 THEN 'Extensively studied'
-        WHEN COUNT(DISTINCT gp.pmid) >= 10000 THEN 'Well-studied'
-        WHEN COUNT(DISTINCT gp.pmid) >= 1000 THEN 'Moderate evidence'
-        ELSE 'Limited publications'
-    END as evidence_level,
+    COALESCE(gls.publication_count, 0) as publication_count,
+    COALESCE(gls.evidence_tier, 'Limited publications') as evidence_level,
     CASE
         WHEN g.gene_symbol = 'MET' AND pe.expression_fold_change >= 3.0
             THEN '🔴 MET AMPLIFICATION: Add Crizotinib or Capmatinib (MET inhibitor)'
@@ -435,13 +402,13 @@ SELECT
 FROM patient_synthetic_luad.expression_data pe
 JOIN public.transcripts t ON pe.transcript_id = t.transcript_id
 JOIN public.genes g ON t.gene_id = g.gene_id
-LEFT JOIN public.gene_publications gp ON g.gene_id = gp.gene_id
+LEFT JOIN public.gene_literature_stats gls ON g.gene_id = gls.gene_id
 WHERE g.gene_symbol IN (
     'MET', 'BRAF', 'PIK3CA', 'AKT1',
     'VIM', 'CDH1', 'CDH2',  -- EMT markers
     'AXL', 'TWIST1'  -- EMT transcription factors
 )
-GROUP BY g.gene_symbol, pe.expression_fold_change
+GROUP BY g.gene_symbol, pe.expression_fold_change, gls.publication_count, gls.evidence_tier
 ORDER BY publication_count DESC, pe.expression_fold_change DESC;
 
 -- Expected Results:
@@ -459,13 +426,8 @@ ORDER BY publication_count DESC, pe.expression_fold_change DESC;
 SELECT
     g.gene_symbol,
     pe.expression_fold_change,
-    COALESCE(COUNT(DISTINCT gp.pmid), 0) as publication_count,
-    CASE
-        WHEN COUNT(DISTINCT gp.pmid) >= 100000 THEN 'Extensively studied'
-        WHEN COUNT(DISTINCT gp.pmid) >= 10000 THEN 'Well-studied'
-        WHEN COUNT(DISTINCT gp.pmid) >= 1000 THEN 'Moderate evidence'
-        ELSE 'Limited publications'
-    END as evidence_level,
+    COALESCE(gls.publication_count, 0) as publication_count,
+    COALESCE(gls.evidence_tier, 'Limited publications') as evidence_level,
     CASE
         WHEN g.gene_symbol = 'VEGFA' AND pe.expression_fold_change >= 3.5
             THEN '🎯 HIGH VEGFA: Add Bevacizumab to Osimertinib (NEJ026 trial)'
@@ -481,14 +443,14 @@ SELECT
 FROM patient_synthetic_luad.expression_data pe
 JOIN public.transcripts t ON pe.transcript_id = t.transcript_id
 JOIN public.genes g ON t.gene_id = g.gene_id
-LEFT JOIN public.gene_publications gp ON g.gene_id = gp.gene_id
+LEFT JOIN public.gene_literature_stats gls ON g.gene_id = gls.gene_id
 WHERE g.gene_symbol IN (
     'VEGFA', 'VEGFB', 'VEGFC',
     'KDR',  -- VEGFR2
     'ANGPT1', 'ANGPT2',
     'FGF2', 'PDGFB'
 )
-GROUP BY g.gene_symbol, pe.expression_fold_change
+GROUP BY g.gene_symbol, pe.expression_fold_change, gls.publication_count, gls.evidence_tier
 ORDER BY publication_count DESC, pe.expression_fold_change DESC;
 
 -- Expected Results:
@@ -512,13 +474,8 @@ ORDER BY publication_count DESC, pe.expression_fold_change DESC;
 SELECT
     g.gene_symbol,
     COALESCE(pe.expression_fold_change, 1.0) as fold_change,
-    COALESCE(COUNT(DISTINCT gp.pmid), 0) as publication_count,
-    CASE
-        WHEN COUNT(DISTINCT gp.pmid) >= 100000 THEN 'Extensively studied'
-        WHEN COUNT(DISTINCT gp.pmid) >= 10000 THEN 'Well-studied'
-        WHEN COUNT(DISTINCT gp.pmid) >= 1000 THEN 'Moderate evidence'
-        ELSE 'Limited publications'
-    END as evidence_level,
+    COALESCE(gls.publication_count, 0) as publication_count,
+    COALESCE(gls.evidence_tier, 'Limited publications') as evidence_level,
     CASE
         WHEN g.gene_symbol IN ('MLH1', 'MSH2', 'MSH6', 'PMS2')
              AND COALESCE(pe.expression_fold_change, 1.0) < 0.4
@@ -536,7 +493,7 @@ SELECT
 FROM public.genes g
 JOIN public.transcripts t ON g.gene_id = t.gene_id
 LEFT JOIN patient_synthetic_her2.expression_data pe ON t.transcript_id = pe.transcript_id
-LEFT JOIN public.gene_publications gp ON g.gene_id = gp.gene_id
+LEFT JOIN public.gene_literature_stats gls ON g.gene_id = gls.gene_id
 WHERE g.gene_symbol IN (
     'MLH1', 'MSH2', 'MSH6', 'PMS2',  -- MMR genes
     'CD274', 'PDCD1',  -- PD-L1/PD-1
@@ -544,7 +501,7 @@ WHERE g.gene_symbol IN (
     'IFNG', 'GZMB', 'PRF1',  -- Cytotoxic markers
     'CTLA4', 'LAG3'  -- Alternative checkpoints
 )
-GROUP BY g.gene_symbol, pe.expression_fold_change
+GROUP BY g.gene_symbol, pe.expression_fold_change, gls.publication_count, gls.evidence_tier
 ORDER BY g.gene_symbol;
 
 -- Expected Results:
@@ -599,13 +556,8 @@ ORDER BY COALESCE(pe.expression_fold_change, 1.0) DESC;
 SELECT
     g.gene_symbol,
     pe.expression_fold_change,
-    COALESCE(COUNT(DISTINCT gp.pmid), 0) as publication_count,
-    CASE
-        WHEN COUNT(DISTINCT gp.pmid) >= 100000 THEN 'Extensively studied'
-        WHEN COUNT(DISTINCT gp.pmid) >= 10000 THEN 'Well-studied'
-        WHEN COUNT(DISTINCT gp.pmid) >= 1000 THEN 'Moderate evidence'
-        ELSE 'Limited publications'
-    END as evidence_level,
+    COALESCE(gls.publication_count, 0) as publication_count,
+    COALESCE(gls.evidence_tier, 'Limited publications') as evidence_level,
     CASE
         WHEN g.gene_symbol = 'KRAS' AND pe.expression_fold_change >= 3.0
             THEN '🎯 KRAS HIGH: Confirm G12C mutation for sotorasib/adagrasib eligibility'
@@ -624,7 +576,7 @@ SELECT
 FROM patient_synthetic_luad.expression_data pe
 JOIN public.transcripts t ON pe.transcript_id = t.transcript_id
 JOIN public.genes g ON t.gene_id = g.gene_id
-LEFT JOIN public.gene_publications gp ON g.gene_id = gp.gene_id
+LEFT JOIN public.gene_literature_stats gls ON g.gene_id = gls.gene_id
 WHERE g.gene_symbol IN (
     'KRAS', 'NRAS', 'HRAS',
     'MAPK1', 'MAPK3',  -- ERK1/2
@@ -632,7 +584,7 @@ WHERE g.gene_symbol IN (
     'RAF1', 'BRAF',
     'MYC', 'TP53'
 )
-GROUP BY g.gene_symbol, pe.expression_fold_change
+GROUP BY g.gene_symbol, pe.expression_fold_change, gls.publication_count, gls.evidence_tier
 ORDER BY publication_count DESC, pe.expression_fold_change DESC;
 
 -- Expected Results:
@@ -650,13 +602,8 @@ ORDER BY publication_count DESC, pe.expression_fold_change DESC;
 SELECT
     g.gene_symbol,
     COALESCE(pe.expression_fold_change, 1.0) as fold_change,
-    COALESCE(COUNT(DISTINCT gp.pmid), 0) as publication_count,
-    CASE
-        WHEN COUNT(DISTINCT gp.pmid) >= 100000 THEN 'Extensively studied'
-        WHEN COUNT(DISTINCT gp.pmid) >= 10000 THEN 'Well-studied'
-        WHEN COUNT(DISTINCT gp.pmid) >= 1000 THEN 'Moderate evidence'
-        ELSE 'Limited publications'
-    END as evidence_level,
+    COALESCE(gls.publication_count, 0) as publication_count,
+    COALESCE(gls.evidence_tier, 'Limited publications') as evidence_level,
     CASE
         WHEN g.gene_symbol IN ('BRCA1', 'BRCA2')
              AND COALESCE(pe.expression_fold_change, 1.0) < 0.5
@@ -675,14 +622,14 @@ SELECT
 FROM public.genes g
 JOIN public.transcripts t ON g.gene_id = t.gene_id
 LEFT JOIN patient_synthetic_luad.expression_data pe ON t.transcript_id = pe.transcript_id
-LEFT JOIN public.gene_publications gp ON g.gene_id = gp.gene_id
+LEFT JOIN public.gene_literature_stats gls ON g.gene_id = gls.gene_id
 WHERE g.gene_symbol IN (
     'BRCA1', 'BRCA2', 'PALB2',
     'ATM', 'ATR', 'CHEK1', 'CHEK2',
     'RAD51', 'RAD51C',
     'FANCA', 'FANCF'
 )
-GROUP BY g.gene_symbol, pe.expression_fold_change
+GROUP BY g.gene_symbol, pe.expression_fold_change, gls.publication_count, gls.evidence_tier
 ORDER BY COALESCE(pe.expression_fold_change, 1.0) ASC;
 
 -- Expected Results:
@@ -752,13 +699,8 @@ IMPORTANT NOTES:
 SELECT
     g.gene_symbol,
     COALESCE(pe.expression_fold_change, 1.0) as fold_change,
-    COALESCE(COUNT(DISTINCT gp.pmid), 0) as publication_count,
-    CASE
-        WHEN COUNT(DISTINCT gp.pmid) >= 100000 THEN 'Extensively studied'
-        WHEN COUNT(DISTINCT gp.pmid) >= 10000 THEN 'Well-studied'
-        WHEN COUNT(DISTINCT gp.pmid) >= 1000 THEN 'Moderate evidence'
-        ELSE 'Limited publications'
-    END as evidence_level,
+    COALESCE(gls.publication_count, 0) as publication_count,
+    COALESCE(gls.evidence_tier, 'Limited publications') as evidence_level,
     CASE
         WHEN g.gene_symbol IN ('ERBB2', 'EGFR', 'MET', 'ALK', 'ROS1', 'RET', 'NTRK1', 'NTRK2', 'NTRK3')
              AND COALESCE(pe.expression_fold_change, 1.0) >= 3.0
@@ -790,7 +732,7 @@ SELECT
 FROM public.genes g
 JOIN public.transcripts t ON g.gene_id = t.gene_id
 LEFT JOIN patient_synthetic_her2.expression_data pe ON t.transcript_id = pe.transcript_id
-LEFT JOIN public.gene_publications gp ON g.gene_id = gp.gene_id
+LEFT JOIN public.gene_literature_stats gls ON g.gene_id = gls.gene_id
 WHERE g.gene_symbol IN (
     -- Receptor tyrosine kinases
     'ERBB2', 'EGFR', 'MET', 'ALK', 'ROS1', 'RET',
@@ -808,7 +750,7 @@ AND (
     COALESCE(pe.expression_fold_change, 1.0) >= 2.5
     OR COALESCE(pe.expression_fold_change, 1.0) < 0.6
 )
-GROUP BY g.gene_symbol, pe.expression_fold_change
+GROUP BY g.gene_symbol, pe.expression_fold_change, gls.publication_count, gls.evidence_tier
 ORDER BY
     publication_count DESC,
     CASE
@@ -0,0 +1,331 @@
+"""Performance benchmarks for PMID-evidence (gene_publications) queries.
+
+This script measures the production literature queries used by the SOTA
+query library and clinical guides against the partitioned gene_publications
+table:
+1. Per-gene publication counts with evidence tiers (HER2 amplicon genes)
+2. Pathway-panel literature counts (PI3K/AKT/mTOR)
+3. Top papers for a single gene (get_top_papers_for_gene pattern)
+4. Genome-wide count-by-gene aggregation
+
+For each query it reports timing plus EXPLAIN (ANALYZE, BUFFERS) details:
+partitions scanned, heap fetches of index-only scans and buffers touched.
+Pass --compare-table to run the same queries against an unpartitioned copy
+(e.g. created with CREATE TABLE gene_publications_heap AS TABLE gene_publications)
+and show the difference side by side.
+
+Usage:
+    python scripts/benchmark_literature_queries.py
+    python scripts/benchmark_literature_queries.py --compare-table gene_publications_heap
+"""
+
+import argparse
+import os
+import sys
+import time
+import statistics
+from typing import Any, Dict, List, Optional, Tuple
+
+import psycopg2
+from psycopg2 import sql
+from rich.console import Console
+from rich.table import Table
+from rich.panel import Panel
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+console = Console()
+
+HER2_AMPLICON_GENES = ["ERBB2", "GRB7", "PGAP3", "PNMT", "STARD3", "CDK12"]
+PI3K_PATHWAY_GENES = [
+    "PIK3CA",
+    "PIK3CB",
+    "PIK3CD",
+    "PIK3CG",
+    "AKT1",
+    "AKT2",
+    "AKT3",
+    "MTOR",
+    "RICTOR",
+    "RAPTOR",
+    "PTEN",
+    "TSC1",
+    "TSC2",
+]
+
+# Production PMID-evidence queries; {table} is the publications table under test
+LITERATURE_QUERIES: List[Tuple[str, str, Tuple[Any, ...]]] = [
+    (
+        "Evidence tiers (HER2 amplicon)",
+        """
+        SELECT
+            g.gene_symbol,
+            COALESCE(COUNT(DISTINCT gp.pmid), 0) AS publication_count,
+            CASE
+                WHEN COUNT(DISTINCT gp.pmid) >= 100000 THEN 'Extensively studied'
+                WHEN COUNT(DISTINCT gp.pmid) >= 10000 THEN 'Well-studied'
+                WHEN COUNT(DISTINCT gp.pmid) >= 1000 THEN 'Moderate evidence'
+                ELSE 'Limited publications'
+            END AS evidence_level
+        FROM public.genes g
+        LEFT JOIN public.{table} gp ON g.gene_id = gp.gene_id
+        WHERE g.gene_symbol = ANY(%s)
+        GROUP BY g.gene_symbol
+        ORDER BY publication_count DESC
+        """,
+        (HER2_AMPLICON_GENES,),
+    ),
+    (
+        "Pathway panel counts (PI3K)",
+        """
+        SELECT g.gene_symbol, COUNT(gp.pmid) AS publication_count
+        FROM public.genes g
+        LEFT JOIN public.{table} gp ON g.gene_id = gp.gene_id
+        WHERE g.gene_symbol = ANY(%s)
+        GROUP BY g.gene_symbol
+        ORDER BY publication_count DESC
+        """,
+        (PI3K_PATHWAY_GENES,),
+    ),
+    (
+        "Top papers for gene (TP53)",
+        """
+        SELECT gp.pmid, gp.mention_count, gp.first_seen_year
+        FROM public.{table} gp
+        JOIN public.genes g ON gp.gene_id = g.gene_id
+        WHERE g.gene_symbol = %s
+        ORDER BY gp.mention_count DESC
+        LIMIT 20
+        """,
+        ("TP53",),
+    ),
+    (
+        "Genome-wide count by gene",
+        """
+        SELECT gene_id, COUNT(*) AS pub_count
+        FROM public.{table}
+        GROUP BY gene_id
+        """,
+        (),
+    ),
+]
+
+
+class LiteratureBenchmark:
+    """Benchmark suite for gene_publications evidence queries."""
+
+    def __init__(self, runs: int = 5):
+        """Initialize database connection.
+
+        Args:
+            runs: Number of timed executions per query
+        """
+        self.config = {
+            "host": os.getenv("MB_POSTGRES_HOST", "localhost"),
+            "port": int(os.getenv("MB_POSTGRES_PORT", "5435")),
+            "dbname": os.getenv("MB_POSTGRES_NAME", "mbase"),
+            "user": os.getenv("MB_POSTGRES_USER", "mbase_user"),
+            "password": os.getenv("MB_POSTGRES_PASSWORD", "mbase_secret"),
+        }
+        self.conn = psycopg2.connect(**self.config)
+        self.conn.autocommit = True
+        self.runs = runs
+        self.results: List[Dict] = []
+
+    def close(self):
+        """Close database connection."""
+        if self.conn:
+            self.conn.close()
+
+    def execute_query_timed(
+        self, query: str, params: tuple
+    ) -> Tuple[float, float, int]:
+        """Execute query multiple times and measure performance.
+
+        Args:
+            query: SQL query to execute
+            params: Query parameters
+
+        Returns:
+            Tuple of (average_ms, median_ms, row_count)
+        """
+        timings = []
+        row_count = 0
+
+        for _ in range(self.runs):
+            start = time.perf_counter()
+            with self.conn.cursor() as cursor:
+                cursor.execute(query, params or None)
+                row_count = len(cursor.fetchall())
+            timings.append((time.perf_counter() - start) * 1000)
+
+        return statistics.mean(timings), statistics.median(timings), row_count
+
+    def explain_query(self, query: str, params: tuple) -> Dict[str, int]:
+        """Collect plan statistics relevant to partitioning and covering indexes.
+
+        Args:
+            query: SQL query to explain
+            params: Query parameters
+
+        Returns:
+            Dictionary with relations scanned, heap fetches and buffer counts
+        """
+        with self.conn.cursor() as cursor:
+            cursor.execute(
+                "EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) " + query, params or None
+            )
+            plan = cursor.fetchone()[0][0]["Plan"]
+
+        stats = {
+            "relations": set(),
+            "heap_fetches": 0,
+            "buffers": 0,
+            "index_only": 0,
+        }
+
+        def walk(node: Dict[str, Any]) -> None:
+            if "Relation Name" in node:
+                stats["relations"].add(node["Relation Name"])
+            if node.get("Node Type") == "Index Only Scan":
+                stats["index_only"] += 1
+            stats["heap_fetches"] += node.get("Heap Fetches", 0)
+            for child in node.get("Plans", []):
+                walk(child)
+
+        walk(plan)
+        stats["buffers"] = plan.get("Shared Hit Blocks", 0) + plan.get(
+            "Shared Read Blocks", 0
+        )
+        stats["relations"] = len(
+            [r for r in stats["relations"] if r.startswith("gene_publications")]
+        )
+        return stats
+
+    def benchmark_table(self, table_name: str) -> None:
+        """Run all literature queries against one publications table.
+
+        Args:
+            table_name: gene_publications or an unpartitioned comparison copy
+        """
+        console.print(f"\n[bold cyan]Benchmarking:[/] {table_name}")
+
+        for label, template, params in LITERATURE_QUERIES:
+            query = (
+                sql.SQL(template)
+                .format(table=sql.Identifier(table_name))
+                .as_string(self.conn)
+            )
+            avg_ms, median_ms, row_count = self.execute_query_timed(query, params)
+            plan_stats = self.explain_query(query, params)
+
+            self.results.append(
+                {
+                    "benchmark": label,
+                    "table": table_name,
+                    "avg_ms": avg_ms,
+                    "median_ms": median_ms,
+                    "rows": row_count,
+                    **plan_stats,
+                }
+            )
+
+            console.print(
+                f"  {label}: Avg {avg_ms:.2f}ms | Median {median_ms:.2f}ms | "
+                f"Rows {row_count} | Heap fetches {plan_stats['heap_fetches']}"
+            )
+
+    def print_results_summary(self) -> None:
+        """Print formatted results summary table."""
+        console.print("\n")
+        console.print(
+            Panel.fit(
+                "[bold]MEDIABASE Literature Query Benchmark Results[/]",
+                border_style="cyan",
+            )
+        )
+
+        table = Table(show_header=True, header_style="bold magenta")
+        table.add_column("Benchmark", style="cyan", width=32)
+        table.add_column("Table", style="yellow", width=24)
+        table.add_column("Avg (ms)", justify="right", style="green")
+        table.add_column("Median (ms)", justify="right", style="blue")
+        table.add_column("Rows", justify="right")
+        table.add_column("Partitions", justify="right")
+        table.add_column("Index-only", justify="right")
+        table.add_column("Heap fetches", justify="right")
+        table.add_column("Buffers", justify="right")
+
+        for result in self.results:
+            table.add_row(
+                result["benchmark"],
+                result["table"],
+                f"{result['avg_ms']:.2f}",
+                f"{result['median_ms']:.2f}",
+                str(result["rows"]),
+                str(result["relations"]),
+                str(result["index_only"]),
+                f"{result['heap_fetches']:,}",
+                f"{result['buffers']:,}",
+            )
+
+        console.print(table)
+
+        # Side-by-side speedup when a comparison table was benchmarked
+        tables = sorted({r["table"] for r in self.results})
+        if len(tables) == 2:
+            by_key = {(r["benchmark"], r["table"]): r for r in self.results}
+            console.print("\n[bold cyan]Speedup vs comparison table:[/]")
+            for label, _, _ in LITERATURE_QUERIES:
+                base = by_key.get((label, tables[1]))
+                current = by_key.get((label, tables[0]))
+                if base and current and current["median_ms"] > 0:
+                    console.print(
+                        f"  {label}: {base['median_ms'] / current['median_ms']:.1f}x"
+                    )
+
+    def run_all_benchmarks(self, compare_table: Optional[str] = None) -> None:
+        """Run all literature benchmarks.
+
+        Args:
+            compare_table: Optional unpartitioned table to benchmark alongside
+        """
+        console.print("\n[bold]MEDIABASE PMID-Evidence Query Benchmarks[/]")
+        console.print("=" * 70)
+
+        try:
+            self.benchmark_table("gene_publications")
+            if compare_table:
+                self.benchmark_table(compare_table)
+            self.print_results_summary()
+        except Exception as e:
+            console.print(f"\n[red]Error during benchmarking: {e}[/]")
+            import traceback
+
+            traceback.print_exc()
+
+
+def main():
+    """Main benchmark execution."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark PMID-evidence queries on gene_publications"
+    )
+    parser.add_argument(
+        "--compare-table",
+        help="Unpartitioned copy of gene_publications to compare against",
+    )
+    parser.add_argument(
+        "--runs", type=int, default=5, help="Timed executions per query"
+    )
+    args = parser.parse_args()
+
+    benchmark = LiteratureBenchmark(runs=args.runs)
+    try:
+        benchmark.run_all_benchmarks(compare_table=args.compare_table)
+    finally:
+        benchmark.close()
+
+
+if __name__ == "__main__":
+    main()
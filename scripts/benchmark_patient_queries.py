@@ -2,7 +2,7 @@
 
 This script measures query performance for:
 1. Single patient expression data access
-2. Cross-patient query patterns
+2. Cross-patient query patterns (per-schema UNION ALL vs. expression_long)
 3. COALESCE baseline access patterns
 4. Query optimization strategies
 
@@ -292,6 +292,72 @@ class PerformanceBenchmark:
             f"  Avg: {avg_ms:.2f}ms | Median: {median_ms:.2f}ms | Rows: {row_count}"
         )
 
+    def benchmark_recurrent_genes(self, schemas: List[str]):
+        """Benchmark "genes >2x in >= 2 patients" across all patient schemas.
+
+        Tests: UNION ALL over every patient schema against the partitioned
+        public.expression_long cohort table (when it has been refreshed)
+        """
+        console.print(
+            f"\n[bold cyan]Benchmark 4b:[/] Recurrent Overexpression (n={len(schemas)})"
+        )
+
+        if len(schemas) < 2:
+            console.print("  [yellow]Skipped: Need at least 2 patient schemas[/]")
+            return
+
+        union_query = " UNION ALL ".join(
+            f"""
+            SELECT '{schema}' AS patient_id, transcript_id, expression_fold_change
+            FROM {schema}.expression_data
+            WHERE expression_fold_change > 2.0
+            """
+            for schema in schemas
+        )
+        queries = {
+            "UNION ALL over schemas": f"""
+                SELECT t.gene_id, COUNT(DISTINCT e.patient_id) AS patients
+                FROM ({union_query}) e
+                JOIN public.transcripts t ON t.transcript_id = e.transcript_id
+                GROUP BY t.gene_id
+                HAVING COUNT(DISTINCT e.patient_id) >= 2;
+            """,
+            "expression_long": """
+                SELECT t.gene_id, COUNT(DISTINCT e.patient_id) AS patients
+                FROM public.expression_long e
+                JOIN public.transcripts t ON t.transcript_id = e.transcript_id
+                WHERE e.fold_change > 2.0
+                GROUP BY t.gene_id
+                HAVING COUNT(DISTINCT e.patient_id) >= 2;
+            """,
+        }
+
+        with self.conn.cursor() as cursor:
+            cursor.execute("SELECT to_regclass('public.expression_long') IS NOT NULL")
+            has_cohort_table = cursor.fetchone()[0]
+        if not has_cohort_table:
+            del queries["expression_long"]
+            console.print("  [yellow]public.expression_long not found[/]")
+
+        for label, query in queries.items():
+            avg_ms, median_ms, row_count = self.execute_query_timed(query, runs=3)
+
+            self.results.append(
+                {
+                    "benchmark": "Cross-Patient Recurrence",
+                    "schema": f"{len(schemas)} schemas",
+                    "query": f"Genes >2.0x in >=2 ({label})",
+                    "avg_ms": avg_ms,
+                    "median_ms": median_ms,
+                    "rows": row_count,
+                }
+            )
+
+            console.print(
+                f"  {label}: Avg: {avg_ms:.2f}ms | Median: {median_ms:.2f}ms "
+                f"| Rows: {row_count}"
+            )
+
     def benchmark_therapeutic_targeting(self, schema_name: str):
         """Benchmark therapeutic targeting query with multiple joins.
 
@@ -476,6 +542,7 @@ class PerformanceBenchmark:
             if len(schemas) >= 2:
                 self.benchmark_cross_patient_comparison(schemas)
                 self.benchmark_common_overexpression(schemas)
+                self.benchmark_recurrent_genes(schemas)
 
             # Print summary
             self.print_results_summary()
@@ -12,6 +12,7 @@ This script:
 2. Imports expression data from CSV
 3. Populates metadata table with import statistics
 4. Validates data integrity
+5. Refreshes the patient's partition of the cohort table (public.expression_long)
 
 Usage:
     poetry run python scripts/create_patient_copy.py \
@@ -48,6 +49,7 @@ from rich.table import Table
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from src.db.cohort_expression import refresh_patient_expression
 from src.db.database import get_db_manager
 from src.db.patient_schema import (
     create_patient_schema,
@@ -57,6 +59,7 @@ from src.db.patient_schema import (
     schema_exists,
     get_schema_name,
     InvalidPatientIDError,
+    PatientSchemaError,
     SchemaExistsError,
 )
 from src.utils.logging import setup_logging
@@ -558,6 +561,25 @@ class PatientDataImporter:
 
         console.print(stats_table)
 
+    def refresh_cohort_table(self) -> None:
+        """Copy the imported expression data into the cohort table partition."""
+        console.print("\n[bold]Refreshing cohort expression table...[/bold]")
+
+        if self.dry_run:
+            console.print("[yellow]  (Dry run - skipping cohort refresh)[/yellow]")
+            return
+
+        try:
+            rows = refresh_patient_expression(self.patient_id, self.db_manager)
+        except PatientSchemaError as e:
+            # The patient schema is complete; the cohort copy can be rebuilt later
+            console.print(f"[yellow]  Cohort table not refreshed: {e}[/yellow]")
+            return
+
+        console.print(
+            f"[bold green]✓ {rows:,} rows in public.expression_long[/bold green]"
+        )
+
     def run(self) -> None:
         """Run complete patient data import workflow."""
         try:
@@ -597,6 +619,9 @@ class PatientDataImporter:
             # Step 6: Validate
             self.validate_import()
 
+            # Step 7: Refresh cohort table partition
+            self.refresh_cohort_table()
+
             # Success summary
             console.print(
                 "\n[bold green]━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━[/bold green]"
@@ -39,6 +39,12 @@ def parse_args() -> argparse.Namespace:
         "--skip-scores", action="store_true", help="Skip drug score calculation"
     )
 
+    parser.add_argument(
+        "--scores-only",
+        action="store_true",
+        help="Only recalculate drug scores from the normalized tables (no ChEMBL import)",
+    )
+
     parser.add_argument(
         "--max-phase-cutoff",
         type=int,
@@ -114,11 +120,17 @@ def main() -> None:
     # Initialize and run the ChEMBL processor
     try:
         processor = ChemblDrugProcessor(config)
-        # The processor already has the config from initialization, so we don't pass it again
-        processor.run()
-        console.print(
-            "[bold green]ChEMBL drug enrichment completed successfully![/bold green]"
-        )
+        if args.scores_only:
+            processor.calculate_drug_scores()
+            console.print(
+                "[bold green]Drug scores recalculated successfully![/bold green]"
+            )
+        else:
+            # The processor already has the config from initialization, so we don't pass it again
+            processor.run()
+            console.print(
+                "[bold green]ChEMBL drug enrichment completed successfully![/bold green]"
+            )
     except Exception as e:
         console.print(f"[bold red]ChEMBL drug enrichment failed: {e}[/bold red]")
         raise
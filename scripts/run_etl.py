@@ -60,6 +60,8 @@ def get_config() -> Dict[str, Any]:
         "batch_size": int(os.getenv("MB_BATCH_SIZE", "1000")),
         "cache_ttl": int(os.getenv("MB_CACHE_TTL", "86400")),
         "max_workers": int(os.getenv("MB_MAX_WORKERS", "4")),
+        "opentargets_refresh": os.getenv("MB_OPENTARGETS_REFRESH", "false").lower()
+        == "true",
     }
 
 
@@ -10,7 +10,7 @@ import sys
 import argparse
 import json
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 # Add project root to Python path
 project_root = Path(__file__).parent.parent
@@ -140,11 +140,23 @@ def test_evidence_scoring(limit_records: int = 10) -> None:
         traceback.print_exc()
 
 
-def run_full_evidence_scoring() -> None:
-    """Run evidence scoring for all records in the database."""
+def run_full_evidence_scoring(
+    full_rescore: bool = False,
+    composite_only: bool = False,
+    workers: Optional[int] = None,
+) -> None:
+    """Run evidence scoring for all records in the database.
+
+    Args:
+        full_rescore: Rescore every gene instead of only changed ones
+        composite_only: Only recompute composites from cached component scores
+        workers: Worker processes (gene partitions) to score with
+    """
     console.print("[cyan]Running full evidence scoring for all records[/cyan]")
 
     config = load_config()
+    if workers:
+        config["max_workers"] = workers
 
     try:
         # Get database configuration from config
@@ -166,8 +178,14 @@ def run_full_evidence_scoring() -> None:
         processor.connection = db_manager.conn
 
         # Run evidence scoring
-        console.print("[yellow]Running evidence scoring for all records...[/yellow]")
-        stats = processor.process_evidence_scoring()
+        if composite_only:
+            console.print("[yellow]Recomputing composite scores...[/yellow]")
+            stats = processor.rescore_composites(force=full_rescore)
+        else:
+            console.print(
+                "[yellow]Running evidence scoring for all records...[/yellow]"
+            )
+            stats = processor.process_evidence_scoring(full_rescore=full_rescore)
 
         # Display results
         display_scoring_results(stats)
@@ -207,13 +225,35 @@ def main():
         action="store_true",
         help="Run evidence scoring for all records in database",
     )
+    parser.add_argument(
+        "--rescore-all",
+        action="store_true",
+        help="With --full: rescore every gene, not only genes whose inputs changed",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="With --full: worker processes to score gene partitions with "
+        "(default: 4)",
+    )
+    parser.add_argument(
+        "--composite-only",
+        action="store_true",
+        help="With --full: recompute composites from cached component scores "
+        "(after changing use-case weights)",
+    )
 
     args = parser.parse_args()
 
     if args.test:
         test_evidence_scoring(limit_records=args.limit)
     elif args.full:
-        run_full_evidence_scoring()
+        run_full_evidence_scoring(
+            full_rescore=args.rescore_all,
+            composite_only=args.composite_only,
+            workers=args.workers,
+        )
     else:
         console.print("[yellow]Please specify --test or --full mode[/yellow]")
         parser.print_help()
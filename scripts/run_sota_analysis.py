@@ -7,11 +7,22 @@ to generate clinically relevant insights for oncologists and researchers.
 
 Analysis Categories:
 1. Drug-Gene Interaction Analysis - Therapeutic targeting opportunities
-2. Pathway Enrichment Analysis - Biological process perturbations  
+2. Pathway Enrichment Analysis - Biological process perturbations
 3. Functional Classification Analysis - Molecular function distributions
 4. Chromosomal Distribution Analysis - Positional clustering patterns
 5. Multi-modal Integration Analysis - Cross-domain associations
 6. Clinical Biomarker Discovery - Potential diagnostic/prognostic markers
+
+Transcripts are loaded as one compact DataFrame (one row per transcript, genes
+as integer codes). Gene annotations (pathways, drugs, functions, locations,
+product types) are loaded as sparse gene x label incidence matrices, so every
+analysis is a handful of sparse products and NumPy reductions instead of loops
+over per-transcript dicts. Counts are per transcript, as before: a gene
+contributes once for each of its transcripts.
+
+Batch mode (--patients / --all-patients) loads this reference data once and
+analyzes each patient schema in a worker process with the patient's fold
+changes applied to it, writing one combined report.
 """
 
 import argparse
@@ -19,21 +30,267 @@ import json
 import logging
 import os
 import sys
-from collections import defaultdict, Counter
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, replace
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
-import statistics
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
 
 # Add project root to Python path
 sys.path.append(str(Path(__file__).resolve().parent.parent))
 
 from src.db.database import get_db_manager
+from src.db.patient_schema import (
+    get_schema_name,
+    list_patient_schemas,
+    schema_exists,
+)
+from src.utils.gene_sets import GeneSetMatrix, get_gene_set_matrix
+from src.utils.id_mapping import GeneIDMap
 from src.utils.logging import setup_logging, get_progress_bar, console
 
 # Setup logging
 logger = setup_logging(module_name=__name__, log_file="sota_analysis.log")
 
+# Genes are up-regulated above this fold change and down-regulated below 1/x
+REGULATION_THRESHOLD = 2.0
+
+TRANSCRIPTS_QUERY = """
+    SELECT
+        t.transcript_id,
+        t.gene_id,
+        g.gene_symbol,
+        g.chromosome,
+        g.start_position,
+        t.expression_fold_change
+    FROM transcripts t
+    JOIN genes g ON g.gene_id = t.gene_id
+    ORDER BY t.expression_fold_change DESC NULLS LAST, t.transcript_id
+"""
+
+# Gene annotations loaded as incidence matrices: name -> (gene_id, label) query
+ANNOTATION_QUERIES = {
+    "pathways": "SELECT DISTINCT gene_id, pathway_name FROM gene_pathways",
+    "product_types": """
+        SELECT DISTINCT gene_id, annotation_value FROM gene_annotations
+        WHERE annotation_type = 'product_type'
+    """,
+    "molecular_functions": """
+        SELECT DISTINCT gene_id, annotation_value FROM gene_annotations
+        WHERE annotation_type = 'molecular_function'
+    """,
+    "cellular_locations": """
+        SELECT DISTINCT gene_id, annotation_value FROM gene_annotations
+        WHERE annotation_type = 'cellular_location'
+    """,
+}
+
+# One row per gene and drug name; gene_drug_interactions has no interaction score
+DRUGS_QUERY = """
+    SELECT DISTINCT ON (gene_id, drug_name)
+        gene_id,
+        drug_name,
+        drug_id,
+        COALESCE(interaction_type, 'unknown') AS mechanism,
+        0.0 AS score
+    FROM gene_drug_interactions
+    ORDER BY gene_id, drug_name, drug_id
+"""
+
+GO_MOLECULAR_FUNCTIONS_QUERY = """
+    SELECT go_term, COUNT(*) AS transcripts
+    FROM transcript_go_terms
+    WHERE go_category = 'molecular_function'
+    GROUP BY go_term
+    ORDER BY transcripts DESC, go_term
+    LIMIT 10
+"""
+
+
+def _incidence(
+    pairs: pd.DataFrame, gene_index: pd.Index
+) -> Tuple[sparse.csr_matrix, np.ndarray]:
+    """Build a binary gene x label matrix from (gene_id, label) rows.
+
+    Args:
+        pairs: Two columns, gene_id and label
+        gene_index: Gene IDs in matrix row order; other genes are dropped
+
+    Returns:
+        Tuple of (incidence matrix, labels in column order)
+    """
+    rows = gene_index.get_indexer(pairs.iloc[:, 0])
+    keep = rows >= 0
+    codes, labels = pd.factorize(pairs.iloc[:, 1][keep], sort=True)
+    matrix = sparse.csr_matrix(
+        (np.ones(len(codes), dtype=np.int64), (rows[keep], codes)),
+        shape=(len(gene_index), len(labels)),
+    )
+    matrix.sum_duplicates()
+    matrix.data[:] = 1
+    return matrix, np.asarray(labels, dtype=object)
+
+
+def _top_entries(
+    matrix: sparse.spmatrix, limit: int, minimum: int = 1
+) -> List[Tuple[int, int, int]]:
+    """Return the largest entries of a sparse matrix as (row, column, value).
+
+    Ties are broken by row, then column, so results are deterministic.
+    """
+    coo = sparse.coo_matrix(matrix)
+    keep = coo.data >= minimum
+    rows, columns, values = coo.row[keep], coo.col[keep], coo.data[keep]
+    order = np.lexsort((columns, rows, -values))[:limit]
+    return list(
+        zip(rows[order].tolist(), columns[order].tolist(), values[order].tolist())
+    )
+
+
+def _top_indices(
+    counts: np.ndarray, labels: np.ndarray, limit: Optional[int] = None
+) -> np.ndarray:
+    """Return the indices of non-zero counts, largest first, ties by label."""
+    order = np.lexsort((labels.astype(str), -counts))
+    return order[counts[order] > 0][:limit]
+
+
+def _top_counts(
+    counts: np.ndarray, labels: np.ndarray, limit: Optional[int] = None
+) -> Dict[str, int]:
+    """Return {label: count} for non-zero counts, largest first."""
+    return {labels[i]: int(counts[i]) for i in _top_indices(counts, labels, limit)}
+
+
+def _most_common(counts: Counter, limit: int) -> List[Tuple[Any, int]]:
+    """Return the most common items of a counter, ties by item."""
+    return sorted(counts.items(), key=lambda item: (-item[1], item[0]))[:limit]
+
+
+@dataclass
+class TranscriptomeData:
+    """Transcripts and gene annotations of one analysis.
+
+    ``transcripts`` has one row per transcript (transcript_id, gene, gene_symbol,
+    chromosome, start_position, expression_fold_change) where ``gene`` is the
+    row of the gene in ``genes`` and in every incidence matrix.
+    """
+
+    transcripts: pd.DataFrame
+    genes: pd.DataFrame
+    annotations: Dict[str, Tuple[sparse.csr_matrix, np.ndarray]]
+    drugs: pd.DataFrame
+    go_molecular_functions: Dict[str, int]
+
+    @classmethod
+    def load(cls, cursor: Any) -> "TranscriptomeData":
+        """Load transcripts and annotations with one query per table."""
+        cursor.execute(TRANSCRIPTS_QUERY)
+        transcripts = pd.DataFrame(
+            cursor.fetchall(), columns=[desc[0] for desc in cursor.description]
+        )
+        codes, gene_ids = pd.factorize(transcripts["gene_id"])
+        genes = pd.DataFrame(
+            {
+                "gene_id": gene_ids,
+                "gene_symbol": transcripts.groupby(codes)["gene_symbol"]
+                .first()
+                .to_numpy(),
+            }
+        )
+        transcripts = transcripts.drop(columns="gene_id")
+        transcripts.insert(1, "gene", codes)
+        transcripts["expression_fold_change"] = transcripts[
+            "expression_fold_change"
+        ].astype(float)
+
+        annotations = {}
+        for name, query in ANNOTATION_QUERIES.items():
+            cursor.execute(query)
+            annotations[name] = _incidence(
+                pd.DataFrame(cursor.fetchall(), columns=["gene_id", "label"]), gene_ids
+            )
+
+        cursor.execute(DRUGS_QUERY)
+        drugs = pd.DataFrame(
+            cursor.fetchall(),
+            columns=["gene_id", "drug_name", "drug_id", "mechanism", "score"],
+        )
+        annotations["drugs"] = _incidence(drugs[["gene_id", "drug_name"]], gene_ids)
+        drugs.insert(0, "gene", gene_ids.get_indexer(drugs.pop("gene_id")))
+        drugs = drugs[drugs["gene"] >= 0].reset_index(drop=True)
+        drugs["score"] = drugs["score"].astype(float)
+
+        cursor.execute(GO_MOLECULAR_FUNCTIONS_QUERY)
+        go_molecular_functions = dict(cursor.fetchall())
+
+        return cls(transcripts, genes, annotations, drugs, go_molecular_functions)
+
+    def with_fold_changes(self, fold_changes: pd.Series) -> "TranscriptomeData":
+        """Return a copy with a patient's fold changes on the reference data.
+
+        Args:
+            fold_changes: Fold change by transcript ID; transcripts missing
+                from it are at baseline (1.0)
+
+        Returns:
+            Transcriptome data sharing the annotation matrices, with
+            transcripts re-sorted by the patient's fold changes
+        """
+        transcripts = self.transcripts.copy()
+        transcripts["expression_fold_change"] = (
+            transcripts["transcript_id"]
+            .map(fold_changes.astype(float))
+            .fillna(1.0)
+            .to_numpy()
+        )
+        transcripts = transcripts.sort_values(
+            "expression_fold_change", ascending=False, kind="stable"
+        ).reset_index(drop=True)
+        return replace(self, transcripts=transcripts)
+
+    @property
+    def weights(self) -> np.ndarray:
+        """Number of transcripts of each gene."""
+        return np.bincount(self.transcripts["gene"], minlength=len(self.genes))
+
+    def label_counts(self, name: str) -> np.ndarray:
+        """Number of transcripts annotated with each label of an annotation."""
+        matrix = self.annotations[name][0]
+        return np.asarray(matrix.T @ self.weights).ravel()
+
+    def transcript_counts(self, name: str) -> np.ndarray:
+        """Number of labels of an annotation for each transcript."""
+        per_gene = np.asarray(self.annotations[name][0].sum(axis=1)).ravel()
+        return per_gene[self.transcripts["gene"].to_numpy()]
+
+    def cooccurrence(self, first: str, second: str) -> sparse.csr_matrix:
+        """Transcripts annotated with both labels, as a first x second matrix."""
+        return (
+            self.annotations[first][0].T
+            @ sparse.diags(self.weights, dtype=np.int64)
+            @ self.annotations[second][0]
+        ).tocsr()
+
+
+def load_patient_fold_changes(cursor: Any, patient_id: str) -> pd.Series:
+    """Load the stored (non-baseline) fold changes of a patient schema."""
+    cursor.execute(
+        "SELECT transcript_id, expression_fold_change "
+        f"FROM {get_schema_name(patient_id)}.expression_data"
+    )
+    rows = cursor.fetchall()
+    return pd.Series(
+        [fold_change for _, fold_change in rows],
+        index=[transcript_id for transcript_id, _ in rows],
+        dtype=float,
+    )
+
 
 class SOTAAnalyzer:
     """Comprehensive SOTA analysis engine for cancer transcriptome data."""
@@ -41,18 +298,22 @@ class SOTAAnalyzer:
     def __init__(self, db_config: Dict[str, Any]):
         """Initialize analyzer with database configuration."""
         self.db_manager = get_db_manager(db_config)
+        self.cache_dir = os.getenv("MB_CACHE_DIR", "/tmp/mediabase/cache")
+        self.gene_sets = None
         self.analysis_results = {}
         self.timestamp = datetime.now().isoformat()
 
-    def get_all_transcripts(self, patient_db: Optional[str] = None) -> List[Dict]:
+    def load_transcriptome(
+        self, patient_db: Optional[str] = None
+    ) -> Optional[TranscriptomeData]:
         """
-        Retrieve all transcript data for analysis.
+        Load transcripts and gene annotations for analysis.
 
         Args:
             patient_db: Optional patient database name for patient-specific analysis
 
         Returns:
-            List of transcript records with all enrichment data
+            Transcriptome data, or None if it could not be loaded
         """
         # Connect to the appropriate database
         if patient_db:
@@ -62,71 +323,22 @@ class SOTAAnalyzer:
 
         if not self.db_manager.ensure_connection():
             logger.error("Failed to establish database connection")
-            return []
+            return None
 
         try:
-            cursor = self.db_manager.cursor
-            # Use optimized materialized view for comprehensive analysis
-            cursor.execute(
-                """
-                SELECT
-                    te.transcript_id,
-                    te.gene_symbol,
-                    te.gene_id,
-                    te.gene_type,
-                    te.chromosome,
-                    te.expression_fold_change,
-                    -- Aggregate enrichment data
-                    COALESCE(ga_products.product_types, ARRAY[]::text[]) as product_type,
-                    COALESCE(tgt.go_terms, '{}'::jsonb) as go_terms,
-                    COALESCE(gp.pathways, ARRAY[]::text[]) as pathways,
-                    COALESCE(gdi.drugs, '{}'::jsonb) as drugs,
-                    -- Coordinates from genes table
-                    jsonb_build_object(
-                        'start', g.start_position,
-                        'end', g.end_position,
-                        'strand', g.strand
-                    ) as coordinates,
-                    ARRAY[]::text[] as molecular_functions,
-                    ARRAY[]::text[] as cellular_location
-                FROM transcript_enrichment_view te
-                LEFT JOIN genes g ON te.gene_id = g.gene_id
-                LEFT JOIN (
-                    SELECT gene_id, array_agg(annotation_value) as product_types
-                    FROM gene_annotations
-                    WHERE annotation_type = 'product_type'
-                    GROUP BY gene_id
-                ) ga_products ON ga_products.gene_id = te.gene_id
-                LEFT JOIN (
-                    SELECT transcript_id, jsonb_agg(jsonb_build_object(
-                        'go_id', go_id, 'name', go_term, 'category', go_category
-                    )) as go_terms
-                    FROM transcript_go_terms
-                    GROUP BY transcript_id
-                ) tgt ON tgt.transcript_id = te.transcript_id
-                LEFT JOIN (
-                    SELECT gene_id, array_agg(pathway_name) as pathways
-                    FROM gene_pathways
-                    GROUP BY gene_id
-                ) gp ON gp.gene_id = te.gene_id
-                LEFT JOIN (
-                    SELECT gene_id, jsonb_object_agg(drug_name, jsonb_build_object(
-                        'drug_id', drug_id, 'interaction_type', interaction_type, 'source', source
-                    )) as drugs
-                    FROM gene_drug_interactions
-                    GROUP BY gene_id
-                ) gdi ON gdi.gene_id = te.gene_id
-                ORDER BY te.expression_fold_change DESC NULLS LAST
-            """
-            )
-
-            columns = [desc[0] for desc in cursor.description]
-            return [dict(zip(columns, row)) for row in cursor.fetchall()]
+            data = TranscriptomeData.load(self.db_manager.cursor)
         except Exception as e:
             logger.error(f"Error retrieving transcript data: {e}")
-            return []
+            return None
+
+        try:
+            self.gene_sets = get_gene_set_matrix(self.cache_dir, self.db_manager)
+        except Exception as e:
+            logger.warning(f"Gene set matrix unavailable, skipping enrichment: {e}")
+            self.gene_sets = None
+        return data
 
-    def analyze_drug_gene_interactions(self, transcripts: List[Dict]) -> Dict[str, Any]:
+    def analyze_drug_gene_interactions(self, data: TranscriptomeData) -> Dict[str, Any]:
         """
         SOTA Query 1: Drug-Gene Interaction Analysis
 
@@ -139,62 +351,63 @@ class SOTAAnalyzer:
         """
         logger.info("Running SOTA Query 1: Drug-Gene Interaction Analysis")
 
-        drug_interactions = []
-        mechanism_counts = Counter()
-        high_score_targets = []
-        druggable_genes = set()
-
-        for transcript in transcripts:
-            if transcript["drugs"] and transcript["drugs"] != {}:
-                gene_symbol = transcript["gene_symbol"]
-                drugs = transcript["drugs"]
-
-                for drug_id, drug_info in drugs.items():
-                    interaction = {
-                        "gene_symbol": gene_symbol,
-                        "transcript_id": transcript["transcript_id"],
-                        "drug_id": drug_id,
-                        "drug_name": drug_info.get("name", "Unknown"),
-                        "score": drug_info.get("score", 0),
-                        "mechanism": drug_info.get("mechanism", "unknown"),
-                        "chromosome": transcript["chromosome"],
-                    }
-
-                    drug_interactions.append(interaction)
-                    mechanism_counts[drug_info.get("mechanism", "unknown")] += 1
-                    druggable_genes.add(gene_symbol)
-
-                    # High therapeutic potential (score > 100)
-                    if drug_info.get("score", 0) > 100:
-                        high_score_targets.append(interaction)
+        drugs = data.drugs
+        weights = data.weights[drugs["gene"].to_numpy()]
+        total_interactions = int(weights.sum())
+        mechanism_counts = (
+            pd.Series(weights, index=drugs["mechanism"]).groupby(level=0).sum()
+        )
+        druggable_genes = data.genes["gene_symbol"].iloc[
+            drugs.loc[weights > 0, "gene"].unique()
+        ]
+
+        # High therapeutic potential (score > 100), one interaction per transcript
+        high_score = drugs[drugs["score"] > 100]
+        high_score_targets = (
+            data.transcripts[["transcript_id", "gene", "gene_symbol", "chromosome"]]
+            .merge(high_score, on="gene")
+            .sort_values("score", ascending=False, kind="stable")
+        )
+        top_drug_targets = high_score_targets[
+            [
+                "gene_symbol",
+                "transcript_id",
+                "drug_id",
+                "drug_name",
+                "score",
+                "mechanism",
+                "chromosome",
+            ]
+        ].head(10)
 
         # Calculate drug interaction statistics
-        if drug_interactions:
-            scores = [d["score"] for d in drug_interactions if d["score"] > 0]
+        scores = np.repeat(drugs["score"].to_numpy(), weights)
+        scores = scores[scores > 0]
+        if len(scores):
             score_stats = {
-                "mean": statistics.mean(scores) if scores else 0,
-                "median": statistics.median(scores) if scores else 0,
-                "max": max(scores) if scores else 0,
-                "min": min(scores) if scores else 0,
+                "mean": float(scores.mean()),
+                "median": float(np.median(scores)),
+                "max": float(scores.max()),
+                "min": float(scores.min()),
             }
         else:
             score_stats = {"mean": 0, "median": 0, "max": 0, "min": 0}
 
         return {
-            "total_drug_interactions": len(drug_interactions),
-            "druggable_genes_count": len(druggable_genes),
+            "total_drug_interactions": total_interactions,
+            "druggable_genes_count": int(druggable_genes.nunique()),
             "high_score_targets": len(high_score_targets),
-            "mechanism_distribution": dict(mechanism_counts),
+            "mechanism_distribution": {
+                mechanism: int(count) for mechanism, count in mechanism_counts.items()
+            },
             "score_statistics": score_stats,
-            "top_drug_targets": sorted(
-                high_score_targets, key=lambda x: x["score"], reverse=True
-            )[:10],
+            "top_drug_targets": top_drug_targets.to_dict("records"),
             "clinical_summary": self._generate_drug_clinical_summary(
-                drug_interactions, high_score_targets
+                total_interactions, top_drug_targets.to_dict("records")
             ),
         }
 
-    def analyze_pathway_enrichment(self, transcripts: List[Dict]) -> Dict[str, Any]:
+    def analyze_pathway_enrichment(self, data: TranscriptomeData) -> Dict[str, Any]:
         """
         SOTA Query 2: Pathway Enrichment Analysis
 
@@ -207,74 +420,84 @@ class SOTAAnalyzer:
         """
         logger.info("Running SOTA Query 2: Pathway Enrichment Analysis")
 
-        pathway_counts = Counter()
-        pathway_gene_map = defaultdict(list)
-        pathway_cooccurrence = defaultdict(lambda: defaultdict(int))
-
-        for transcript in transcripts:
-            if transcript["pathways"]:
-                gene_symbol = transcript["gene_symbol"]
-                pathways = transcript["pathways"]
-
-                for pathway in pathways:
-                    pathway_counts[pathway] += 1
-                    pathway_gene_map[pathway].append(gene_symbol)
-
-                # Pathway co-occurrence analysis
-                for i, pathway1 in enumerate(pathways):
-                    for pathway2 in pathways[i + 1 :]:
-                        pathway_cooccurrence[pathway1][pathway2] += 1
-                        pathway_cooccurrence[pathway2][pathway1] += 1
+        matrix, pathways = data.annotations["pathways"]
+        pathway_counts = data.label_counts("pathways")
+        present = pathway_counts[pathway_counts > 0]
+        members = matrix.tocsc()
+        symbols = data.genes["gene_symbol"].to_numpy()
+        expressed = data.weights > 0
 
         # Calculate enrichment scores (frequency-based)
-        total_genes = len(transcripts)
+        total_genes = len(data.transcripts)
         enrichment_analysis = []
-
-        for pathway, count in pathway_counts.most_common():
-            enrichment_score = (count / total_genes) * 100  # Percentage enrichment
+        for pathway in _top_indices(pathway_counts, pathways, 20):
+            genes = members[:, pathway].indices
+            genes = genes[expressed[genes]]
+            count = int(pathway_counts[pathway])
             enrichment_analysis.append(
                 {
-                    "pathway": pathway,
+                    "pathway": pathways[pathway],
                     "gene_count": count,
-                    "enrichment_score": enrichment_score,
-                    "genes": pathway_gene_map[pathway],
+                    "enrichment_score": (count / total_genes) * 100,
+                    "genes": sorted(set(symbols[genes])),
                 }
             )
 
-        # Top co-occurring pathway pairs
-        cooccurrence_pairs = []
-        for pathway1, partners in pathway_cooccurrence.items():
-            for pathway2, count in partners.items():
-                if count >= 2:  # Minimum co-occurrence threshold
-                    cooccurrence_pairs.append(
-                        {
-                            "pathway1": pathway1,
-                            "pathway2": pathway2,
-                            "cooccurrence_count": count,
-                        }
-                    )
-
-        cooccurrence_pairs.sort(key=lambda x: x["cooccurrence_count"], reverse=True)
+        # Pathway co-occurrence: pathways x pathways transcript counts
+        cooccurrence = sparse.triu(data.cooccurrence("pathways", "pathways"), k=1)
+        cooccurrence_pairs = [
+            {
+                "pathway1": pathways[first],
+                "pathway2": pathways[second],
+                "cooccurrence_count": count,
+            }
+            # Minimum co-occurrence threshold of 2
+            for first, second, count in _top_entries(cooccurrence, 15, minimum=2)
+        ]
 
-        return {
-            "total_pathways": len(pathway_counts),
-            "enriched_pathways": enrichment_analysis[:20],  # Top 20 enriched
-            "pathway_cooccurrence_network": cooccurrence_pairs[:15],  # Top 15 pairs
+        result = {
+            "total_pathways": len(present),
+            "enriched_pathways": enrichment_analysis,  # Top 20 enriched
+            "pathway_cooccurrence_network": cooccurrence_pairs,  # Top 15 pairs
             "pathway_statistics": {
-                "mean_genes_per_pathway": statistics.mean(pathway_counts.values())
-                if pathway_counts
-                else 0,
-                "max_pathway_size": max(pathway_counts.values())
-                if pathway_counts
-                else 0,
+                "mean_genes_per_pathway": float(present.mean()) if len(present) else 0,
+                "max_pathway_size": int(present.max()) if len(present) else 0,
             },
             "clinical_summary": self._generate_pathway_clinical_summary(
                 enrichment_analysis[:10]
             ),
         }
 
+        # Statistical over-representation of the regulated genes
+        if self.gene_sets is not None:
+            result["over_representation"] = self._over_representation(data)
+        return result
+
+    def _over_representation(self, data: TranscriptomeData) -> Dict[str, Any]:
+        """Test pathways and GO terms for up- and down-regulated genes."""
+        fold_change = data.transcripts.groupby("gene")["expression_fold_change"]
+        highest, lowest = fold_change.max(), fold_change.min()
+        gene_ids = data.genes["gene_id"].to_numpy()
+        gene_lists = {
+            "up_regulated": gene_ids[highest.index[highest > REGULATION_THRESHOLD]],
+            "down_regulated": gene_ids[
+                lowest.index[lowest < 1.0 / REGULATION_THRESHOLD]
+            ],
+        }
+
+        results = {}
+        for direction, genes in gene_lists.items():
+            enrichment = self.gene_sets.enrich(genes, namespace="ensembl")
+            results[direction] = {
+                "gene_count": len(genes),
+                "tested_sets": len(enrichment),
+                "significant_sets": int((enrichment["fdr"] <= 0.05).sum()),
+                "top_sets": enrichment.head(20).to_dict("records"),
+            }
+        return results
+
     def analyze_functional_classification(
-        self, transcripts: List[Dict]
+        self, data: TranscriptomeData
     ) -> Dict[str, Any]:
         """
         SOTA Query 3: Functional Classification Analysis
@@ -288,71 +511,47 @@ class SOTAAnalyzer:
         """
         logger.info("Running SOTA Query 3: Functional Classification Analysis")
 
-        function_counts = Counter()
-        location_counts = Counter()
-        product_type_counts = Counter()
-        go_function_counts = Counter()
-
-        function_location_map = defaultdict(lambda: defaultdict(int))
-
-        for transcript in transcripts:
-            # Molecular functions analysis
-            if transcript["molecular_functions"]:
-                for func in transcript["molecular_functions"]:
-                    function_counts[func] += 1
-
-                    # Cross-reference with cellular location
-                    if transcript["cellular_location"]:
-                        for location in transcript["cellular_location"]:
-                            function_location_map[func][location] += 1
-
-            # Cellular location analysis
-            if transcript["cellular_location"]:
-                for location in transcript["cellular_location"]:
-                    location_counts[location] += 1
-
-            # Product type analysis
-            if transcript["product_type"]:
-                for ptype in transcript["product_type"]:
-                    product_type_counts[ptype] += 1
-
-            # GO terms molecular function analysis
-            if (
-                transcript["go_terms"]
-                and "molecular_function" in transcript["go_terms"]
-            ):
-                for go_func in transcript["go_terms"]["molecular_function"]:
-                    go_function_counts[go_func] += 1
+        functions = data.annotations["molecular_functions"][1]
+        locations = data.annotations["cellular_locations"][1]
+        function_counts = data.label_counts("molecular_functions")
+        function_locations = data.cooccurrence(
+            "molecular_functions", "cellular_locations"
+        )
 
         # Generate functional profiles
         functional_profiles = []
-        for func, count in function_counts.most_common(15):
-            profile = {
-                "molecular_function": func,
-                "gene_count": count,
-                "primary_locations": dict(
-                    Counter(function_location_map[func]).most_common(3)
-                ),
-                "frequency_score": (count / len(transcripts)) * 100,
-            }
-            functional_profiles.append(profile)
+        for func in _top_indices(function_counts, functions, 15):
+            count = int(function_counts[func])
+            row = function_locations[func].toarray().ravel()
+            functional_profiles.append(
+                {
+                    "molecular_function": functions[func],
+                    "gene_count": count,
+                    "primary_locations": _top_counts(row, locations, 3),
+                    "frequency_score": (count / len(data.transcripts)) * 100,
+                }
+            )
 
         return {
             "molecular_function_landscape": {
-                "total_functions": len(function_counts),
-                "top_functions": dict(function_counts.most_common(10)),
+                "total_functions": int((function_counts > 0).sum()),
+                "top_functions": _top_counts(function_counts, functions, 10),
                 "functional_profiles": functional_profiles,
             },
-            "cellular_location_distribution": dict(location_counts.most_common(10)),
-            "product_type_classification": dict(product_type_counts.most_common()),
-            "go_molecular_functions": dict(go_function_counts.most_common(10)),
+            "cellular_location_distribution": _top_counts(
+                data.label_counts("cellular_locations"), locations, 10
+            ),
+            "product_type_classification": _top_counts(
+                data.label_counts("product_types"), data.annotations["product_types"][1]
+            ),
+            "go_molecular_functions": data.go_molecular_functions,
             "clinical_summary": self._generate_functional_clinical_summary(
                 functional_profiles[:5]
             ),
         }
 
     def analyze_chromosomal_distribution(
-        self, transcripts: List[Dict]
+        self, data: TranscriptomeData
     ) -> Dict[str, Any]:
         """
         SOTA Query 4: Chromosomal Distribution Analysis
@@ -366,53 +565,44 @@ class SOTAAnalyzer:
         """
         logger.info("Running SOTA Query 4: Chromosomal Distribution Analysis")
 
-        chromosome_counts = Counter()
-        chromosome_density = defaultdict(list)
-        chromosomal_drug_targets = defaultdict(int)
-
-        for transcript in transcripts:
-            chromosome = transcript["chromosome"]
-            chromosome_counts[chromosome] += 1
-
-            # Extract chromosomal coordinates if available
-            if transcript["coordinates"]:
-                coords = transcript["coordinates"]
-                if isinstance(coords, dict) and "start" in coords:
-                    chromosome_density[chromosome].append(coords["start"])
-
-            # Map drug targets by chromosome
-            if transcript["drugs"] and transcript["drugs"] != {}:
-                chromosomal_drug_targets[chromosome] += len(transcript["drugs"])
+        transcripts = data.transcripts.assign(
+            drug_targets=data.transcript_counts("drugs")
+        )
+        chromosomes = (
+            transcripts.groupby("chromosome", dropna=False, sort=False)
+            .agg(
+                gene_count=("transcript_id", "size"),
+                drug_targets=("drug_targets", "sum"),
+                start=("start_position", "min"),
+                end=("start_position", "max"),
+            )
+            .sort_values("gene_count", ascending=False, kind="stable")
+        )
 
         # Calculate chromosomal statistics
         chromosome_stats = []
-        for chrom, count in chromosome_counts.most_common():
+        for chrom, row in chromosomes.iterrows():
             stats = {
-                "chromosome": chrom,
-                "gene_count": count,
-                "drug_targets": chromosomal_drug_targets[chrom],
-                "density_score": count / len(transcripts) * 100,
+                "chromosome": None if pd.isna(chrom) else chrom,
+                "gene_count": int(row["gene_count"]),
+                "drug_targets": int(row["drug_targets"]),
+                "density_score": row["gene_count"] / len(transcripts) * 100,
             }
 
             # Add positional clustering analysis if coordinates available
-            if chromosome_density[chrom]:
-                positions = chromosome_density[chrom]
+            if pd.notna(row["start"]):
                 stats["position_range"] = {
-                    "start": min(positions),
-                    "end": max(positions),
-                    "span": max(positions) - min(positions),
+                    "start": int(row["start"]),
+                    "end": int(row["end"]),
+                    "span": int(row["end"] - row["start"]),
                 }
 
             chromosome_stats.append(stats)
 
         # Identify chromosomal hotspots (top 25% by density)
-        density_scores = [s["density_score"] for s in chromosome_stats]
+        density_scores = sorted(s["density_score"] for s in chromosome_stats)
         if density_scores:
-            # Sort and find 75th percentile manually
-            sorted_scores = sorted(density_scores)
-            n = len(sorted_scores)
-            index = int(0.75 * (n - 1))
-            hotspot_threshold = sorted_scores[index]
+            hotspot_threshold = density_scores[int(0.75 * (len(density_scores) - 1))]
         else:
             hotspot_threshold = 0
         hotspots = [
@@ -423,12 +613,14 @@ class SOTAAnalyzer:
             "chromosomal_distribution": chromosome_stats,
             "hotspot_chromosomes": hotspots,
             "drug_target_chromosomes": sorted(
-                chromosomal_drug_targets.items(), key=lambda x: x[1], reverse=True
+                [(s["chromosome"], s["drug_targets"]) for s in chromosome_stats],
+                key=lambda x: x[1],
+                reverse=True,
             )[:5],
             "distribution_statistics": {
-                "total_chromosomes": len(chromosome_counts),
-                "mean_genes_per_chromosome": statistics.mean(chromosome_counts.values())
-                if chromosome_counts
+                "total_chromosomes": len(chromosome_stats),
+                "mean_genes_per_chromosome": float(chromosomes["gene_count"].mean())
+                if chromosome_stats
                 else 0,
                 "hotspot_threshold": hotspot_threshold,
             },
@@ -437,7 +629,7 @@ class SOTAAnalyzer:
             ),
         }
 
-    def analyze_multimodal_integration(self, transcripts: List[Dict]) -> Dict[str, Any]:
+    def analyze_multimodal_integration(self, data: TranscriptomeData) -> Dict[str, Any]:
         """
         SOTA Query 5: Multi-modal Integration Analysis
 
@@ -450,110 +642,69 @@ class SOTAAnalyzer:
         """
         logger.info("Running SOTA Query 5: Multi-modal Integration Analysis")
 
-        integrated_profiles = []
-        pathway_drug_associations = defaultdict(lambda: defaultdict(int))
-        function_drug_associations = defaultdict(lambda: defaultdict(int))
-
-        for transcript in transcripts:
-            gene_symbol = transcript["gene_symbol"]
-
-            # Create integrated gene profile
-            profile = {
-                "gene_symbol": gene_symbol,
-                "transcript_id": transcript["transcript_id"],
-                "chromosome": transcript["chromosome"],
-                "has_drugs": bool(transcript["drugs"] and transcript["drugs"] != {}),
-                "drug_count": len(transcript["drugs"]) if transcript["drugs"] else 0,
-                "pathway_count": len(transcript["pathways"])
-                if transcript["pathways"]
-                else 0,
-                "function_count": len(transcript["molecular_functions"])
-                if transcript["molecular_functions"]
-                else 0,
-                "multimodal_score": 0,
-            }
-
-            # Calculate multimodal score (integration complexity)
-            if profile["has_drugs"]:
-                profile["multimodal_score"] += (
-                    profile["drug_count"] * 3
-                )  # Drug interactions weighted heavily
-            profile["multimodal_score"] += (
-                profile["pathway_count"] * 2
-            )  # Pathway involvement
-            profile["multimodal_score"] += profile[
-                "function_count"
-            ]  # Functional diversity
-
-            integrated_profiles.append(profile)
-
-            # Cross-domain association analysis
-            if transcript["drugs"] and transcript["pathways"]:
-                for pathway in transcript["pathways"]:
-                    for drug_id in transcript["drugs"].keys():
-                        pathway_drug_associations[pathway][drug_id] += 1
-
-            if transcript["drugs"] and transcript["molecular_functions"]:
-                for function in transcript["molecular_functions"]:
-                    for drug_id in transcript["drugs"].keys():
-                        function_drug_associations[function][drug_id] += 1
-
-        # Sort by multimodal complexity
-        integrated_profiles.sort(key=lambda x: x["multimodal_score"], reverse=True)
-
-        # Generate cross-domain association networks
-        pathway_drug_network = []
-        for pathway, drugs in pathway_drug_associations.items():
-            for drug_id, count in drugs.items():
-                if count >= 1:  # Minimum association threshold
-                    pathway_drug_network.append(
-                        {
-                            "pathway": pathway,
-                            "drug_id": drug_id,
-                            "association_strength": count,
-                        }
-                    )
+        profiles = data.transcripts[
+            ["gene_symbol", "transcript_id", "chromosome"]
+        ].assign(
+            drug_count=data.transcript_counts("drugs"),
+            pathway_count=data.transcript_counts("pathways"),
+            function_count=data.transcript_counts("molecular_functions"),
+        )
+        profiles.insert(3, "has_drugs", profiles["drug_count"] > 0)
+
+        # Multimodal score (integration complexity): drug interactions weighted
+        # heavily, then pathway involvement, then functional diversity
+        profiles["multimodal_score"] = (
+            profiles["drug_count"] * 3
+            + profiles["pathway_count"] * 2
+            + profiles["function_count"]
+        )
+        integrated_profiles = profiles.sort_values(
+            "multimodal_score", ascending=False, kind="stable"
+        )
 
-        function_drug_network = []
-        for function, drugs in function_drug_associations.items():
-            for drug_id, count in drugs.items():
-                if count >= 1:
-                    function_drug_network.append(
-                        {
-                            "molecular_function": function,
-                            "drug_id": drug_id,
-                            "association_strength": count,
-                        }
-                    )
+        # Cross-domain association networks (minimum association of 1)
+        drugs = data.annotations["drugs"][1]
+        pathways = data.annotations["pathways"][1]
+        functions = data.annotations["molecular_functions"][1]
+        pathway_drug_network = [
+            {
+                "pathway": pathways[pathway],
+                "drug_name": drugs[drug],
+                "association_strength": count,
+            }
+            for pathway, drug, count in _top_entries(
+                data.cooccurrence("pathways", "drugs"), 15
+            )
+        ]
+        function_drug_network = [
+            {
+                "molecular_function": functions[function],
+                "drug_name": drugs[drug],
+                "association_strength": count,
+            }
+            for function, drug, count in _top_entries(
+                data.cooccurrence("molecular_functions", "drugs"), 15
+            )
+        ]
 
         return {
-            "integrated_gene_profiles": integrated_profiles[
-                :20
-            ],  # Top 20 complex genes
+            "integrated_gene_profiles": integrated_profiles.head(20).to_dict(
+                "records"
+            ),  # Top 20 complex genes
             "multimodal_statistics": {
-                "mean_multimodal_score": statistics.mean(
-                    [p["multimodal_score"] for p in integrated_profiles]
-                ),
-                "highly_integrated_genes": len(
-                    [p for p in integrated_profiles if p["multimodal_score"] >= 10]
+                "mean_multimodal_score": float(profiles["multimodal_score"].mean()),
+                "highly_integrated_genes": int(
+                    (profiles["multimodal_score"] >= 10).sum()
                 ),
             },
-            "pathway_drug_associations": sorted(
-                pathway_drug_network,
-                key=lambda x: x["association_strength"],
-                reverse=True,
-            )[:15],
-            "function_drug_associations": sorted(
-                function_drug_network,
-                key=lambda x: x["association_strength"],
-                reverse=True,
-            )[:15],
+            "pathway_drug_associations": pathway_drug_network,
+            "function_drug_associations": function_drug_network,
             "clinical_summary": self._generate_multimodal_clinical_summary(
-                integrated_profiles[:10]
+                integrated_profiles.head(10).to_dict("records")
             ),
         }
 
-    def analyze_clinical_biomarkers(self, transcripts: List[Dict]) -> Dict[str, Any]:
+    def analyze_clinical_biomarkers(self, data: TranscriptomeData) -> Dict[str, Any]:
         """
         SOTA Query 6: Clinical Biomarker Discovery Analysis
 
@@ -566,116 +717,101 @@ class SOTAAnalyzer:
         """
         logger.info("Running SOTA Query 6: Clinical Biomarker Discovery Analysis")
 
-        biomarker_candidates = []
-
-        for transcript in transcripts:
-            gene_symbol = transcript["gene_symbol"]
-
-            # Calculate biomarker potential score
-            biomarker_score = 0
-            characteristics = []
+        transcripts = data.transcripts
+        genes = transcripts["gene"].to_numpy()
+        drug_count = data.transcript_counts("drugs")
+        pathway_count = data.transcript_counts("pathways")
+        function_count = data.transcript_counts("molecular_functions")
+        max_drug_score = (
+            data.drugs.groupby("gene")["score"]
+            .max()
+            .reindex(range(len(data.genes)), fill_value=0.0)
+            .to_numpy()[genes]
+        )
+        fold_change = transcripts["expression_fold_change"].abs().to_numpy()
+        autosomal = ~transcripts["chromosome"].isin(["chrX", "chrY"]).to_numpy()
 
+        traits = {
             # Drug targetability (high clinical utility)
-            if transcript["drugs"] and transcript["drugs"] != {}:
-                drug_scores = [d.get("score", 0) for d in transcript["drugs"].values()]
-                if drug_scores:
-                    biomarker_score += (
-                        max(drug_scores) * 0.4
-                    )  # 40% weight for druggability
-                    characteristics.append("drug_targetable")
-
+            "drug_targetable": drug_count > 0,
             # Pathway involvement (systems relevance)
-            if transcript["pathways"]:
-                pathway_count = len(transcript["pathways"])
-                biomarker_score += min(pathway_count * 10, 50)  # Cap at 50 points
-                if pathway_count >= 3:
-                    characteristics.append("multi_pathway")
-
+            "multi_pathway": pathway_count >= 3,
             # Functional diversity (biological importance)
-            if transcript["molecular_functions"]:
-                function_count = len(transcript["molecular_functions"])
-                biomarker_score += min(function_count * 5, 25)  # Cap at 25 points
-                if function_count >= 3:
-                    characteristics.append("multi_functional")
-
+            "multi_functional": function_count >= 3,
             # Expression level consideration (if available)
-            if transcript.get("expression_fold_change"):
-                fold_change = abs(transcript["expression_fold_change"])
-                if fold_change >= 2.0:
-                    biomarker_score += 20
-                    characteristics.append("high_expression_change")
-                elif fold_change >= 1.5:
-                    biomarker_score += 10
-                    characteristics.append("moderate_expression_change")
-
-            # Chromosomal location consideration (stability)
-            chromosome = transcript["chromosome"]
-            if chromosome not in ["chrX", "chrY"]:  # Autosomal chromosomes more stable
-                biomarker_score += 5
-                characteristics.append("autosomal")
-
-            biomarker_candidates.append(
-                {
-                    "gene_symbol": gene_symbol,
-                    "transcript_id": transcript["transcript_id"],
-                    "biomarker_score": biomarker_score,
-                    "characteristics": characteristics,
-                    "chromosome": chromosome,
-                    "drug_count": len(transcript["drugs"])
-                    if transcript["drugs"]
-                    else 0,
-                    "pathway_count": len(transcript["pathways"])
-                    if transcript["pathways"]
-                    else 0,
-                    "function_count": len(transcript["molecular_functions"])
-                    if transcript["molecular_functions"]
-                    else 0,
-                }
-            )
+            "high_expression_change": fold_change >= 2.0,
+            "moderate_expression_change": (fold_change >= 1.5) & (fold_change < 2.0),
+            # Chromosomal location consideration (autosomes more stable)
+            "autosomal": autosomal,
+        }
+
+        # 40% weight for druggability; pathways capped at 50, functions at 25
+        biomarker_score = (
+            np.where(drug_count > 0, max_drug_score * 0.4, 0.0)
+            + np.minimum(pathway_count * 10, 50)
+            + np.minimum(function_count * 5, 25)
+            + np.where(traits["high_expression_change"], 20, 0)
+            + np.where(traits["moderate_expression_change"], 10, 0)
+            + np.where(autosomal, 5, 0)
+        )
 
         # Sort by biomarker potential
-        biomarker_candidates.sort(key=lambda x: x["biomarker_score"], reverse=True)
+        order = np.argsort(-biomarker_score, kind="stable")
+        high_potential = int((biomarker_score >= 75).sum())
+        moderate_potential = int(
+            ((biomarker_score >= 50) & (biomarker_score < 75)).sum()
+        )
+        emerging_biomarkers = int(
+            ((biomarker_score >= 25) & (biomarker_score < 50)).sum()
+        )
 
-        # Categorize biomarkers
-        high_potential = [b for b in biomarker_candidates if b["biomarker_score"] >= 75]
-        moderate_potential = [
-            b for b in biomarker_candidates if 50 <= b["biomarker_score"] < 75
-        ]
-        emerging_biomarkers = [
-            b for b in biomarker_candidates if 25 <= b["biomarker_score"] < 50
+        biomarker_candidates = [
+            {
+                "gene_symbol": transcripts["gene_symbol"].iat[i],
+                "transcript_id": transcripts["transcript_id"].iat[i],
+                "biomarker_score": float(biomarker_score[i]),
+                "characteristics": [name for name, has in traits.items() if has[i]],
+                "chromosome": transcripts["chromosome"].iat[i],
+                "drug_count": int(drug_count[i]),
+                "pathway_count": int(pathway_count[i]),
+                "function_count": int(function_count[i]),
+            }
+            for i in order[:25]
         ]
+        top_biomarkers = biomarker_candidates[: min(high_potential, 10)]
 
         return {
             "biomarker_candidates": biomarker_candidates[:25],  # Top 25 candidates
             "biomarker_categories": {
-                "high_potential": len(high_potential),
-                "moderate_potential": len(moderate_potential),
-                "emerging_biomarkers": len(emerging_biomarkers),
+                "high_potential": high_potential,
+                "moderate_potential": moderate_potential,
+                "emerging_biomarkers": emerging_biomarkers,
             },
-            "top_biomarkers": high_potential[:10],
+            "top_biomarkers": top_biomarkers,
             "biomarker_statistics": {
-                "mean_biomarker_score": statistics.mean(
-                    [b["biomarker_score"] for b in biomarker_candidates]
-                ),
+                "mean_biomarker_score": float(biomarker_score.mean()),
                 "score_distribution": {
-                    "high": len(high_potential),
-                    "moderate": len(moderate_potential),
-                    "emerging": len(emerging_biomarkers),
+                    "high": high_potential,
+                    "moderate": moderate_potential,
+                    "emerging": emerging_biomarkers,
                 },
             },
             "clinical_summary": self._generate_biomarker_clinical_summary(
-                high_potential[:5]
+                top_biomarkers[:5]
             ),
         }
 
     def _generate_drug_clinical_summary(
-        self, interactions: List[Dict], high_score: List[Dict]
+        self, interaction_count: int, high_score: List[Dict]
     ) -> str:
         """Generate clinical summary for drug interaction analysis."""
-        if not interactions:
+        if not interaction_count:
             return "No drug interactions found in the dataset."
 
-        summary = f"Analysis identified {len(interactions)} drug-gene interactions across multiple therapeutic modalities. "
+        summary = (
+            f"Analysis identified {interaction_count} drug-gene interactions "
+            "across multiple therapeutic modalities. "
+        )
 
         if high_score:
             top_target = max(high_score, key=lambda x: x["score"])
@@ -760,9 +896,9 @@ class SOTAAnalyzer:
         logger.info("Starting comprehensive SOTA analysis pipeline")
 
         # Retrieve transcript data
-        transcripts = self.get_all_transcripts(patient_db)
+        data = self.load_transcriptome(patient_db)
 
-        if not transcripts:
+        if data is None or data.transcripts.empty:
             logger.warning("No transcript data found for analysis")
             return {
                 "status": "no_data",
@@ -770,7 +906,7 @@ class SOTAAnalyzer:
                 "timestamp": self.timestamp,
             }
 
-        logger.info(f"Analyzing {len(transcripts)} transcripts")
+        logger.info(f"Analyzing {len(data.transcripts)} transcripts")
 
         # Progress tracking
         progress_bar = get_progress_bar(
@@ -778,63 +914,184 @@ class SOTAAnalyzer:
         )
 
         try:
-            # Run all SOTA analyses
-            self.analysis_results = {
-                "analysis_metadata": {
-                    "timestamp": self.timestamp,
-                    "database": patient_db or "mediabase",
-                    "transcript_count": len(transcripts),
-                    "analysis_version": "v1.0.0",
-                }
+            self.analyze_transcriptome(data, patient_db or "mediabase", progress_bar)
+            logger.info("SOTA analysis pipeline completed successfully")
+            return self.analysis_results
+
+        finally:
+            progress_bar.close()
+
+    def analyze_transcriptome(
+        self, data: TranscriptomeData, database: str, progress_bar: Any = None
+    ) -> Dict[str, Any]:
+        """
+        Run all SOTA analyses on loaded transcriptome data.
+
+        Args:
+            data: Transcriptome data to analyze
+            database: Database or patient schema recorded in the metadata
+            progress_bar: Optional progress bar advanced once per analysis
+
+        Returns:
+            Complete analysis results with all SOTA queries
+        """
+        self.analysis_results = {
+            "analysis_metadata": {
+                "timestamp": self.timestamp,
+                "database": database,
+                "transcript_count": len(data.transcripts),
+                "analysis_version": "v1.0.0",
             }
+        }
 
+        analyses = [
             # SOTA Query 1: Drug-Gene Interactions
-            self.analysis_results[
-                "drug_gene_interactions"
-            ] = self.analyze_drug_gene_interactions(transcripts)
-            progress_bar.update(1)
-
+            ("drug_gene_interactions", self.analyze_drug_gene_interactions),
             # SOTA Query 2: Pathway Enrichment
-            self.analysis_results[
-                "pathway_enrichment"
-            ] = self.analyze_pathway_enrichment(transcripts)
-            progress_bar.update(1)
-
+            ("pathway_enrichment", self.analyze_pathway_enrichment),
             # SOTA Query 3: Functional Classification
-            self.analysis_results[
-                "functional_classification"
-            ] = self.analyze_functional_classification(transcripts)
-            progress_bar.update(1)
-
+            ("functional_classification", self.analyze_functional_classification),
             # SOTA Query 4: Chromosomal Distribution
-            self.analysis_results[
-                "chromosomal_distribution"
-            ] = self.analyze_chromosomal_distribution(transcripts)
-            progress_bar.update(1)
-
+            ("chromosomal_distribution", self.analyze_chromosomal_distribution),
             # SOTA Query 5: Multi-modal Integration
-            self.analysis_results[
-                "multimodal_integration"
-            ] = self.analyze_multimodal_integration(transcripts)
-            progress_bar.update(1)
-
+            ("multimodal_integration", self.analyze_multimodal_integration),
             # SOTA Query 6: Clinical Biomarkers
-            self.analysis_results[
-                "clinical_biomarkers"
-            ] = self.analyze_clinical_biomarkers(transcripts)
-            progress_bar.update(1)
+            ("clinical_biomarkers", self.analyze_clinical_biomarkers),
+        ]
+        for name, analyze in analyses:
+            self.analysis_results[name] = analyze(data)
+            if progress_bar is not None:
+                progress_bar.update(1)
 
-            # Generate executive summary
-            self.analysis_results[
-                "executive_summary"
-            ] = self._generate_executive_summary()
+        # Generate executive summary
+        self.analysis_results["executive_summary"] = self._generate_executive_summary()
+        return self.analysis_results
 
-            logger.info("SOTA analysis pipeline completed successfully")
-            return self.analysis_results
+    def run_batch_analysis(
+        self, patient_ids: List[str], max_workers: int = 4
+    ) -> Dict[str, Any]:
+        """
+        Run the SOTA analyses for many patient schemas in worker processes.
+
+        The public reference data (transcripts and annotation matrices) and
+        the gene set matrix are loaded once and handed to every worker; each
+        worker only reads the sparse fold changes of its patients over its
+        own connection.
+
+        Args:
+            patient_ids: Patients to analyze (schemas patient_<id>)
+            max_workers: Number of worker processes
+
+        Returns:
+            Combined report with per-patient results and a cohort summary
+        """
+        logger.info(f"Starting batch SOTA analysis of {len(patient_ids)} patients")
 
+        reference = self.load_transcriptome()
+        if reference is None or reference.transcripts.empty:
+            logger.warning("No transcript data found for analysis")
+            return {
+                "status": "no_data",
+                "message": "No transcript data available for analysis",
+                "timestamp": self.timestamp,
+            }
+
+        gene_set_dirs = None
+        if self.gene_sets is not None:
+            gene_set_dirs = (
+                str(self.gene_sets.gene_map.directory),
+                str(self.gene_sets.directory),
+            )
+
+        results: Dict[str, Dict[str, Any]] = {}
+        failed: Dict[str, str] = {}
+        progress_bar = get_progress_bar(
+            total=len(patient_ids),
+            desc="Analyzing patients",
+            module_name="sota_analysis",
+        )
+        try:
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_batch_worker,
+                initargs=(self.db_manager.db_config, reference, gene_set_dirs),
+            ) as executor:
+                futures = {
+                    executor.submit(_analyze_patient, patient_id): patient_id
+                    for patient_id in patient_ids
+                }
+                for future in as_completed(futures):
+                    patient_id = futures[future]
+                    try:
+                        results[patient_id] = future.result()
+                    except Exception as e:
+                        logger.error(f"SOTA analysis failed for {patient_id}: {e}")
+                        failed[patient_id] = str(e)
+                    progress_bar.update(1)
         finally:
             progress_bar.close()
 
+        patients = {pid: results[pid] for pid in patient_ids if pid in results}
+        self.analysis_results = {
+            "analysis_metadata": {
+                "timestamp": self.timestamp,
+                "database": "mediabase",
+                "transcript_count": len(reference.transcripts),
+                "patient_count": len(patients),
+                "analysis_version": "v1.0.0",
+            },
+            "cohort_summary": self._generate_cohort_summary(patients, failed),
+            "patients": patients,
+        }
+        logger.info(
+            f"Batch SOTA analysis completed: {len(patients)} patients, "
+            f"{len(failed)} failed"
+        )
+        return self.analysis_results
+
+    def _generate_cohort_summary(
+        self, patients: Dict[str, Dict[str, Any]], failed: Dict[str, str]
+    ) -> Dict[str, Any]:
+        """Summarize findings that recur across the patients of a batch."""
+        biomarkers = Counter()
+        enriched_sets = Counter()
+        for results in patients.values():
+            # Genes with at least moderate biomarker potential
+            biomarkers.update(
+                {
+                    b["gene_symbol"]
+                    for b in results["clinical_biomarkers"]["biomarker_candidates"]
+                    if b["biomarker_score"] >= 50
+                }
+            )
+            for direction, enrichment in (
+                results["pathway_enrichment"].get("over_representation", {}).items()
+            ):
+                enriched_sets.update(
+                    (direction, s["set_id"], s["name"])
+                    for s in enrichment["top_sets"]
+                    if s["fdr"] <= 0.05
+                )
+
+        return {
+            "patients_analyzed": len(patients),
+            "failed_patients": failed,
+            "high_potential_biomarkers": {
+                patient_id: results["clinical_biomarkers"]["biomarker_categories"][
+                    "high_potential"
+                ]
+                for patient_id, results in patients.items()
+            },
+            "recurrent_biomarker_genes": [
+                {"gene_symbol": gene, "patients": count}
+                for gene, count in _most_common(biomarkers, 20)
+            ],
+            "recurrent_enriched_sets": [
+                {"direction": direction, "set_id": set_id, "name": name, "patients": n}
+                for (direction, set_id, name), n in _most_common(enriched_sets, 20)
+            ],
+        }
+
     def _generate_executive_summary(self) -> Dict[str, Any]:
         """Generate executive summary of all analyses."""
         summary = {
@@ -918,25 +1175,84 @@ class SOTAAnalyzer:
             f.write(f"Database: {metadata.get('database', 'Unknown')}\n")
             f.write(f"Transcripts Analyzed: {metadata.get('transcript_count', 0)}\n\n")
 
+            # Batch reports: cohort summary, then one section per patient
+            if "patients" in self.analysis_results:
+                cohort = self.analysis_results["cohort_summary"]
+                f.write("COHORT SUMMARY\n")
+                f.write("-" * 20 + "\n")
+                f.write(f"Patients Analyzed: {cohort['patients_analyzed']}\n")
+                for patient_id, error in cohort["failed_patients"].items():
+                    f.write(f"Failed: {patient_id} ({error})\n")
+
+                f.write("\nRecurrent Biomarker Genes:\n")
+                for gene in cohort["recurrent_biomarker_genes"]:
+                    f.write(f"• {gene['gene_symbol']}: {gene['patients']} patients\n")
+
+                f.write("\nRecurrent Enriched Gene Sets:\n")
+                for gene_set in cohort["recurrent_enriched_sets"]:
+                    f.write(
+                        f"• {gene_set['name']} ({gene_set['direction']}): "
+                        f"{gene_set['patients']} patients\n"
+                    )
+                f.write("\n" + "=" * 50 + "\n")
+
+                for patient_id, results in self.analysis_results["patients"].items():
+                    f.write(f"\nPATIENT {patient_id}\n")
+                    self._write_executive_summary(f, results["executive_summary"])
+                return
+
             # Write executive summary
             if "executive_summary" in self.analysis_results:
-                summary = self.analysis_results["executive_summary"]
-                f.write("EXECUTIVE SUMMARY\n")
-                f.write("-" * 20 + "\n")
+                self._write_executive_summary(
+                    f, self.analysis_results["executive_summary"]
+                )
 
-                f.write("\nKey Findings:\n")
-                for finding in summary.get("key_findings", []):
-                    f.write(f"• {finding}\n")
+    def _write_executive_summary(self, f: Any, summary: Dict[str, Any]) -> None:
+        """Write an executive summary section of the text report."""
+        f.write("EXECUTIVE SUMMARY\n")
+        f.write("-" * 20 + "\n")
 
-                f.write("\nTherapeutic Opportunities:\n")
-                for opportunity in summary.get("therapeutic_opportunities", []):
-                    f.write(f"• {opportunity}\n")
+        f.write("\nKey Findings:\n")
+        for finding in summary.get("key_findings", []):
+            f.write(f"• {finding}\n")
 
-                f.write("\nRecommended Actions:\n")
-                for action in summary.get("recommended_actions", []):
-                    f.write(f"• {action}\n")
+        f.write("\nTherapeutic Opportunities:\n")
+        for opportunity in summary.get("therapeutic_opportunities", []):
+            f.write(f"• {opportunity}\n")
+
+        f.write("\nRecommended Actions:\n")
+        for action in summary.get("recommended_actions", []):
+            f.write(f"• {action}\n")
+
+        f.write("\n" + "=" * 50 + "\n")
 
-                f.write("\n" + "=" * 50 + "\n")
+
+# Per-process state of batch workers, set once by _init_batch_worker
+_batch_worker_state: Dict[str, Any] = {}
+
+
+def _init_batch_worker(
+    db_config: Dict[str, Any],
+    reference: TranscriptomeData,
+    gene_set_dirs: Optional[Tuple[str, str]],
+) -> None:
+    """Initialize a batch worker with its own connection and the reference data."""
+    analyzer = SOTAAnalyzer(db_config)
+    if gene_set_dirs is not None:
+        map_dir, matrix_dir = gene_set_dirs
+        analyzer.gene_sets = GeneSetMatrix(matrix_dir, GeneIDMap(map_dir))
+    _batch_worker_state.update(analyzer=analyzer, reference=reference)
+
+
+def _analyze_patient(patient_id: str) -> Dict[str, Any]:
+    """Run the SOTA analyses for one patient in a batch worker."""
+    analyzer = _batch_worker_state["analyzer"]
+    db_manager = analyzer.db_manager
+    if not db_manager.cursor:
+        db_manager.connect()
+    fold_changes = load_patient_fold_changes(db_manager.cursor, patient_id)
+    data = _batch_worker_state["reference"].with_fold_changes(fold_changes)
+    return analyzer.analyze_transcriptome(data, get_schema_name(patient_id))
 
 
 def main():
@@ -950,6 +1266,24 @@ def main():
         type=str,
         help="Patient database name for patient-specific analysis",
     )
+    patients = parser.add_mutually_exclusive_group()
+    patients.add_argument(
+        "--patients",
+        nargs="+",
+        metavar="PATIENT_ID",
+        help="Analyze these patient schemas in one batch with a combined report",
+    )
+    patients.add_argument(
+        "--all-patients",
+        action="store_true",
+        help="Analyze every patient schema in one batch with a combined report",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Number of worker processes for batch analysis (default: 4)",
+    )
     parser.add_argument(
         "--output",
         type=str,
@@ -988,7 +1322,23 @@ def main():
         analyzer = SOTAAnalyzer(db_config)
 
         # Run analysis
-        results = analyzer.run_complete_analysis(args.patient_db)
+        if args.all_patients:
+            patient_ids = [
+                schema["patient_id"]
+                for schema in list_patient_schemas(analyzer.db_manager)
+            ]
+            analyzer.run_batch_analysis(patient_ids, max_workers=args.workers)
+        elif args.patients:
+            missing = [
+                patient_id
+                for patient_id in args.patients
+                if not schema_exists(patient_id, analyzer.db_manager)
+            ]
+            if missing:
+                raise ValueError(f"Patient schemas not found: {', '.join(missing)}")
+            analyzer.run_batch_analysis(args.patients, max_workers=args.workers)
+        else:
+            analyzer.run_complete_analysis(args.patient_db)
 
         # Save reports
         output_path = Path(args.output)
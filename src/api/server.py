@@ -29,7 +29,9 @@ from src.db.patient_schema import (
     get_schema_name,
     schema_exists,
     list_patient_schemas,
+    get_regulated_genes,
 )
+from src.utils.gene_sets import get_gene_set_matrix
 from src.utils.logging import setup_logging
 
 
@@ -82,6 +84,46 @@ class TranscriptResponse(BaseModel):
     molecular_functions: Optional[List[str]]
     cellular_location: Optional[List[str]]
     source_references: Optional[Dict[str, Any]]
+    publication_count: int = 0  # From gene_literature_stats
+    evidence_tier: Optional[str] = None  # From gene_literature_stats
+
+
+class GeneLiteratureResponse(BaseModel):
+    """Per-gene literature statistics from the gene_literature_stats rollup."""
+
+    gene_id: str
+    gene_symbol: str
+    publication_count: int
+    total_mentions: int
+    first_year: Optional[int]
+    last_year: Optional[int]
+    evidence_tier: str
+
+
+class EnrichedGeneSet(BaseModel):
+    """One over-represented gene set (hypergeometric test)."""
+
+    set_id: str
+    name: str
+    collection: str  # pathways, go_biological_process, ...
+    set_size: int
+    overlap: int
+    expected: float
+    fold_enrichment: float
+    p_value: float
+    fdr: float  # Benjamini-Hochberg
+    genes: List[str]
+
+
+class EnrichmentResponse(BaseModel):
+    """Gene set enrichment of a patient's up- or down-regulated genes."""
+
+    patient_id: str
+    direction: str
+    fold_change_threshold: float
+    gene_count: int
+    tested_sets: int
+    enriched_sets: List[EnrichedGeneSet]
 
 
 class HealthResponse(BaseModel):
@@ -246,9 +288,12 @@ async def search_transcripts(
                 COALESCE(gdi.drugs, '{{}}'::jsonb) as drugs,
                 ARRAY[]::text[] as molecular_functions,
                 ARRAY[]::text[] as cellular_location,
-                '{{}}'::jsonb as source_references
+                '{{}}'::jsonb as source_references,
+                COALESCE(gls.publication_count, 0) as publication_count,
+                gls.evidence_tier
             FROM {base_table}
             JOIN public.genes g ON {gene_id_ref} = g.gene_id
+            LEFT JOIN public.gene_literature_stats gls ON gls.gene_id = {gene_id_ref}
             LEFT JOIN (
                 SELECT gene_id, array_agg(annotation_value) as product_types
                 FROM gene_annotations
@@ -326,8 +371,11 @@ async def get_transcript(
                 COALESCE(gdi.drugs, '{}'::jsonb) as drugs,
                 ARRAY[]::text[] as molecular_functions,
                 ARRAY[]::text[] as cellular_location,
-                '{}'::jsonb as source_references
+                '{}'::jsonb as source_references,
+                COALESCE(gls.publication_count, 0) as publication_count,
+                gls.evidence_tier
             FROM transcript_enrichment_view te
+            LEFT JOIN gene_literature_stats gls ON gls.gene_id = te.gene_id
             LEFT JOIN (
                 SELECT gene_id, array_agg(annotation_value) as product_types
                 FROM gene_annotations
@@ -377,6 +425,48 @@ async def get_transcript(
         raise HTTPException(status_code=500, detail=f"Retrieval failed: {str(e)}")
 
 
+@app.get(
+    "/api/v1/genes/{gene_symbol}/literature", response_model=GeneLiteratureResponse
+)
+async def get_gene_literature(
+    gene_symbol: str, db: DatabaseManager = Depends(get_database)
+):
+    """Get publication statistics and evidence tier for a gene symbol."""
+    try:
+        cursor = db.cursor
+        cursor.execute(
+            """
+            SELECT
+                g.gene_id,
+                g.gene_symbol,
+                COALESCE(gls.publication_count, 0) as publication_count,
+                COALESCE(gls.total_mentions, 0) as total_mentions,
+                gls.first_year,
+                gls.last_year,
+                COALESCE(gls.evidence_tier, 'Limited publications') as evidence_tier
+            FROM genes g
+            LEFT JOIN gene_literature_stats gls ON gls.gene_id = g.gene_id
+            WHERE g.gene_symbol = %s
+            ORDER BY publication_count DESC
+            LIMIT 1
+        """,
+            (gene_symbol,),
+        )
+
+        result = cursor.fetchone()
+        if not result:
+            raise HTTPException(status_code=404, detail=f"Gene {gene_symbol} not found")
+
+        columns = [desc[0] for desc in cursor.description]
+        return GeneLiteratureResponse(**dict(zip(columns, result)))
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error retrieving literature for {gene_symbol}: {e}")
+        raise HTTPException(status_code=500, detail=f"Retrieval failed: {str(e)}")
+
+
 @app.get("/api/v1/patients")
 async def list_patients(db: DatabaseManager = Depends(get_database)):
     """
@@ -409,6 +499,80 @@ async def list_patients(db: DatabaseManager = Depends(get_database)):
         )
 
 
+@app.get(
+    "/api/v1/patients/{patient_id}/enrichment",
+    response_model=List[EnrichmentResponse],
+)
+async def get_patient_enrichment(
+    patient_id: str,
+    direction: str = Query("both", description="up, down or both"),
+    fold_change_threshold: float = Query(
+        2.0, gt=1.0, description="Up above this fold change, down below its inverse"
+    ),
+    collections: Optional[List[str]] = Query(
+        None, description="Gene set collections (pathways, go_biological_process, ...)"
+    ),
+    max_fdr: float = Query(0.05, gt=0, le=1, description="Maximum FDR reported"),
+    min_set_size: int = Query(5, ge=1),
+    max_set_size: int = Query(500, ge=1),
+    limit: int = Query(50, ge=1, le=1000),
+    db: DatabaseManager = Depends(get_database),
+):
+    """
+    Gene set over-representation of a patient's regulated genes.
+
+    Tests pathways and GO terms with a hypergeometric test and
+    Benjamini-Hochberg FDR, using the cached gene set matrix.
+    """
+    if direction not in ("up", "down", "both"):
+        raise HTTPException(status_code=400, detail=f"Invalid direction: {direction}")
+    if not validate_patient_id(patient_id):
+        raise HTTPException(
+            status_code=400, detail=f"Invalid patient_id format: {patient_id}"
+        )
+    if not schema_exists(patient_id, db):
+        raise HTTPException(
+            status_code=404,
+            detail=f"Patient schema not found for patient_id: {patient_id}",
+        )
+
+    try:
+        gene_sets = get_gene_set_matrix(
+            os.getenv("MB_CACHE_DIR", "/tmp/mediabase/cache"), db
+        )
+        regulated = get_regulated_genes(patient_id, db, fold_change_threshold)
+
+        responses = []
+        for name in ["up", "down"] if direction == "both" else [direction]:
+            result = gene_sets.enrich(
+                regulated[name],
+                namespace="ensembl",
+                collections=collections,
+                min_size=min_set_size,
+                max_size=max_set_size,
+            )
+            enriched = result[result["fdr"] <= max_fdr].head(limit)
+            responses.append(
+                EnrichmentResponse(
+                    patient_id=patient_id,
+                    direction=name,
+                    fold_change_threshold=fold_change_threshold,
+                    gene_count=len(regulated[name]),
+                    tested_sets=len(result),
+                    enriched_sets=[
+                        EnrichedGeneSet(**row) for row in enriched.to_dict("records")
+                    ],
+                )
+            )
+
+        logger.info(f"Gene set enrichment for {patient_id} ({direction})")
+        return responses
+
+    except Exception as e:
+        logger.error(f"Error computing enrichment for {patient_id}: {e}")
+        raise HTTPException(status_code=500, detail=f"Enrichment failed: {str(e)}")
+
+
 @app.get("/api/v1/stats")
 async def get_database_stats(db: DatabaseManager = Depends(get_database)):
     """Get database statistics from normalized schema."""
@@ -437,6 +601,9 @@ async def get_database_stats(db: DatabaseManager = Depends(get_database)):
         cursor.execute("SELECT COUNT(DISTINCT transcript_id) FROM transcript_go_terms")
         transcripts_with_go_terms = cursor.fetchone()[0]
 
+        cursor.execute("SELECT COUNT(*) FROM gene_literature_stats")
+        genes_with_publications = cursor.fetchone()[0]
+
         # Get materialized view statistics
         cursor.execute("SELECT COUNT(*) FROM gene_summary_view")
         materialized_view_genes = cursor.fetchone()[0]
@@ -448,6 +615,7 @@ async def get_database_stats(db: DatabaseManager = Depends(get_database)):
             "genes_with_pathways": genes_with_pathways,
             "genes_with_product_types": genes_with_product_types,
             "transcripts_with_go_terms": transcripts_with_go_terms,
+            "genes_with_publications": genes_with_publications,
             "materialized_view_genes": materialized_view_genes,
             "drug_coverage": (genes_with_drugs / unique_genes * 100)
             if unique_genes > 0
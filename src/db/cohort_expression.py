@@ -0,0 +1,297 @@
+"""Cohort-level expression table maintained from the patient schemas.
+
+Cross-patient queries over ``patient_<ID>.expression_data`` need one
+``UNION ALL`` branch per patient, built with dynamic SQL, and get slower with
+every patient. ``public.expression_long`` holds the same sparse fold changes
+in one table, list-partitioned by patient:
+
+- Each patient's rows live in its own partition, ``patient_<ID>.expression_long``,
+  inside the patient schema. Dropping the schema drops the partition, and
+  queries filtered on ``patient_id`` prune to that single partition.
+- The patient schemas stay the source of truth. A partition is a materialized
+  copy of the patient's ``expression_data``, rebuilt in one transaction by
+  ``refresh_patient_expression`` (readers see the old or the new rows, never a
+  mix). ``refresh_cohort_expression`` refreshes only patients whose row count
+  or latest ``updated_at`` changed since their last refresh.
+- Baseline (1.0) values are implicit, as in the patient schemas.
+
+Usage:
+    from src.db.cohort_expression import (
+        refresh_cohort_expression,
+        find_recurrent_genes,
+    )
+
+    refresh_cohort_expression(db_manager)
+
+    # Genes above 2x in at least 3 patients
+    genes = find_recurrent_genes(db_manager, min_patients=3)
+"""
+
+from typing import Any, Dict, List, Optional, Sequence
+
+from .database import DatabaseManager
+from .patient_schema import (
+    PatientSchemaError,
+    SchemaNotFoundError,
+    get_expression_state,
+    get_schema_name,
+    list_patient_schemas,
+    schema_exists,
+)
+from ..utils.logging import setup_logging
+
+# Create logger
+logger = setup_logging(module_name=__name__)
+
+COHORT_TABLE = "public.expression_long"
+REFRESH_TABLE = "public.expression_long_patients"
+
+
+def get_cohort_patient_id(patient_id: str) -> str:
+    """Get the patient_id a patient's rows carry in expression_long.
+
+    This is the schema name suffix, so it is lowercased like the schema name
+    and matches the patient_id returned by ``list_patient_schemas``.
+
+    Args:
+        patient_id: Patient identifier
+
+    Returns:
+        Cohort patient ID
+    """
+    return get_schema_name(patient_id)[len("patient_") :]
+
+
+def get_partition_name(patient_id: str) -> str:
+    """Get the expression_long partition of a patient (inside its schema).
+
+    Args:
+        patient_id: Patient identifier
+
+    Returns:
+        Qualified partition table name
+    """
+    return f"{get_schema_name(patient_id)}.expression_long"
+
+
+def refresh_patient_expression(patient_id: str, db_manager: DatabaseManager) -> int:
+    """Rebuild a patient's expression_long partition from its expression_data.
+
+    The partition is created on first use, then truncated and refilled in one
+    transaction, and the patient's refresh state is recorded.
+
+    Args:
+        patient_id: Patient identifier
+        db_manager: Database manager instance
+
+    Returns:
+        Number of rows in the refreshed partition
+
+    Raises:
+        SchemaNotFoundError: If the patient schema doesn't exist
+        PatientSchemaError: If the refresh fails
+    """
+    if not schema_exists(patient_id, db_manager):
+        raise SchemaNotFoundError(f"Schema for patient {patient_id} does not exist")
+
+    schema_name = get_schema_name(patient_id)
+    partition = get_partition_name(patient_id)
+    cohort_id = get_cohort_patient_id(patient_id)
+
+    try:
+        # Ensure database connection
+        if not db_manager.cursor:
+            db_manager.connect()
+        cursor = db_manager.cursor
+
+        with db_manager.transaction():
+            cursor.execute(
+                f"""
+                CREATE TABLE IF NOT EXISTS {partition}
+                PARTITION OF {COHORT_TABLE} FOR VALUES IN (%s)
+                """,
+                (cohort_id,),
+            )
+            cursor.execute(f"TRUNCATE {partition}")
+            cursor.execute(
+                f"""
+                INSERT INTO {partition} (patient_id, transcript_id, fold_change)
+                SELECT %s, transcript_id, expression_fold_change
+                FROM {schema_name}.expression_data
+                """,
+                (cohort_id,),
+            )
+            row_count = cursor.rowcount
+            cursor.execute(
+                f"""
+                INSERT INTO {REFRESH_TABLE} (patient_id, row_count, source_updated_at)
+                SELECT %s, COUNT(*), MAX(updated_at)
+                FROM {schema_name}.expression_data
+                ON CONFLICT (patient_id) DO UPDATE SET
+                    row_count = EXCLUDED.row_count,
+                    source_updated_at = EXCLUDED.source_updated_at,
+                    refreshed_at = CURRENT_TIMESTAMP
+                """,
+                (cohort_id,),
+            )
+
+        # Outside the transaction: keep planner statistics current
+        cursor.execute(f"ANALYZE {partition}")
+
+        logger.info(f"Refreshed {partition}: {row_count:,} rows")
+        return row_count
+
+    except Exception as e:
+        logger.error(f"Failed to refresh {partition}: {e}")
+        raise PatientSchemaError(f"Cohort expression refresh failed: {e}") from e
+
+
+def refresh_cohort_expression(
+    db_manager: DatabaseManager,
+    patient_ids: Optional[Sequence[str]] = None,
+    force: bool = False,
+) -> Dict[str, int]:
+    """Bring expression_long up to date with the patient schemas.
+
+    A patient is refreshed when it has no partition yet or when the row count
+    or latest ``updated_at`` of its expression_data differ from its last
+    refresh. Refresh state of patients whose schema was dropped is removed
+    (their partitions were dropped with the schema).
+
+    Args:
+        db_manager: Database manager instance
+        patient_ids: Patients to check (default: every patient schema)
+        force: Refresh every selected patient regardless of its state
+
+    Returns:
+        Dict of refreshed patient ID -> row count
+    """
+    # Ensure database connection
+    if not db_manager.cursor:
+        db_manager.connect()
+    cursor = db_manager.cursor
+
+    existing = [schema["patient_id"] for schema in list_patient_schemas(db_manager)]
+    if patient_ids is None:
+        patient_ids = existing
+    else:
+        missing = set(map(get_cohort_patient_id, patient_ids)) - set(existing)
+        if missing:
+            raise SchemaNotFoundError(
+                f"Patient schemas not found: {', '.join(sorted(missing))}"
+            )
+
+    cursor.execute(
+        f"""
+        DELETE FROM {REFRESH_TABLE}
+        WHERE patient_id <> ALL(%s)
+        RETURNING patient_id
+        """,
+        (existing,),
+    )
+    for (patient_id,) in cursor.fetchall():
+        logger.info(f"Removed refresh state of dropped patient {patient_id}")
+
+    cursor.execute(
+        f"SELECT patient_id, row_count, source_updated_at FROM {REFRESH_TABLE}"
+    )
+    refreshed_state = {row[0]: tuple(row[1:]) for row in cursor.fetchall()}
+
+    refreshed = {}
+    for patient_id in patient_ids:
+        cohort_id = get_cohort_patient_id(patient_id)
+        if not force and cohort_id in refreshed_state:
+            state = get_expression_state(patient_id, db_manager)
+            if state == refreshed_state[cohort_id]:
+                logger.debug(f"expression_long is current for {cohort_id}")
+                continue
+        refreshed[cohort_id] = refresh_patient_expression(patient_id, db_manager)
+
+    logger.info(
+        f"Cohort expression: {len(refreshed)} of {len(patient_ids)} patients refreshed"
+    )
+    return refreshed
+
+
+def find_recurrent_genes(
+    db_manager: DatabaseManager,
+    fold_change_threshold: float = 2.0,
+    min_patients: int = 2,
+    direction: str = "up",
+    patient_ids: Optional[Sequence[str]] = None,
+) -> List[Dict[str, Any]]:
+    """Find genes regulated beyond a threshold in at least k patients.
+
+    Served by the per-partition fold_change indexes of expression_long, so the
+    cost follows the number of regulated transcripts, not patients x
+    transcripts.
+
+    Args:
+        db_manager: Database manager instance
+        fold_change_threshold: Fold change threshold (> 1.0)
+        min_patients: Minimum number of patients a gene must be regulated in
+        direction: 'up' (fold change > threshold) or 'down' (< 1/threshold)
+        patient_ids: Restrict the cohort to these patients (default: all)
+
+    Returns:
+        List of dicts with gene_id, gene_symbol, patient_count, patient_ids and
+        the most extreme fold change, most recurrent genes first
+
+    Raises:
+        ValueError: If direction or threshold are invalid
+    """
+    if direction not in ("up", "down"):
+        raise ValueError(f"direction must be 'up' or 'down', got {direction!r}")
+    if fold_change_threshold <= 1.0:
+        raise ValueError("fold_change_threshold must be greater than 1.0")
+
+    if direction == "up":
+        condition = "e.fold_change > %(threshold)s"
+        extreme = "MAX(e.fold_change)"
+        threshold = fold_change_threshold
+    else:
+        condition = "e.fold_change < %(threshold)s"
+        extreme = "MIN(e.fold_change)"
+        threshold = 1.0 / fold_change_threshold
+
+    params: Dict[str, Any] = {"threshold": threshold, "min_patients": min_patients}
+    if patient_ids is not None:
+        condition += " AND e.patient_id = ANY(%(patient_ids)s)"
+        params["patient_ids"] = [get_cohort_patient_id(p) for p in patient_ids]
+
+    # Ensure database connection
+    if not db_manager.cursor:
+        db_manager.connect()
+    cursor = db_manager.cursor
+
+    cursor.execute(
+        f"""
+        SELECT
+            g.gene_id,
+            g.gene_symbol,
+            COUNT(DISTINCT e.patient_id) AS patient_count,
+            ARRAY_AGG(DISTINCT e.patient_id) AS patient_ids,
+            {extreme} AS extreme_fold_change
+        FROM {COHORT_TABLE} e
+        JOIN public.transcripts t ON t.transcript_id = e.transcript_id
+        JOIN public.genes g ON g.gene_id = t.gene_id
+        WHERE {condition}
+        GROUP BY g.gene_id, g.gene_symbol
+        HAVING COUNT(DISTINCT e.patient_id) >= %(min_patients)s
+        ORDER BY patient_count DESC, g.gene_symbol;
+    """,
+        params,
+    )
+
+    return [
+        {
+            "gene_id": gene_id,
+            "gene_symbol": gene_symbol,
+            "patient_count": patient_count,
+            "patient_ids": sorted(patients),
+            "extreme_fold_change": float(fold_change),
+        }
+        for gene_id, gene_symbol, patient_count, patients, fold_change in (
+            cursor.fetchall()
+        )
+    ]
@@ -0,0 +1,158 @@
+-- =============================================================================
+-- Migration v1.0.1: Hash-partition gene_publications
+-- =============================================================================
+-- Purpose: Bring v1.0.0_baseline databases to the partitioned
+--          gene_publications layout of the current baseline schema
+-- Rollback: v1.0.1_partition_gene_publications_rollback.sql
+--
+-- Changes:
+-- 1. gene_publications becomes PARTITION BY HASH (gene_id) with 16 partitions
+--    (gene_publications_p00..p15) and PRIMARY KEY (gene_id, pmid); id becomes
+--    BIGSERIAL. All rows are copied, keeping their ids.
+-- 2. Indexes follow the baseline: pmid INCLUDE (gene_id), covering
+--    (gene_id, mention_count) index, BRIN on last_updated. The separate
+--    gene_id index is dropped (the primary key serves gene_id lookups).
+-- 3. gene_literature_summary and publication_coverage, which read
+--    gene_publications, are recreated from their current definitions.
+--
+-- Databases that already have the partitioned table (created from the current
+-- baseline) are left unchanged. The copy rewrites the whole table: run it in a
+-- maintenance window and expect it to take roughly as long as a PubTator load.
+--
+-- Apply:
+--   psql -h localhost -p 5435 -U mbase_user -d mbase \
+--        -f src/db/migrations/v1.0.1_partition_gene_publications.sql
+-- =============================================================================
+
+BEGIN;
+
+DO $$
+DECLARE
+    summary_def TEXT;
+    summary_indexes TEXT[];
+    coverage_def TEXT;
+    coverage_comment TEXT;
+    index_def TEXT;
+    col RECORD;
+    i INTEGER;
+BEGIN
+    IF (SELECT relkind FROM pg_class
+        WHERE oid = 'public.gene_publications'::regclass) = 'p' THEN
+        RAISE NOTICE 'gene_publications is already partitioned, nothing to do';
+        RETURN;
+    END IF;
+
+    -- Views reading gene_publications are rebuilt on the new table
+    summary_def := pg_get_viewdef('public.gene_literature_summary'::regclass);
+    SELECT array_agg(indexdef) INTO summary_indexes
+    FROM pg_indexes
+    WHERE schemaname = 'public' AND tablename = 'gene_literature_summary';
+    coverage_def := pg_get_viewdef('public.publication_coverage'::regclass);
+    coverage_comment := obj_description('public.publication_coverage'::regclass, 'pg_class');
+
+    DROP VIEW publication_coverage;
+    DROP MATERIALIZED VIEW gene_literature_summary;
+
+    -- Move the old table and the names the new one needs out of the way
+    ALTER TABLE gene_publications RENAME TO gene_publications_v1_0_0;
+    ALTER TABLE gene_publications_v1_0_0
+        RENAME CONSTRAINT gene_publications_pkey TO gene_publications_v1_0_0_pkey;
+    EXECUTE format(
+        'ALTER SEQUENCE %s RENAME TO gene_publications_v1_0_0_id_seq',
+        pg_get_serial_sequence('gene_publications_v1_0_0', 'id')
+    );
+
+    CREATE TABLE gene_publications (
+        id BIGSERIAL,
+        gene_id VARCHAR(50) NOT NULL REFERENCES genes(gene_id) ON DELETE CASCADE,
+        pmid VARCHAR(20) NOT NULL,
+        mention_count INTEGER DEFAULT 1,
+        first_seen_year INTEGER,
+        created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+        last_updated TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+        PRIMARY KEY (gene_id, pmid)
+    ) PARTITION BY HASH (gene_id);
+
+    FOR i IN 0..15 LOOP
+        EXECUTE format(
+            'CREATE TABLE gene_publications_p%s PARTITION OF gene_publications
+             FOR VALUES WITH (MODULUS 16, REMAINDER %s)',
+            lpad(i::text, 2, '0'), i
+        );
+    END LOOP;
+
+    -- Copy before building the secondary indexes
+    INSERT INTO gene_publications (
+        id, gene_id, pmid, mention_count, first_seen_year, created_at, last_updated
+    )
+    SELECT id, gene_id, pmid, mention_count, first_seen_year, created_at, last_updated
+    FROM gene_publications_v1_0_0
+    ORDER BY last_updated;
+
+    PERFORM setval(
+        pg_get_serial_sequence('gene_publications', 'id'),
+        COALESCE((SELECT MAX(id) FROM gene_publications), 0) + 1,
+        false
+    );
+
+    -- Keep the table and column documentation
+    EXECUTE format(
+        'COMMENT ON TABLE gene_publications IS %L',
+        obj_description('gene_publications_v1_0_0'::regclass, 'pg_class')
+            || E'\n\nStorage: hash-partitioned by gene_id into 16 partitions'
+            || E' (gene_publications_p00..p15).\nAlways filter or join on gene_id'
+            || ' so the planner prunes to a single partition.'
+    );
+    FOR col IN
+        SELECT attname, col_description(attrelid, attnum) AS description
+        FROM pg_attribute
+        WHERE attrelid = 'gene_publications_v1_0_0'::regclass
+          AND attnum > 0
+          AND NOT attisdropped
+          AND col_description(attrelid, attnum) IS NOT NULL
+    LOOP
+        EXECUTE format(
+            'COMMENT ON COLUMN gene_publications.%I IS %L', col.attname, col.description
+        );
+    END LOOP;
+
+    DROP TABLE gene_publications_v1_0_0;
+
+    CREATE INDEX idx_gene_publications_pmid
+        ON gene_publications(pmid) INCLUDE (gene_id);
+    CREATE INDEX idx_gene_publications_mention_count
+        ON gene_publications(mention_count DESC);
+    CREATE INDEX idx_gene_publications_year
+        ON gene_publications(first_seen_year DESC) WHERE first_seen_year IS NOT NULL;
+    CREATE INDEX idx_gene_publications_gene_mentions
+        ON gene_publications(gene_id, mention_count DESC)
+        INCLUDE (pmid, first_seen_year);
+    CREATE INDEX idx_gene_publications_last_updated_brin
+        ON gene_publications USING BRIN(last_updated);
+
+    EXECUTE 'CREATE MATERIALIZED VIEW gene_literature_summary AS ' || summary_def;
+    FOREACH index_def IN ARRAY COALESCE(summary_indexes, '{}') LOOP
+        EXECUTE index_def;
+    END LOOP;
+    EXECUTE 'CREATE VIEW publication_coverage AS ' || coverage_def;
+    EXECUTE format('COMMENT ON VIEW publication_coverage IS %L', coverage_comment);
+END $$;
+
+ANALYZE gene_publications;
+
+INSERT INTO schema_version (version_name, description)
+VALUES ('v1.0.1', 'Hash-partitioned gene_publications (16 partitions by gene_id)')
+ON CONFLICT (version_name) DO NOTHING;
+
+COMMIT;
+
+-- =============================================================================
+-- Verification queries (run manually after migration)
+-- =============================================================================
+
+-- Partitions and their row counts:
+-- SELECT tableoid::regclass AS partition, COUNT(*)
+-- FROM gene_publications GROUP BY 1 ORDER BY 1;
+
+-- Per-gene lookups prune to one partition:
+-- EXPLAIN SELECT pmid FROM gene_publications WHERE gene_id = 'ENSG00000141510';
@@ -0,0 +1,115 @@
+-- =============================================================================
+-- Rollback of migration v1.0.1: Hash-partition gene_publications
+-- =============================================================================
+-- Purpose: Restore the unpartitioned v1.0.0_baseline gene_publications table
+--          (SERIAL id primary key, UNIQUE (gene_id, pmid)) with all rows
+--
+-- Apply:
+--   psql -h localhost -p 5435 -U mbase_user -d mbase \
+--        -f src/db/migrations/v1.0.1_partition_gene_publications_rollback.sql
+-- =============================================================================
+
+BEGIN;
+
+DO $$
+DECLARE
+    summary_def TEXT;
+    summary_indexes TEXT[];
+    coverage_def TEXT;
+    coverage_comment TEXT;
+    index_def TEXT;
+    col RECORD;
+BEGIN
+    IF (SELECT relkind FROM pg_class
+        WHERE oid = 'public.gene_publications'::regclass) <> 'p' THEN
+        RAISE NOTICE 'gene_publications is not partitioned, nothing to do';
+        RETURN;
+    END IF;
+
+    summary_def := pg_get_viewdef('public.gene_literature_summary'::regclass);
+    SELECT array_agg(indexdef) INTO summary_indexes
+    FROM pg_indexes
+    WHERE schemaname = 'public' AND tablename = 'gene_literature_summary';
+    coverage_def := pg_get_viewdef('public.publication_coverage'::regclass);
+    coverage_comment := obj_description('public.publication_coverage'::regclass, 'pg_class');
+
+    DROP VIEW publication_coverage;
+    DROP MATERIALIZED VIEW gene_literature_summary;
+
+    ALTER TABLE gene_publications RENAME TO gene_publications_partitioned;
+    ALTER TABLE gene_publications_partitioned
+        RENAME CONSTRAINT gene_publications_pkey TO gene_publications_partitioned_pkey;
+    EXECUTE format(
+        'ALTER SEQUENCE %s RENAME TO gene_publications_partitioned_id_seq',
+        pg_get_serial_sequence('gene_publications_partitioned', 'id')
+    );
+
+    CREATE TABLE gene_publications (
+        id SERIAL PRIMARY KEY,
+        gene_id VARCHAR(50) NOT NULL REFERENCES genes(gene_id) ON DELETE CASCADE,
+        pmid VARCHAR(20) NOT NULL,
+        mention_count INTEGER DEFAULT 1,
+        first_seen_year INTEGER,
+        created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+        last_updated TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+        UNIQUE (gene_id, pmid)
+    );
+
+    -- ids fit the SERIAL column unless more than 2^31 rows were ever loaded
+    INSERT INTO gene_publications (
+        id, gene_id, pmid, mention_count, first_seen_year, created_at, last_updated
+    )
+    SELECT id, gene_id, pmid, mention_count, first_seen_year, created_at, last_updated
+    FROM gene_publications_partitioned;
+
+    PERFORM setval(
+        pg_get_serial_sequence('gene_publications', 'id'),
+        COALESCE((SELECT MAX(id) FROM gene_publications), 0) + 1,
+        false
+    );
+
+    EXECUTE format(
+        'COMMENT ON TABLE gene_publications IS %L',
+        regexp_replace(
+            obj_description('gene_publications_partitioned'::regclass, 'pg_class'),
+            E'\n\nStorage: hash-partitioned by gene_id.*$', ''
+        )
+    );
+    FOR col IN
+        SELECT attname, col_description(attrelid, attnum) AS description
+        FROM pg_attribute
+        WHERE attrelid = 'gene_publications_partitioned'::regclass
+          AND attnum > 0
+          AND NOT attisdropped
+          AND col_description(attrelid, attnum) IS NOT NULL
+    LOOP
+        EXECUTE format(
+            'COMMENT ON COLUMN gene_publications.%I IS %L', col.attname, col.description
+        );
+    END LOOP;
+
+    -- Drops the partitions as well
+    DROP TABLE gene_publications_partitioned;
+
+    CREATE INDEX idx_gene_publications_gene_id ON gene_publications(gene_id);
+    CREATE INDEX idx_gene_publications_pmid ON gene_publications(pmid);
+    CREATE INDEX idx_gene_publications_mention_count
+        ON gene_publications(mention_count DESC);
+    CREATE INDEX idx_gene_publications_year
+        ON gene_publications(first_seen_year DESC) WHERE first_seen_year IS NOT NULL;
+    CREATE INDEX idx_gene_publications_gene_mentions
+        ON gene_publications(gene_id, mention_count DESC);
+
+    EXECUTE 'CREATE MATERIALIZED VIEW gene_literature_summary AS ' || summary_def;
+    FOREACH index_def IN ARRAY COALESCE(summary_indexes, '{}') LOOP
+        EXECUTE index_def;
+    END LOOP;
+    EXECUTE 'CREATE VIEW publication_coverage AS ' || coverage_def;
+    EXECUTE format('COMMENT ON VIEW publication_coverage IS %L', coverage_comment);
+END $$;
+
+ANALYZE gene_publications;
+
+DELETE FROM schema_version WHERE version_name = 'v1.0.1';
+
+COMMIT;
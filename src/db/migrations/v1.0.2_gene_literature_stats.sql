@@ -0,0 +1,86 @@
+-- =============================================================================
+-- Migration v1.0.2: gene_literature_stats rollup
+-- =============================================================================
+-- Purpose: Add the per-gene literature rollup of the current baseline schema
+--          to v1.0.0_baseline databases and fill it from gene_publications
+-- Rollback: v1.0.2_gene_literature_stats_rollback.sql
+--
+-- The PubTator loader refreshes the rollup for every gene it writes and the
+-- API reads it, so both fail on databases without the table.
+--
+-- Apply:
+--   psql -h localhost -p 5435 -U mbase_user -d mbase \
+--        -f src/db/migrations/v1.0.2_gene_literature_stats.sql
+-- =============================================================================
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS gene_literature_stats (
+    gene_id VARCHAR(50) PRIMARY KEY REFERENCES genes(gene_id) ON DELETE CASCADE,
+    publication_count INTEGER NOT NULL DEFAULT 0,
+    total_mentions BIGINT NOT NULL DEFAULT 0,
+    first_year INTEGER,
+    last_year INTEGER,
+    evidence_tier TEXT GENERATED ALWAYS AS (
+        CASE
+            WHEN publication_count >= 100000 THEN 'Extensively studied'
+            WHEN publication_count >= 10000 THEN 'Well-studied'
+            WHEN publication_count >= 1000 THEN 'Moderate evidence'
+            ELSE 'Limited publications'
+        END
+    ) STORED,
+    last_updated TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+);
+
+COMMENT ON TABLE gene_literature_stats IS
+'Precomputed per-gene literature statistics derived from gene_publications.
+One row per gene with at least one publication. Updated by the PubTator ETL for
+every gene it loads, so queries never need COUNT(*) ... GROUP BY gene_id over
+the 47M-row gene_publications table.
+
+Evidence tiers (by publication_count):
+- Extensively studied: >= 100,000
+- Well-studied: >= 10,000
+- Moderate evidence: >= 1,000
+- Limited publications: < 1,000
+
+Example: LEFT JOIN gene_literature_stats gls ON g.gene_id = gls.gene_id';
+
+COMMENT ON COLUMN gene_literature_stats.publication_count IS 'Number of distinct PMIDs mentioning the gene';
+COMMENT ON COLUMN gene_literature_stats.total_mentions IS 'Sum of mention_count over all publications of the gene';
+COMMENT ON COLUMN gene_literature_stats.first_year IS 'Earliest first_seen_year (NULL until publication years are populated)';
+COMMENT ON COLUMN gene_literature_stats.last_year IS 'Latest first_seen_year (NULL until publication years are populated)';
+COMMENT ON COLUMN gene_literature_stats.evidence_tier IS 'Evidence strength category derived from publication_count';
+
+CREATE INDEX IF NOT EXISTS idx_gene_literature_stats_pub_count ON gene_literature_stats(publication_count DESC);
+CREATE INDEX IF NOT EXISTS idx_gene_literature_stats_tier ON gene_literature_stats(evidence_tier);
+
+-- Backfill from the publications already loaded (one pass over gene_publications)
+INSERT INTO gene_literature_stats (
+    gene_id, publication_count, total_mentions, first_year, last_year
+)
+SELECT
+    gene_id,
+    COUNT(*),
+    COALESCE(SUM(mention_count), 0),
+    MIN(first_seen_year),
+    MAX(first_seen_year)
+FROM gene_publications
+GROUP BY gene_id
+ON CONFLICT (gene_id) DO NOTHING;
+
+ANALYZE gene_literature_stats;
+
+INSERT INTO schema_version (version_name, description)
+VALUES ('v1.0.2', 'gene_literature_stats per-gene literature rollup')
+ON CONFLICT (version_name) DO NOTHING;
+
+COMMIT;
+
+-- =============================================================================
+-- Verification queries (run manually after migration)
+-- =============================================================================
+
+-- Every gene with publications has a rollup row:
+-- SELECT COUNT(DISTINCT gene_id) FROM gene_publications;
+-- SELECT COUNT(*) FROM gene_literature_stats;
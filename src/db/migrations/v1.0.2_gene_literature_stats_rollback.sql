@@ -0,0 +1,17 @@
+-- =============================================================================
+-- Rollback of migration v1.0.2: gene_literature_stats rollup
+-- =============================================================================
+-- The rollup is derived from gene_publications; dropping it loses no data.
+--
+-- Apply:
+--   psql -h localhost -p 5435 -U mbase_user -d mbase \
+--        -f src/db/migrations/v1.0.2_gene_literature_stats_rollback.sql
+-- =============================================================================
+
+BEGIN;
+
+DROP TABLE IF EXISTS gene_literature_stats;
+
+DELETE FROM schema_version WHERE version_name = 'v1.0.2';
+
+COMMIT;
@@ -0,0 +1,51 @@
+-- =============================================================================
+-- Migration v1.0.3: clinical_trials and gene_clinical_trials
+-- =============================================================================
+-- Purpose: Add the ClinicalTrials.gov tables of the current baseline schema to
+--          v1.0.0_baseline databases
+-- Rollback: v1.0.3_clinical_trials_rollback.sql
+--
+-- The tables start empty until ClinicalTrialsProcessor.run() loads them.
+--
+-- Apply:
+--   psql -h localhost -p 5435 -U mbase_user -d mbase \
+--        -f src/db/migrations/v1.0.3_clinical_trials.sql
+-- =============================================================================
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS clinical_trials (
+    nct_id VARCHAR(20) PRIMARY KEY,  -- NCTxxxxxxxx
+    title TEXT,
+    official_title TEXT,
+    phase VARCHAR(50),  -- Normalized: Phase 1, Phase 1/2, ..., Not Applicable
+    status VARCHAR(50),  -- COMPLETED, RECRUITING, ...
+    conditions TEXT[],
+    interventions JSONB DEFAULT '[]'::jsonb,
+    start_date VARCHAR(20),  -- YYYY, YYYY-MM or YYYY-MM-DD as published
+    completion_date VARCHAR(20),
+    lead_sponsor TEXT,
+    url TEXT,
+    last_updated TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS gene_clinical_trials (
+    gene_id VARCHAR(50) NOT NULL REFERENCES genes(gene_id) ON DELETE CASCADE,
+    nct_id VARCHAR(20) NOT NULL REFERENCES clinical_trials(nct_id) ON DELETE CASCADE,
+    match_source VARCHAR(20) DEFAULT 'search',  -- search (API query) or dump (bulk export)
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (gene_id, nct_id)
+);
+
+COMMENT ON TABLE clinical_trials IS 'ClinicalTrials.gov studies (cancer-related by default), one row per NCT ID';
+COMMENT ON TABLE gene_clinical_trials IS 'Gene-trial links: genes mentioned in trial titles, conditions, keywords or interventions';
+
+CREATE INDEX IF NOT EXISTS idx_clinical_trials_phase ON clinical_trials(phase);
+CREATE INDEX IF NOT EXISTS idx_clinical_trials_status ON clinical_trials(status);
+CREATE INDEX IF NOT EXISTS idx_gene_clinical_trials_nct ON gene_clinical_trials(nct_id);
+
+INSERT INTO schema_version (version_name, description)
+VALUES ('v1.0.3', 'clinical_trials and gene_clinical_trials tables')
+ON CONFLICT (version_name) DO NOTHING;
+
+COMMIT;
@@ -0,0 +1,19 @@
+-- =============================================================================
+-- Rollback of migration v1.0.3: clinical_trials and gene_clinical_trials
+-- =============================================================================
+-- Drops the loaded trials; running ClinicalTrialsProcessor again after
+-- re-applying v1.0.3 restores them (cached trial documents make this cheap).
+--
+-- Apply:
+--   psql -h localhost -p 5435 -U mbase_user -d mbase \
+--        -f src/db/migrations/v1.0.3_clinical_trials_rollback.sql
+-- =============================================================================
+
+BEGIN;
+
+DROP TABLE IF EXISTS gene_clinical_trials;
+DROP TABLE IF EXISTS clinical_trials;
+
+DELETE FROM schema_version WHERE version_name = 'v1.0.3';
+
+COMMIT;
@@ -0,0 +1,43 @@
+-- =============================================================================
+-- Migration v1.0.4: evidence_component_scores cache
+-- =============================================================================
+-- Purpose: Add the per-gene evidence component cache of the current baseline
+--          schema to v1.0.0_baseline databases
+-- Rollback: v1.0.4_evidence_component_scores_rollback.sql
+--
+-- The cache starts empty: the next evidence scoring run scores every gene and
+-- fills it; later runs rescore only genes whose inputs changed, and
+-- run_evidence_scoring.py --composite-only works from then on.
+--
+-- Apply:
+--   psql -h localhost -p 5435 -U mbase_user -d mbase \
+--        -f src/db/migrations/v1.0.4_evidence_component_scores.sql
+-- =============================================================================
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS evidence_component_scores (
+    gene_symbol TEXT PRIMARY KEY,
+    input_hash TEXT NOT NULL,  -- Scoring version + hash of the gene's feature counts
+    weights_hash TEXT,  -- Use-case weights of the gene's evidence_scoring_metadata rows
+    clinical FLOAT NOT NULL,
+    mechanistic FLOAT NOT NULL,
+    publication FLOAT NOT NULL,
+    genomic FLOAT NOT NULL,
+    safety FLOAT NOT NULL,
+    clinical_confidence FLOAT NOT NULL,
+    mechanistic_confidence FLOAT NOT NULL,
+    publication_confidence FLOAT NOT NULL,
+    genomic_confidence FLOAT NOT NULL,
+    safety_confidence FLOAT NOT NULL,
+    evidence_count INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+);
+
+COMMENT ON TABLE evidence_component_scores IS 'Cached per-gene evidence component scores; genes are rescored only when input_hash changes, and composites are recomputed from these rows when the use-case weights change';
+
+INSERT INTO schema_version (version_name, description)
+VALUES ('v1.0.4', 'evidence_component_scores incremental scoring cache')
+ON CONFLICT (version_name) DO NOTHING;
+
+COMMIT;
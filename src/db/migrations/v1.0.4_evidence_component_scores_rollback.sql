@@ -0,0 +1,18 @@
+-- =============================================================================
+-- Rollback of migration v1.0.4: evidence_component_scores cache
+-- =============================================================================
+-- The cache is derived from the evidence sources; evidence_scoring_metadata is
+-- left as is.
+--
+-- Apply:
+--   psql -h localhost -p 5435 -U mbase_user -d mbase \
+--        -f src/db/migrations/v1.0.4_evidence_component_scores_rollback.sql
+-- =============================================================================
+
+BEGIN;
+
+DROP TABLE IF EXISTS evidence_component_scores;
+
+DELETE FROM schema_version WHERE version_name = 'v1.0.4';
+
+COMMIT;
@@ -0,0 +1,62 @@
+-- =============================================================================
+-- Migration v1.0.5: expression_long cohort table
+-- =============================================================================
+-- Purpose: Add the cohort expression table of the current baseline schema and
+--          its refresh state to v1.0.0_baseline databases
+-- Rollback: v1.0.5_expression_long_rollback.sql
+--
+-- The per-patient partitions (patient_<ID>.expression_long) are not created
+-- here: refresh_cohort_expression() creates and fills them on its first run,
+-- since expression_long_patients starts empty.
+--
+-- Apply:
+--   psql -h localhost -p 5435 -U mbase_user -d mbase \
+--        -f src/db/migrations/v1.0.5_expression_long.sql
+-- =============================================================================
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS expression_long (
+    patient_id VARCHAR(100) NOT NULL,  -- Patient schema suffix (lowercase)
+    transcript_id VARCHAR(50) NOT NULL,
+    fold_change FLOAT NOT NULL,
+    PRIMARY KEY (patient_id, transcript_id),
+    CONSTRAINT check_expression_long_not_default CHECK (fold_change != 1.0)
+) PARTITION BY LIST (patient_id);
+
+COMMENT ON TABLE expression_long IS
+'Sparse fold changes of all patients in one table (patients x transcripts, long format).
+- One partition per patient: patient_<ID>.expression_long
+- Materialized copy of patient_<ID>.expression_data; refreshed per patient
+  when its data changes (refresh_cohort_expression)
+- Baseline fold_change = 1.0 is implicit for transcripts without a row
+
+Query pattern (genes > 2x in at least 3 patients):
+  SELECT g.gene_symbol, COUNT(DISTINCT e.patient_id) AS patients
+  FROM expression_long e
+  JOIN transcripts t ON t.transcript_id = e.transcript_id
+  JOIN genes g ON g.gene_id = t.gene_id
+  WHERE e.fold_change > 2.0
+  GROUP BY g.gene_symbol
+  HAVING COUNT(DISTINCT e.patient_id) >= 3;
+
+Filter on patient_id to read a single patient partition.';
+
+-- Indexes are created on the parent and inherited by every patient partition
+CREATE INDEX IF NOT EXISTS idx_expression_long_fold_change ON expression_long(fold_change) INCLUDE (transcript_id);
+CREATE INDEX IF NOT EXISTS idx_expression_long_transcript ON expression_long(transcript_id) INCLUDE (fold_change);
+
+CREATE TABLE IF NOT EXISTS expression_long_patients (
+    patient_id VARCHAR(100) PRIMARY KEY,
+    row_count INTEGER NOT NULL,  -- expression_data rows at the last refresh
+    source_updated_at TIMESTAMP WITH TIME ZONE,  -- MAX(expression_data.updated_at) at the last refresh
+    refreshed_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+);
+
+COMMENT ON TABLE expression_long_patients IS 'Refresh state of expression_long partitions; a patient is refreshed when the row count or latest updated_at of its expression_data differ';
+
+INSERT INTO schema_version (version_name, description)
+VALUES ('v1.0.5', 'expression_long cohort table and refresh state')
+ON CONFLICT (version_name) DO NOTHING;
+
+COMMIT;
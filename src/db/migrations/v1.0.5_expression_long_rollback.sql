@@ -0,0 +1,20 @@
+-- =============================================================================
+-- Rollback of migration v1.0.5: expression_long cohort table
+-- =============================================================================
+-- expression_long is a copy of the patient schemas' expression_data; dropping
+-- it also drops every patient_<ID>.expression_long partition, while the
+-- patients' expression_data is left as is.
+--
+-- Apply:
+--   psql -h localhost -p 5435 -U mbase_user -d mbase \
+--        -f src/db/migrations/v1.0.5_expression_long_rollback.sql
+-- =============================================================================
+
+BEGIN;
+
+DROP TABLE IF EXISTS expression_long;
+DROP TABLE IF EXISTS expression_long_patients;
+
+DELETE FROM schema_version WHERE version_name = 'v1.0.5';
+
+COMMIT;
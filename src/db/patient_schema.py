@@ -615,3 +615,80 @@ def get_patient_statistics(
 
     logger.debug(f"Statistics for {patient_id}: {stats}")
     return stats
+
+
+def get_expression_state(
+    patient_id: str, db_manager: DatabaseManager
+) -> Tuple[int, Optional[datetime]]:
+    """Get the row count and latest update time of a patient's expression data.
+
+    Inserts, updates and deletes change at least one of the two, so caches of
+    a patient's expression data compare it to decide whether to reload.
+
+    Args:
+        patient_id: Patient identifier
+        db_manager: Database manager instance
+
+    Returns:
+        Tuple of (row count, latest updated_at or None if empty)
+    """
+    schema_name = get_schema_name(patient_id)
+
+    # Ensure database connection
+    if not db_manager.cursor:
+        db_manager.connect()
+    cursor = db_manager.cursor
+    cursor.execute(
+        f"SELECT COUNT(*), MAX(updated_at) FROM {schema_name}.expression_data;"
+    )
+    row_count, updated_at = cursor.fetchone()
+    return row_count, updated_at
+
+
+def get_regulated_genes(
+    patient_id: str, db_manager: DatabaseManager, fold_change_threshold: float = 2.0
+) -> Dict[str, List[str]]:
+    """Get the up- and down-regulated genes of a patient.
+
+    A gene is up-regulated if any of its transcripts has a fold change above
+    the threshold and down-regulated if any is below its inverse. Only the
+    stored (non-baseline) transcripts are read.
+
+    Args:
+        patient_id: Patient identifier
+        db_manager: Database manager instance
+        fold_change_threshold: Fold change threshold (> 1.0)
+
+    Returns:
+        Dict with 'up' and 'down' lists of Ensembl gene IDs
+    """
+    schema_name = get_schema_name(patient_id)
+
+    # Ensure database connection
+    if not db_manager.cursor:
+        db_manager.connect()
+    cursor = db_manager.cursor
+
+    cursor.execute(
+        f"""
+        SELECT
+            t.gene_id,
+            MAX(e.expression_fold_change) AS max_fc,
+            MIN(e.expression_fold_change) AS min_fc
+        FROM {schema_name}.expression_data e
+        JOIN public.transcripts t ON t.transcript_id = e.transcript_id
+        GROUP BY t.gene_id
+        HAVING MAX(e.expression_fold_change) > %(up)s
+            OR MIN(e.expression_fold_change) < %(down)s
+        ORDER BY t.gene_id;
+    """,
+        {"up": fold_change_threshold, "down": 1.0 / fold_change_threshold},
+    )
+    rows = cursor.fetchall()
+
+    return {
+        "up": [gene for gene, max_fc, _ in rows if max_fc > fold_change_threshold],
+        "down": [
+            gene for gene, _, min_fc in rows if min_fc < 1.0 / fold_change_threshold
+        ],
+    }
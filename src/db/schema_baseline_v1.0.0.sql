@@ -292,21 +292,69 @@ CREATE INDEX idx_transcript_go_id ON transcript_go_terms(go_id);
 CREATE INDEX idx_transcript_go_category ON transcript_go_terms(go_category);
 CREATE INDEX idx_transcript_go_evidence ON transcript_go_terms(evidence_code);
 
+-- -----------------------------------------------------------------------------
+-- clinical_trials / gene_clinical_trials: ClinicalTrials.gov studies and
+-- the genes they mention (loaded by the clinical_trials ETL)
+-- -----------------------------------------------------------------------------
+CREATE TABLE clinical_trials (
+    nct_id VARCHAR(20) PRIMARY KEY,  -- NCTxxxxxxxx
+    title TEXT,
+    official_title TEXT,
+    phase VARCHAR(50),  -- Normalized: Phase 1, Phase 1/2, ..., Not Applicable
+    status VARCHAR(50),  -- COMPLETED, RECRUITING, ...
+    conditions TEXT[],
+    interventions JSONB DEFAULT '[]'::jsonb,
+    start_date VARCHAR(20),  -- YYYY, YYYY-MM or YYYY-MM-DD as published
+    completion_date VARCHAR(20),
+    lead_sponsor TEXT,
+    url TEXT,
+    last_updated TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE gene_clinical_trials (
+    gene_id VARCHAR(50) NOT NULL REFERENCES genes(gene_id) ON DELETE CASCADE,
+    nct_id VARCHAR(20) NOT NULL REFERENCES clinical_trials(nct_id) ON DELETE CASCADE,
+    match_source VARCHAR(20) DEFAULT 'search',  -- search (API query) or dump (bulk export)
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (gene_id, nct_id)
+);
+
+COMMENT ON TABLE clinical_trials IS 'ClinicalTrials.gov studies (cancer-related by default), one row per NCT ID';
+COMMENT ON TABLE gene_clinical_trials IS 'Gene-trial links: genes mentioned in trial titles, conditions, keywords or interventions';
+
+CREATE INDEX idx_clinical_trials_phase ON clinical_trials(phase);
+CREATE INDEX idx_clinical_trials_status ON clinical_trials(status);
+CREATE INDEX idx_gene_clinical_trials_nct ON gene_clinical_trials(nct_id);
+
 -- ============================================================================
 -- PART 5: PubTator Central Integration (v0.5.0)
 -- ============================================================================
 
 -- Create gene_publications table for literature associations
+-- Hash-partitioned by gene_id: per-gene literature lookups touch exactly one
+-- partition, and the PubTator loader writes partitions in parallel.
 CREATE TABLE gene_publications (
-    id SERIAL PRIMARY KEY,
+    id BIGSERIAL,
     gene_id VARCHAR(50) NOT NULL REFERENCES genes(gene_id) ON DELETE CASCADE,
     pmid VARCHAR(20) NOT NULL,
     mention_count INTEGER DEFAULT 1,
     first_seen_year INTEGER,
     created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
     last_updated TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
-    UNIQUE (gene_id, pmid)
-);
+    PRIMARY KEY (gene_id, pmid)
+) PARTITION BY HASH (gene_id);
+
+-- 16 hash partitions (~3M rows each at 47M associations)
+DO $$
+BEGIN
+    FOR i IN 0..15 LOOP
+        EXECUTE format(
+            'CREATE TABLE gene_publications_p%s PARTITION OF gene_publications
+             FOR VALUES WITH (MODULUS 16, REMAINDER %s)',
+            lpad(i::text, 2, '0'), i
+        );
+    END LOOP;
+END $$;
 
 COMMENT ON TABLE gene_publications IS
 'Gene-publication associations from PubTator Central (NCBI).
@@ -328,6 +376,9 @@ Example Queries:
 3. "Which of my upregulated genes have the most research literature?"
 4. "Find papers linking TP53 mutations to treatment response"
 
+Storage: hash-partitioned by gene_id into 16 partitions (gene_publications_p00..p15).
+Always filter or join on gene_id so the planner prunes to a single partition.
+
 Schema v1.0.0_baseline';
 
 COMMENT ON COLUMN gene_publications.gene_id IS
@@ -353,12 +404,58 @@ COMMENT ON COLUMN gene_publications.last_updated IS
 'Timestamp of last data refresh.
 PubTator Central is updated monthly - track when this record was last synchronized.';
 
--- Indexes for gene_publications
-CREATE INDEX idx_gene_publications_gene_id ON gene_publications(gene_id);
-CREATE INDEX idx_gene_publications_pmid ON gene_publications(pmid);
+-- Indexes for gene_publications (created on the parent, inherited by every partition)
+-- The (gene_id, pmid) primary key already serves gene_id lookups and index-only
+-- COUNT(DISTINCT pmid) per gene, so no separate gene_id index is needed.
+CREATE INDEX idx_gene_publications_pmid ON gene_publications(pmid) INCLUDE (gene_id);
 CREATE INDEX idx_gene_publications_mention_count ON gene_publications(mention_count DESC);
 CREATE INDEX idx_gene_publications_year ON gene_publications(first_seen_year DESC) WHERE first_seen_year IS NOT NULL;
-CREATE INDEX idx_gene_publications_gene_mentions ON gene_publications(gene_id, mention_count DESC);
+-- Covering index: top papers / mention totals per gene without heap fetches
+CREATE INDEX idx_gene_publications_gene_mentions ON gene_publications(gene_id, mention_count DESC)
+    INCLUDE (pmid, first_seen_year);
+-- BRIN: last_updated follows load order, so a tiny BRIN index serves refresh-window scans
+CREATE INDEX idx_gene_publications_last_updated_brin ON gene_publications USING BRIN(last_updated);
+
+-- Per-gene literature rollup, maintained incrementally by the PubTator ETL
+CREATE TABLE gene_literature_stats (
+    gene_id VARCHAR(50) PRIMARY KEY REFERENCES genes(gene_id) ON DELETE CASCADE,
+    publication_count INTEGER NOT NULL DEFAULT 0,
+    total_mentions BIGINT NOT NULL DEFAULT 0,
+    first_year INTEGER,
+    last_year INTEGER,
+    evidence_tier TEXT GENERATED ALWAYS AS (
+        CASE
+            WHEN publication_count >= 100000 THEN 'Extensively studied'
+            WHEN publication_count >= 10000 THEN 'Well-studied'
+            WHEN publication_count >= 1000 THEN 'Moderate evidence'
+            ELSE 'Limited publications'
+        END
+    ) STORED,
+    last_updated TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+);
+
+COMMENT ON TABLE gene_literature_stats IS
+'Precomputed per-gene literature statistics derived from gene_publications.
+One row per gene with at least one publication. Updated by the PubTator ETL for
+every gene it loads, so queries never need COUNT(*) ... GROUP BY gene_id over
+the 47M-row gene_publications table.
+
+Evidence tiers (by publication_count):
+- Extensively studied: >= 100,000
+- Well-studied: >= 10,000
+- Moderate evidence: >= 1,000
+- Limited publications: < 1,000
+
+Example: LEFT JOIN gene_literature_stats gls ON g.gene_id = gls.gene_id';
+
+COMMENT ON COLUMN gene_literature_stats.publication_count IS 'Number of distinct PMIDs mentioning the gene';
+COMMENT ON COLUMN gene_literature_stats.total_mentions IS 'Sum of mention_count over all publications of the gene';
+COMMENT ON COLUMN gene_literature_stats.first_year IS 'Earliest first_seen_year (NULL until publication years are populated)';
+COMMENT ON COLUMN gene_literature_stats.last_year IS 'Latest first_seen_year (NULL until publication years are populated)';
+COMMENT ON COLUMN gene_literature_stats.evidence_tier IS 'Evidence strength category derived from publication_count';
+
+CREATE INDEX idx_gene_literature_stats_pub_count ON gene_literature_stats(publication_count DESC);
+CREATE INDEX idx_gene_literature_stats_tier ON gene_literature_stats(evidence_tier);
 
 -- ============================================================================
 -- PART 6: Open Targets Platform Integration (v0.5.0)
@@ -796,6 +893,79 @@ CREATE INDEX idx_evidence_scoring_quality ON evidence_scoring_metadata(evidence_
 CREATE INDEX idx_evidence_scoring_updated ON evidence_scoring_metadata(last_updated);
 CREATE INDEX idx_evidence_scoring_jsonb ON evidence_scoring_metadata USING GIN(evidence_score);
 
+-- -----------------------------------------------------------------------------
+-- evidence_component_scores: Per-gene component scores cached by the
+-- evidence_scoring ETL, keyed by a hash of the gene's scoring inputs
+-- -----------------------------------------------------------------------------
+CREATE TABLE evidence_component_scores (
+    gene_symbol TEXT PRIMARY KEY,
+    input_hash TEXT NOT NULL,  -- Scoring version + hash of the gene's feature counts
+    weights_hash TEXT,  -- Use-case weights of the gene's evidence_scoring_metadata rows
+    clinical FLOAT NOT NULL,
+    mechanistic FLOAT NOT NULL,
+    publication FLOAT NOT NULL,
+    genomic FLOAT NOT NULL,
+    safety FLOAT NOT NULL,
+    clinical_confidence FLOAT NOT NULL,
+    mechanistic_confidence FLOAT NOT NULL,
+    publication_confidence FLOAT NOT NULL,
+    genomic_confidence FLOAT NOT NULL,
+    safety_confidence FLOAT NOT NULL,
+    evidence_count INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+);
+
+COMMENT ON TABLE evidence_component_scores IS 'Cached per-gene evidence component scores; genes are rescored only when input_hash changes, and composites are recomputed from these rows when the use-case weights change';
+
+-- -----------------------------------------------------------------------------
+-- expression_long: Cohort-level copy of every patient schema's sparse
+-- expression_data, list-partitioned by patient_id (maintained by
+-- src/db/cohort_expression.py)
+-- -----------------------------------------------------------------------------
+-- Partitions are created on first refresh inside the patient schema
+-- (patient_<ID>.expression_long), so dropping a patient schema drops its rows.
+CREATE TABLE expression_long (
+    patient_id VARCHAR(100) NOT NULL,  -- Patient schema suffix (lowercase)
+    transcript_id VARCHAR(50) NOT NULL,
+    fold_change FLOAT NOT NULL,
+    PRIMARY KEY (patient_id, transcript_id),
+    CONSTRAINT check_expression_long_not_default CHECK (fold_change != 1.0)
+) PARTITION BY LIST (patient_id);
+
+COMMENT ON TABLE expression_long IS
+'Sparse fold changes of all patients in one table (patients x transcripts, long format).
+- One partition per patient: patient_<ID>.expression_long
+- Materialized copy of patient_<ID>.expression_data; refreshed per patient
+  when its data changes (refresh_cohort_expression)
+- Baseline fold_change = 1.0 is implicit for transcripts without a row
+
+Query pattern (genes > 2x in at least 3 patients):
+  SELECT g.gene_symbol, COUNT(DISTINCT e.patient_id) AS patients
+  FROM expression_long e
+  JOIN transcripts t ON t.transcript_id = e.transcript_id
+  JOIN genes g ON g.gene_id = t.gene_id
+  WHERE e.fold_change > 2.0
+  GROUP BY g.gene_symbol
+  HAVING COUNT(DISTINCT e.patient_id) >= 3;
+
+Filter on patient_id to read a single patient partition.';
+
+-- Indexes are created on the parent and inherited by every patient partition
+-- Threshold filters ("> 2x in >= k patients") as index-only range scans
+CREATE INDEX idx_expression_long_fold_change ON expression_long(fold_change) INCLUDE (transcript_id);
+-- One transcript across all patients
+CREATE INDEX idx_expression_long_transcript ON expression_long(transcript_id) INCLUDE (fold_change);
+
+-- Refresh state of each patient's expression_long partition
+CREATE TABLE expression_long_patients (
+    patient_id VARCHAR(100) PRIMARY KEY,
+    row_count INTEGER NOT NULL,  -- expression_data rows at the last refresh
+    source_updated_at TIMESTAMP WITH TIME ZONE,  -- MAX(expression_data.updated_at) at the last refresh
+    refreshed_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+);
+
+COMMENT ON TABLE expression_long_patients IS 'Refresh state of expression_long partitions; a patient is refreshed when the row count or latest updated_at of its expression_data differ';
+
 -- ============================================================================
 -- PART 9: Views (Query Convenience)
 -- ============================================================================
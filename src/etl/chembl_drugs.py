@@ -12,14 +12,14 @@ import os
 import shutil
 import tempfile
 import re
+import threading
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Set, Tuple, Union, Iterator
+from typing import Dict, List, Optional, Any, Set, Tuple, Iterable
 from datetime import datetime, timedelta
 
 # Third party imports
 import pandas as pd
 import numpy as np
-import requests
 from tqdm import tqdm
 from rich.console import Console
 from rich.table import Table
@@ -46,12 +46,15 @@ from ..utils.gene_matcher import (
     match_genes_bulk,
     get_gene_match_stats,
 )
+from ..utils.api_client import APIRequestError, CachedAPIClient
 from ..utils.logging import get_progress_bar, setup_logging
 from ..utils.progress import track_progress
 
 # Constants
 CHEMBL_VERSION = "35"
 CHEMBL_CACHE_TTL = 365 * 24 * 60 * 60  # 1 year in seconds
+CHEMBL_API_CACHE_TTL = 30 * 24 * 60 * 60  # 30 days in seconds
+CLINICAL_PHASE_BATCH_SIZE = 50  # genes per batched clinical-phase lookup
 CHEMBL_DB_DUMP_URL = f"https://ftp.ebi.ac.uk/pub/databases/chembl/ChEMBLdb/releases/chembl_{CHEMBL_VERSION}/chembl_{CHEMBL_VERSION}_postgresql.tar.gz"
 CHEMBL_MAPPING_URL = f"https://ftp.ebi.ac.uk/pub/databases/chembl/ChEMBLdb/latest/chembl_uniprot_mapping.txt"
 
@@ -63,6 +66,104 @@ TARGET_TYPES_OF_INTEREST = {
     "PROTEIN-PROTEIN INTERACTION",
 }
 
+# ChEMBL tables (and columns) streamed from the restored dump into the
+# ChEMBL schema as src_<table>; everything else in the dump is ignored
+CHEMBL_SOURCE_TABLES: Dict[str, List[str]] = {
+    "molecule_dictionary": [
+        "molregno",
+        "chembl_id",
+        "pref_name",
+        "max_phase",
+        "molecule_type",
+        "therapeutic_flag",
+    ],
+    "compound_structures": [
+        "molregno",
+        "canonical_smiles",
+        "standard_inchi",
+        "standard_inchi_key",
+    ],
+    "compound_properties": [
+        "molregno",
+        "mw_freebase",
+        "alogp",
+        "hba",
+        "hbd",
+        "psa",
+        "rtb",
+        "ro3_pass",
+        "num_ro5_violations",
+    ],
+    "target_dictionary": [
+        "tid",
+        "chembl_id",
+        "pref_name",
+        "target_type",
+        "organism",
+    ],
+    "target_components": ["tid", "component_id"],
+    "component_sequences": [
+        "component_id",
+        "accession",
+        "component_type",
+        "description",
+        "organism",
+    ],
+    "drug_mechanism": [
+        "mec_id",
+        "molregno",
+        "mechanism_of_action",
+        "action_type",
+        "tid",
+    ],
+    "drug_indication": [
+        "drugind_id",
+        "molregno",
+        "efo_id",
+        "mesh_id",
+        "max_phase_for_ind",
+    ],
+    "docs": ["doc_id", "pubmed_id", "doi", "title", "year", "journal"],
+    "molecule_synonyms": ["molregno", "synonyms"],
+}
+
+# pg_restore TOC entry types needed to COPY the source tables; indexes,
+# constraints, triggers, comments and ACLs are skipped
+RESTORE_ENTRY_TYPES = {"TABLE", "TABLE DATA"}
+RESTORE_SUPPORT_TYPES = {"SCHEMA", "TYPE", "DOMAIN", "EXTENSION"}
+
+
+def build_restore_list(toc: str, tables: Iterable[str]) -> str:
+    """Filter a ``pg_restore --list`` table of contents for selective restore.
+
+    Args:
+        toc: Output of ``pg_restore --list``
+        tables: Table names whose definition and data should be restored
+
+    Returns:
+        List file content for ``pg_restore --use-list``
+    """
+    wanted = set(tables)
+    kept = []
+    for line in toc.splitlines():
+        if not line.strip() or line.lstrip().startswith(";"):
+            continue
+        # "<dumpId>; <tableoid> <oid> <DESC...> <schema> <name> <owner>"
+        tokens = line.split()
+        if len(tokens) < 6:
+            continue
+        if tokens[3:5] == ["TABLE", "DATA"]:
+            entry_type, name = "TABLE DATA", tokens[6] if len(tokens) > 6 else ""
+        else:
+            entry_type, name = tokens[3], tokens[5]
+
+        if entry_type in RESTORE_ENTRY_TYPES and name in wanted:
+            kept.append(line)
+        elif entry_type in RESTORE_SUPPORT_TYPES and name != "public":
+            # public already exists in the freshly created temporary database
+            kept.append(line)
+    return "\n".join(kept) + "\n"
+
 
 class ChemblDrugProcessor(BaseProcessor):
     """Process drug data from ChEMBL and integrate with transcript data."""
@@ -85,6 +186,9 @@ class ChemblDrugProcessor(BaseProcessor):
 
         # Configuration options
         self.skip_scores = config.get("skip_scores", False)
+        self.restore_jobs = config.get(
+            "chembl_restore_jobs", config.get("max_workers", 4)
+        )
         self.force_download = config.get("force_download", False)
         self.use_temp_schema = config.get("use_temp_schema", True)
         self.chembl_schema = config.get("chembl_schema", "chembl_temp")
@@ -92,8 +196,6 @@ class ChemblDrugProcessor(BaseProcessor):
             "max_phase_cutoff", 0
         )  # 0 = include all, 1+ = only drugs with specified phase or higher
 
-        # Path to the extracted data files
-        self.extracted_dir = self.chembl_dir / "extracted"
         self.processed_dir = self.chembl_dir / "processed"
 
         # Enhanced ChEMBL API configuration for clinical data
@@ -103,9 +205,15 @@ class ChemblDrugProcessor(BaseProcessor):
         self.api_rate_limit = config.get("api_rate_limit", 0.2)  # 5 requests per second
         self.include_clinical_phases = config.get("include_clinical_phases", True)
         self.include_mechanisms = config.get("include_mechanisms", True)
+        self.api_client = CachedAPIClient(
+            self.chembl_api_base,
+            cache_dir=self.chembl_dir / "api_cache",
+            cache_ttl=config.get("chembl_api_cache_ttl", CHEMBL_API_CACHE_TTL),
+            rate_limit=self.api_rate_limit,
+            max_workers=config.get("max_workers", 4),
+        )
 
         # Create directories
-        self.extracted_dir.mkdir(exist_ok=True)
         self.processed_dir.mkdir(exist_ok=True)
 
         # Schema version tracking
@@ -227,7 +335,13 @@ class ChemblDrugProcessor(BaseProcessor):
             return False
 
     def _restore_dump_to_temp_db(self, dump_file: Path, temp_db_name: str) -> bool:
-        """Restore ChEMBL .dmp file to temporary database using pg_restore.
+        """Restore the ChEMBL tables we extract from the .dmp file using pg_restore.
+
+        Only the table definitions and data of CHEMBL_SOURCE_TABLES are restored
+        (via a filtered ``-L`` table-of-contents list); indexes, constraints,
+        triggers and the remaining ~70 tables are skipped because extraction
+        only performs full-table COPYs. Table data is loaded with ``-j`` parallel
+        jobs.
 
         Args:
             dump_file: Path to the .dmp file extracted from the archive
@@ -248,6 +362,18 @@ class ChemblDrugProcessor(BaseProcessor):
             env = os.environ.copy()
             env["PGPASSWORD"] = password
 
+            # Read the dump's table of contents and keep only what we extract
+            toc = subprocess.run(
+                ["pg_restore", "--list", str(dump_file)],
+                env=env,
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+            restore_list = build_restore_list(toc, CHEMBL_SOURCE_TABLES)
+            list_file = dump_file.with_suffix(".restore.list")
+            list_file.write_text(restore_list)
+
             # Use pg_restore with custom format
             restore_cmd = [
                 "pg_restore",
@@ -261,14 +387,17 @@ class ChemblDrugProcessor(BaseProcessor):
                 temp_db_name,
                 "--no-owner",
                 "--no-privileges",
-                "--clean",
-                "--if-exists",
-                "--verbose",
+                "--no-comments",
+                "--jobs",
+                str(self.restore_jobs),
+                "--use-list",
+                str(list_file),
                 str(dump_file),
             ]
 
             self.logger.info(
-                f"Restoring ChEMBL dump {dump_file} to {temp_db_name} (this may take several minutes)"
+                f"Restoring {len(CHEMBL_SOURCE_TABLES)} ChEMBL tables from {dump_file} "
+                f"to {temp_db_name} with {self.restore_jobs} jobs"
             )
 
             # Run pg_restore with progress indication
@@ -405,117 +534,29 @@ class ChemblDrugProcessor(BaseProcessor):
             self.logger.warning(f"Failed to drop temporary database: {e}")
             return False
 
-    def extract_chembl_dump(self, dump_file: Path) -> Path:
-        """Extract the necessary tables from the ChEMBL database dump using pg_restore.
+    def extract_chembl_dump(self, dump_file: Path) -> None:
+        """Stream the tables of interest from the ChEMBL dump into the ChEMBL schema.
 
-        ChEMBL v35 changed from SQL files to PostgreSQL custom dump format (.dmp).
-        This method creates a temporary database, restores the dump, queries the tables,
-        and saves the results as CSV files for further processing.
+        ChEMBL v35 ships a PostgreSQL custom dump (.dmp). This method restores it
+        into a temporary database and streams each table in CHEMBL_SOURCE_TABLES
+        with ``COPY ... TO STDOUT`` piped straight into ``COPY ... FROM STDIN``
+        on an unlogged ``src_<table>`` table in the ChEMBL schema, so rows are
+        never written to intermediate files.
 
         Args:
             dump_file: Path to the downloaded ChEMBL database dump (tar.gz containing .dmp)
 
-        Returns:
-            Path to the directory containing extracted table data (CSV files)
-
         Raises:
             ProcessingError: If extraction fails
         """
         try:
-            # Check if extraction has already been done
-            extraction_marker = self.extracted_dir / ".extraction_complete"
-            if extraction_marker.exists() and not self.force_download:
-                self.logger.info("Using previously extracted ChEMBL data.")
-                return self.extracted_dir
-
-            # Clear previous extraction if force_download is True
-            if self.force_download and self.extracted_dir.exists():
-                self.logger.info(
-                    f"Clearing previous extractions at {self.extracted_dir}"
-                )
-                for file in self.extracted_dir.glob("*.csv"):
-                    file.unlink()
-                for file in self.extracted_dir.glob("*.parquet"):
-                    file.unlink()
+            if self._source_tables_loaded() and not self.force_download:
+                self.logger.info("Using previously extracted ChEMBL source tables.")
+                return
 
             # Extract the tar.gz file to find the .dmp file
             self.logger.info(f"Extracting ChEMBL database dump from {dump_file}")
 
-            # Tables of interest for drug data extraction
-            tables_of_interest = {
-                "molecule_dictionary": [
-                    "molregno",
-                    "chembl_id",
-                    "pref_name",
-                    "max_phase",
-                    "molecule_type",
-                    "therapeutic_flag",
-                ],
-                "compound_structures": [
-                    "molregno",
-                    "canonical_smiles",
-                    "standard_inchi",
-                    "standard_inchi_key",
-                ],
-                "compound_properties": [
-                    "molregno",
-                    "mw_freebase",
-                    "alogp",
-                    "hba",
-                    "hbd",
-                    "psa",
-                    "rtb",
-                    "ro3_pass",
-                    "num_ro5_violations",
-                ],
-                "target_dictionary": [
-                    "tid",
-                    "chembl_id",
-                    "pref_name",
-                    "target_type",
-                    "organism",
-                ],
-                "target_components": ["tid", "component_id"],
-                "component_sequences": [
-                    "component_id",
-                    "accession",
-                    "component_type",
-                    "description",
-                    "organism",
-                ],
-                "drug_mechanism": [
-                    "mec_id",
-                    "molregno",
-                    "mechanism_of_action",
-                    "action_type",
-                    "tid",
-                ],
-                "drug_indication": [
-                    "drugind_id",
-                    "molregno",
-                    "efo_id",
-                    "mesh_id",
-                    "max_phase_for_ind",
-                ],
-                "activities": [
-                    "activity_id",
-                    "molregno",
-                    "toid",
-                    "standard_type",
-                    "standard_value",
-                    "standard_units",
-                ],
-                "docs": ["doc_id", "pubmed_id", "doi", "title", "year", "journal"],
-                "molecule_synonyms": ["molregno", "synonyms"],
-                "atc_classification": [
-                    "level1",
-                    "level2",
-                    "level3",
-                    "level4",
-                    "level5",
-                ],
-            }
-
             # Create a temporary directory for extraction
             with tempfile.TemporaryDirectory() as temp_dir:
                 # Extract the main archive first
@@ -554,54 +595,191 @@ class ChemblDrugProcessor(BaseProcessor):
                             "Failed to restore ChEMBL dump to temporary database"
                         )
 
-                    # Create target directory if it doesn't exist
-                    self.extracted_dir.mkdir(exist_ok=True, parents=True)
-
-                    # Extract each table from temporary database
                     self.logger.info(
-                        f"Extracting {len(tables_of_interest)} tables from temporary database"
+                        f"Streaming {len(CHEMBL_SOURCE_TABLES)} tables "
+                        "from temporary database"
                     )
 
-                    for table_name, columns in tables_of_interest.items():
-                        try:
-                            # Build query to extract table data
-                            column_list = ", ".join(columns) if columns else "*"
-                            query = f"SELECT {column_list} FROM {table_name}"
-
-                            # Query and save as CSV
-                            df = self._query_temp_database(temp_db_name, query)
-
-                            if df is not None and not df.empty:
-                                output_file = self.extracted_dir / f"{table_name}.csv"
-                                df.to_csv(output_file, index=False)
+                    temp_conn = self._connect_temp_database(temp_db_name)
+                    try:
+                        for table_name, columns in CHEMBL_SOURCE_TABLES.items():
+                            try:
+                                rows = self._stream_source_table(
+                                    temp_conn, table_name, columns
+                                )
                                 self.logger.info(
-                                    f"Extracted {table_name}: {len(df)} rows → {output_file}"
+                                    f"Extracted {table_name}: {rows} rows → "
+                                    f"{self._source_table(table_name)}"
                                 )
-                            else:
+                            except Exception as e:
+                                self.db_manager.conn.rollback()
+                                temp_conn.rollback()
                                 self.logger.warning(
-                                    f"Table {table_name} is empty or query failed"
+                                    f"Failed to extract {table_name}: {e}"
                                 )
-
-                        except Exception as e:
-                            self.logger.warning(f"Failed to extract {table_name}: {e}")
-                            continue
+                                continue
+                    finally:
+                        temp_conn.close()
 
                 finally:
                     # Clean up temporary database
                     self._drop_temp_database(temp_db_name)
 
-            # Create a marker file indicating extraction is complete
-            with open(extraction_marker, "w") as f:
-                f.write(f"Extraction completed at {datetime.now().isoformat()}\n")
-                f.write(f"ChEMBL version: {CHEMBL_VERSION}\n")
-                f.write(f"Extraction method: pg_restore to temporary database\n")
-
             self.logger.info(f"ChEMBL data extraction completed successfully")
-            return self.extracted_dir
 
         except Exception as e:
             raise ProcessingError(f"Failed to extract ChEMBL dump: {e}")
 
+    def _connect_temp_database(
+        self, temp_db_name: str
+    ) -> "psycopg2.extensions.connection":
+        """Open a connection to the temporary ChEMBL database.
+
+        Args:
+            temp_db_name: Name of the temporary database
+
+        Returns:
+            psycopg2 connection
+        """
+        return psycopg2.connect(
+            host=os.environ.get("MB_POSTGRES_HOST", "localhost"),
+            port=os.environ.get("MB_POSTGRES_PORT", "5432"),
+            user=os.environ.get("MB_POSTGRES_USER", "postgres"),
+            password=os.environ.get("MB_POSTGRES_PASSWORD", ""),
+            dbname=temp_db_name,
+        )
+
+    def _source_table(self, table_name: str) -> str:
+        """Qualified name of the streamed copy of a ChEMBL source table."""
+        return f"{self.chembl_schema}.src_{table_name}"
+
+    def _source_tables_loaded(self) -> bool:
+        """Check whether every ChEMBL source table is present in the ChEMBL schema."""
+        if not self.ensure_connection() or not self.db_manager.cursor:
+            return False
+        self.db_manager.cursor.execute(
+            """
+            SELECT COUNT(*) FROM information_schema.tables
+            WHERE table_schema = %s AND table_name = ANY(%s)
+            """,
+            (
+                self.chembl_schema,
+                [f"src_{table_name}" for table_name in CHEMBL_SOURCE_TABLES],
+            ),
+        )
+        result = self.db_manager.cursor.fetchone()
+        return bool(result) and result[0] == len(CHEMBL_SOURCE_TABLES)
+
+    def _stream_source_table(
+        self,
+        temp_conn: "psycopg2.extensions.connection",
+        table_name: str,
+        columns: List[str],
+    ) -> int:
+        """Copy selected columns of one table from the temporary database.
+
+        A producer thread runs ``COPY (SELECT ...) TO STDOUT`` on the temporary
+        database and writes into an OS pipe that the main connection consumes
+        with ``COPY ... FROM STDIN``. Column types are taken from the source
+        catalog (numeric columns become double precision for pandas).
+
+        Args:
+            temp_conn: Connection to the restored temporary database
+            table_name: ChEMBL table name
+            columns: Columns to copy
+
+        Returns:
+            Number of rows copied
+        """
+        with temp_conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT a.attname, format_type(a.atttypid, a.atttypmod)
+                FROM pg_attribute a
+                WHERE a.attrelid = to_regclass(%s)
+                  AND a.attnum > 0 AND NOT a.attisdropped
+                """,
+                (table_name,),
+            )
+            source_types = dict(cur.fetchall())
+
+        if not source_types:
+            raise ProcessingError(f"Table {table_name} not found in ChEMBL dump")
+
+        missing = [column for column in columns if column not in source_types]
+        if missing:
+            self.logger.warning(
+                f"{table_name}: columns not in this ChEMBL release: "
+                f"{', '.join(missing)}"
+            )
+        columns = [column for column in columns if column in source_types]
+
+        column_defs = ", ".join(
+            f"{column} "
+            + (
+                "DOUBLE PRECISION"
+                if source_types[column].startswith("numeric")
+                else source_types[column]
+            )
+            for column in columns
+        )
+        column_list = ", ".join(columns)
+        target = self._source_table(table_name)
+
+        cursor = self.db_manager.cursor
+        cursor.execute(f"DROP TABLE IF EXISTS {target}")
+        cursor.execute(f"CREATE UNLOGGED TABLE {target} ({column_defs})")
+
+        read_fd, write_fd = os.pipe()
+        producer_error: List[BaseException] = []
+
+        def produce() -> None:
+            try:
+                with os.fdopen(write_fd, "wb") as sink:
+                    with temp_conn.cursor() as source_cursor:
+                        source_cursor.copy_expert(
+                            f"COPY (SELECT {column_list} FROM {table_name}) TO STDOUT",
+                            sink,
+                        )
+            except BaseException as e:
+                producer_error.append(e)
+
+        producer = threading.Thread(target=produce, name=f"copy-{table_name}")
+        producer.start()
+        try:
+            with os.fdopen(read_fd, "rb") as source:
+                cursor.copy_expert(f"COPY {target} ({column_list}) FROM STDIN", source)
+        finally:
+            producer.join()
+
+        # A failed producer closes the pipe early; never keep a truncated table
+        if producer_error:
+            raise producer_error[0]
+
+        rows = cursor.rowcount
+        cursor.execute(f"ANALYZE {target}")
+        self.db_manager.conn.commit()
+        return rows
+
+    def _read_source_table(self, table_name: str) -> Optional[pd.DataFrame]:
+        """Load a streamed ChEMBL source table into a DataFrame.
+
+        Args:
+            table_name: ChEMBL table name
+
+        Returns:
+            DataFrame with the source columns, or None if the table is missing
+        """
+        cursor = self.db_manager.cursor
+        cursor.execute("SELECT to_regclass(%s)", (self._source_table(table_name),))
+        result = cursor.fetchone()
+        if not result or result[0] is None:
+            return None
+
+        cursor.execute(f"SELECT * FROM {self._source_table(table_name)}")
+        columns = [desc[0] for desc in cursor.description]
+        return pd.DataFrame.from_records(cursor.fetchall(), columns=columns)
+
     def process_uniprot_mapping(self, mapping_file: Path) -> Dict[str, Set[str]]:
         """Process ChEMBL-UniProt mapping file to create lookup dictionaries.
 
@@ -807,20 +985,17 @@ class ChemblDrugProcessor(BaseProcessor):
                 self.db_manager.conn.rollback()
             raise DatabaseError(f"Failed to create ChEMBL tables: {e}")
 
-    def _process_molecule_dictionary(self, extracted_dir: Path) -> None:
-        """Process molecule_dictionary table from extracted CSV files.
+    def _process_molecule_dictionary(self) -> None:
+        """Process molecule_dictionary from the streamed ChEMBL source tables.
 
-        Reads molecule_dictionary.csv, compound_structures.csv, compound_properties.csv
+        Reads molecule_dictionary, compound_structures and compound_properties
         and merges them to create comprehensive drug records.
 
-        Args:
-            extracted_dir: Path to directory containing extracted CSV files
-
         Raises:
             ProcessingError: If processing fails
         """
         schema_name = self.chembl_schema
-        self.logger.info("Processing ChEMBL molecule_dictionary from CSV files")
+        self.logger.info("Processing ChEMBL molecule_dictionary from source tables")
 
         try:
             if not self.ensure_connection() or not self.db_manager.cursor:
@@ -835,17 +1010,14 @@ class ChemblDrugProcessor(BaseProcessor):
                 )
                 return
 
-            # Read CSV files
-            molecule_dict_path = extracted_dir / "molecule_dictionary.csv"
-            if not molecule_dict_path.exists():
+            # Read source tables
+            df_molecules = self._read_source_table("molecule_dictionary")
+            if df_molecules is None:
                 self.logger.warning(
-                    "molecule_dictionary.csv not found, skipping drug processing"
+                    "molecule_dictionary not extracted, skipping drug processing"
                 )
                 return
 
-            self.logger.info(f"Reading molecule_dictionary from {molecule_dict_path}")
-            df_molecules = pd.read_csv(molecule_dict_path)
-
             # Filter by max_phase if configured
             if self.max_phase_cutoff > 0:
                 initial_count = len(df_molecules)
@@ -857,29 +1029,26 @@ class ChemblDrugProcessor(BaseProcessor):
                 )
 
             # Read and merge compound structures
-            structures_path = extracted_dir / "compound_structures.csv"
-            if structures_path.exists():
+            df_structures = self._read_source_table("compound_structures")
+            if df_structures is not None:
                 self.logger.info("Merging compound structures")
-                df_structures = pd.read_csv(structures_path)
                 df_molecules = df_molecules.merge(
                     df_structures, on="molregno", how="left"
                 )
 
             # Read and merge compound properties
-            properties_path = extracted_dir / "compound_properties.csv"
-            if properties_path.exists():
+            df_properties = self._read_source_table("compound_properties")
+            if df_properties is not None:
                 self.logger.info("Merging compound properties")
-                df_properties = pd.read_csv(properties_path)
                 df_molecules = df_molecules.merge(
                     df_properties, on="molregno", how="left"
                 )
 
             # Read molecule synonyms for drug names
-            synonyms_path = extracted_dir / "molecule_synonyms.csv"
+            df_synonyms = self._read_source_table("molecule_synonyms")
             synonyms_dict = {}
-            if synonyms_path.exists():
+            if df_synonyms is not None:
                 self.logger.info("Processing molecule synonyms")
-                df_synonyms = pd.read_csv(synonyms_path)
                 # Group synonyms by molregno
                 for molregno, group in df_synonyms.groupby("molregno"):
                     synonyms_dict[molregno] = group["synonyms"].dropna().tolist()
@@ -1009,20 +1178,17 @@ class ChemblDrugProcessor(BaseProcessor):
                 self.db_manager.conn.rollback()
             raise ProcessingError(f"Failed to process molecule_dictionary: {e}")
 
-    def _process_drug_targets(self, extracted_dir: Path) -> None:
-        """Process drug_targets table from extracted CSV files.
-
-        Reads target_dictionary.csv, target_components.csv, component_sequences.csv,
-        and drug_mechanism.csv to build comprehensive drug-target relationships.
+    def _process_drug_targets(self) -> None:
+        """Process drug_targets from the streamed ChEMBL source tables.
 
-        Args:
-            extracted_dir: Path to directory containing extracted CSV files
+        Reads target_dictionary, target_components, component_sequences and
+        drug_mechanism to build comprehensive drug-target relationships.
 
         Raises:
             ProcessingError: If processing fails
         """
         schema_name = self.chembl_schema
-        self.logger.info("Processing ChEMBL drug_targets from CSV files")
+        self.logger.info("Processing ChEMBL drug_targets from source tables")
 
         try:
             if not self.ensure_connection() or not self.db_manager.cursor:
@@ -1037,17 +1203,14 @@ class ChemblDrugProcessor(BaseProcessor):
                 )
                 return
 
-            # Read required CSV files
-            target_dict_path = extracted_dir / "target_dictionary.csv"
-            if not target_dict_path.exists():
+            # Read required source tables
+            df_targets = self._read_source_table("target_dictionary")
+            if df_targets is None:
                 self.logger.warning(
-                    "target_dictionary.csv not found, skipping target processing"
+                    "target_dictionary not extracted, skipping target processing"
                 )
                 return
 
-            self.logger.info(f"Reading target_dictionary from {target_dict_path}")
-            df_targets = pd.read_csv(target_dict_path)
-
             # Filter by target type if configured
             if TARGET_TYPES_OF_INTEREST:
                 initial_count = len(df_targets)
@@ -1059,31 +1222,28 @@ class ChemblDrugProcessor(BaseProcessor):
                 )
 
             # Read target components to get component IDs
-            components_path = extracted_dir / "target_components.csv"
-            if components_path.exists():
+            df_components = self._read_source_table("target_components")
+            if df_components is not None:
                 self.logger.info("Merging target_components")
-                df_components = pd.read_csv(components_path)
                 df_targets = df_targets.merge(df_components, on="tid", how="left")
 
             # Read component sequences to get gene symbols and UniProt IDs
-            sequences_path = extracted_dir / "component_sequences.csv"
-            if sequences_path.exists():
+            df_sequences = self._read_source_table("component_sequences")
+            if df_sequences is not None:
                 self.logger.info("Merging component_sequences for gene symbols")
-                df_sequences = pd.read_csv(sequences_path)
                 df_targets = df_targets.merge(
                     df_sequences, on="component_id", how="left"
                 )
 
             # Read drug mechanisms to link targets to molecules
-            mechanisms_path = extracted_dir / "drug_mechanism.csv"
-            if not mechanisms_path.exists():
+            df_mechanisms = self._read_source_table("drug_mechanism")
+            if df_mechanisms is None:
                 self.logger.warning(
-                    "drug_mechanism.csv not found, creating targets without drug links"
+                    "drug_mechanism not extracted, creating targets without drug links"
                 )
                 df_mechanisms = pd.DataFrame()
             else:
-                self.logger.info("Reading drug_mechanism")
-                df_mechanisms = pd.read_csv(mechanisms_path)
+                self.logger.info("Merging drug_mechanism")
                 # Merge with targets
                 df_targets = df_targets.merge(
                     df_mechanisms[
@@ -1217,19 +1377,16 @@ class ChemblDrugProcessor(BaseProcessor):
                 self.db_manager.conn.rollback()
             raise ProcessingError(f"Failed to process drug_targets: {e}")
 
-    def _process_drug_indications(self, extracted_dir: Path) -> None:
-        """Process drug_indications table from extracted CSV files.
-
-        Reads drug_indication.csv and maps to drug ChEMBL IDs.
+    def _process_drug_indications(self) -> None:
+        """Process drug_indications from the streamed ChEMBL source tables.
 
-        Args:
-            extracted_dir: Path to directory containing extracted CSV files
+        Reads drug_indication and maps to drug ChEMBL IDs.
 
         Raises:
             ProcessingError: If processing fails
         """
         schema_name = self.chembl_schema
-        self.logger.info("Processing ChEMBL drug_indications from CSV files")
+        self.logger.info("Processing ChEMBL drug_indications from source tables")
 
         try:
             if not self.ensure_connection() or not self.db_manager.cursor:
@@ -1244,17 +1401,14 @@ class ChemblDrugProcessor(BaseProcessor):
                 )
                 return
 
-            # Read drug_indication CSV file
-            indication_path = extracted_dir / "drug_indication.csv"
-            if not indication_path.exists():
+            # Read drug_indication source table
+            df_indications = self._read_source_table("drug_indication")
+            if df_indications is None:
                 self.logger.warning(
-                    "drug_indication.csv not found, skipping indication processing"
+                    "drug_indication not extracted, skipping indication processing"
                 )
                 return
 
-            self.logger.info(f"Reading drug_indication from {indication_path}")
-            df_indications = pd.read_csv(indication_path)
-
             # Filter by max_phase_for_ind if configured
             if self.max_phase_cutoff > 0:
                 initial_count = len(df_indications)
@@ -1363,19 +1517,16 @@ class ChemblDrugProcessor(BaseProcessor):
                 self.db_manager.conn.rollback()
             raise ProcessingError(f"Failed to process drug_indications: {e}")
 
-    def _process_drug_publications(self, extracted_dir: Path) -> None:
-        """Process drug_publications table from extracted CSV files.
-
-        Reads docs.csv and populates publication metadata.
+    def _process_drug_publications(self) -> None:
+        """Process drug_publications from the streamed ChEMBL source tables.
 
-        Args:
-            extracted_dir: Path to directory containing extracted CSV files
+        Reads docs and populates publication metadata.
 
         Raises:
             ProcessingError: If processing fails
         """
         schema_name = self.chembl_schema
-        self.logger.info("Processing ChEMBL drug_publications from CSV files")
+        self.logger.info("Processing ChEMBL drug_publications from source tables")
 
         try:
             if not self.ensure_connection() or not self.db_manager.cursor:
@@ -1390,17 +1541,14 @@ class ChemblDrugProcessor(BaseProcessor):
                 )
                 return
 
-            # Read docs CSV file
-            docs_path = extracted_dir / "docs.csv"
-            if not docs_path.exists():
+            # Read docs source table
+            df_docs = self._read_source_table("docs")
+            if df_docs is None:
                 self.logger.warning(
-                    "docs.csv not found, skipping publication processing"
+                    "docs not extracted, skipping publication processing"
                 )
                 return
 
-            self.logger.info(f"Reading docs from {docs_path}")
-            df_docs = pd.read_csv(docs_path)
-
             # Filter to publications with PubMed IDs or DOIs
             df_docs = df_docs[df_docs["pubmed_id"].notna() | df_docs["doi"].notna()]
 
@@ -1501,11 +1649,8 @@ class ChemblDrugProcessor(BaseProcessor):
                 self.db_manager.conn.rollback()
             raise ProcessingError(f"Failed to process drug_publications: {e}")
 
-    def import_chembl_to_tables(self, extracted_dir: Path) -> None:
-        """Import extracted ChEMBL data into optimized tables.
-
-        Args:
-            extracted_dir: Path to the directory containing extracted SQL files
+    def import_chembl_to_tables(self) -> None:
+        """Import the streamed ChEMBL source tables into optimized tables.
 
         Raises:
             DatabaseError: If import fails
@@ -1532,16 +1677,16 @@ class ChemblDrugProcessor(BaseProcessor):
             self.logger.info("Importing ChEMBL data into optimized tables")
 
             # Process molecule_dictionary data
-            self._process_molecule_dictionary(extracted_dir)
+            self._process_molecule_dictionary()
 
             # Process drug targets
-            self._process_drug_targets(extracted_dir)
+            self._process_drug_targets()
 
             # Process drug indications
-            self._process_drug_indications(extracted_dir)
+            self._process_drug_indications()
 
             # Process drug publications
-            self._process_drug_publications(extracted_dir)
+            self._process_drug_publications()
 
             # Fixed: Add null check before commit
             if self.db_manager.conn is not None and not getattr(
@@ -1625,7 +1770,14 @@ class ChemblDrugProcessor(BaseProcessor):
     def calculate_drug_scores(self) -> None:
         """Calculate synergy-based drug scores using pathways and GO terms.
 
-        This reuses the scoring logic from the DrugProcessor but applies it to ChEMBL data.
+        A drug's score for a target gene is the number of protein-coding genes
+        sharing a pathway with the target (weighted by ``drug_pathway_weight``)
+        plus the number sharing a GO term (at half that weight). Scores are
+        computed set-based over gene_pathways and transcript_go_terms for the
+        genes with drugs in cancer_transcript_base, keyed like their ``drugs``
+        entries, and merged into ``drug_scores`` with a single UPDATE, so
+        rescoring does not depend on the ChEMBL import (see
+        ``scripts/run_chembl_enrichment.py --scores-only``).
 
         Raises:
             DatabaseError: If drug score calculation fails
@@ -1637,224 +1789,110 @@ class ChemblDrugProcessor(BaseProcessor):
         if not self.ensure_connection() or not self.db_manager.cursor:
             raise DatabaseError("Database connection failed")
 
+        pathway_weight = float(self.config.get("drug_pathway_weight", 1.0))
+        go_weight = pathway_weight * 0.5  # GO terms weighted at 50% of pathway weight
+
         try:
-            # Create temporary scoring tables
             with self.get_db_transaction() as transaction:
-                transaction.cursor.execute(
-                    """
-                    -- Table for storing intermediate pathway scores
-                    CREATE TEMP TABLE temp_pathway_scores (
-                        gene_symbol TEXT,
-                        drug_id TEXT,
-                        pathway_score FLOAT,
-                        PRIMARY KEY (gene_symbol, drug_id)
-                    );
-                    
-                    -- Table for storing intermediate GO term scores
-                    CREATE TEMP TABLE temp_go_scores (
-                        gene_symbol TEXT,
-                        drug_id TEXT,
-                        go_score FLOAT,
-                        PRIMARY KEY (gene_symbol, drug_id)
-                    );
-                    
-                    -- Table for final combined scores
-                    CREATE TEMP TABLE temp_final_scores (
-                        gene_symbol TEXT,
-                        drug_scores JSONB
-                    );
-                """
-                )
+                cursor = transaction.cursor
 
-            # Count total genes to process
-            if self.db_manager.cursor:
-                self.db_manager.cursor.execute(
+                # Gene-level GO annotations (GO terms are stored per transcript)
+                cursor.execute(
+                    """
+                    CREATE TEMP TABLE temp_gene_go ON COMMIT DROP AS
+                    SELECT DISTINCT t.gene_id, tg.go_id
+                    FROM transcript_go_terms tg
+                    JOIN transcripts t ON t.transcript_id = tg.transcript_id;
+
+                    CREATE INDEX ON temp_gene_go (go_id);
+                    CREATE INDEX ON temp_gene_go (gene_id);
+                    ANALYZE temp_gene_go;
                     """
-                    SELECT COUNT(*) 
-                    FROM cancer_transcript_base 
-                    WHERE drugs IS NOT NULL
-                """
                 )
-                result = self.db_manager.cursor.fetchone()
-                total_genes = result[0] if result is not None else 0
-            else:
-                total_genes = 0
 
-            self.logger.info(f"Calculating drug scores for {total_genes} genes")
-
-            # Setup progress tracking
-            progress = get_progress_bar(
-                total=total_genes,
-                desc="Calculating drug scores",
-                module_name="chembl_drugs",
-                unit="genes",
-            )
-
-            # Process in batches
-            offset = 0
+                # Drugs per gene, keyed as in cancer_transcript_base.drugs
+                cursor.execute(
+                    """
+                    CREATE TEMP TABLE temp_gene_drugs ON COMMIT DROP AS
+                    SELECT DISTINCT cb.gene_id, d.drug_key
+                    FROM cancer_transcript_base cb
+                    CROSS JOIN LATERAL jsonb_object_keys(cb.drugs) AS d(drug_key)
+                    WHERE jsonb_typeof(cb.drugs) = 'object';
 
-            try:
-                while True:
-                    # Ensure connection is still valid
-                    if not self.ensure_connection() or not self.db_manager.cursor:
-                        raise DatabaseError(
-                            "Database connection lost during score calculation"
-                        )
+                    ANALYZE temp_gene_drugs;
+                    """
+                )
 
-                    # Get batch of genes with drugs
-                    self.db_manager.cursor.execute(
-                        """
-                        SELECT gene_symbol, drugs, pathways, go_terms
-                        FROM cancer_transcript_base
-                        WHERE drugs IS NOT NULL
-                        ORDER BY gene_symbol
-                        LIMIT %s OFFSET %s
-                    """,
-                        (self.batch_size, offset),
+                # One synergy score per drug target gene
+                cursor.execute(
+                    """
+                    CREATE TEMP TABLE temp_gene_synergy ON COMMIT DROP AS
+                    WITH target_genes AS (
+                        SELECT DISTINCT gene_id FROM temp_gene_drugs
+                    ),
+                    coding_genes AS (
+                        SELECT gene_id FROM genes WHERE gene_type = 'protein_coding'
+                    ),
+                    pathway_scores AS (
+                        SELECT
+                            tg.gene_id,
+                            COUNT(DISTINCT partner.gene_id) AS pathway_score
+                        FROM target_genes tg
+                        JOIN gene_pathways src ON src.gene_id = tg.gene_id
+                        JOIN gene_pathways partner
+                            ON partner.pathway_id = src.pathway_id
+                        JOIN coding_genes cg ON cg.gene_id = partner.gene_id
+                        GROUP BY tg.gene_id
+                    ),
+                    go_scores AS (
+                        SELECT
+                            tg.gene_id,
+                            COUNT(DISTINCT partner.gene_id) AS go_score
+                        FROM target_genes tg
+                        JOIN temp_gene_go src ON src.gene_id = tg.gene_id
+                        JOIN temp_gene_go partner ON partner.go_id = src.go_id
+                        JOIN coding_genes cg ON cg.gene_id = partner.gene_id
+                        GROUP BY tg.gene_id
                     )
+                    SELECT
+                        ps.gene_id,
+                        ps.pathway_score * %s
+                            + COALESCE(gs.go_score, 0) * %s AS score
+                    FROM pathway_scores ps
+                    LEFT JOIN go_scores gs ON gs.gene_id = ps.gene_id
+                    """,
+                    (pathway_weight, go_weight),
+                )
+                cursor.execute("SELECT COUNT(*) FROM temp_gene_synergy")
+                result = cursor.fetchone()
+                scored_genes = result[0] if result else 0
+                self.logger.info(f"Calculated synergy scores for {scored_genes} genes")
 
-                    rows = self.db_manager.cursor.fetchall()
-                    if not rows:
-                        break
-
-                    # Process scores in a transaction
-                    with self.get_db_transaction() as transaction:
-                        # Process pathway scores for this batch
-                        transaction.cursor.execute(
-                            """
-                            INSERT INTO temp_pathway_scores
-                            WITH batch_genes AS (
-                                SELECT 
-                                    t1.gene_symbol,
-                                    t1.drugs,
-                                    t1.pathways as source_pathways
-                                FROM cancer_transcript_base t1
-                                WHERE t1.gene_symbol = ANY(%s)
-                            )
-                            SELECT DISTINCT
-                                bg.gene_symbol,
-                                d.key as drug_id,
-                                COUNT(DISTINCT t2.gene_symbol)::float as pathway_score
-                            FROM batch_genes bg
-                            CROSS JOIN LATERAL jsonb_each(bg.drugs) d
-                            JOIN cancer_transcript_base t2 
-                            ON t2.pathways && bg.source_pathways
-                            AND t2.gene_type = 'protein_coding'
-                            GROUP BY bg.gene_symbol, d.key
-                        """,
-                            ([row[0] for row in rows],),
-                        )
-
-                        # Process GO term scores for this batch
-                        transaction.cursor.execute(
-                            """
-                            INSERT INTO temp_go_scores
-                            WITH batch_genes AS (
-                                SELECT 
-                                    t1.gene_symbol,
-                                    t1.drugs,
-                                    t1.go_terms as source_terms
-                                FROM cancer_transcript_base t1
-                                WHERE t1.gene_symbol = ANY(%s)
-                            )
-                            SELECT DISTINCT
-                                bg.gene_symbol,
-                                d.key as drug_id,
-                                COUNT(DISTINCT t2.gene_symbol)::float as go_score
-                            FROM batch_genes bg
-                            CROSS JOIN LATERAL jsonb_each(bg.drugs) d
-                            JOIN cancer_transcript_base t2 
-                            ON EXISTS (
-                                SELECT 1
-                                FROM jsonb_object_keys(bg.source_terms) go_id
-                                WHERE t2.go_terms ? go_id
-                            )
-                            AND t2.gene_type = 'protein_coding'
-                            GROUP BY bg.gene_symbol, d.key
-                        """,
-                            ([row[0] for row in rows],),
-                        )
-
-                        # Combine scores for this batch
-                        pathway_weight = float(
-                            self.config.get("drug_pathway_weight", 1.0)
-                        )
-                        go_weight = (
-                            pathway_weight * 0.5
-                        )  # GO terms weighted at 50% of pathway weight
-
-                        transaction.cursor.execute(
-                            """
-                            INSERT INTO temp_final_scores
-                            SELECT 
-                                ps.gene_symbol,
-                                jsonb_object_agg(
-                                    ps.drug_id,
-                                    (COALESCE(ps.pathway_score * %s, 0) + 
-                                     COALESCE(gs.go_score * %s, 0))::text::jsonb
-                                ) as drug_scores
-                            FROM temp_pathway_scores ps
-                            LEFT JOIN temp_go_scores gs 
-                            ON ps.gene_symbol = gs.gene_symbol 
-                            AND ps.drug_id = gs.drug_id
-                            WHERE ps.gene_symbol = ANY(%s)
-                            GROUP BY ps.gene_symbol
-                        """,
-                            (pathway_weight, go_weight, [row[0] for row in rows]),
-                        )
-
-                        # Update main table for this batch
-                        transaction.cursor.execute(
-                            """
-                            UPDATE cancer_transcript_base cb
-                            SET drug_scores = 
-                                COALESCE(cb.drug_scores, '{}'::jsonb) || fs.drug_scores
-                            FROM temp_final_scores fs
-                            WHERE cb.gene_symbol = fs.gene_symbol
-                        """
-                        )
-
-                        # Clear temporary tables for next batch
-                        transaction.cursor.execute(
-                            """
-                            TRUNCATE temp_pathway_scores, temp_go_scores, temp_final_scores
-                        """
-                        )
-
-                    batch_size = len(rows)
-                    offset += self.batch_size
-
-                    # Update progress
-                    progress.update(batch_size)
-
-                # Log final statistics
-                self.logger.info(f"Drug score calculation completed.")
-            finally:
-                # Ensure progress bar is completed
-                progress.close()
+                # Single bulk write of per-drug scores, keeping other score keys
+                cursor.execute(
+                    """
+                    UPDATE cancer_transcript_base cb
+                    SET drug_scores =
+                        COALESCE(cb.drug_scores, '{}'::jsonb) || fs.drug_scores
+                    FROM (
+                        SELECT
+                            gd.gene_id,
+                            jsonb_object_agg(gd.drug_key, gs.score) AS drug_scores
+                        FROM temp_gene_drugs gd
+                        JOIN temp_gene_synergy gs ON gs.gene_id = gd.gene_id
+                        GROUP BY gd.gene_id
+                    ) fs
+                    WHERE cb.gene_id = fs.gene_id
+                    """
+                )
+                self.logger.info(
+                    "Drug score calculation completed: "
+                    f"{cursor.rowcount} transcripts updated"
+                )
 
         except Exception as e:
             self.logger.error(f"Drug score calculation failed: {e}")
-            if self.db_manager.conn and not self.db_manager.conn.closed:
-                self.db_manager.conn.rollback()
             raise DatabaseError(f"Drug score calculation failed: {e}")
-        finally:
-            # Clean up temporary tables
-            try:
-                if self.ensure_connection() and self.db_manager.cursor:
-                    self.db_manager.cursor.execute(
-                        """
-                        DROP TABLE IF EXISTS temp_pathway_scores;
-                        DROP TABLE IF EXISTS temp_go_scores;
-                        DROP TABLE IF EXISTS temp_final_scores;
-                    """
-                    )
-                    if self.db_manager.conn and not getattr(
-                        self.db_manager.conn, "closed", True
-                    ):
-                        self.db_manager.conn.commit()
-            except Exception as e:
-                self.logger.warning(f"Failed to clean up temporary tables: {e}")
 
     def _verify_integration_results(self) -> None:
         """Verify ChEMBL integration results with database statistics."""
@@ -1993,7 +2031,7 @@ class ChemblDrugProcessor(BaseProcessor):
     def query_chembl_api(
         self, endpoint: str, params: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
-        """Query ChEMBL API with rate limiting.
+        """Query ChEMBL API through the shared rate-limited, cached client.
 
         Args:
             endpoint: API endpoint (e.g., 'target', 'molecule')
@@ -2005,21 +2043,36 @@ class ChemblDrugProcessor(BaseProcessor):
         Raises:
             DownloadError: If API request fails
         """
-        import time
-
-        url = f"{self.chembl_api_base}/{endpoint}"
-
         try:
-            # Rate limiting
-            time.sleep(self.api_rate_limit)
+            return self.api_client.get(endpoint, params)
+        except APIRequestError as e:
+            raise DownloadError(f"ChEMBL API request failed for {endpoint}: {e}")
 
-            response = requests.get(url, params=params)
-            response.raise_for_status()
+    def _query_chembl_api_many(
+        self, endpoint: str, params_list: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Query one ChEMBL endpoint for several parameter sets concurrently.
 
-            return response.json()
+        Failed requests are logged and yield an empty response.
 
-        except Exception as e:
-            raise DownloadError(f"ChEMBL API request failed for {endpoint}: {e}")
+        Args:
+            endpoint: API endpoint
+            params_list: Query parameters per request
+
+        Returns:
+            Responses in the order of params_list
+        """
+        responses = self.api_client.get_many(
+            [(endpoint, params) for params in params_list], return_exceptions=True
+        )
+        results = []
+        for response in responses:
+            if isinstance(response, APIRequestError):
+                self.logger.debug(f"ChEMBL API request failed: {response}")
+                results.append({})
+            else:
+                results.append(response)
+        return results
 
     def get_clinical_phase_data(self, gene_symbol: str) -> List[Dict[str, Any]]:
         """Get clinical phase data for a gene from ChEMBL API.
@@ -2030,95 +2083,160 @@ class ChemblDrugProcessor(BaseProcessor):
         Returns:
             List of drug records with clinical phase information
         """
-        try:
-            # Search for targets by gene symbol
-            target_response = self.query_chembl_api(
-                "target", {"target_synonym": gene_symbol, "format": "json", "limit": 20}
-            )
-
-            clinical_drugs = []
+        return self.get_clinical_phase_data_many([gene_symbol])[gene_symbol]
 
-            for target in target_response.get("targets", []):
-                target_chembl_id = target.get("target_chembl_id")
-                if not target_chembl_id:
-                    continue
+    def get_clinical_phase_data_many(
+        self, gene_symbols: List[str]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Get clinical phase data for several genes from ChEMBL API.
 
-                # Get activities for this target
-                activity_response = self.query_chembl_api(
-                    "activity",
-                    {
-                        "target_chembl_id": target_chembl_id,
-                        "format": "json",
-                        "limit": 50,
-                    },
-                )
+        Targets, activities, molecules and mechanisms are requested level by
+        level for all genes at once through the client's bounded concurrent
+        batch API. Each target and molecule is fetched once even if several
+        genes share it, mechanisms only for molecules that pass
+        max_phase_cutoff, and every response is served from the on-disk
+        cache on later runs. Failed requests count as empty responses.
 
-                for activity in activity_response.get("activities", []):
-                    molecule_chembl_id = activity.get("molecule_chembl_id")
-                    if not molecule_chembl_id:
-                        continue
+        Args:
+            gene_symbols: Gene symbols to search
 
-                    # Get molecule details including clinical phase
-                    molecule_response = self.query_chembl_api(
-                        "molecule",
-                        {"molecule_chembl_id": molecule_chembl_id, "format": "json"},
-                    )
+        Returns:
+            Drug records with clinical phase information per gene symbol
+        """
+        try:
+            # Search for targets by gene symbol
+            target_responses = self._query_chembl_api_many(
+                "target",
+                [
+                    {"target_synonym": gene_symbol, "format": "json", "limit": 20}
+                    for gene_symbol in gene_symbols
+                ],
+            )
+            gene_targets = [
+                (gene_symbol, target)
+                for gene_symbol, response in zip(gene_symbols, target_responses)
+                for target in response.get("targets", [])
+                if target.get("target_chembl_id")
+            ]
 
-                    for molecule in molecule_response.get("molecules", []):
-                        max_phase = molecule.get("max_phase")
-                        if max_phase is not None and max_phase >= self.max_phase_cutoff:
-                            drug_record = {
-                                "molecule_chembl_id": molecule_chembl_id,
-                                "pref_name": molecule.get("pref_name", ""),
-                                "max_phase": max_phase,
-                                "therapeutic_flag": molecule.get(
-                                    "therapeutic_flag", False
-                                ),
-                                "target_chembl_id": target_chembl_id,
-                                "target_pref_name": target.get("pref_name", ""),
-                                "activity_type": activity.get("standard_type", ""),
-                                "activity_value": activity.get("standard_value"),
-                                "activity_units": activity.get("standard_units", ""),
+            # Get activities for all targets
+            target_ids = list(
+                dict.fromkeys(target["target_chembl_id"] for _, target in gene_targets)
+            )
+            activity_responses = dict(
+                zip(
+                    target_ids,
+                    self._query_chembl_api_many(
+                        "activity",
+                        [
+                            {
+                                "target_chembl_id": target_id,
+                                "format": "json",
+                                "limit": 50,
                             }
+                            for target_id in target_ids
+                        ],
+                    ),
+                )
+            )
+            target_activities = [
+                (gene_symbol, target, activity)
+                for gene_symbol, target in gene_targets
+                for activity in activity_responses[target["target_chembl_id"]].get(
+                    "activities", []
+                )
+                if activity.get("molecule_chembl_id")
+            ]
 
-                            # Get mechanism of action if available
-                            if self.include_mechanisms:
-                                moa_response = self.query_chembl_api(
-                                    "mechanism",
-                                    {
-                                        "molecule_chembl_id": molecule_chembl_id,
-                                        "format": "json",
-                                    },
-                                )
+            # Get molecule details (and mechanisms) once per molecule
+            molecule_ids = list(
+                dict.fromkeys(
+                    activity["molecule_chembl_id"]
+                    for _, _, activity in target_activities
+                )
+            )
+            molecule_responses = dict(
+                zip(
+                    molecule_ids,
+                    self._query_chembl_api_many(
+                        "molecule",
+                        [
+                            {"molecule_chembl_id": molecule_id, "format": "json"}
+                            for molecule_id in molecule_ids
+                        ],
+                    ),
+                )
+            )
 
-                                mechanisms = []
-                                for moa in moa_response.get("mechanisms", []):
-                                    mechanisms.append(
-                                        {
-                                            "mechanism_of_action": moa.get(
-                                                "mechanism_of_action", ""
-                                            ),
-                                            "action_type": moa.get("action_type", ""),
-                                            "target_chembl_id": moa.get(
-                                                "target_chembl_id", ""
-                                            ),
-                                        }
-                                    )
+            # Keep molecules at or above the phase cutoff before asking for
+            # their mechanisms
+            clinical_molecules: Dict[str, List[Dict[str, Any]]] = {}
+            for molecule_id, molecule_response in molecule_responses.items():
+                molecules = [
+                    molecule
+                    for molecule in molecule_response.get("molecules", [])
+                    if molecule.get("max_phase") is not None
+                    and float(molecule["max_phase"]) >= self.max_phase_cutoff
+                ]
+                if molecules:
+                    clinical_molecules[molecule_id] = molecules
+
+            mechanisms_by_molecule: Dict[str, List[Dict[str, Any]]] = {}
+            if self.include_mechanisms:
+                moa_responses = self._query_chembl_api_many(
+                    "mechanism",
+                    [
+                        {"molecule_chembl_id": molecule_id, "format": "json"}
+                        for molecule_id in clinical_molecules
+                    ],
+                )
+                for molecule_id, moa_response in zip(clinical_molecules, moa_responses):
+                    mechanisms_by_molecule[molecule_id] = [
+                        {
+                            "mechanism_of_action": moa.get("mechanism_of_action", ""),
+                            "action_type": moa.get("action_type", ""),
+                            "target_chembl_id": moa.get("target_chembl_id", ""),
+                        }
+                        for moa in moa_response.get("mechanisms", [])
+                    ]
 
-                                drug_record["mechanisms"] = mechanisms
+            clinical_drugs: Dict[str, List[Dict[str, Any]]] = {
+                gene_symbol: [] for gene_symbol in gene_symbols
+            }
+            for gene_symbol, target, activity in target_activities:
+                molecule_chembl_id = activity["molecule_chembl_id"]
+
+                for molecule in clinical_molecules.get(molecule_chembl_id, []):
+                    drug_record = {
+                        "molecule_chembl_id": molecule_chembl_id,
+                        "pref_name": molecule.get("pref_name", ""),
+                        "max_phase": molecule["max_phase"],
+                        "therapeutic_flag": molecule.get("therapeutic_flag", False),
+                        "target_chembl_id": target["target_chembl_id"],
+                        "target_pref_name": target.get("pref_name", ""),
+                        "activity_type": activity.get("standard_type", ""),
+                        "activity_value": activity.get("standard_value"),
+                        "activity_units": activity.get("standard_units", ""),
+                    }
+
+                    if self.include_mechanisms:
+                        drug_record["mechanisms"] = mechanisms_by_molecule[
+                            molecule_chembl_id
+                        ]
 
-                            clinical_drugs.append(drug_record)
+                    clinical_drugs[gene_symbol].append(drug_record)
 
             self.logger.debug(
-                f"Found {len(clinical_drugs)} clinical drug records for {gene_symbol}"
+                f"Found {sum(map(len, clinical_drugs.values()))} clinical drug records "
+                f"for {len(gene_symbols)} genes"
             )
             return clinical_drugs
 
         except Exception as e:
             self.logger.warning(
-                f"Failed to get clinical phase data for {gene_symbol}: {e}"
+                f"Failed to get clinical phase data for {len(gene_symbols)} genes: {e}"
             )
-            return []
+            return {gene_symbol: [] for gene_symbol in gene_symbols}
 
     def enhance_existing_drug_data(self) -> None:
         """Enhance existing drug data with clinical phases and mechanisms from ChEMBL API.
@@ -2161,32 +2279,35 @@ class ChemblDrugProcessor(BaseProcessor):
             )
 
             try:
-                for gene_symbol in genes_with_drugs:
-                    clinical_data = self.get_clinical_phase_data(gene_symbol)
-
-                    if clinical_data:
-                        # Convert to format compatible with existing schema
-                        enhanced_drug_records = {}
-
-                        for drug in clinical_data:
-                            drug_id = drug["molecule_chembl_id"]
-                            enhanced_drug_records[drug_id] = {
-                                "name": drug["pref_name"],
-                                "score": drug.get("activity_value", 0),
-                                "mechanism": drug.get("mechanisms", [{}])[0].get(
-                                    "mechanism_of_action", ""
-                                ),
-                                "max_phase": drug["max_phase"],
-                                "therapeutic_flag": drug["therapeutic_flag"],
-                                "activity_type": drug["activity_type"],
-                                "activity_units": drug.get("activity_units", ""),
-                                "target_name": drug["target_pref_name"],
-                            }
+                for start in range(0, len(genes_with_drugs), CLINICAL_PHASE_BATCH_SIZE):
+                    batch = genes_with_drugs[start : start + CLINICAL_PHASE_BATCH_SIZE]
+                    clinical_data_by_gene = self.get_clinical_phase_data_many(batch)
+
+                    for gene_symbol in batch:
+                        clinical_data = clinical_data_by_gene[gene_symbol]
+                        if clinical_data:
+                            # Convert to format compatible with existing schema
+                            enhanced_drug_records = {}
+
+                            for drug in clinical_data:
+                                drug_id = drug["molecule_chembl_id"]
+                                enhanced_drug_records[drug_id] = {
+                                    "name": drug["pref_name"],
+                                    "score": drug.get("activity_value", 0),
+                                    "mechanism": drug.get("mechanisms", [{}])[0].get(
+                                        "mechanism_of_action", ""
+                                    ),
+                                    "max_phase": drug["max_phase"],
+                                    "therapeutic_flag": drug["therapeutic_flag"],
+                                    "activity_type": drug["activity_type"],
+                                    "activity_units": drug.get("activity_units", ""),
+                                    "target_name": drug["target_pref_name"],
+                                }
 
-                        if enhanced_drug_records:
-                            enhanced_drugs[gene_symbol] = enhanced_drug_records
+                            if enhanced_drug_records:
+                                enhanced_drugs[gene_symbol] = enhanced_drug_records
 
-                    progress_bar.update(1)
+                    progress_bar.update(len(batch))
 
             finally:
                 progress_bar.close()
@@ -2677,17 +2798,17 @@ class ChemblDrugProcessor(BaseProcessor):
             # Download ChEMBL data
             chembl_dump, uniprot_mapping = self.download_chembl_data()
 
-            # Extract ChEMBL dump
-            extracted_dir = self.extract_chembl_dump(chembl_dump)
+            # Create optimized tables for ChEMBL data
+            self.create_optimized_tables()
+
+            # Stream the ChEMBL source tables into the ChEMBL schema
+            self.extract_chembl_dump(chembl_dump)
 
             # Process UniProt mapping
             uniprot_to_chembl = self.process_uniprot_mapping(uniprot_mapping)
 
-            # Create optimized tables for ChEMBL data
-            self.create_optimized_tables()
-
             # Import ChEMBL data into tables
-            self.import_chembl_to_tables(extracted_dir)
+            self.import_chembl_to_tables()
 
             # Extract and process publication references
             publications = self.extract_publication_references()
@@ -5,15 +5,40 @@ to enhance transcript records with trial-based publication references.
 """
 
 # Standard library imports
+import asyncio
+import gzip
 import json
 import time
 import re
+import zipfile
+from collections import defaultdict
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Set, Tuple
+from typing import (
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Any,
+    Set,
+    Tuple,
+    Union,
+)
 from datetime import datetime, timedelta
 
 # Third party imports
+import aiohttp
 import requests
+from psycopg2.extras import execute_values
 from tqdm import tqdm
 from rich.console import Console
 from rich.table import Table
@@ -27,6 +52,7 @@ from ..utils.publication_utils import (
     format_pmid_url,
     format_publication_url,
 )
+from ..utils.api_client import AsyncRateLimiter, ResponseCache
 from ..utils.logging import get_progress_bar
 
 # Constants
@@ -34,6 +60,13 @@ CLINICAL_TRIALS_API_BASE = "https://clinicaltrials.gov/api/v2"
 CLINICAL_TRIALS_API_VERSION = "2.0.0"
 DEFAULT_RATE_LIMIT = 1.0  # 1 request per second
 MAX_RESULTS_PER_REQUEST = 1000
+DEFAULT_MAX_CONCURRENCY = 4
+DOCUMENT_CACHE_TTL = 30 * 24 * 60 * 60  # 30 days
+ID_BATCH_SIZE = 100  # NCT IDs per filter.ids request
+STORE_BATCH_SIZE = 1000
+API_TIMEOUT = 120
+MAX_API_RETRIES = 4
+RETRY_STATUSES = (429, 500, 502, 503, 504)
 CANCER_RELATED_CONDITIONS = [
     "cancer",
     "carcinoma",
@@ -53,6 +86,264 @@ CANCER_RELATED_CONDITIONS = [
     "radiation therapy",
 ]
 
+# Bulk export scanning
+EXPORT_SCAN_BATCH = 2000  # export files (or studies of one file) per worker task
+MIN_SYMBOL_LENGTH = 3
+SYMBOL_TOKEN_PATTERN = re.compile(r"[A-Za-z0-9][A-Za-z0-9\-]*")
+JSON_LINES_SUFFIXES = {".jsonl", ".ndjson"}
+
+
+def is_relevant_study(
+    protocol_section: Dict[str, Any], cancer_only: bool, include_phase_0: bool
+) -> bool:
+    """Apply the phase and cancer-condition filters to a study.
+
+    Args:
+        protocol_section: protocolSection of a study document
+        cancer_only: Require a cancer-related condition
+        include_phase_0: Keep early phase 1 (phase 0) trials
+
+    Returns:
+        True if the study should be kept
+    """
+    phases = protocol_section.get("designModule", {}).get("phases", [])
+    if not include_phase_0 and phases and phases[0] == "EARLY_PHASE1":
+        return False
+
+    if cancer_only:
+        conditions = protocol_section.get("conditionsModule", {}).get("conditions", [])
+        return any(
+            cancer_term.lower() in condition.lower()
+            for condition in conditions
+            for cancer_term in CANCER_RELATED_CONDITIONS
+        )
+
+    return True
+
+
+class GeneSymbolMatcher:
+    """Find gene symbols mentioned as whole tokens in free text.
+
+    The symbol set is compiled once into a hash set; matching a text is one
+    regex tokenization plus a lookup per token (and per hyphen-separated part,
+    so "EGFR-mutant" matches EGFR while "HLA-A" still matches as a whole).
+    The cost per text is independent of the number of symbols. Matching is
+    case-sensitive, so ordinary words do not match upper-case symbols, and
+    symbols shorter than ``min_length`` are ignored.
+    """
+
+    def __init__(
+        self, symbols: Iterable[str], min_length: int = MIN_SYMBOL_LENGTH
+    ) -> None:
+        """Compile the matcher.
+
+        Args:
+            symbols: Gene symbols to search for
+            min_length: Shortest symbol that is matched
+        """
+        self.symbols = frozenset(
+            symbol
+            for symbol in symbols
+            if symbol and len(symbol) >= min_length and not symbol.isdigit()
+        )
+
+    def find(self, text: str) -> Set[str]:
+        """Return the gene symbols mentioned in a text."""
+        found = set()
+        for token in SYMBOL_TOKEN_PATTERN.findall(text):
+            token = token.rstrip("-")
+            if token in self.symbols:
+                found.add(token)
+            elif "-" in token:
+                found.update(part for part in token.split("-") if part in self.symbols)
+        return found
+
+
+def _study_match_texts(protocol_section: Dict[str, Any]) -> Iterator[str]:
+    """Yield the study fields searched for gene symbols.
+
+    Titles, conditions, keywords and interventions (names, other names,
+    descriptions). Trial acronyms are not searched: they are upper-case
+    words such as MET, REST or CAT that collide with gene symbols.
+    """
+    identification = protocol_section.get("identificationModule", {})
+    for field in ("briefTitle", "officialTitle"):
+        if identification.get(field):
+            yield identification[field]
+
+    conditions_module = protocol_section.get("conditionsModule", {})
+    yield from conditions_module.get("conditions", [])
+    yield from conditions_module.get("keywords", [])
+
+    interventions = protocol_section.get("armsInterventionsModule", {}).get(
+        "interventions", []
+    )
+    for intervention in interventions:
+        if intervention.get("name"):
+            yield intervention["name"]
+        yield from intervention.get("otherNames", [])
+        if intervention.get("description"):
+            yield intervention["description"]
+
+
+def scan_studies(
+    studies: Iterable[Dict[str, Any]],
+    matcher: GeneSymbolMatcher,
+    cancer_only: bool,
+    include_phase_0: bool,
+) -> List[Tuple[Dict[str, Any], List[str]]]:
+    """Match gene symbols in relevant studies.
+
+    Args:
+        studies: Study documents
+        matcher: Compiled gene symbol matcher
+        cancer_only: Require a cancer-related condition
+        include_phase_0: Keep early phase 1 (phase 0) trials
+
+    Returns:
+        (study, matched gene symbols) for relevant studies with at least one
+        match; studies are trimmed to the sections _extract_trial_data reads
+    """
+    matches = []
+    for study in studies:
+        protocol_section = study.get("protocolSection", {})
+        if not is_relevant_study(protocol_section, cancer_only, include_phase_0):
+            continue
+
+        genes: Set[str] = set()
+        for text in _study_match_texts(protocol_section):
+            genes |= matcher.find(text)
+
+        if genes:
+            misc_info = study.get("derivedSection", {}).get("miscInfoModule", {})
+            matches.append(
+                (
+                    {
+                        "protocolSection": protocol_section,
+                        "derivedSection": {"miscInfoModule": misc_info},
+                    },
+                    sorted(genes),
+                )
+            )
+    return matches
+
+
+def _decode_studies(data: Union[bytes, str]) -> Iterator[Dict[str, Any]]:
+    """Decode one export file: a study, a list of studies or an API page."""
+    document = json.loads(data)
+    if isinstance(document, list):
+        yield from document
+    elif "studies" in document:
+        yield from document["studies"]
+    else:
+        yield document
+
+
+def iter_json_studies(
+    path: Path, chunk_size: int = 1 << 20
+) -> Iterator[Dict[str, Any]]:
+    """Stream study documents from a JSON array or JSON Lines file.
+
+    JSON arrays are decoded one element at a time, so the file is never
+    held in memory as a whole.
+
+    Args:
+        path: JSON (array, object or API page), .jsonl or .ndjson file,
+            optionally gzipped
+        chunk_size: Characters read per chunk
+
+    Yields:
+        Study documents
+    """
+    opener = gzip.open if path.suffix == ".gz" else open
+    suffix = Path(path.stem).suffix if path.suffix == ".gz" else path.suffix
+
+    with opener(path, "rt", encoding="utf-8") as handle:
+        if suffix in JSON_LINES_SUFFIXES:
+            for line in handle:
+                if line.strip():
+                    yield json.loads(line)
+            return
+
+        buffer = handle.read(chunk_size).lstrip()
+        if not buffer.startswith("["):
+            yield from _decode_studies(buffer + handle.read())
+            return
+
+        decoder = json.JSONDecoder()
+        position = 1
+        while True:
+            # Skip separators, refilling the buffer as needed
+            while True:
+                while position < len(buffer) and buffer[position] in " \t\r\n,":
+                    position += 1
+                if position < len(buffer):
+                    break
+                buffer, position = handle.read(chunk_size), 0
+                if not buffer:
+                    return
+
+            if buffer[position] == "]":
+                return
+
+            try:
+                study, end = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                chunk = handle.read(chunk_size)
+                if not chunk:
+                    raise
+                buffer, position = buffer[position:] + chunk, 0
+                continue
+
+            yield study
+            position = end
+
+
+# Per-process state of export scan workers, set once by the pool initializer
+_export_worker_state: Dict[str, Any] = {}
+
+
+def _init_export_worker(
+    matcher: GeneSymbolMatcher, cancer_only: bool, include_phase_0: bool
+) -> None:
+    _export_worker_state.update(
+        matcher=matcher, cancer_only=cancer_only, include_phase_0=include_phase_0
+    )
+
+
+def _scan_export_files(
+    source: str, names: List[str]
+) -> List[Tuple[Dict[str, Any], List[str]]]:
+    """Parse and match a slice of a ZIP export or export directory (worker)."""
+
+    def iter_studies() -> Iterator[Dict[str, Any]]:
+        if zipfile.is_zipfile(source):
+            with zipfile.ZipFile(source) as archive:
+                for name in names:
+                    yield from _decode_studies(archive.read(name))
+        else:
+            for name in names:
+                yield from _decode_studies((Path(source) / name).read_bytes())
+
+    return scan_studies(
+        iter_studies(),
+        _export_worker_state["matcher"],
+        _export_worker_state["cancer_only"],
+        _export_worker_state["include_phase_0"],
+    )
+
+
+def _scan_export_studies(
+    studies: List[Dict[str, Any]],
+) -> List[Tuple[Dict[str, Any], List[str]]]:
+    """Match a batch of studies decoded from a single export file (worker)."""
+    return scan_studies(
+        studies,
+        _export_worker_state["matcher"],
+        _export_worker_state["cancer_only"],
+        _export_worker_state["include_phase_0"],
+    )
+
 
 class ClinicalTrialsProcessor(BaseProcessor):
     """Process clinical trial data from ClinicalTrials.gov and integrate with transcript data."""
@@ -91,6 +382,26 @@ class ClinicalTrialsProcessor(BaseProcessor):
             "clinical_trials_cache_ttl", 7 * 24 * 60 * 60
         )  # 7 days
 
+        # Concurrent harvesting: searches are cached per query, study documents
+        # per NCT ID (documents change rarely, so they live longer)
+        self.max_concurrency = config.get(
+            "clinical_trials_max_concurrency", DEFAULT_MAX_CONCURRENCY
+        )
+        self.search_cache = ResponseCache(
+            self.clinical_trials_dir / "searches", self.cache_ttl
+        )
+        self.study_cache = ResponseCache(
+            self.clinical_trials_dir / "studies",
+            config.get("clinical_trials_document_ttl", DOCUMENT_CACHE_TTL),
+        )
+
+        # Bulk export ingestion (offline alternative to per-gene searches)
+        self.export_path = config.get("clinical_trials_export")
+        self.min_symbol_length = config.get(
+            "clinical_trials_min_symbol_length", MIN_SYMBOL_LENGTH
+        )
+        self.max_workers = config.get("max_workers", 4)
+
         # Track API usage
         self.api_requests_made = 0
         self.last_request_time = 0
@@ -141,6 +452,52 @@ class ClinicalTrialsProcessor(BaseProcessor):
                 f"Invalid JSON response from ClinicalTrials.gov API: {e}"
             )
 
+    def _build_search_params(self, gene_symbol: str) -> Dict[str, Any]:
+        """Build the study search parameters for a gene.
+
+        Args:
+            gene_symbol: Gene symbol to search for
+
+        Returns:
+            Query parameters for the studies endpoint
+        """
+        # Add cancer-related filters if enabled
+        if self.cancer_only:
+            # Use condition search for cancer-related trials
+            cancer_condition = " OR ".join(
+                [f'"{condition}"' for condition in CANCER_RELATED_CONDITIONS[:5]]
+            )
+
+            params = {
+                "query.term": f'"{gene_symbol}"',
+                "query.cond": cancer_condition,
+                "query.titles": f'"{gene_symbol}"',
+                "query.intr": f'"{gene_symbol}"',
+                "pageSize": min(self.max_results, 1000),
+                "countTotal": "true",
+            }
+        else:
+            params = {
+                "query.term": f'"{gene_symbol}"',
+                "pageSize": min(self.max_results, 1000),
+                "countTotal": "true",
+            }
+
+        # Add study status filters
+        if self.include_completed_only:
+            params["query.status"] = "COMPLETED"
+        else:
+            params[
+                "query.status"
+            ] = "COMPLETED,ACTIVE_NOT_RECRUITING,RECRUITING,ENROLLING_BY_INVITATION"
+
+        # Add date range filter
+        if self.max_age_years:
+            start_date = datetime.now() - timedelta(days=self.max_age_years * 365)
+            params["query.start"] = start_date.strftime("%Y-%m-%d")
+
+        return params
+
     def search_trials_by_gene(self, gene_symbol: str) -> List[Dict[str, Any]]:
         """Search for clinical trials mentioning a specific gene.
 
@@ -151,43 +508,7 @@ class ClinicalTrialsProcessor(BaseProcessor):
             List of trial records
         """
         try:
-            # Build search query
-            search_terms = [gene_symbol]
-
-            # Add cancer-related filters if enabled
-            if self.cancer_only:
-                # Use condition search for cancer-related trials
-                cancer_condition = " OR ".join(
-                    [f'"{condition}"' for condition in CANCER_RELATED_CONDITIONS[:5]]
-                )
-
-                params = {
-                    "query.term": f'"{gene_symbol}"',
-                    "query.cond": cancer_condition,
-                    "query.titles": f'"{gene_symbol}"',
-                    "query.intr": f'"{gene_symbol}"',
-                    "pageSize": min(self.max_results, 1000),
-                    "countTotal": "true",
-                }
-            else:
-                params = {
-                    "query.term": f'"{gene_symbol}"',
-                    "pageSize": min(self.max_results, 1000),
-                    "countTotal": "true",
-                }
-
-            # Add study status filters
-            if self.include_completed_only:
-                params["query.status"] = "COMPLETED"
-            else:
-                params[
-                    "query.status"
-                ] = "COMPLETED,ACTIVE_NOT_RECRUITING,RECRUITING,ENROLLING_BY_INVITATION"
-
-            # Add date range filter
-            if self.max_age_years:
-                start_date = datetime.now() - timedelta(days=self.max_age_years * 365)
-                params["query.start"] = start_date.strftime("%Y-%m-%d")
+            params = self._build_search_params(gene_symbol)
 
             # Make API request
             response = self.search_studies(params)
@@ -217,13 +538,14 @@ class ClinicalTrialsProcessor(BaseProcessor):
         return self._make_api_request("studies", params)
 
     def _extract_trial_data(
-        self, study: Dict[str, Any], gene_symbol: str
+        self, study: Dict[str, Any], gene_symbol: Optional[str]
     ) -> Optional[Dict[str, Any]]:
         """Extract relevant data from a clinical trial study record.
 
         Args:
             study: Study record from API response
-            gene_symbol: Gene symbol being searched
+            gene_symbol: Gene symbol being searched, or None for trials that
+                are not tied to one gene (bulk export matching)
 
         Returns:
             Extracted trial data or None if not relevant
@@ -244,29 +566,17 @@ class ClinicalTrialsProcessor(BaseProcessor):
             if not nct_id:
                 return None
 
-            # Extract study phase
-            phases = design_module.get("phases", [])
-            phase = phases[0] if phases else "Not Applicable"
-
-            # Skip Phase 0 if not included
-            if not self.include_phase_0 and phase == "EARLY_PHASE1":
+            # Skip Phase 0 and non-cancer trials as configured
+            if not is_relevant_study(
+                protocol_section, self.cancer_only, self.include_phase_0
+            ):
                 return None
 
-            # Extract conditions
+            # Extract study phase and conditions
+            phases = design_module.get("phases", [])
+            phase = phases[0] if phases else "Not Applicable"
             conditions = conditions_module.get("conditions", [])
 
-            # Check if cancer-related (if filtering enabled)
-            if self.cancer_only:
-                is_cancer_related = any(
-                    any(
-                        cancer_term.lower() in condition.lower()
-                        for cancer_term in CANCER_RELATED_CONDITIONS
-                    )
-                    for condition in conditions
-                )
-                if not is_cancer_related:
-                    return None
-
             # Extract interventions
             interventions = []
             for intervention in interventions_module.get("interventions", []):
@@ -395,17 +705,56 @@ class ClinicalTrialsProcessor(BaseProcessor):
     ) -> Dict[str, List[Dict[str, Any]]]:
         """Get clinical trials for a list of genes.
 
+        Searches run concurrently under a shared rate limiter and only return
+        NCT IDs; full study documents are then fetched once per NCT ID (in
+        ``filter.ids`` batches, following ``nextPageToken``) and streamed into
+        the clinical_trials table page by page. Search results and documents
+        are cached on disk, so trials shared across genes and repeated runs
+        cost no further requests.
+
         Args:
             gene_symbols: List of gene symbols to search
 
         Returns:
             Dictionary mapping gene symbols to their trial records
         """
-        gene_trials = {}
-
+        gene_symbols = list(dict.fromkeys(gene_symbols))
         self.logger.info(f"Searching clinical trials for {len(gene_symbols)} genes")
 
-        # Create progress bar
+        gene_trials = asyncio.run(self._harvest_trials(gene_symbols))
+
+        if gene_trials:
+            self._store_gene_trial_links(gene_trials, match_source="search")
+
+        self.logger.info(
+            f"Found trials for {len(gene_trials)} genes, "
+            f"total API requests: {self.api_requests_made}"
+        )
+        return gene_trials
+
+    async def _harvest_trials(
+        self, gene_symbols: List[str]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Search trials for all genes and fetch each study document once.
+
+        Args:
+            gene_symbols: Unique gene symbols to search
+
+        Returns:
+            Dictionary mapping gene symbols to their trial records
+        """
+        limiter = AsyncRateLimiter(self.rate_limit)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        # psycopg2 connections are not thread-safe: serialize DB writes
+        db_executor = ThreadPoolExecutor(max_workers=1)
+        loop = asyncio.get_running_loop()
+
+        gene_nct_ids: Dict[str, List[str]] = {}
+        documents: Dict[str, Dict[str, Any]] = {}
+
+        async def store(studies: List[Dict[str, Any]]) -> None:
+            await loop.run_in_executor(db_executor, self._store_trials, studies)
+
         progress_bar = get_progress_bar(
             total=len(gene_symbols),
             desc="Searching clinical trials",
@@ -413,23 +762,517 @@ class ClinicalTrialsProcessor(BaseProcessor):
         )
 
         try:
-            for gene_symbol in gene_symbols:
-                trials = self.search_trials_by_gene(gene_symbol)
-                if trials:
-                    gene_trials[gene_symbol] = trials
+            async with aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.max_concurrency),
+                timeout=aiohttp.ClientTimeout(total=API_TIMEOUT),
+            ) as session:
+
+                async def search(gene_symbol: str) -> None:
+                    async with semaphore:
+                        try:
+                            gene_nct_ids[gene_symbol] = await self._search_gene_nct_ids(
+                                session, limiter, gene_symbol
+                            )
+                        except DownloadError as e:
+                            self.logger.warning(
+                                f"Failed to search trials for gene {gene_symbol}: {e}"
+                            )
+                    progress_bar.update(1)
+
+                await asyncio.gather(*(search(gene) for gene in gene_symbols))
+
+                # Each trial is fetched (or read from the cache) exactly once
+                missing = []
+                for nct_id in dict.fromkeys(
+                    nct_id for ids in gene_nct_ids.values() for nct_id in ids
+                ):
+                    document = self.study_cache.get(self._study_cache_key(nct_id))
+                    if document is None:
+                        missing.append(nct_id)
+                    else:
+                        documents[nct_id] = document
+
+                self.logger.info(
+                    f"{len(documents) + len(missing)} unique trials: "
+                    f"{len(documents)} cached, {len(missing)} to fetch"
+                )
+
+                cached = list(documents.values())
+                for start in range(0, len(cached), STORE_BATCH_SIZE):
+                    await store(cached[start : start + STORE_BATCH_SIZE])
+
+                async def fetch(nct_ids: List[str]) -> None:
+                    params = {"filter.ids": ",".join(nct_ids), "pageSize": len(nct_ids)}
+                    async with semaphore:
+                        try:
+                            async for studies in self._iter_study_pages(
+                                session, limiter, params
+                            ):
+                                for study in studies:
+                                    nct_id = self._get_nct_id(study)
+                                    if nct_id:
+                                        self.study_cache.set(
+                                            self._study_cache_key(nct_id), study
+                                        )
+                                        documents[nct_id] = study
+                                await store(studies)
+                        except DownloadError as e:
+                            self.logger.warning(
+                                f"Failed to fetch {len(nct_ids)} trial documents: {e}"
+                            )
+
+                await asyncio.gather(
+                    *(
+                        fetch(missing[start : start + ID_BATCH_SIZE])
+                        for start in range(0, len(missing), ID_BATCH_SIZE)
+                    )
+                )
+        finally:
+            progress_bar.close()
+            db_executor.shutdown(wait=True)
+
+        gene_trials: Dict[str, List[Dict[str, Any]]] = {}
+        for gene_symbol, nct_ids in gene_nct_ids.items():
+            trials = [
+                trial
+                for trial in (
+                    self._extract_trial_data(documents[nct_id], gene_symbol)
+                    for nct_id in nct_ids
+                    if nct_id in documents
+                )
+                if trial
+            ]
+            if trials:
+                gene_trials[gene_symbol] = trials
+
+        return gene_trials
+
+    async def _search_gene_nct_ids(
+        self,
+        session: "aiohttp.ClientSession",
+        limiter: AsyncRateLimiter,
+        gene_symbol: str,
+    ) -> List[str]:
+        """Return the NCT IDs of the trials matching a gene search.
+
+        Result pages are followed until max_results IDs are collected.
+
+        Args:
+            session: Shared aiohttp session
+            limiter: Shared rate limiter
+            gene_symbol: Gene symbol to search
 
-                progress_bar.update(1)
+        Returns:
+            Up to max_results NCT IDs, in result order
+        """
+        params = self._build_search_params(gene_symbol)
+        params["fields"] = "NCTId"
 
-                # Rate limiting between gene searches
-                time.sleep(self.rate_limit)
+        cache_key = ResponseCache.make_key(
+            "studies", {**params, "maxResults": self.max_results}
+        )
+        cached = self.search_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
+        nct_ids: List[str] = []
+        pages = self._iter_study_pages(session, limiter, params)
+        try:
+            async for studies in pages:
+                nct_ids.extend(
+                    nct_id for nct_id in map(self._get_nct_id, studies) if nct_id
+                )
+                if len(nct_ids) >= self.max_results:
+                    del nct_ids[self.max_results :]
+                    break
         finally:
-            progress_bar.close()
+            await pages.aclose()
+
+        self.search_cache.set(cache_key, nct_ids)
+        return nct_ids
+
+    async def _iter_study_pages(
+        self,
+        session: "aiohttp.ClientSession",
+        limiter: AsyncRateLimiter,
+        params: Dict[str, Any],
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Yield the studies of each result page, following nextPageToken.
+
+        Args:
+            session: Shared aiohttp session
+            limiter: Shared rate limiter
+            params: Query parameters of the first page
+
+        Yields:
+            Studies of one page
+        """
+        page_params = dict(params)
+        while True:
+            response = await self._make_api_request_async(
+                session, limiter, "studies", page_params
+            )
+            yield response.get("studies", [])
+
+            next_page_token = response.get("nextPageToken")
+            if not next_page_token:
+                break
+            page_params = {**params, "pageToken": next_page_token}
+
+    async def _make_api_request_async(
+        self,
+        session: "aiohttp.ClientSession",
+        limiter: AsyncRateLimiter,
+        endpoint: str,
+        params: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """Make a rate-limited API request, retrying on 429/5xx and network errors.
+
+        Args:
+            session: Shared aiohttp session
+            limiter: Shared rate limiter
+            endpoint: API endpoint (e.g., 'studies')
+            params: Query parameters
+
+        Returns:
+            API response as dictionary
+
+        Raises:
+            DownloadError: If the request still fails after retries
+        """
+        url = f"{self.api_base_url}/{endpoint}"
+        query = {key: str(value) for key, value in params.items()}
+        query["format"] = "json"
+
+        for attempt in range(1, MAX_API_RETRIES + 1):
+            await limiter.wait()
+            try:
+                async with session.get(url, params=query) as response:
+                    if response.status in RETRY_STATUSES and attempt < MAX_API_RETRIES:
+                        retry_after = response.headers.get("Retry-After")
+                        await asyncio.sleep(
+                            float(retry_after) if retry_after else attempt * 2.0
+                        )
+                        continue
+                    response.raise_for_status()
+                    self.api_requests_made += 1
+                    return await response.json(content_type=None)
+            except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+                if attempt == MAX_API_RETRIES:
+                    raise DownloadError(
+                        f"ClinicalTrials.gov API request failed for {endpoint}: {e}"
+                    )
+                await asyncio.sleep(attempt * 2.0)
+
+        raise DownloadError(f"ClinicalTrials.gov API request failed for {endpoint}")
+
+    @staticmethod
+    def _get_nct_id(study: Dict[str, Any]) -> Optional[str]:
+        """Return the NCT ID of a study document."""
+        return (
+            study.get("protocolSection", {})
+            .get("identificationModule", {})
+            .get("nctId")
+        )
+
+    @staticmethod
+    def _study_cache_key(nct_id: str) -> str:
+        """Cache key of a study document."""
+        return ResponseCache.make_key("study", {"nct_id": nct_id})
+
+    def _store_trials(self, studies: List[Dict[str, Any]]) -> int:
+        """Upsert study documents into the clinical_trials table.
+
+        Studies rejected by the relevance filters (cancer, phase) are skipped.
+
+        Args:
+            studies: Study documents from the API
+
+        Returns:
+            Number of trials written
+
+        Raises:
+            DatabaseError: If the write fails
+        """
+        trials = [
+            trial
+            for trial in (self._extract_trial_data(study, None) for study in studies)
+            if trial
+        ]
+        return self._upsert_trials(trials)
+
+    def _upsert_trials(self, trials: List[Dict[str, Any]]) -> int:
+        """Upsert extracted trial records into the clinical_trials table.
+
+        Args:
+            trials: Trial records from _extract_trial_data
+
+        Returns:
+            Number of trials written
+
+        Raises:
+            DatabaseError: If the write fails
+        """
+        rows = []
+        for trial in trials:
+            rows.append(
+                (
+                    trial["nct_id"],
+                    trial["title"],
+                    trial["official_title"],
+                    trial["phase"],
+                    trial["status"],
+                    trial["conditions"],
+                    json.dumps(trial["interventions"]),
+                    trial["start_date"] or None,
+                    trial["completion_date"] or None,
+                    trial["lead_sponsor"] or None,
+                    trial["url"],
+                )
+            )
+        if not rows:
+            return 0
+
+        if not self.ensure_connection() or not self.db_manager.cursor:
+            raise DatabaseError("Database connection failed")
+
+        try:
+            execute_values(
+                self.db_manager.cursor,
+                """
+                INSERT INTO clinical_trials (
+                    nct_id, title, official_title, phase, status, conditions,
+                    interventions, start_date, completion_date, lead_sponsor, url
+                ) VALUES %s
+                ON CONFLICT (nct_id) DO UPDATE SET
+                    title = EXCLUDED.title,
+                    official_title = EXCLUDED.official_title,
+                    phase = EXCLUDED.phase,
+                    status = EXCLUDED.status,
+                    conditions = EXCLUDED.conditions,
+                    interventions = EXCLUDED.interventions,
+                    start_date = EXCLUDED.start_date,
+                    completion_date = EXCLUDED.completion_date,
+                    lead_sponsor = EXCLUDED.lead_sponsor,
+                    url = EXCLUDED.url,
+                    last_updated = CURRENT_TIMESTAMP
+                """,
+                rows,
+                template="(%s, %s, %s, %s, %s, %s, %s::jsonb, %s, %s, %s, %s)",
+                page_size=STORE_BATCH_SIZE,
+            )
+            self.db_manager.conn.commit()
+        except Exception as e:
+            self.db_manager.conn.rollback()
+            raise DatabaseError(f"Failed to store clinical trials: {e}")
+
+        return len(rows)
+
+    def _store_gene_trial_links(
+        self, gene_trials: Dict[str, List[Dict[str, Any]]], match_source: str
+    ) -> None:
+        """Bulk-load gene-trial links for genes known to the database.
+
+        Args:
+            gene_trials: Dictionary mapping gene symbols to trial records
+            match_source: 'search' or 'dump'
+
+        Raises:
+            DatabaseError: If the write fails
+        """
+        links = [
+            (gene_symbol, trial["nct_id"], match_source)
+            for gene_symbol, trials in gene_trials.items()
+            for trial in trials
+        ]
+        if not links:
+            return
+
+        if not self.ensure_connection() or not self.db_manager.cursor:
+            raise DatabaseError("Database connection failed")
+
+        try:
+            execute_values(
+                self.db_manager.cursor,
+                """
+                INSERT INTO gene_clinical_trials (gene_id, nct_id, match_source)
+                SELECT DISTINCT g.gene_id, v.nct_id, v.match_source
+                FROM (VALUES %s) AS v(gene_symbol, nct_id, match_source)
+                JOIN genes g ON g.gene_symbol = v.gene_symbol
+                JOIN clinical_trials ct ON ct.nct_id = v.nct_id
+                ON CONFLICT (gene_id, nct_id) DO NOTHING
+                """,
+                links,
+                page_size=10000,
+            )
+            self.db_manager.conn.commit()
+            self.logger.info(f"Stored {len(links):,} gene-trial links ({match_source})")
+        except Exception as e:
+            self.db_manager.conn.rollback()
+            raise DatabaseError(f"Failed to store gene-trial links: {e}")
 
+    def ingest_export(
+        self, export_path: Union[str, Path]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Load trials and gene links from a full ClinicalTrials.gov export.
+
+        Accepts the ZIP of per-study JSON files from the ClinicalTrials.gov
+        download page (or a directory of them), whose files are parsed and
+        matched by a process pool, or a single JSON array / JSON Lines file,
+        which is streamed here and matched by the pool in batches.
+        Gene symbols from the genes table are matched in titles, conditions,
+        keywords and interventions; matching trials are upserted into
+        clinical_trials and linked in gene_clinical_trials with match_source
+        'dump'. No API requests are made.
+
+        Args:
+            export_path: Path to the export
+
+        Returns:
+            Dictionary mapping gene symbols to their trial records
+
+        Raises:
+            ProcessingError: If the export cannot be read
+            DatabaseError: If loading fails
+        """
+        export_path = Path(export_path)
+        if not export_path.exists():
+            raise ProcessingError(f"Clinical trials export not found: {export_path}")
+
+        matcher = GeneSymbolMatcher(self._get_gene_symbols(), self.min_symbol_length)
         self.logger.info(
-            f"Found trials for {len(gene_trials)} genes, total API requests: {self.api_requests_made}"
+            f"Scanning clinical trials export {export_path} "
+            f"for {len(matcher.symbols):,} gene symbols"
         )
-        return gene_trials
+
+        gene_trials: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        trial_count = 0
+        try:
+            for matches in self._scan_export(export_path, matcher):
+                batch_trials = []
+                batch_links: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+                for study, genes in matches:
+                    trial = self._extract_trial_data(study, None)
+                    if not trial:
+                        continue
+                    batch_trials.append(trial)
+                    for gene_symbol in genes:
+                        batch_links[gene_symbol].append(trial)
+
+                trial_count += self._upsert_trials(batch_trials)
+                self._store_gene_trial_links(batch_links, match_source="dump")
+                for gene_symbol, trials in batch_links.items():
+                    gene_trials[gene_symbol].extend(trials)
+        except (OSError, ValueError, zipfile.BadZipFile) as e:
+            raise ProcessingError(f"Failed to read clinical trials export: {e}")
+
+        self.logger.info(
+            f"Loaded {trial_count:,} trials linked to {len(gene_trials):,} genes "
+            "from export"
+        )
+        return dict(gene_trials)
+
+    def _scan_export(
+        self, export_path: Path, matcher: GeneSymbolMatcher
+    ) -> Iterator[List[Tuple[Dict[str, Any], List[str]]]]:
+        """Yield batches of (study, matched genes) from an export.
+
+        ZIP members and directory files are parsed and matched by the
+        process pool in slices of EXPORT_SCAN_BATCH files. A single JSON
+        array or JSON Lines file is decoded as a stream in this process and
+        its studies are matched by the pool in batches of EXPORT_SCAN_BATCH.
+
+        Args:
+            export_path: ZIP export, export directory or single JSON file
+            matcher: Compiled gene symbol matcher
+
+        Yields:
+            Matched studies, one batch per scanned slice
+        """
+        if zipfile.is_zipfile(export_path):
+            with zipfile.ZipFile(export_path) as archive:
+                names = [n for n in archive.namelist() if n.endswith(".json")]
+        elif export_path.is_dir():
+            names = sorted(
+                str(path.relative_to(export_path))
+                for path in export_path.rglob("*.json")
+            )
+        else:
+            studies = iter_json_studies(export_path)
+            batches = iter(lambda: list(islice(studies, EXPORT_SCAN_BATCH)), [])
+            for matches, _ in self._run_export_scan(
+                matcher, ((_scan_export_studies, batch) for batch in batches)
+            ):
+                yield matches
+            return
+
+        progress_bar = get_progress_bar(
+            total=len(names),
+            desc="Scanning clinical trials export",
+            module_name="clinical_trials",
+        )
+        try:
+            for matches, names_slice in self._run_export_scan(
+                matcher,
+                (
+                    (
+                        _scan_export_files,
+                        str(export_path),
+                        names[start : start + EXPORT_SCAN_BATCH],
+                    )
+                    for start in range(0, len(names), EXPORT_SCAN_BATCH)
+                ),
+            ):
+                yield matches
+                progress_bar.update(len(names_slice))
+        finally:
+            progress_bar.close()
+
+    def _run_export_scan(
+        self, matcher: GeneSymbolMatcher, tasks: Iterable[Tuple[Any, ...]]
+    ) -> Iterator[Tuple[List[Tuple[Dict[str, Any], List[str]]], Any]]:
+        """Run export scan tasks on a process pool as they are produced.
+
+        At most two tasks per worker are in flight, so a streamed export is
+        never queued up in memory ahead of the workers.
+
+        Args:
+            matcher: Compiled gene symbol matcher
+            tasks: (worker function, *args) tuples
+
+        Yields:
+            (matched studies, last task argument) in completion order
+        """
+        with ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            initializer=_init_export_worker,
+            initargs=(matcher, self.cancer_only, self.include_phase_0),
+        ) as executor:
+            pending: Dict[Future, Any] = {}
+            for function, *args in tasks:
+                pending[executor.submit(function, *args)] = args[-1]
+                while len(pending) >= 2 * self.max_workers:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield future.result(), pending.pop(future)
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result(), pending.pop(future)
+
+    def _get_gene_symbols(self) -> List[str]:
+        """Return all gene symbols from the genes table.
+
+        Raises:
+            DatabaseError: If the query fails
+        """
+        if not self.ensure_connection() or not self.db_manager.cursor:
+            raise DatabaseError("Database connection failed")
+
+        self.db_manager.cursor.execute(
+            "SELECT DISTINCT gene_symbol FROM genes WHERE gene_symbol IS NOT NULL"
+        )
+        return [row[0] for row in self.db_manager.cursor.fetchall()]
 
     def extract_publication_references(
         self, gene_trials: Dict[str, List[Dict[str, Any]]]
@@ -677,11 +1520,11 @@ class ClinicalTrialsProcessor(BaseProcessor):
         """Run the complete ClinicalTrials.gov integration pipeline.
 
         Steps:
-        1. Get genes from database
-        2. Search for clinical trials for each gene
-        3. Extract publication references
-        4. Update transcript records with trial data
-        5. Process publications through publications processor
+        1. Load trials from the configured export (clinical_trials_export), or
+           get genes from database and search for clinical trials for each gene
+        2. Extract publication references
+        3. Update transcript records with trial data
+        4. Process publications through publications processor
         """
         try:
             self.logger.info("Starting ClinicalTrials.gov integration pipeline")
@@ -690,24 +1533,30 @@ class ClinicalTrialsProcessor(BaseProcessor):
             if not self.ensure_connection():
                 raise DatabaseError("Database connection failed")
 
-            # Get sample of genes from database for trial search
-            # In production, you might want to be more selective
-            self.db_manager.cursor.execute(
+            if self.export_path:
+                # Full coverage from a local export, no API requests
+                gene_trials = self.ingest_export(self.export_path)
+            else:
+                # Get sample of genes from database for trial search
+                # In production, you might want to be more selective
+                self.db_manager.cursor.execute(
+                    """
+                    SELECT DISTINCT gene_symbol 
+                    FROM cancer_transcript_base 
+                    WHERE gene_symbol IS NOT NULL
+                      AND gene_type = 'protein_coding'
+                    ORDER BY gene_symbol
+                    LIMIT 100  -- Limit for demonstration
                 """
-                SELECT DISTINCT gene_symbol 
-                FROM cancer_transcript_base 
-                WHERE gene_symbol IS NOT NULL
-                  AND gene_type = 'protein_coding'
-                ORDER BY gene_symbol
-                LIMIT 100  -- Limit for demonstration
-            """
-            )
+                )
 
-            gene_symbols = [row[0] for row in self.db_manager.cursor.fetchall()]
-            self.logger.info(f"Searching clinical trials for {len(gene_symbols)} genes")
+                gene_symbols = [row[0] for row in self.db_manager.cursor.fetchall()]
+                self.logger.info(
+                    f"Searching clinical trials for {len(gene_symbols)} genes"
+                )
 
-            # Search for clinical trials
-            gene_trials = self.get_trials_for_genes(gene_symbols)
+                # Search for clinical trials
+                gene_trials = self.get_trials_for_genes(gene_symbols)
 
             if not gene_trials:
                 self.logger.warning("No clinical trials found for any genes")
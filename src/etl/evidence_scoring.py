@@ -5,20 +5,23 @@ multiple data sources to generate confidence-based scores for drug-gene interact
 biomarker discovery, and therapeutic targeting in cancer research.
 """
 
-import json
+import hashlib
+import io
 import logging
 import math
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple, Any, Set
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Any, Union
 from dataclasses import dataclass
 from enum import Enum
 
 import numpy as np
-from scipy import stats
+import pandas as pd
+import yaml
 
 from .base_processor import BaseProcessor
-from ..utils.logging import get_progress_bar
 
 
 class EvidenceType(Enum):
@@ -40,6 +43,386 @@ class UseCase(Enum):
     THERAPEUTIC_TARGETING = "therapeutic_targeting"
 
 
+SCORING_VERSION = "2.0"
+
+DEFAULT_SCORING_CONFIG = (
+    Path(__file__).resolve().parents[2] / "config" / "evidence_scoring.yml"
+)
+
+# Use-case names in the scoring config that differ from the UseCase values
+USE_CASE_ALIASES = {"therapeutic_target": UseCase.THERAPEUTIC_TARGETING}
+
+# Column order of component score matrices
+EVIDENCE_TYPES = [
+    EvidenceType.CLINICAL,
+    EvidenceType.MECHANISTIC,
+    EvidenceType.PUBLICATION,
+    EvidenceType.GENOMIC,
+    EvidenceType.SAFETY,
+]
+
+USE_CASES = [
+    UseCase.DRUG_REPURPOSING,
+    UseCase.BIOMARKER_DISCOVERY,
+    UseCase.PATHWAY_ANALYSIS,
+    UseCase.THERAPEUTIC_TARGETING,
+]
+
+CANCER_GO_KEYWORDS = [
+    "apoptosis",
+    "cell death",
+    "tumor",
+    "cancer",
+    "oncogene",
+    "tumor suppressor",
+    "cell cycle",
+    "DNA repair",
+    "metastasis",
+    "proliferation",
+    "growth factor",
+    "angiogenesis",
+    "invasion",
+    "migration",
+    "transformation",
+]
+
+# Component scores pool several sources; the per-record path scores their
+# "multiple_*" sources with the default reliability as well
+COMPONENT_SOURCE_RELIABILITY = 0.5
+
+# Per-gene evidence features, one column each in the feature matrix
+GENE_FEATURES = [
+    "drug_count",
+    "drugcentral_targets",
+    "phase_4",
+    "phase_3",
+    "phase_2",
+    "phase_1",
+    "phase_0",
+    "pgkb_annotations",
+    "pgkb_level_1a",
+    "pgkb_level_1b",
+    "pgkb_level_2a",
+    "pgkb_level_2b",
+    "pgkb_level_3",
+    "pgkb_significance_high",
+    "pgkb_significance_moderate",
+    "pgkb_significance_low",
+    "pgkb_toxicity",
+    "pathways",
+    "go_molecular_function",
+    "go_biological_process",
+    "go_cellular_component",
+    "go_other",
+    "cancer_go_terms",
+    "molecular_functions",
+    "gene_features",
+    "publications",
+]
+
+# Cached component columns of evidence_component_scores
+COMPONENT_COLUMNS = [t.value for t in EVIDENCE_TYPES]
+CONFIDENCE_COLUMNS = [f"{t.value}_confidence" for t in EVIDENCE_TYPES]
+
+# Clinical evidence weights per feature (ChEMBL phase and PharmGKB level scores)
+CLINICAL_FEATURE_WEIGHTS = {
+    "phase_4": 12.0,
+    "phase_3": 8.0,
+    "phase_2": 4.0,
+    "phase_1": 2.0,
+    "phase_0": 0.5,
+    "pgkb_level_1a": 8.0,
+    "pgkb_level_1b": 6.0,
+    "pgkb_level_2a": 4.0,
+    "pgkb_level_2b": 2.0,
+    "pgkb_level_3": 1.0,
+    "pgkb_significance_high": 2.0,
+    "pgkb_significance_moderate": 1.0,
+    "pgkb_significance_low": 0.5,
+}
+
+# Restricts a query to one hash partition of the gene symbols; with
+# partitions = 1 every gene matches
+PARTITION_FILTER = (
+    "(%(partitions)s = 1 OR mod(hashtext({column})::bigint + 2147483648, "
+    "%(partitions)s) = %(partition)s)"
+)
+
+# Aggregates every feature per gene symbol from the normalized tables.
+# PharmGKB clinical annotations are only stored in cancer_transcript_base.drugs
+# (one copy per transcript), so they are read from one transcript per gene.
+GENE_FEATURES_QUERY = r"""
+WITH part AS (
+    SELECT gene_id, gene_symbol
+    FROM genes
+    WHERE {partition_filter}
+),
+drug AS (
+    SELECT
+        g.gene_symbol,
+        COUNT(DISTINCT d.drug_name) AS drug_count,
+        COUNT(DISTINCT d.drug_name) FILTER (WHERE d.source ILIKE 'drugcentral%%')
+            AS drugcentral_targets,
+        COUNT(*) FILTER (WHERE d.phase = 4) AS phase_4,
+        COUNT(*) FILTER (WHERE d.phase = 3) AS phase_3,
+        COUNT(*) FILTER (WHERE d.phase = 2) AS phase_2,
+        COUNT(*) FILTER (WHERE d.phase = 1) AS phase_1,
+        COUNT(*) FILTER (WHERE d.phase = 0) AS phase_0
+    FROM (
+        SELECT
+            gene_id,
+            drug_name,
+            source,
+            CASE
+                WHEN approval_status ILIKE 'approved%%'
+                     OR clinical_phase ~* '^\s*(approved|4)|phase\s*(4|iv)\M' THEN 4
+                WHEN clinical_phase ~* '^\s*3|phase\s*(3|iii)\M' THEN 3
+                WHEN clinical_phase ~* '^\s*2|phase\s*(2|ii)\M' THEN 2
+                WHEN clinical_phase ~* '^\s*1|phase\s*(1|i)\M' THEN 1
+                WHEN clinical_phase ~* '^\s*0|preclinical' THEN 0
+            END AS phase
+        FROM gene_drug_interactions
+    ) d
+    JOIN part g ON g.gene_id = d.gene_id
+    GROUP BY g.gene_symbol
+),
+pgkb AS (
+    SELECT
+        c.gene_symbol,
+        COUNT(*) AS pgkb_annotations,
+        COUNT(*) FILTER (WHERE a->>'evidence_level' = '1A') AS pgkb_level_1a,
+        COUNT(*) FILTER (WHERE a->>'evidence_level' = '1B') AS pgkb_level_1b,
+        COUNT(*) FILTER (WHERE a->>'evidence_level' = '2A') AS pgkb_level_2a,
+        COUNT(*) FILTER (WHERE a->>'evidence_level' = '2B') AS pgkb_level_2b,
+        COUNT(*) FILTER (WHERE a->>'evidence_level' = '3') AS pgkb_level_3,
+        COUNT(*) FILTER (WHERE a->>'clinical_significance' = 'High')
+            AS pgkb_significance_high,
+        COUNT(*) FILTER (WHERE a->>'clinical_significance' = 'Moderate')
+            AS pgkb_significance_moderate,
+        COUNT(*) FILTER (WHERE a->>'clinical_significance' = 'Low')
+            AS pgkb_significance_low,
+        COUNT(*) FILTER (WHERE a->>'phenotype_category' ILIKE '%%toxicity%%')
+            AS pgkb_toxicity
+    FROM (
+        SELECT DISTINCT ON (gene_symbol)
+            gene_symbol,
+            drugs->'pharmgkb_data'->'clinical_annotations' AS annotations
+        FROM cancer_transcript_base
+        WHERE drugs ? 'pharmgkb_data'
+          AND {partition_filter}
+          AND jsonb_typeof(drugs->'pharmgkb_data'->'clinical_annotations') = 'array'
+        ORDER BY gene_symbol, transcript_id
+    ) c
+    CROSS JOIN LATERAL jsonb_array_elements(c.annotations) AS a
+    GROUP BY c.gene_symbol
+),
+pathway AS (
+    SELECT g.gene_symbol, COUNT(DISTINCT gp.pathway_id) AS pathways
+    FROM gene_pathways gp
+    JOIN part g ON g.gene_id = gp.gene_id
+    GROUP BY g.gene_symbol
+),
+go AS (
+    SELECT
+        g.gene_symbol,
+        COUNT(DISTINCT tg.go_id) FILTER (WHERE tg.go_category = 'molecular_function')
+            AS go_molecular_function,
+        COUNT(DISTINCT tg.go_id) FILTER (WHERE tg.go_category = 'biological_process')
+            AS go_biological_process,
+        COUNT(DISTINCT tg.go_id) FILTER (WHERE tg.go_category = 'cellular_component')
+            AS go_cellular_component,
+        COUNT(DISTINCT tg.go_id) FILTER (
+            WHERE tg.go_category IS NULL OR tg.go_category NOT IN (
+                'molecular_function', 'biological_process', 'cellular_component'
+            )
+        ) AS go_other,
+        COUNT(DISTINCT tg.go_id) FILTER (WHERE tg.go_term ~* %(cancer_terms)s)
+            AS cancer_go_terms
+    FROM transcript_go_terms tg
+    JOIN transcripts t ON t.transcript_id = tg.transcript_id
+    JOIN part g ON g.gene_id = t.gene_id
+    GROUP BY g.gene_symbol
+),
+annotation AS (
+    SELECT
+        g.gene_symbol,
+        COUNT(*) FILTER (WHERE ga.annotation_type = 'molecular_function')
+            AS molecular_functions,
+        COUNT(*) FILTER (WHERE ga.annotation_type <> 'molecular_function')
+            AS gene_features
+    FROM gene_annotations ga
+    JOIN part g ON g.gene_id = ga.gene_id
+    GROUP BY g.gene_symbol
+),
+literature AS (
+    SELECT g.gene_symbol, MAX(ls.publication_count) AS publications
+    FROM gene_literature_stats ls
+    JOIN part g ON g.gene_id = ls.gene_id
+    GROUP BY g.gene_symbol
+),
+scored AS (
+    SELECT gene_symbol FROM drug
+    UNION SELECT gene_symbol FROM pgkb
+)
+SELECT s.gene_symbol, {columns}
+FROM scored s
+LEFT JOIN drug USING (gene_symbol)
+LEFT JOIN pgkb USING (gene_symbol)
+LEFT JOIN pathway USING (gene_symbol)
+LEFT JOIN go USING (gene_symbol)
+LEFT JOIN annotation USING (gene_symbol)
+LEFT JOIN literature USING (gene_symbol)
+ORDER BY s.gene_symbol
+""".format(
+    columns=", ".join(f"COALESCE({name}, 0)" for name in GENE_FEATURES),
+    partition_filter=PARTITION_FILTER.format(column="gene_symbol"),
+)
+
+
+def load_use_case_weights(
+    path: Union[str, Path]
+) -> Dict[UseCase, Dict[EvidenceType, float]]:
+    """Read use-case weights from the ``scoring.use_case_weights`` section.
+
+    Args:
+        path: Evidence scoring YAML config
+
+    Returns:
+        Weights per use case and evidence type (only use cases in the file)
+    """
+    with open(path) as f:
+        config = yaml.safe_load(f) or {}
+
+    section = (config.get("scoring") or {}).get("use_case_weights") or {}
+    return {
+        (USE_CASE_ALIASES.get(name) or UseCase(name)): {
+            EvidenceType(evidence_type): float(weight)
+            for evidence_type, weight in weights.items()
+        }
+        for name, weights in section.items()
+    }
+
+
+def feature_hashes(features: pd.DataFrame) -> np.ndarray:
+    """Hash each gene's scoring inputs.
+
+    A gene needs rescoring when its hash changes; the scoring version is part
+    of the hash so that changes to the scoring rules invalidate every gene.
+
+    Args:
+        features: One row per gene, one column per GENE_FEATURES entry
+
+    Returns:
+        Array of hash strings, one per row
+    """
+    hashes = pd.util.hash_pandas_object(
+        features[GENE_FEATURES].astype("int64"), index=False
+    )
+    return np.array([f"{SCORING_VERSION}:{h:016x}" for h in hashes.to_numpy()])
+
+
+def compute_component_scores(
+    features: pd.DataFrame,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Score every evidence type for many genes at once.
+
+    Vectorized counterpart of the ``calculate_*_evidence_score`` methods,
+    working on per-gene feature counts (see GENE_FEATURES) instead of the
+    nested transcript JSON.
+
+    Args:
+        features: One row per gene, one column per GENE_FEATURES entry
+
+    Returns:
+        Tuple of (scores, confidence, evidence_count); scores and confidence
+        are (genes x EVIDENCE_TYPES) matrices
+    """
+    f = {name: features[name].to_numpy(dtype=float) for name in GENE_FEATURES}
+    phases = ["phase_4", "phase_3", "phase_2", "phase_1", "phase_0"]
+
+    clinical_weights = np.array(
+        [CLINICAL_FEATURE_WEIGHTS.get(name, 0.0) for name in GENE_FEATURES]
+    )
+    clinical = np.minimum(
+        features[GENE_FEATURES].to_numpy(dtype=float) @ clinical_weights, 30.0
+    )
+    clinical_count = f["pgkb_annotations"] + sum(f[p] for p in phases)
+
+    mechanistic = np.minimum(
+        np.minimum(8.0, f["pathways"] * 0.5)
+        + np.minimum(7.0, f["drugcentral_targets"] * 1.5),
+        25.0,
+    )
+    mechanistic_count = f["pathways"] + f["drugcentral_targets"]
+
+    publications = f["publications"]
+    publication = np.minimum(
+        np.minimum(8.0, publications * 0.3)
+        + np.where(publications > 20, np.minimum(3.0, (publications - 20) * 0.1), 0.0),
+        20.0,
+    )
+
+    go_aspects = np.stack(
+        [
+            f["go_molecular_function"],
+            f["go_biological_process"],
+            f["go_cellular_component"],
+            f["go_other"],
+        ],
+        axis=1,
+    )
+    cancer_terms = f["cancer_go_terms"]
+    genomic = np.minimum(
+        np.minimum(3.0, go_aspects * 0.2).sum(axis=1)
+        + cancer_terms * 0.5
+        + np.minimum(4.0, cancer_terms * 0.8)
+        + np.minimum(2.0, f["gene_features"] * 0.3)
+        + np.minimum(2.0, f["molecular_functions"] * 0.4),
+        15.0,
+    )
+    genomic_count = (
+        go_aspects.sum(axis=1) + f["gene_features"] + f["molecular_functions"]
+    )
+
+    approved = f["phase_4"] > 0
+    safety = np.clip(
+        5.0
+        - f["pgkb_toxicity"] * 0.2
+        + np.where(approved, 3.0, 0.0)
+        - np.where(
+            f["drug_count"] > 1, np.minimum(2.0, (f["drug_count"] - 1) * 0.2), 0.0
+        ),
+        0.0,
+        10.0,
+    )
+    safety_count = f["pgkb_toxicity"] + approved
+
+    counts = np.stack(
+        [clinical_count, mechanistic_count, publications, genomic_count, safety_count],
+        axis=1,
+    )
+    # (per-item confidence, cap, confidence without evidence) per evidence type
+    rates = np.array([0.2, 0.15, 0.1, 0.05, 0.3])
+    caps = np.array([0.9, 0.9, 0.8, 0.8, 0.7])
+    floors = np.array([0.0, 0.0, 0.0, 0.0, 0.3])
+    confidence = np.where(counts > 0, np.minimum(caps, counts * rates), floors)
+
+    scores = np.stack([clinical, mechanistic, publication, genomic, safety], axis=1)
+    return scores, confidence, counts.sum(axis=1)
+
+
+def _score_partition_worker(
+    config: Dict[str, Any], partition: int, partitions: int, full_rescore: bool
+) -> Tuple[pd.DataFrame, List[str]]:
+    """Score one gene partition on the worker's own connection (worker)."""
+    processor = EvidenceScoringProcessor(config)
+    processor.connection = processor.db_manager.conn
+    try:
+        return processor._score_partition(partition, partitions, None, full_rescore)
+    finally:
+        processor.db_manager.close()
+
+
 @dataclass
 class EvidenceScore:
     """Individual evidence score with metadata."""
@@ -71,7 +454,8 @@ class EvidenceScoringProcessor(BaseProcessor):
         """Initialize the evidence scoring processor."""
         super().__init__(config)
 
-        # Evidence type weights for different use cases
+        # Evidence type weights for different use cases (defaults, overridden
+        # by the use_case_weights section of the scoring config)
         self.use_case_weights = {
             UseCase.DRUG_REPURPOSING: {
                 EvidenceType.CLINICAL: 0.35,
@@ -102,6 +486,11 @@ class EvidenceScoringProcessor(BaseProcessor):
                 EvidenceType.SAFETY: 0.10,
             },
         }
+        scoring_config = Path(
+            self.config.get("evidence_scoring_config", DEFAULT_SCORING_CONFIG)
+        )
+        if scoring_config.exists():
+            self.use_case_weights.update(load_use_case_weights(scoring_config))
 
         # Source reliability weights
         self.source_weights = {
@@ -129,6 +518,9 @@ class EvidenceScoringProcessor(BaseProcessor):
             EvidenceType.SAFETY: 10.0,
         }
 
+        # Worker processes (gene partitions) for full scoring runs
+        self.max_workers = config.get("max_workers", 4)
+
         # Required schema version
         self.required_schema_version = "0.1.8"
 
@@ -696,185 +1088,496 @@ class EvidenceScoringProcessor(BaseProcessor):
 
         return total_quality / total_weight if total_weight > 0 else 0.0
 
-    def process_evidence_scoring(
-        self, limit_records: Optional[int] = None
-    ) -> Dict[str, Any]:
-        """Process evidence scoring for all genes in the database."""
-        self.logger.info("Starting evidence scoring processing")
+    def weight_matrix(self) -> np.ndarray:
+        """Return use-case weights as an (EVIDENCE_TYPES x USE_CASES) matrix."""
+        return np.array(
+            [
+                [
+                    self.use_case_weights[use_case].get(evidence_type, 0.0)
+                    for use_case in USE_CASES
+                ]
+                for evidence_type in EVIDENCE_TYPES
+            ]
+        )
+
+    def weights_hash(self) -> str:
+        """Fingerprint of the use-case weights the composites are built with."""
+        weights = np.round(self.weight_matrix(), 6)
+        return hashlib.sha256(weights.tobytes()).hexdigest()[:16]
+
+    def score_components(
+        self, scores: np.ndarray, confidence: np.ndarray
+    ) -> Dict[str, np.ndarray]:
+        """Combine component scores into composite scores for every use case.
 
-        # Get all genes with drug data
-        query = """
-        SELECT transcript_id, gene_symbol, drugs, pharmgkb_pathways, go_terms,
-               pathways, source_references, features, molecular_functions, pharmgkb_variants
-        FROM cancer_transcript_base 
-        WHERE drugs IS NOT NULL AND drugs != '{}'
+        Vectorized counterpart of calculate_composite_score: one matrix product
+        with the use-case weight matrix, uncertainty propagation for the 95%
+        confidence intervals, and the score-weighted evidence quality.
+
+        Args:
+            scores: (genes x EVIDENCE_TYPES) component scores
+            confidence: (genes x EVIDENCE_TYPES) component confidences
+
+        Returns:
+            Dictionary with (genes x USE_CASES) 'overall', 'ci_lower' and
+            'ci_upper' matrices and the per-gene 'evidence_quality'
         """
+        weights = self.weight_matrix()
+        overall = scores @ weights
+
+        uncertainty = (1.0 - confidence) * scores
+        margin = 1.96 * np.sqrt(uncertainty**2 @ weights**2)
+
+        quality_weight = np.where(scores > 0, scores, 0.1)
+        quality = (confidence * COMPONENT_SOURCE_RELIABILITY * quality_weight).sum(
+            axis=1
+        ) / quality_weight.sum(axis=1)
+
+        return {
+            "overall": np.round(overall, 2),
+            "ci_lower": np.round(np.maximum(0.0, overall - margin), 2),
+            "ci_upper": np.round(np.minimum(100.0, overall + margin), 2),
+            "evidence_quality": np.round(quality, 3),
+        }
 
+    def _load_gene_features(
+        self,
+        limit_records: Optional[int] = None,
+        partition: int = 0,
+        partitions: int = 1,
+    ) -> pd.DataFrame:
+        """Load the per-gene feature matrix (one row per scored gene symbol).
+
+        Args:
+            limit_records: Optional maximum number of genes
+            partition: Gene hash partition to load
+            partitions: Number of partitions (1 loads every gene)
+        """
+        query = GENE_FEATURES_QUERY
         if limit_records:
-            query += f" LIMIT {limit_records}"
+            query += f" LIMIT {int(limit_records)}"
 
         cursor = self.connection.cursor()
-        cursor.execute(query)
-        records = cursor.fetchall()
-
-        self.logger.info(f"Processing evidence scores for {len(records)} genes")
-
-        score_updates = []
-        use_cases = [
-            UseCase.DRUG_REPURPOSING,
-            UseCase.BIOMARKER_DISCOVERY,
-            UseCase.PATHWAY_ANALYSIS,
-            UseCase.THERAPEUTIC_TARGETING,
-        ]
-
-        progress_bar = get_progress_bar(
-            total=len(records),
-            desc="Calculating evidence scores",
-            module_name="evidence_scoring",
+        try:
+            cursor.execute(
+                query,
+                {
+                    "cancer_terms": "|".join(CANCER_GO_KEYWORDS),
+                    "partition": partition,
+                    "partitions": partitions,
+                },
+            )
+            rows = cursor.fetchall()
+        finally:
+            cursor.close()
+
+        return pd.DataFrame(rows, columns=["gene_symbol"] + GENE_FEATURES)
+
+    def _load_component_cache(
+        self, partition: int = 0, partitions: int = 1
+    ) -> pd.DataFrame:
+        """Load cached component scores, indexed by gene symbol."""
+        columns = (
+            ["gene_symbol", "input_hash", "weights_hash"]
+            + COMPONENT_COLUMNS
+            + CONFIDENCE_COLUMNS
+            + ["evidence_count"]
         )
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute(
+                f"SELECT {', '.join(columns)} FROM evidence_component_scores "
+                f"WHERE {PARTITION_FILTER.format(column='gene_symbol')}",
+                {"partition": partition, "partitions": partitions},
+            )
+            rows = cursor.fetchall()
+        finally:
+            cursor.close()
+
+        return pd.DataFrame(rows, columns=columns).set_index("gene_symbol")
+
+    def _write_evidence_scores(
+        self,
+        genes: pd.DataFrame,
+        composite: Dict[str, np.ndarray],
+        weights_hash: str,
+        stale: Optional[List[str]] = None,
+    ) -> None:
+        """Write component scores and composites of the given genes in bulk.
+
+        The genes' cached components are upserted into
+        evidence_component_scores and their gene-level rows (drug_id NULL) of
+        evidence_scoring_metadata replaced, both from COPY-loaded staging
+        tables. Rows of stale genes are removed from both tables. Everything
+        is committed in one transaction: autocommit, which DatabaseManager
+        connections use by default, is switched off until the writes are
+        committed or rolled back, so a failed write leaves the cache and the
+        scores untouched.
+
+        Args:
+            genes: One row per gene with gene_symbol, input_hash, the component
+                and confidence columns and evidence_count
+            composite: score_components() result aligned with genes
+            weights_hash: Fingerprint of the weights the composites used
+            stale: Genes that are no longer scored
+        """
+        n_genes, n_use_cases = composite["overall"].shape
+        rows = pd.DataFrame(
+            {
+                "gene_symbol": np.repeat(genes["gene_symbol"].to_numpy(), n_use_cases),
+                "use_case": np.tile([u.value for u in USE_CASES], n_genes),
+                "overall_score": composite["overall"].ravel(),
+                "ci_lower": composite["ci_lower"].ravel(),
+                "ci_upper": composite["ci_upper"].ravel(),
+                "evidence_quality": np.repeat(
+                    composite["evidence_quality"], n_use_cases
+                ),
+                "evidence_count": np.repeat(
+                    genes["evidence_count"].to_numpy(dtype=int), n_use_cases
+                ),
+            }
+        )
+        for column in COMPONENT_COLUMNS:
+            rows[column] = np.repeat(
+                np.round(genes[column].to_numpy(dtype=float), 2), n_use_cases
+            )
 
+        components = genes[
+            ["gene_symbol", "input_hash"]
+            + COMPONENT_COLUMNS
+            + CONFIDENCE_COLUMNS
+            + ["evidence_count"]
+        ].astype({"evidence_count": int})
+
+        buffers = {}
+        for name, frame in (("scores", rows), ("components", components)):
+            buffers[name] = io.StringIO()
+            frame.to_csv(buffers[name], sep="\t", header=False, index=False)
+            buffers[name].seek(0)
+
+        component_json = ", ".join(f"'{t.value}', {t.value}" for t in EVIDENCE_TYPES)
+        autocommit = self.connection.autocommit
+        self.connection.autocommit = False
+        cursor = self.connection.cursor()
         try:
-            for record in records:
-                progress_bar.update()
+            if stale:
+                cursor.execute(
+                    "DELETE FROM evidence_component_scores WHERE gene_symbol = ANY(%s)",
+                    (list(stale),),
+                )
+                cursor.execute(
+                    """
+                    DELETE FROM evidence_scoring_metadata
+                    WHERE gene_symbol = ANY(%s) AND drug_id IS NULL
+                    """,
+                    (list(stale),),
+                )
+
+            if not n_genes:
+                self.connection.commit()
+                return
+
+            cursor.execute(
+                f"""
+                CREATE TEMP TABLE IF NOT EXISTS evidence_components_stage (
+                    gene_symbol TEXT,
+                    input_hash TEXT,
+                    {", ".join(f"{c} FLOAT" for c in COMPONENT_COLUMNS)},
+                    {", ".join(f"{c} FLOAT" for c in CONFIDENCE_COLUMNS)},
+                    evidence_count INTEGER
+                )
+                """
+            )
+            cursor.execute("TRUNCATE evidence_components_stage")
+            cursor.copy_expert(
+                f"COPY evidence_components_stage ({', '.join(components.columns)}) "
+                "FROM STDIN",
+                buffers["components"],
+            )
+            value_columns = COMPONENT_COLUMNS + CONFIDENCE_COLUMNS + ["evidence_count"]
+            cursor.execute(
+                f"""
+                INSERT INTO evidence_component_scores (
+                    {", ".join(components.columns)}, weights_hash, updated_at
+                )
+                SELECT {", ".join(components.columns)}, %s, CURRENT_TIMESTAMP
+                FROM evidence_components_stage
+                ON CONFLICT (gene_symbol) DO UPDATE SET
+                    {", ".join(f"{c} = EXCLUDED.{c}" for c in value_columns)},
+                    weights_hash = EXCLUDED.weights_hash,
+                    updated_at = CASE
+                        WHEN evidence_component_scores.input_hash
+                             IS DISTINCT FROM EXCLUDED.input_hash
+                        THEN EXCLUDED.updated_at
+                        ELSE evidence_component_scores.updated_at
+                    END,
+                    input_hash = EXCLUDED.input_hash
+                """,
+                (weights_hash,),
+            )
 
-                (
-                    transcript_id,
+            cursor.execute(
+                f"""
+                CREATE TEMP TABLE IF NOT EXISTS evidence_scores_stage (
+                    gene_symbol TEXT,
+                    use_case TEXT,
+                    overall_score FLOAT,
+                    ci_lower FLOAT,
+                    ci_upper FLOAT,
+                    evidence_quality FLOAT,
+                    evidence_count INTEGER,
+                    {", ".join(f"{c} FLOAT" for c in COMPONENT_COLUMNS)}
+                )
+                """
+            )
+            cursor.execute("TRUNCATE evidence_scores_stage")
+            cursor.copy_expert(
+                f"COPY evidence_scores_stage ({', '.join(rows.columns)}) FROM STDIN",
+                buffers["scores"],
+            )
+            cursor.execute(
+                """
+                DELETE FROM evidence_scoring_metadata e
+                USING (SELECT DISTINCT gene_symbol FROM evidence_scores_stage) s
+                WHERE e.gene_symbol = s.gene_symbol AND e.drug_id IS NULL
+                """
+            )
+            cursor.execute(
+                f"""
+                INSERT INTO evidence_scoring_metadata (
+                    gene_symbol, drug_id, evidence_score, use_case,
+                    confidence_lower, confidence_upper, evidence_count,
+                    evidence_quality, scoring_version, last_updated
+                )
+                SELECT
                     gene_symbol,
-                    drugs,
-                    pharmgkb_pathways,
-                    go_terms,
-                    pathways,
-                    source_references,
-                    features,
-                    molecular_functions,
-                    pharmgkb_variants,
-                ) = record
-
-                # Prepare gene data structure
-                gene_data = {
-                    "drugs": drugs or {},
-                    "pharmgkb_pathways": pharmgkb_pathways or {},
-                    "go_terms": go_terms or {},
-                    "pathways": pathways or [],
-                    "publications": [],  # Publications not available in current schema
-                    "source_references": source_references or {},
-                    "features": features or {},
-                    "molecular_functions": molecular_functions or [],
-                    "pharmgkb_variants": pharmgkb_variants or {},
-                }
+                    NULL,
+                    jsonb_build_object(
+                        'overall_score', overall_score,
+                        'component_scores', jsonb_build_object({component_json}),
+                        'confidence_interval', jsonb_build_array(ci_lower, ci_upper),
+                        'evidence_quality', evidence_quality
+                    ),
+                    use_case,
+                    ci_lower,
+                    ci_upper,
+                    evidence_count,
+                    evidence_quality,
+                    %s,
+                    CURRENT_TIMESTAMP
+                FROM evidence_scores_stage
+                """,
+                (SCORING_VERSION,),
+            )
+            self.connection.commit()
+        except Exception:
+            self.connection.rollback()
+            raise
+        finally:
+            cursor.close()
+            self.connection.autocommit = autocommit
 
-                # Calculate individual evidence scores
-                evidence_scores = [
-                    self.calculate_clinical_evidence_score(gene_data),
-                    self.calculate_mechanistic_evidence_score(gene_data),
-                    self.calculate_publication_evidence_score(gene_data),
-                    self.calculate_genomic_evidence_score(gene_data),
-                    self.calculate_safety_evidence_score(gene_data),
+    def process_evidence_scoring(
+        self,
+        limit_records: Optional[int] = None,
+        full_rescore: Optional[bool] = None,
+    ) -> Dict[str, Any]:
+        """Score all genes with drug or PharmGKB evidence in one batch.
+
+        Builds the (genes x features) matrix from the normalized tables and
+        compares each gene's input hash with evidence_component_scores. Only
+        new or changed genes get their components rescored; composites are
+        recomputed for every gene from the (cached) components, which is
+        cheap, and written for the rescored genes plus any gene scored with
+        different use-case weights. Genes without evidence anymore are
+        removed.
+
+        With max_workers > 1 the genes are split into hash partitions that
+        are loaded and scored in a process pool, each worker on its own
+        connection. The partition results are merged in gene order and
+        written in one transaction, so the outcome does not depend on the
+        number of workers.
+
+        Args:
+            limit_records: Optional maximum number of genes to score
+                (scored in-process)
+            full_rescore: Rescore every gene (default: the
+                'evidence_full_rescore' config option)
+
+        Returns:
+            Scoring statistics
+        """
+        self.logger.info("Starting evidence scoring processing")
+        if full_rescore is None:
+            full_rescore = bool(self.config.get("evidence_full_rescore", False))
+
+        workers = 1 if limit_records else max(1, int(self.max_workers))
+        if workers == 1:
+            results = [self._score_partition(0, 1, limit_records, full_rescore)]
+        else:
+            self.logger.info(f"Scoring {workers} gene partitions in parallel")
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(
+                        _score_partition_worker,
+                        self.config,
+                        partition,
+                        workers,
+                        full_rescore,
+                    )
+                    for partition in range(workers)
                 ]
+                results = [future.result() for future in futures]
 
-                # Calculate composite scores for each use case
-                use_case_scores = {}
-                for use_case in use_cases:
-                    composite = self.calculate_composite_score(
-                        evidence_scores, use_case
-                    )
-                    use_case_scores[use_case.value] = {
-                        "overall_score": composite.overall_score,
-                        "component_scores": composite.component_scores,
-                        "confidence_interval": composite.confidence_interval,
-                        "evidence_quality": composite.evidence_quality,
-                    }
+        genes = pd.concat([genes for genes, _ in results], ignore_index=True)
+        genes = genes.sort_values("gene_symbol", kind="stable", ignore_index=True)
+        stale = sorted(gene for _, part_stale in results for gene in part_stale)
+        rescored = genes.pop("rescored").to_numpy(dtype=bool)
+        previous_weights = genes.pop("weights_hash")
 
-                # Prepare drug-specific scores
-                drug_specific_scores = {}
-                for drug_key, drug_data in gene_data["drugs"].items():
-                    if isinstance(drug_data, dict):
-                        drug_name = drug_data.get("name", drug_key)
-                        # Use therapeutic targeting as default for drug-specific scoring
-                        score = use_case_scores[UseCase.THERAPEUTIC_TARGETING.value][
-                            "overall_score"
-                        ]
-                        drug_specific_scores[drug_key] = {
-                            "drug_name": drug_name,
-                            "score": score,
-                            "source": drug_data.get("source", "unknown"),
-                        }
-
-                # Build comprehensive drug_scores structure
-                new_drug_scores = {
-                    "use_case_scores": use_case_scores,
-                    "drug_specific_scores": drug_specific_scores,
-                    "scoring_version": "1.0",
-                    "last_updated": datetime.now().isoformat(),
-                }
+        self.logger.info(
+            f"Evidence scoring: {len(genes)} genes, {int(rescored.sum())} rescored, "
+            f"{len(stale)} removed"
+        )
+        stats = self._score_and_write(genes, previous_weights, rescored, stale)
 
-                score_updates.append((transcript_id, json.dumps(new_drug_scores)))
+        self.logger.info("Evidence scoring processing completed successfully")
+        return stats
 
-        finally:
-            progress_bar.close()
+    def _score_partition(
+        self,
+        partition: int,
+        partitions: int,
+        limit_records: Optional[int],
+        full_rescore: bool,
+    ) -> Tuple[pd.DataFrame, List[str]]:
+        """Rescore the changed genes of one gene partition.
+
+        Returns:
+            Tuple of (genes, stale): one row per gene with gene_symbol,
+            input_hash, the component and confidence columns, evidence_count,
+            'rescored' and the cached 'weights_hash'; and the cached genes of
+            the partition that are no longer scored
+        """
+        features = self._load_gene_features(limit_records, partition, partitions)
+        cache = self._load_component_cache(partition, partitions)
+        symbols = features["gene_symbol"]
+        # A limited run sees only part of the genes, so nothing is stale then
+        stale = [] if limit_records else sorted(set(cache.index) - set(symbols))
+
+        genes = pd.DataFrame({"gene_symbol": symbols.to_numpy()})
+        genes["input_hash"] = feature_hashes(features) if len(features) else []
+        cached = cache.reindex(symbols.to_numpy())
+        rescored = (
+            np.ones(len(genes), dtype=bool)
+            if full_rescore
+            else cached["input_hash"].to_numpy() != genes["input_hash"].to_numpy()
+        )
 
-        # Batch update database
-        self.logger.info(f"Updating drug scores for {len(score_updates)} genes")
+        genes[COMPONENT_COLUMNS + CONFIDENCE_COLUMNS + ["evidence_count"]] = cached[
+            COMPONENT_COLUMNS + CONFIDENCE_COLUMNS + ["evidence_count"]
+        ].to_numpy(dtype=float)
+        if rescored.any():
+            scores, confidence, evidence_count = compute_component_scores(
+                features[rescored]
+            )
+            genes.loc[rescored, COMPONENT_COLUMNS] = scores
+            genes.loc[rescored, CONFIDENCE_COLUMNS] = confidence
+            genes.loc[rescored, "evidence_count"] = evidence_count
 
-        update_query = """
-        UPDATE cancer_transcript_base 
-        SET drug_scores = %s::jsonb
-        WHERE transcript_id = %s
-        """
+        genes["rescored"] = rescored
+        genes["weights_hash"] = cached["weights_hash"].to_numpy()
+        return genes, stale
 
-        cursor.executemany(
-            update_query, [(scores, tid) for tid, scores in score_updates]
-        )
-        self.connection.commit()
+    def rescore_composites(self, force: bool = False) -> Dict[str, Any]:
+        """Recompute composites from cached component scores only.
 
-        # Generate summary statistics
-        stats = self._generate_scoring_statistics(score_updates)
+        Used after changing the use-case weights: no features are loaded and
+        no components rescored.
 
-        self.logger.info("Evidence scoring processing completed successfully")
-        return stats
+        Args:
+            force: Rewrite every gene, not only those scored with other weights
+
+        Returns:
+            Scoring statistics
+        """
+        cache = self._load_component_cache()
+        genes = cache.reset_index()
+        self.logger.info(f"Recomputing composite scores for {len(genes)} genes")
+        return self._score_and_write(
+            genes,
+            cache["weights_hash"],
+            np.full(len(genes), force, dtype=bool),
+            [],
+        )
 
-    def _generate_scoring_statistics(
-        self, score_updates: List[Tuple[str, str]]
+    def _score_and_write(
+        self,
+        genes: pd.DataFrame,
+        previous_weights: pd.Series,
+        rescored: np.ndarray,
+        stale: List[str],
     ) -> Dict[str, Any]:
-        """Generate summary statistics for the scoring results."""
-        if not score_updates:
+        """Compute composites for all genes and write the outdated ones."""
+        if genes.empty and not stale:
             return {}
 
-        all_scores = []
-        use_case_stats = defaultdict(list)
+        composite = self.score_components(
+            genes[COMPONENT_COLUMNS].to_numpy(dtype=float),
+            genes[CONFIDENCE_COLUMNS].to_numpy(dtype=float),
+        )
+        weights_hash = self.weights_hash()
+        write = rescored | (previous_weights.to_numpy() != weights_hash)
+
+        if write.any() or stale:
+            self.logger.info(f"Writing evidence scores for {int(write.sum())} genes")
+            self._write_evidence_scores(
+                genes[write].reset_index(drop=True),
+                {name: values[write] for name, values in composite.items()},
+                weights_hash,
+                stale,
+            )
+
+        stats = self._generate_scoring_statistics(composite["overall"])
+        stats.update(
+            {
+                "genes_rescored": int(rescored.sum()),
+                "genes_written": int(write.sum()),
+                "genes_removed": len(stale),
+            }
+        )
+        return stats
 
-        for _, scores_json in score_updates:
-            scores = json.loads(scores_json)
-            use_case_scores = scores.get("use_case_scores", {})
+    def _generate_scoring_statistics(self, overall: np.ndarray) -> Dict[str, Any]:
+        """Generate summary statistics for the scoring results.
 
-            for use_case, score_data in use_case_scores.items():
-                overall_score = score_data.get("overall_score", 0)
-                all_scores.append(overall_score)
-                use_case_stats[use_case].append(overall_score)
+        Args:
+            overall: (genes x USE_CASES) composite scores
+        """
+        if not overall.size:
+            return {}
 
         stats = {
-            "total_genes_scored": len(score_updates),
+            "total_genes_scored": overall.shape[0],
             "overall_statistics": {
-                "mean_score": np.mean(all_scores) if all_scores else 0,
-                "median_score": np.median(all_scores) if all_scores else 0,
-                "std_score": np.std(all_scores) if all_scores else 0,
-                "min_score": np.min(all_scores) if all_scores else 0,
-                "max_score": np.max(all_scores) if all_scores else 0,
+                "mean_score": float(np.mean(overall)),
+                "median_score": float(np.median(overall)),
+                "std_score": float(np.std(overall)),
+                "min_score": float(np.min(overall)),
+                "max_score": float(np.max(overall)),
             },
             "use_case_statistics": {},
         }
 
-        for use_case, scores in use_case_stats.items():
-            if scores:
-                stats["use_case_statistics"][use_case] = {
-                    "mean_score": np.mean(scores),
-                    "median_score": np.median(scores),
-                    "high_confidence_genes": len([s for s in scores if s > 70]),
-                    "medium_confidence_genes": len(
-                        [s for s in scores if 40 <= s <= 70]
-                    ),
-                    "low_confidence_genes": len([s for s in scores if s < 40]),
-                }
+        for column, use_case in enumerate(USE_CASES):
+            scores = overall[:, column]
+            stats["use_case_statistics"][use_case.value] = {
+                "mean_score": float(np.mean(scores)),
+                "median_score": float(np.median(scores)),
+                "high_confidence_genes": int((scores > 70).sum()),
+                "medium_confidence_genes": int(((scores >= 40) & (scores <= 70)).sum()),
+                "low_confidence_genes": int((scores < 40).sum()),
+            }
 
         return stats
 
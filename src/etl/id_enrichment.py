@@ -8,6 +8,7 @@ compatibility and searchability.
 # Standard library imports
 import csv
 import gzip
+import io
 import json
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Set, Tuple, DefaultDict
@@ -16,6 +17,11 @@ from datetime import datetime
 import re
 
 # Third party imports
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
 from tqdm import tqdm
 from rich.console import Console
 from rich.table import Table
@@ -26,6 +32,109 @@ from ..utils.logging import get_progress_bar
 
 # Constants
 HUMAN_TAXID = "9606"  # NCBI taxonomy ID for humans
+UNIPROT_MAPPING_FILE = "uniprot_human_idmapping.parquet"
+UNIPROT_CSV_BLOCK_SIZE = 64 * 1024 * 1024
+# Genes staged per COPY + UPDATE ... FROM round
+ID_UPDATE_BATCH_SIZE = 50000
+
+# (UniProt ID type, value prefix or None, standardized ID type)
+UNIPROT_ID_TYPE_RULES = [
+    ("Gene_Name", None, "gene_symbol"),
+    ("GeneID", None, "ncbi_id"),
+    ("Ensembl", "ENSG", "ensembl_gene_id"),
+    ("Ensembl", "ENST", "ensembl_transcript_id"),
+    ("RefSeq", "NP_", "refseq_protein_id"),
+    ("RefSeq", "XP_", "refseq_protein_id"),
+    ("RefSeq", "NM_", "refseq_mrna_id"),
+    ("RefSeq", "XM_", "refseq_mrna_id"),
+    ("HGNC", None, "hgnc_id"),
+    ("MIM", None, "omim_id"),
+    ("KEGG", None, "kegg_id"),
+    ("PDB", None, "pdb_id"),
+]
+UNIPROT_ID_TYPE_NAMES = list(dict.fromkeys(rule[2] for rule in UNIPROT_ID_TYPE_RULES))
+
+UNIPROT_MAPPING_SCHEMA = pa.schema(
+    [
+        ("uniprot_id", pa.string()),
+        ("id_type", pa.string()),
+        ("id_value", pa.string()),
+    ]
+)
+
+
+def standardize_uniprot_id_types(source_type: pa.Array, id_value: pa.Array) -> pa.Array:
+    """Translate UniProt ID types to standardized ID types.
+
+    Args:
+        source_type: UniProt ID type column (e.g. 'Ensembl', 'RefSeq')
+        id_value: ID value column
+
+    Returns:
+        Standardized ID type per row; null for rows that are not used
+    """
+    id_type = pa.nulls(len(source_type), type=pa.string())
+    for uniprot_type, prefix, standard_type in UNIPROT_ID_TYPE_RULES:
+        mask = pc.equal(source_type, uniprot_type)
+        if prefix:
+            mask = pc.and_kleene(mask, pc.starts_with(id_value, prefix))
+        id_type = pc.if_else(mask, standard_type, id_type)
+    return id_type
+
+
+def _copy_escape(value: str) -> str:
+    """Escape a value for COPY text format."""
+    return (
+        value.replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+def _pg_text_array(values: List[str]) -> str:
+    """Format strings as a PostgreSQL text[] literal."""
+    elements = (
+        '"' + str(value).replace("\\", "\\\\").replace('"', '\\"') + '"'
+        for value in values
+    )
+    return "{" + ",".join(elements) + "}"
+
+
+def id_updates_to_copy(updates: List[Tuple]) -> io.StringIO:
+    """Serialize ID update tuples for ``COPY ... FROM STDIN``.
+
+    Rows are keyed by gene symbol; a later tuple for the same symbol replaces
+    an earlier one, so the staged rows join at most once per transcript.
+
+    Args:
+        updates: (uniprot_ids, ncbi_ids, refseq_ids, alt_gene_ids_json,
+                 alt_transcript_ids_json, gene_symbol) tuples
+
+    Returns:
+        Text-format COPY buffer positioned at the start
+    """
+    rows = {update[5]: update for update in updates}
+    buffer = io.StringIO()
+    for (
+        uniprot_ids,
+        ncbi_ids,
+        refseq_ids,
+        alt_gene,
+        alt_transcript,
+        symbol,
+    ) in rows.values():
+        fields = [
+            symbol,
+            _pg_text_array(uniprot_ids or []),
+            _pg_text_array(ncbi_ids or []),
+            _pg_text_array(refseq_ids or []),
+            alt_gene or "{}",
+            alt_transcript or "{}",
+        ]
+        buffer.write("\t".join(_copy_escape(field) for field in fields) + "\n")
+    buffer.seek(0)
+    return buffer
 
 
 class IDEnrichmentProcessor(BaseProcessor):
@@ -88,18 +197,23 @@ class IDEnrichmentProcessor(BaseProcessor):
             raise DownloadError(f"Failed to download UniProt ID mapping: {e}")
 
     def _filter_uniprot_mapping(self, input_path: Path) -> Path:
-        """Filter UniProt mapping file to include only human entries.
+        """Filter the UniProt mapping to human entries and the ID types we use.
+
+        The gzipped file is streamed once through pyarrow's CSV reader; each
+        record batch is filtered and its UniProt ID types translated to our
+        standardized types with vectorized compute kernels. The result is a
+        long-format Parquet file (uniprot_id, id_type, id_value).
 
         Args:
             input_path: Path to the full mapping file
 
         Returns:
-            Path to the filtered file
+            Path to the filtered Parquet file
 
         Raises:
             ProcessingError: If filtering fails
         """
-        output_path = self.id_dir / "uniprot_human_idmapping_filtered.dat.gz"
+        output_path = self.id_dir / UNIPROT_MAPPING_FILE
 
         # Check if already filtered
         meta_path = self.id_dir / "uniprot_filtered_meta.json"
@@ -107,7 +221,10 @@ class IDEnrichmentProcessor(BaseProcessor):
             try:
                 with open(meta_path, "r") as f:
                     self.filter_metadata["uniprot"] = json.load(f)
-                if self.filter_metadata["uniprot"].get("filtered", False):
+                if (
+                    self.filter_metadata["uniprot"].get("filtered", False)
+                    and self.filter_metadata["uniprot"].get("format") == "parquet"
+                ):
                     self.logger.info(
                         f"Using pre-filtered UniProt mapping with "
                         f"{self.filter_metadata['uniprot'].get('human', 0):,} human entries "
@@ -121,78 +238,104 @@ class IDEnrichmentProcessor(BaseProcessor):
 
         try:
             self.logger.info(
-                "Filtering UniProt ID mapping to ensure human entries only"
+                "Filtering UniProt ID mapping to human entries and used ID types"
             )
 
             total_entries = 0
-            human_entries = 0
-
-            # Improved filtering with better progress reporting
-            with gzip.open(input_path, "rt") as f_in:
-                # Count lines first to set up progress bar
-                self.logger.info("Counting lines in UniProt mapping file...")
-                line_count = sum(1 for _ in f_in)
-                self.logger.info(f"UniProt mapping file contains {line_count:,} lines")
-                f_in.seek(0)  # Reset file pointer
-
-                # First pass: identify human UniProt IDs
-                human_uniprot_ids = set()
-                self.logger.info("First pass: identifying human UniProt IDs...")
-
-                # Fix: Use get_progress_bar instead of direct tqdm
-                pbar = get_progress_bar(
-                    total=line_count,
-                    desc="Identifying human entries",
-                    module_name="etl.id_enrichment",
+            human_ids: List[pa.Array] = []
+            unfiltered_path = output_path.with_name(f".{output_path.name}.tmp")
+
+            raw = pa.OSFile(str(input_path))
+            pbar = get_progress_bar(
+                total=input_path.stat().st_size,
+                desc="Filtering UniProt mapping",
+                module_name="etl.id_enrichment",
+            )
+            try:
+                reader = pacsv.open_csv(
+                    pa.CompressedInputStream(raw, "gzip"),
+                    read_options=pacsv.ReadOptions(
+                        column_names=["uniprot_id", "source_type", "id_value"],
+                        block_size=UNIPROT_CSV_BLOCK_SIZE,
+                    ),
+                    parse_options=pacsv.ParseOptions(
+                        delimiter="\t",
+                        quote_char=False,
+                        invalid_row_handler=lambda row: "skip",
+                    ),
+                    convert_options=pacsv.ConvertOptions(
+                        column_types={
+                            "uniprot_id": pa.string(),
+                            "source_type": pa.string(),
+                            "id_value": pa.string(),
+                        }
+                    ),
                 )
+                with pq.ParquetWriter(
+                    unfiltered_path, UNIPROT_MAPPING_SCHEMA
+                ) as writer:
+                    for batch in reader:
+                        total_entries += batch.num_rows
+                        pbar.update(raw.tell() - pbar.n)
+
+                        source_type = batch.column("source_type")
+                        id_value = batch.column("id_value")
+
+                        human_ids.append(
+                            batch.column("uniprot_id").filter(
+                                pc.and_(
+                                    pc.equal(source_type, "NCBI_TaxID"),
+                                    pc.equal(id_value, HUMAN_TAXID),
+                                )
+                            )
+                        )
 
-                for line in f_in:
-                    total_entries += 1
-                    pbar.update(1)
-
-                    parts = line.strip().split("\t")
-                    if (
-                        len(parts) >= 3
-                        and parts[1] == "NCBI_TaxID"
-                        and parts[2] == HUMAN_TAXID
-                    ):
-                        human_uniprot_ids.add(parts[0])
-
-                # Close the first progress bar
+                        id_type = standardize_uniprot_id_types(source_type, id_value)
+                        keep = pc.and_kleene(
+                            pc.is_valid(id_type),
+                            pc.invert(
+                                pc.is_in(id_value, value_set=pa.array(["", "-"]))
+                            ),
+                        )
+                        writer.write_table(
+                            pa.table(
+                                {
+                                    "uniprot_id": batch.column("uniprot_id"),
+                                    "id_type": id_type,
+                                    "id_value": id_value,
+                                },
+                                schema=UNIPROT_MAPPING_SCHEMA,
+                            ).filter(keep)
+                        )
+            finally:
                 pbar.close()
-
-                # Reset file pointer for second pass
-                f_in.seek(0)
-
-                # Second pass: extract all entries for human UniProt IDs
-                self.logger.info(
-                    f"Second pass: extracting {len(human_uniprot_ids):,} human UniProt entries..."
+                raw.close()
+
+            # Keep entries of human UniProt IDs (the by-organism file is
+            # human-only, so a file without taxonomy rows is kept whole)
+            table = pq.read_table(unfiltered_path)
+            human_id_set = pc.unique(pa.chunked_array(human_ids, type=pa.string()))
+            if len(human_id_set):
+                table = table.filter(
+                    pc.is_in(table.column("uniprot_id"), value_set=human_id_set)
                 )
-
-                # Fix: Use get_progress_bar again for the second pass
-                pbar = get_progress_bar(
-                    total=line_count,
-                    desc="Filtering human entries",
-                    module_name="etl.id_enrichment",
+            else:
+                self.logger.warning(
+                    "No NCBI_TaxID entries in UniProt mapping, keeping all entries"
                 )
+            pq.write_table(table, output_path)
+            unfiltered_path.unlink()
 
-                with gzip.open(output_path, "wt") as f_out:
-                    for line in f_in:
-                        pbar.update(1)
-                        parts = line.strip().split("\t")
-                        if parts[0] in human_uniprot_ids:
-                            human_entries += 1
-                            f_out.write(line)
-
-                # Close the second progress bar
-                pbar.close()
+            human_entries = table.num_rows
+            uniprot_count = len(pc.unique(table.column("uniprot_id")))
 
             # Update and save metadata
             self.filter_metadata["uniprot"] = {
                 "filtered": True,
+                "format": "parquet",
                 "total": total_entries,
                 "human": human_entries,
-                "uniprot_ids": len(human_uniprot_ids),
+                "uniprot_ids": uniprot_count,
                 "filter_date": datetime.now().isoformat(),
             }
 
@@ -214,6 +357,9 @@ class IDEnrichmentProcessor(BaseProcessor):
     ) -> Dict[str, Dict[str, List[str]]]:
         """Process UniProt ID mapping to extract comprehensive ID mappings.
 
+        The filtered mapping is pivoted to gene symbols with a join on the
+        UniProt ID and a group-by on (gene symbol, ID type).
+
         Args:
             mapping_file: Path to the UniProt ID mapping file
 
@@ -228,133 +374,35 @@ class IDEnrichmentProcessor(BaseProcessor):
 
             # Make sure we're using the human-filtered version
             mapping_file = self._filter_uniprot_mapping(mapping_file)
+            df = pq.read_table(mapping_file).to_pandas()
 
-            # Initialize mapping dictionaries
-            # First by UniProt ID to collect all IDs per protein
-            uniprot_mapping: DefaultDict[str, Dict[str, List[str]]] = defaultdict(
-                lambda: defaultdict(list)
-            )
+            symbols = df.loc[df["id_type"] == "gene_symbol", ["uniprot_id", "id_value"]]
+            symbols = symbols.rename(columns={"id_value": "gene_symbol"})
 
-            # Then by gene symbol for final output
-            gene_mapping: DefaultDict[str, Dict[str, List[str]]] = defaultdict(
-                lambda: defaultdict(list)
+            # Every gene symbol of an accession gets the accession and its IDs
+            uniprot_rows = symbols.assign(
+                id_type="uniprot_ids", id_value=symbols["uniprot_id"]
             )
-
-            # Track statistics
-            id_stats = {
-                "uniprot_ids": 0,
-                "gene_symbols": 0,
-                "ncbi_ids": 0,
-                "ensembl_ids": 0,
-                "refseq_ids": 0,
-                "hgnc_ids": 0,
-                "mim_ids": 0,
-                "kegg_ids": 0,
-                "pdb_ids": 0,
-            }
-
-            # Process the mapping file
-            with gzip.open(mapping_file, "rt") as f:
-                # Count lines for progress bar
-                line_count = sum(1 for _ in f)
-                f.seek(0)  # Reset file pointer
-
-                # Fix: Use get_progress_bar instead of direct tqdm
-                pbar = get_progress_bar(
-                    total=line_count,
-                    desc="Processing UniProt mapping",
-                    module_name="etl.id_enrichment",
-                )
-
-                for line in f:
-                    pbar.update(1)
-
-                    parts = line.strip().split("\t")
-                    if len(parts) < 3:
-                        continue
-
-                    uniprot_id = parts[0]
-                    id_type = parts[1]
-                    id_value = parts[2]
-
-                    # Skip empty values
-                    if not id_value or id_value == "-":
-                        continue
-
-                    # Map ID types to our standardized types and collect in uniprot_mapping
-                    if id_type == "Gene_Name":
-                        uniprot_mapping[uniprot_id]["gene_symbol"].append(id_value)
-                        id_stats["gene_symbols"] += 1
-                    elif id_type == "GeneID":
-                        uniprot_mapping[uniprot_id]["ncbi_id"].append(id_value)
-                        id_stats["ncbi_ids"] += 1
-                    elif id_type == "Ensembl":
-                        if id_value.startswith("ENSG"):  # Ensembl gene ID
-                            uniprot_mapping[uniprot_id]["ensembl_gene_id"].append(
-                                id_value
-                            )
-                            id_stats["ensembl_ids"] += 1
-                        elif id_value.startswith("ENST"):  # Ensembl transcript ID
-                            uniprot_mapping[uniprot_id]["ensembl_transcript_id"].append(
-                                id_value
-                            )
-                            id_stats["ensembl_ids"] += 1
-                    elif id_type == "RefSeq":
-                        if id_value.startswith("NP_") or id_value.startswith("XP_"):
-                            uniprot_mapping[uniprot_id]["refseq_protein_id"].append(
-                                id_value
-                            )
-                            id_stats["refseq_ids"] += 1
-                        elif id_value.startswith("NM_") or id_value.startswith("XM_"):
-                            uniprot_mapping[uniprot_id]["refseq_mrna_id"].append(
-                                id_value
-                            )
-                            id_stats["refseq_ids"] += 1
-                    elif id_type == "HGNC":
-                        uniprot_mapping[uniprot_id]["hgnc_id"].append(id_value)
-                        id_stats["hgnc_ids"] += 1
-                    elif id_type == "MIM":
-                        uniprot_mapping[uniprot_id]["omim_id"].append(id_value)
-                        id_stats["mim_ids"] += 1
-                    elif id_type == "KEGG":
-                        uniprot_mapping[uniprot_id]["kegg_id"].append(id_value)
-                        id_stats["kegg_ids"] += 1
-                    elif id_type == "PDB":
-                        uniprot_mapping[uniprot_id]["pdb_id"].append(id_value)
-                        id_stats["pdb_ids"] += 1
-
-                # Close the progress bar
-                pbar.close()
-
-            # Now reorganize by gene symbol for easier database updates
-            for uniprot_id, id_dict in uniprot_mapping.items():
-                gene_symbols = id_dict.get("gene_symbol", [])
-
-                # Skip entries without gene symbols
-                if not gene_symbols:
-                    continue
-
-                # Add this UniProt ID to each gene symbol's entry
-                for gene_symbol in gene_symbols:
-                    # Add UniProt ID to list
-                    if uniprot_id not in gene_mapping[gene_symbol]["uniprot_ids"]:
-                        gene_mapping[gene_symbol]["uniprot_ids"].append(uniprot_id)
-
-                    # Copy all other IDs to gene mapping
-                    for id_type, id_list in id_dict.items():
-                        if id_type != "gene_symbol":  # Skip to avoid duplication
-                            for id_value in id_list:
-                                if id_value not in gene_mapping[gene_symbol][id_type]:
-                                    gene_mapping[gene_symbol][id_type].append(id_value)
+            id_rows = df[df["id_type"] != "gene_symbol"].merge(symbols, on="uniprot_id")
+            long_df = pd.concat(
+                [uniprot_rows, id_rows], ignore_index=True
+            ).drop_duplicates(["gene_symbol", "id_type", "id_value"])
+
+            grouped = long_df.groupby(["gene_symbol", "id_type"], sort=False)[
+                "id_value"
+            ].agg(list)
+            gene_mapping: Dict[str, Dict[str, List[str]]] = {}
+            for (gene_symbol, id_type), id_values in grouped.items():
+                gene_mapping.setdefault(gene_symbol, {})[id_type] = id_values
 
             # Log ID type statistics
-            id_stats["uniprot_ids"] = len(uniprot_mapping)
+            type_counts = df["id_type"].value_counts()
             self.logger.info(f"ID mapping statistics:")
-            for id_type, count in id_stats.items():
-                self.logger.info(f"  - {id_type}: {count:,}")
+            self.logger.info(f"  - uniprot_ids: {df['uniprot_id'].nunique():,}")
+            for id_type in UNIPROT_ID_TYPE_NAMES:
+                self.logger.info(f"  - {id_type}: {int(type_counts.get(id_type, 0)):,}")
 
-            # Convert defaultdict to regular dict for return
-            return {k: dict(v) for k, v in gene_mapping.items()}
+            return gene_mapping
 
         except Exception as e:
             raise ProcessingError(f"Failed to process UniProt mapping: {e}")
@@ -506,10 +554,9 @@ class IDEnrichmentProcessor(BaseProcessor):
                     )
                 )
 
-                # Process in batches - with a smaller batch size for testing
-                if len(updates) >= min(1000, self.batch_size):
+                # Each batch is one COPY and one set-based UPDATE
+                if len(updates) >= ID_UPDATE_BATCH_SIZE:
                     self._update_id_batch(updates)
-                    # Add verification after each batch during debugging
                     self.logger.info(f"Processed batch of {len(updates)} records")
                     updates = []
 
@@ -528,6 +575,12 @@ class IDEnrichmentProcessor(BaseProcessor):
     def _update_id_batch(self, updates: List[Tuple]) -> None:
         """Update a batch of transcript records with alternative IDs.
 
+        The batch is COPYed into a temp staging table and applied with one
+        ``UPDATE ... FROM`` join, so each transcript row is rewritten at most
+        once and rows whose IDs are already current are skipped. NCBI Gene IDs
+        go to gene_cross_references with one ``INSERT ... SELECT`` from the
+        same staging table.
+
         Args:
             updates: List of update tuples (uniprot_ids, ncbi_ids, refseq_ids,
                     alt_gene_ids_json, alt_transcript_ids_json, gene_symbol)
@@ -535,83 +588,76 @@ class IDEnrichmentProcessor(BaseProcessor):
         Raises:
             DatabaseError: If batch update fails
         """
-        if not self.db_manager.cursor:
-            raise DatabaseError("No database cursor available")
+        if not self.db_manager.conn or not self.db_manager.cursor:
+            raise DatabaseError("No database connection or cursor available")
 
+        cursor = self.db_manager.cursor
         try:
-            # Log some sample updates for debugging
-            sample_update = updates[0] if updates else None
             self.logger.info(f"Processing batch update with {len(updates)} records")
-            if sample_update:
-                self.logger.debug(
-                    f"Sample update - Gene: {sample_update[5]}, "
-                    + f"UniProt IDs: {sample_update[0]}, "
-                    + f"NCBI IDs: {sample_update[1]}"
+            cursor.execute(
+                """
+                CREATE TEMP TABLE IF NOT EXISTS id_enrichment_stage (
+                    gene_symbol TEXT PRIMARY KEY,
+                    uniprot_ids TEXT[],
+                    ncbi_ids TEXT[],
+                    refseq_ids TEXT[],
+                    alt_gene_ids JSONB,
+                    alt_transcript_ids JSONB
                 )
+                """
+            )
+            cursor.execute("TRUNCATE id_enrichment_stage")
+            cursor.copy_expert(
+                "COPY id_enrichment_stage FROM STDIN", id_updates_to_copy(updates)
+            )
+            cursor.execute("ANALYZE id_enrichment_stage")
 
-            # Use our database manager's connection and cursor directly
-            if self.db_manager.conn and self.db_manager.cursor:
-                # Safer approach that doesn't alter connection state during a transaction
-                try:
-                    # Execute the batch update using executemany
-                    self.db_manager.cursor.executemany(
-                        """
-                        UPDATE cancer_transcript_base
-                        SET
-                            uniprot_ids = %s::text[],
-                            ncbi_ids = %s::text[],
-                            refseq_ids = %s::text[],
-                            alt_gene_ids = COALESCE(alt_gene_ids, '{}'::jsonb) || %s::jsonb,
-                            alt_transcript_ids = COALESCE(alt_transcript_ids, '{}'::jsonb) || %s::jsonb
-                        WHERE gene_symbol = %s
-                        """,
-                        updates,
-                    )
-
-                    # ALSO populate normalized gene_cross_references table with NCBI IDs
-                    # This is critical for pathways module which queries gene_cross_references
-                    cross_ref_inserts = []
-                    for update in updates:
-                        uniprot_ids, ncbi_ids, refseq_ids, _, _, gene_symbol = update
-                        if ncbi_ids:  # ncbi_ids is a list
-                            for ncbi_id in ncbi_ids:
-                                if ncbi_id:  # Skip empty strings
-                                    # FIXED: Correct parameter order - (external_db, external_id, gene_symbol)
-                                    cross_ref_inserts.append(
-                                        ("GeneID", ncbi_id, gene_symbol)
-                                    )
-
-                    if cross_ref_inserts:
-                        self.logger.info(
-                            f"Inserting {len(cross_ref_inserts)} NCBI cross-references into gene_cross_references"
-                        )
-                        self.db_manager.cursor.executemany(
-                            """
-                            INSERT INTO gene_cross_references (gene_id, external_db, external_id)
-                            SELECT g.gene_id, %s, %s
-                            FROM genes g
-                            WHERE g.gene_symbol = %s
-                            ON CONFLICT DO NOTHING
-                            """,
-                            cross_ref_inserts,
-                        )
+            cursor.execute(
+                """
+                UPDATE cancer_transcript_base t
+                SET
+                    uniprot_ids = s.uniprot_ids,
+                    ncbi_ids = s.ncbi_ids,
+                    refseq_ids = s.refseq_ids,
+                    alt_gene_ids = COALESCE(t.alt_gene_ids, '{}'::jsonb) || s.alt_gene_ids,
+                    alt_transcript_ids = COALESCE(t.alt_transcript_ids, '{}'::jsonb) || s.alt_transcript_ids
+                FROM id_enrichment_stage s
+                WHERE t.gene_symbol = s.gene_symbol
+                  AND (
+                      t.uniprot_ids IS DISTINCT FROM s.uniprot_ids
+                      OR t.ncbi_ids IS DISTINCT FROM s.ncbi_ids
+                      OR t.refseq_ids IS DISTINCT FROM s.refseq_ids
+                      OR NOT COALESCE(t.alt_gene_ids, '{}'::jsonb) @> s.alt_gene_ids
+                      OR NOT COALESCE(t.alt_transcript_ids, '{}'::jsonb) @> s.alt_transcript_ids
+                  )
+                """
+            )
+            updated = cursor.rowcount
 
-                    # Only commit if the connection is not in autocommit mode already
-                    if not self.db_manager.conn.autocommit:
-                        self.db_manager.conn.commit()
-                        self.logger.debug(
-                            f"Committed batch update of {len(updates)} records and {len(cross_ref_inserts)} cross-references"
-                        )
+            # gene_cross_references feeds the pathways module's NCBI lookups
+            cursor.execute(
+                """
+                INSERT INTO gene_cross_references (gene_id, external_db, external_id)
+                SELECT DISTINCT g.gene_id, 'GeneID', x.ncbi_id
+                FROM id_enrichment_stage s
+                CROSS JOIN LATERAL unnest(s.ncbi_ids) AS x(ncbi_id)
+                JOIN genes g ON g.gene_symbol = s.gene_symbol
+                WHERE x.ncbi_id <> ''
+                ON CONFLICT DO NOTHING
+                """
+            )
+            inserted = cursor.rowcount
 
-                except Exception as e:
-                    # Rollback only if not in autocommit mode
-                    if self.db_manager.conn and not self.db_manager.conn.autocommit:
-                        self.db_manager.conn.rollback()
-                    raise e
-            else:
-                raise DatabaseError("No database connection or cursor available")
+            if not self.db_manager.conn.autocommit:
+                self.db_manager.conn.commit()
+            self.logger.debug(
+                f"Updated {updated:,} transcripts and inserted {inserted:,} "
+                "NCBI cross-references"
+            )
 
         except Exception as e:
+            if not self.db_manager.conn.autocommit:
+                self.db_manager.conn.rollback()
             self.logger.error(f"Batch ID update failed: {e}")
             raise DatabaseError(f"Failed to update ID batch: {e}")
 
@@ -18,11 +18,14 @@ from dataclasses import dataclass
 
 import numpy as np
 import pandas as pd
+import pyarrow.dataset as ds
 import pyarrow.parquet as pq
 from tqdm import tqdm
 
 from .base_processor import BaseProcessor, DownloadError, ProcessingError, DatabaseError
 from ..db.database import DatabaseManager
+from ..utils.dataset_fetcher import DatasetFetcher, FetchError
+from ..utils.id_mapping import get_gene_id_map
 
 logger = logging.getLogger(__name__)
 
@@ -95,6 +98,13 @@ class OpenTargetsProcessor(BaseProcessor):
         if "opentargets_min_score" in config:
             self.ot_config.min_overall_score = config["opentargets_min_score"]
 
+        # Rows per Arrow record batch when streaming large datasets
+        self.parquet_batch_size = config.get("opentargets_batch_rows", 250_000)
+
+        # Concurrent part downloads; refresh re-checks the remote listing
+        self.max_workers = config.get("max_workers", 4)
+        self.refresh = config.get("opentargets_refresh", False)
+
         # Build dataset URLs
         base = f"{self.ot_config.base_url}/{self.ot_config.version}/output/etl/parquet"
         self.dataset_urls = {
@@ -140,8 +150,6 @@ class OpenTargetsProcessor(BaseProcessor):
         Returns:
             bool: True if requirements are met
         """
-        from ..db.database import DatabaseManager
-
         # Check required tables exist
         required_tables = ["genes", "gene_cross_references"]
 
@@ -451,71 +459,101 @@ class OpenTargetsProcessor(BaseProcessor):
         """
         Download and process gene-disease associations.
 
+        The score threshold and cancer-disease filter are pushed down into the
+        Parquet scan, only the needed columns are read, and records are built
+        per Arrow record batch with a vectorized gene ID lookup.
+
         Returns:
             int: Number of associations loaded
         """
         # Download associations Parquet file(s)
         cache_path = self._download_dataset("associations")
 
-        # Read Parquet - may be partitioned
-        df = self._read_parquet_dataset(cache_path)
-
-        # Filter for cancer diseases and score threshold
         logger.info(
             f"Filtering associations: score >= {self.ot_config.min_overall_score}, cancer only"
         )
-        df = df[df["score"] >= self.ot_config.min_overall_score]
-
-        # Get cancer disease IDs from database
         cancer_disease_ids = self._get_cancer_disease_ids()
-        df = df[df["diseaseId"].isin(cancer_disease_ids)]
+        filter_expression = (
+            ds.field("score") >= self.ot_config.min_overall_score
+        ) & ds.field("diseaseId").isin(cancer_disease_ids)
 
-        logger.info(f"Retained {len(df)} associations after filtering")
+        dataset = ds.dataset(cache_path, format="parquet")
+        columns = ["targetId", "diseaseId", "score"]
+        if "datasources" in dataset.schema.names:
+            columns.append("datasources")
 
         # Get gene ID mapping from database
-        gene_id_map = self._get_gene_id_mapping()
+        gene_id_map = pd.Series(self._get_gene_id_mapping(), dtype=object)
 
-        # Transform to database format
-        records = []
+        loaded = 0
         skipped = 0
 
-        for _, row in tqdm(
-            df.iterrows(), total=len(df), desc="Processing associations"
-        ):
-            # Map target ID to our gene_id format
-            target_id = row.get("targetId", "")
-            gene_id = gene_id_map.get(target_id)
-
-            if not gene_id:
-                skipped += 1
-                continue
+        with tqdm(desc="Processing associations", unit=" rows") as pbar:
+            for batch in dataset.to_batches(
+                columns=columns,
+                filter=filter_expression,
+                batch_size=self.parquet_batch_size,
+            ):
+                df = batch.to_pandas()
+                pbar.update(len(df))
 
-            # Handle NULL disease_id safely
-            disease_id_raw = row.get("diseaseId")
-            if not disease_id_raw or pd.isna(disease_id_raw):
-                skipped += 1
-                continue
-            disease_id = disease_id_raw.replace(":", "_")
+                records, batch_skipped = self._build_association_records(
+                    df, gene_id_map
+                )
+                skipped += batch_skipped
 
-            record = {
-                "gene_id": gene_id,
-                "disease_id": disease_id,
-                "overall_score": self._safe_float(row.get("score", 0)),
-                "is_direct": True,  # Using direct associations dataset
-                "metadata": self._extract_association_metadata(row),
-                "ot_version": self.ot_config.version,
-            }
+                if records:
+                    self._batch_insert_associations(records)
+                    loaded += len(records)
 
-            records.append(record)
+        logger.info(f"Retained {loaded + skipped} associations after filtering")
 
         if skipped > 0:
             logger.warning(f"Skipped {skipped} associations due to unmapped gene IDs")
 
-        # Batch insert
-        if records:
-            self._batch_insert_associations(records)
+        return loaded
 
-        return len(records)
+    def _build_association_records(
+        self, df: pd.DataFrame, gene_id_map: pd.Series
+    ) -> Tuple[List[Dict], int]:
+        """Build association records from one filtered batch.
+
+        Args:
+            df: Batch with targetId, diseaseId, score (and optionally datasources)
+            gene_id_map: Series indexed by Ensembl target ID holding our gene_id
+
+        Returns:
+            Tuple of (records ready for insertion, number of rows skipped)
+        """
+        df = df.assign(gene_id=df["targetId"].map(gene_id_map))
+        valid = df["gene_id"].notna() & df["diseaseId"].notna()
+        skipped = int((~valid).sum())
+        df = df[valid]
+
+        if df.empty:
+            return [], skipped
+
+        if "datasources" in df.columns:
+            metadata = [
+                self._extract_association_metadata(row)
+                for row in df[["datasources"]].to_dict("records")
+            ]
+        else:
+            metadata = [{"datasources": []} for _ in range(len(df))]
+
+        out = pd.DataFrame(
+            {
+                "gene_id": df["gene_id"].to_numpy(),
+                "disease_id": df["diseaseId"]
+                .str.replace(":", "_", regex=False)
+                .to_numpy(),
+                "overall_score": df["score"].astype(float).to_numpy(),
+                "is_direct": True,  # Using direct associations dataset
+                "metadata": metadata,
+                "ot_version": self.ot_config.version,
+            }
+        )
+        return out.to_dict("records"), skipped
 
     def _process_known_drugs(self) -> int:
         """
@@ -526,11 +564,11 @@ class OpenTargetsProcessor(BaseProcessor):
         """
         cache_path = self._download_dataset("known_drugs")
 
-        df = self._read_parquet_dataset(cache_path)
-
-        # Filter for cancer diseases
+        # Filter for cancer diseases inside the Parquet scan
         cancer_disease_ids = self._get_cancer_disease_ids()
-        df = df[df["diseaseId"].isin(cancer_disease_ids)]
+        df = self._read_parquet_dataset(
+            cache_path, filter_expression=ds.field("diseaseId").isin(cancer_disease_ids)
+        )
 
         logger.info(f"Processing {len(df)} cancer drug entries")
 
@@ -724,55 +762,41 @@ class OpenTargetsProcessor(BaseProcessor):
     # Helper methods
 
     def _download_dataset(self, dataset_name: str) -> Path:
-        """Download dataset from Open Targets FTP using wget.
+        """Download all parts of a dataset from Open Targets FTP.
+
+        Parts are fetched concurrently (``max_workers``) with resume support and
+        recorded in a manifest of sizes and checksums. The cache is only reused
+        when the manifest shows a completed download whose parts are all present
+        with the recorded sizes; with ``opentargets_refresh`` the remote listing
+        is re-checked and only changed parts are downloaded again.
 
         Args:
             dataset_name: Name of dataset to download
 
         Returns:
-            Path to cached directory/file
+            Path to cached directory
         """
-        import subprocess
-        from ftplib import FTP
-        import os
-
         url = self.dataset_urls[dataset_name]
-        cache_key = self._get_cache_key(url)
+        cache_path = self.opentargets_dir / dataset_name
 
-        # Create dataset-specific cache directory
-        cache_path = self.cache_dir / "opentargets" / dataset_name
-        cache_path.mkdir(parents=True, exist_ok=True)
+        fetcher = DatasetFetcher(url, cache_path, max_workers=self.max_workers)
 
-        # Check if already cached (recursively search subdirectories)
-        if cache_path.exists() and list(cache_path.glob("**/*.parquet")):
-            if not self.force_download:
-                logger.info(f"Using cached {dataset_name} data at {cache_path}")
-                return cache_path
+        if not self.force_download and not self.refresh and fetcher.is_complete():
+            logger.info(f"Using cached {dataset_name} data at {cache_path}")
+            return cache_path
 
         logger.info(f"Downloading {dataset_name} from Open Targets FTP...")
-
-        # Use wget for FTP download with resume support
         try:
-            cmd = [
-                "wget",
-                "-r",  # Recursive
-                "-np",  # No parent directories
-                "-nH",  # No host directories
-                "--cut-dirs=6",  # Remove directory prefix
-                "-P",
-                str(cache_path),
-                "-q",  # Quiet (use progress bar instead)
-                "--show-progress",
-                url,
-            ]
-
-            subprocess.run(cmd, check=True)
-            logger.info(f"Downloaded {dataset_name} to {cache_path}")
-            return cache_path
-
-        except subprocess.CalledProcessError as e:
+            result = fetcher.fetch(force=self.force_download)
+        except FetchError as e:
             logger.error(f"FTP download failed for {dataset_name}: {e}")
-            raise DownloadError(f"Failed to download {dataset_name}")
+            raise DownloadError(f"Failed to download {dataset_name}: {e}") from e
+
+        logger.info(
+            f"Downloaded {dataset_name} to {cache_path}: "
+            f"{len(result.downloaded)} parts fetched, {len(result.skipped)} unchanged"
+        )
+        return cache_path
 
     def _get_cache_key(self, url: str) -> str:
         """Generate cache key from URL."""
@@ -780,12 +804,25 @@ class OpenTargetsProcessor(BaseProcessor):
 
         return hashlib.sha256(url.encode()).hexdigest()[:16]
 
-    def _read_parquet_dataset(self, path: Path) -> pd.DataFrame:
-        """Read Parquet file or partitioned dataset."""
-        if path.is_dir():
-            return pq.read_table(path).to_pandas()
-        else:
-            return pq.read_table(path).to_pandas()
+    def _read_parquet_dataset(
+        self,
+        path: Path,
+        columns: Optional[List[str]] = None,
+        filter_expression: Optional[ds.Expression] = None,
+    ) -> pd.DataFrame:
+        """Read Parquet file or partitioned dataset.
+
+        Args:
+            path: Parquet file or directory of part files
+            columns: Optional column projection; only these columns are decoded
+            filter_expression: Optional pyarrow.dataset predicate evaluated during
+                the scan (row groups whose statistics exclude it are skipped)
+
+        Returns:
+            DataFrame with the selected rows and columns
+        """
+        dataset = ds.dataset(path, format="parquet")
+        return dataset.to_table(columns=columns, filter=filter_expression).to_pandas()
 
     def _is_cancer_disease(
         self, therapeutic_areas: List[str], disease_id: str, disease_name: str
@@ -958,16 +995,9 @@ class OpenTargetsProcessor(BaseProcessor):
         """
         if not self.ensure_connection() or not self.db_manager.cursor:
             return {}
-        # In our schema, gene_id column in genes table IS the Ensembl gene ID
-        self.db_manager.cursor.execute(
-            """
-            SELECT gene_id, gene_id
-            FROM genes
-            WHERE gene_id LIKE 'ENSG%'
-        """
-        )
-        result = self.db_manager.cursor.fetchall()
-        return {row[0]: row[1] for row in result}
+        ensembl = get_gene_id_map(self.cache_dir, self.db_manager).frame("ensembl")
+        ensembl = ensembl[ensembl["key"].str.startswith("ENSG")]
+        return dict(zip(ensembl["key"], ensembl["gene_id"]))
 
     def _count_cancer_diseases(self) -> int:
         """Count cancer diseases in database."""
@@ -7,8 +7,10 @@ into transcript records, enhancing them with biological pathway information.
 import logging
 import json
 import re
-from typing import Dict, List, Optional, Any, Set, Tuple
+from collections import defaultdict
+from typing import Dict, Iterable, List, Any, Set, Tuple
 from pathlib import Path
+from urllib.parse import urlparse
 import csv
 
 import pandas as pd
@@ -18,6 +20,8 @@ from psycopg2.extras import execute_batch
 
 from .base_processor import BaseProcessor, DownloadError, ProcessingError, DatabaseError
 from .publications import Publication, PublicationsProcessor
+from ..utils.api_client import APIRequestError, CachedAPIClient, ResponseCache
+from ..utils.id_mapping import get_gene_id_map
 from ..utils.publication_utils import extract_pmids_from_text, format_pmid_url
 from ..utils.gene_matcher import (
     normalize_gene_symbol,
@@ -28,6 +32,19 @@ from ..utils.gene_matcher import (
 # Constants
 HUMAN_SPECIES = "Homo sapiens"
 HUMAN_TAXONOMY_ID = "9606"  # NCBI taxonomy ID for humans
+REACTOME_API_BASE = "https://reactome.org/ContentService"
+REACTOME_API_CACHE_TTL = 365 * 24 * 60 * 60  # keyed by release, so rarely stale
+REACTOME_RATE_LIMIT = 0.1
+
+
+def _is_not_found(error: APIRequestError) -> bool:
+    """Return True if an API error was an HTTP 404 response."""
+    cause = error.__cause__
+    return (
+        isinstance(cause, requests.HTTPError)
+        and cause.response is not None
+        and cause.response.status_code == 404
+    )
 
 
 class PathwayProcessor(BaseProcessor):
@@ -51,6 +68,18 @@ class PathwayProcessor(BaseProcessor):
             "https://reactome.org/download/current/NCBI2Reactome_All_Levels.txt",
         )
 
+        # Pathway literature: Content Service (cached per release) or bulk export
+        self.reactome_api_base = config.get("reactome_api_base", REACTOME_API_BASE)
+        self.reactome_literature_url = config.get("reactome_literature_url")
+        self.reactome_cache_dir = self.pathway_dir / "reactome_api"
+        self.reactome_cache_ttl = config.get(
+            "reactome_api_cache_ttl", REACTOME_API_CACHE_TTL
+        )
+        self.reactome_rate_limit = config.get(
+            "reactome_rate_limit", REACTOME_RATE_LIMIT
+        )
+        self.max_workers = config.get("max_workers", 4)
+
     def download_reactome(self) -> Path:
         """Download Reactome pathway data file with caching.
 
@@ -150,9 +179,7 @@ class PathwayProcessor(BaseProcessor):
             )
 
             # Extract pathway publications using Reactome API
-            self.logger.info(
-                "Extracting pathway publication references from Reactome API"
-            )
+            self.logger.info("Extracting pathway publication references from Reactome")
             pathway_publications = self._fetch_reactome_publications(pathway_to_genes)
 
             # Save pathway publications for use in enrichment
@@ -199,7 +226,12 @@ class PathwayProcessor(BaseProcessor):
     def _fetch_reactome_publications(
         self, pathway_to_genes: Dict[str, Set[str]]
     ) -> Dict[str, List[Publication]]:
-        """Fetch publication references from Reactome Content Service API.
+        """Fetch publication references for all pathways.
+
+        Reads the bulk literature export when ``reactome_literature_url`` is
+        configured. Otherwise queries the Reactome Content Service concurrently;
+        responses are cached on disk per Reactome release, so later runs
+        against the same release make no requests.
 
         Args:
             pathway_to_genes: Dictionary mapping pathway IDs to gene symbols
@@ -207,72 +239,188 @@ class PathwayProcessor(BaseProcessor):
         Returns:
             Dictionary mapping pathway IDs to publication references
         """
-        pathway_publications: Dict[str, List[Publication]] = {}
-        api_base = "https://reactome.org/ContentService"
+        pathway_ids = sorted(pathway_to_genes)
 
-        # Sample first 100 pathways to avoid overwhelming the API
-        # In production, you might want to cache this or use a different approach
-        pathway_ids = list(pathway_to_genes.keys())[:100]
+        if self.reactome_literature_url:
+            pathway_publications = self._load_reactome_literature_export(
+                set(pathway_ids)
+            )
+        else:
+            pathway_publications = self._query_reactome_literature(pathway_ids)
 
+        total_pmids = sum(len(pubs) for pubs in pathway_publications.values())
+        average_pmids = total_pmids / max(1, len(pathway_publications))
         self.logger.info(
-            f"Fetching publications for {len(pathway_ids)} pathways from Reactome API"
+            f"Extracted pathway publications:\n"
+            f"- Pathways with publications: {len(pathway_publications):,}\n"
+            f"- Total PMIDs: {total_pmids:,}\n"
+            f"- Average PMIDs per pathway: {average_pmids:.1f}"
         )
 
-        for pathway_id in tqdm(pathway_ids, desc="Fetching pathway publications"):
-            try:
-                # Query Reactome API for pathway publications
-                url = f"{api_base}/data/pathway/{pathway_id}/literatureReferences"
-                response = requests.get(url, timeout=10)
-
-                if response.status_code == 200:
-                    lit_refs = response.json()
-                    publications = []
-
-                    # Extract PMIDs from literature references
-                    for ref in lit_refs:
-                        # Check if reference has a PubMed ID
-                        if "pubMedIdentifier" in ref and ref["pubMedIdentifier"]:
-                            pmid = str(ref["pubMedIdentifier"])
-                            publication = PublicationsProcessor.create_publication_reference(
-                                pmid=pmid,
-                                evidence_type="pathway_evidence",
-                                source_db="Reactome",
-                                url=f"https://reactome.org/content/detail/{pathway_id}",
-                            )
-                            publications.append(publication)
+        return pathway_publications
 
-                    if publications:
-                        pathway_publications[pathway_id] = publications
+    def _query_reactome_literature(
+        self, pathway_ids: List[str]
+    ) -> Dict[str, List[Publication]]:
+        """Query literature references of pathways from the Content Service.
 
-                elif response.status_code == 404:
-                    # Pathway not found in API, skip silently
-                    continue
-                else:
-                    self.logger.warning(
-                        f"Failed to fetch publications for pathway {pathway_id}: HTTP {response.status_code}"
-                    )
+        Args:
+            pathway_ids: Reactome pathway stable IDs
 
-            except requests.exceptions.Timeout:
-                self.logger.warning(
-                    f"Timeout fetching publications for pathway {pathway_id}"
-                )
-                continue
-            except Exception as e:
-                self.logger.warning(
-                    f"Error fetching publications for pathway {pathway_id}: {e}"
-                )
+        Returns:
+            Dictionary mapping pathway IDs to publication references
+        """
+        try:
+            release = self._get_reactome_release()
+        except DownloadError as e:
+            self.logger.warning(f"Skipping Reactome pathway publications: {e}")
+            return {}
+
+        self.logger.info(
+            f"Fetching publications for {len(pathway_ids)} pathways from Reactome API "
+            f"(release {release})"
+        )
+
+        client = CachedAPIClient(
+            self.reactome_api_base,
+            cache_dir=self.reactome_cache_dir / f"release_{release}",
+            cache_ttl=self.reactome_cache_ttl,
+            rate_limit=self.reactome_rate_limit,
+            max_workers=self.max_workers,
+        )
+        endpoints = [
+            f"data/pathway/{pathway_id}/literatureReferences"
+            for pathway_id in pathway_ids
+        ]
+        try:
+            results = client.get_many(
+                [(endpoint, None) for endpoint in endpoints], return_exceptions=True
+            )
+        finally:
+            client.close()
+
+        pathway_publications: Dict[str, List[Publication]] = {}
+        failed = 0
+        for pathway_id, endpoint, result in zip(pathway_ids, endpoints, results):
+            if isinstance(result, APIRequestError):
+                if _is_not_found(result):
+                    # No literature for this pathway: cache the empty answer
+                    client.cache.set(ResponseCache.make_key(endpoint, None), [])
+                else:
+                    failed += 1
                 continue
 
-        total_pmids = sum(len(pubs) for pubs in pathway_publications.values())
+            publications = self._make_pathway_publications(
+                pathway_id,
+                (
+                    ref.get("pubMedIdentifier")
+                    for ref in result
+                    if isinstance(ref, dict)
+                ),
+            )
+            if publications:
+                pathway_publications[pathway_id] = publications
+
         self.logger.info(
-            f"Extracted pathway publications:\n"
-            f"- Pathways with publications: {len(pathway_publications):,}\n"
-            f"- Total PMIDs: {total_pmids:,}\n"
-            f"- Average PMIDs per pathway: {total_pmids/max(1, len(pathway_publications)):.1f}"
+            f"Reactome API: {client.stats['requests']:,} requests, "
+            f"{client.stats['cache_hits']:,} cache hits, {failed:,} failures"
         )
+        return pathway_publications
+
+    def _get_reactome_release(self) -> str:
+        """Return the current Reactome release number.
+
+        Falls back to the newest cached release when the service is unreachable.
+
+        Raises:
+            DownloadError: If the release is unknown and nothing is cached
+        """
+        try:
+            response = requests.get(
+                f"{self.reactome_api_base}/data/database/version", timeout=10
+            )
+            response.raise_for_status()
+            return str(response.json())
+        except (requests.RequestException, ValueError) as e:
+            cached = sorted(
+                self.reactome_cache_dir.glob("release_*"),
+                key=lambda path: path.stat().st_mtime,
+            )
+            if not cached:
+                raise DownloadError(f"Failed to get Reactome release: {e}")
+            release = cached[-1].name[len("release_") :]
+            self.logger.warning(
+                f"Failed to get Reactome release ({e}), using cached release {release}"
+            )
+            return release
+
+    def _load_reactome_literature_export(
+        self, pathway_ids: Set[str]
+    ) -> Dict[str, List[Publication]]:
+        """Read pathway literature from a bulk export.
 
+        The export is a tab-separated file of Reactome stable ID and PMID
+        (further columns and '#' comment lines are ignored), given as a URL
+        (downloaded once into the pathway cache) or a local path.
+
+        Args:
+            pathway_ids: Pathway stable IDs to keep
+
+        Returns:
+            Dictionary mapping pathway IDs to publication references
+
+        Raises:
+            DownloadError: If the export cannot be downloaded
+            ProcessingError: If the export cannot be read
+        """
+        source = self.reactome_literature_url
+        if urlparse(source).scheme in ("http", "https", "ftp"):
+            export_file = self.download_file(
+                url=source,
+                file_path=self.pathway_dir / Path(urlparse(source).path).name,
+            )
+        else:
+            export_file = Path(source)
+
+        self.logger.info(f"Reading Reactome literature export from {export_file}")
+
+        pathway_pmids: Dict[str, List[str]] = defaultdict(list)
+        try:
+            with open(export_file, "r") as f:
+                for line in f:
+                    if line.startswith("#"):
+                        continue
+                    parts = line.rstrip("\n").split("\t")
+                    if len(parts) >= 2 and parts[0] in pathway_ids:
+                        pathway_pmids[parts[0]].append(parts[1].strip())
+        except OSError as e:
+            raise ProcessingError(f"Failed to read Reactome literature export: {e}")
+
+        pathway_publications = {}
+        for pathway_id, pmids in pathway_pmids.items():
+            publications = self._make_pathway_publications(pathway_id, pmids)
+            if publications:
+                pathway_publications[pathway_id] = publications
         return pathway_publications
 
+    def _make_pathway_publications(
+        self, pathway_id: str, pmids: Iterable[Any]
+    ) -> List[Publication]:
+        """Build publication references for a pathway's unique PubMed IDs."""
+        publications = []
+        for pmid in dict.fromkeys(str(pmid) for pmid in pmids if pmid):
+            if not pmid.isdigit():
+                continue
+            publications.append(
+                PublicationsProcessor.create_publication_reference(
+                    pmid=pmid,
+                    evidence_type="pathway_evidence",
+                    source_db="Reactome",
+                    url=f"https://reactome.org/content/detail/{pathway_id}",
+                )
+            )
+        return publications
+
     def _save_pathway_publications(
         self, pathway_publications: Dict[str, List[Publication]]
     ) -> None:
@@ -328,49 +476,28 @@ class PathwayProcessor(BaseProcessor):
             return {}
 
         try:
-            # Query gene_cross_references table for NCBI ID mappings (normalized schema)
-            # FIXED: Added 'GeneID' to the filter - this is what transcript.py actually writes
-            self.db_manager.cursor.execute(
-                """
-                SELECT DISTINCT
-                    g.gene_symbol,
-                    gcr.external_id as ncbi_id,
-                    gcr.external_db
-                FROM gene_cross_references gcr
-                INNER JOIN genes g ON gcr.gene_id = g.gene_id
-                WHERE gcr.external_db IN ('GeneID', 'NCBI', 'EntrezGene')
-                    AND gcr.external_id IS NOT NULL
-                    AND gcr.external_id ~ '^[0-9]+$'
-            """
-            )
+            # NCBI ID mappings from the shared gene ID map (gene_cross_references
+            # entries with external_db GeneID, NCBI or EntrezGene)
+            gene_map = get_gene_id_map(self.cache_dir, self.db_manager)
+            ncbi = gene_map.frame("ncbi")
+            ncbi = ncbi[ncbi["key"].str.fullmatch(r"[0-9]+")]
 
             # Build bidirectional mapping dictionary (NCBI→Symbol and Symbol→NCBI)
             ncbi_to_symbol = {}
             symbol_to_ncbi = {}
-            db_type_counts = {}
-
-            rows = self.db_manager.cursor.fetchall()
-            self.logger.info(
-                f"Found {len(rows)} NCBI ID mappings in gene_cross_references"
-            )
-
-            for row in rows:
-                gene_symbol, ncbi_id, external_db = row
 
-                # Track which external_db types we're seeing
-                db_type_counts[external_db] = db_type_counts.get(external_db, 0) + 1
+            self.logger.info(f"Found {len(ncbi)} NCBI ID mappings in gene ID map")
 
+            for ncbi_id, gene_symbol in zip(ncbi["key"], ncbi["gene_symbol"]):
                 if ncbi_id and gene_symbol:
                     # NCBI → Symbol mapping
                     ncbi_to_symbol[ncbi_id] = gene_symbol
-                    ncbi_to_symbol[ncbi_id.upper()] = gene_symbol
 
                     # Symbol → NCBI mapping (for reverse lookups)
                     symbol_to_ncbi[gene_symbol] = ncbi_id
                     symbol_to_ncbi[normalize_gene_symbol(gene_symbol)] = ncbi_id
 
             # Diagnostic logging
-            self.logger.info(f"External DB type distribution: {db_type_counts}")
             if ncbi_to_symbol:
                 sample_mappings = list(ncbi_to_symbol.items())[:5]
                 self.logger.info(f"Sample NCBI mappings: {sample_mappings}")
@@ -386,18 +513,8 @@ class PathwayProcessor(BaseProcessor):
                     "loaded with NCBI cross-references. Using direct symbol mapping as fallback."
                 )
 
-                # Query genes table for gene symbols to use for direct mapping
-                self.db_manager.cursor.execute(
-                    """
-                    SELECT DISTINCT gene_symbol
-                    FROM genes
-                    WHERE gene_symbol IS NOT NULL
-                """
-                )
-
                 # Create a self-mapping for known gene symbols with normalized keys
-                for row in self.db_manager.cursor.fetchall():
-                    gene_symbol = row[0]
+                for gene_symbol in gene_map.frame("symbol")["key"]:
                     if gene_symbol:
                         mapping[gene_symbol] = gene_symbol
                         mapping[normalize_gene_symbol(gene_symbol)] = gene_symbol
@@ -15,6 +15,7 @@ from datetime import datetime
 from collections import defaultdict, Counter
 
 # Third party imports
+import numpy as np
 import pandas as pd
 import requests
 from tqdm import tqdm
@@ -53,6 +54,187 @@ EVIDENCE_LEVEL_SCORES = {
 # Clinical significance scoring
 CLINICAL_SIGNIFICANCE_SCORES = {"High": 3, "Moderate": 2, "Low": 1, "Unknown": 0}
 
+# CYP450 star alleles -> (metabolizer phenotype, confidence), first match wins
+CYP2D6_METABOLIZER_ALLELES = [
+    (["*4", "*5", "*6", "*10"], "poor_metabolizer", 0.85),
+    (["*9", "*41"], "intermediate_metabolizer", 0.80),
+    (["*1", "*2"], "extensive_metabolizer", 0.75),
+]
+CYP2C19_METABOLIZER_ALLELES = [
+    (["*2", "*3"], "poor_metabolizer", 0.85),
+    (["*17"], "ultrarapid_metabolizer", 0.80),
+]
+
+
+def _text_column(df: pd.DataFrame, column: str, missing: str = "") -> pd.Series:
+    """Return a column as strings.
+
+    Missing values become ``missing``; an absent column becomes empty strings,
+    as ``row.get(column, "")`` does for the per-row parser.
+    """
+    if column not in df.columns:
+        return pd.Series("", index=df.index, dtype=object)
+    values = df[column]
+    return values.astype(str).where(values.notna(), missing)
+
+
+def _numeric_column(df: pd.DataFrame, column: str) -> pd.Series:
+    """Return a column as numbers, with missing or non-numeric values as 0."""
+    if column not in df.columns:
+        return pd.Series(0, index=df.index)
+    return pd.to_numeric(df[column], errors="coerce").fillna(0)
+
+
+def _contains_any(values: pd.Series, terms: List[str]) -> pd.Series:
+    """Vectorized ``any(term in value for term in terms)``."""
+    return values.str.contains("|".join(re.escape(t) for t in terms), regex=True)
+
+
+def parse_gene_symbol_column(genes: pd.Series) -> pd.Series:
+    """Vectorized PharmGKBAnnotationsProcessor.parse_gene_symbols.
+
+    Args:
+        genes: PharmGKB gene field per annotation
+
+    Returns:
+        Series of cleaned gene symbol lists
+    """
+    symbols = (
+        genes.astype(str)
+        .where(genes.notna(), "")
+        .str.split(r"[,;|]", regex=True)
+        .explode()
+        .str.strip()
+        .str.upper()
+        .str.replace(r"[^\w-]", "", regex=True)
+    )
+    symbols = symbols[symbols.str.len() > 1]
+    grouped = symbols.groupby(level=0, sort=False).agg(list)
+    return grouped.reindex(genes.index).map(
+        lambda value: value if isinstance(value, list) else []
+    )
+
+
+def score_variant_annotations(df: pd.DataFrame) -> pd.DataFrame:
+    """Score PharmGKB variant annotations with column operations.
+
+    Computes per annotation the pharmacogenomic score, evidence level,
+    metabolizer prediction, clinical actionability and variant type.
+
+    The score and evidence level read missing values the way ``str()`` does
+    (as ``"nan"``): a missing Significance counts as a non-empty significance
+    and a missing PMID as present for the evidence level. Scores stay
+    comparable with earlier releases that way.
+
+    Args:
+        df: Variant annotations as read from ``var_drug_ann.tsv``
+
+    Returns:
+        DataFrame on the same index with columns pharmacogenomic_score,
+        evidence_level, metabolizer_phenotype, metabolizer_confidence,
+        clinical_actionability and variant_type
+    """
+    significance_raw = _text_column(df, "Significance", "nan").str.lower()
+    category_raw = _text_column(df, "Phenotype Category", "nan").str.lower()
+    direction = _text_column(df, "Direction of effect", "nan").str.lower()
+    pmid_raw = _text_column(df, "PMID", "nan")
+    specialty_raw = _text_column(df, "Specialty Population", "nan")
+
+    has_yes = significance_raw.str.contains("yes", regex=False)
+    strong_category = _contains_any(category_raw, ["efficacy", "toxicity"])
+    pmid_present = pmid_raw.str.strip() != ""
+
+    score = np.select(
+        [
+            has_yes,
+            significance_raw.str.contains("no", regex=False),
+            significance_raw != "",
+        ],
+        [30.0, 10.0, 5.0],
+        0.0,
+    )
+    score += np.select(
+        [
+            category_raw.str.contains("efficacy", regex=False),
+            category_raw.str.contains("toxicity", regex=False),
+            _contains_any(category_raw, ["metabolism", "pk"]),
+            category_raw.str.contains("dosage", regex=False),
+        ],
+        [25.0, 20.0, 15.0, 10.0],
+        0.0,
+    )
+    score += np.where(
+        _contains_any(direction, ["increased", "decreased", "affected"]), 15.0, 0.0
+    )
+    score += np.where(pmid_present & (pmid_raw != "nan"), 10.0, 0.0)
+    score += np.where(
+        (specialty_raw.str.strip() != "") & (specialty_raw != "nan"), 5.0, 0.0
+    )
+
+    evidence_level = np.select(
+        [
+            has_yes & pmid_present & strong_category,
+            (has_yes | strong_category) & pmid_present,
+            (significance_raw != "") | pmid_present,
+        ],
+        ["high", "moderate", "low"],
+        "insufficient",
+    )
+
+    # Metabolizer prediction and actionability use the cleaned record fields
+    variant = _text_column(df, "Variant/Haplotypes")
+    allele = variant.str.lower()
+    category = _text_column(df, "Phenotype Category").str.lower()
+    significance = _text_column(df, "Significance").str.lower()
+
+    star_allele = variant.str.contains("*", regex=False)
+    cyp2d6 = star_allele & category.str.contains("cyp2d6", regex=False)
+    cyp2c19 = star_allele & ~cyp2d6 & category.str.contains("cyp2c19", regex=False)
+    conditions, phenotypes, confidences = [], [], []
+    for gene_mask, rules in (
+        (cyp2d6, CYP2D6_METABOLIZER_ALLELES),
+        (cyp2c19, CYP2C19_METABOLIZER_ALLELES),
+    ):
+        for alleles, phenotype, confidence in rules:
+            conditions.append(gene_mask & _contains_any(allele, alleles))
+            phenotypes.append(phenotype)
+            confidences.append(confidence)
+
+    actionability = np.select(
+        [
+            significance.str.contains("yes", regex=False)
+            & _contains_any(category, ["dosage", "efficacy", "toxicity"]),
+            significance.str.contains("yes", regex=False)
+            & category.str.contains("metabolism", regex=False),
+            (significance != "") & (significance != "no"),
+        ],
+        ["high", "moderate", "low"],
+        "research_only",
+    )
+
+    variant_type = np.select(
+        [
+            variant.str.startswith("rs"),
+            star_allele,
+            _contains_any(allele, ["del", "ins"]),
+            allele.str.contains("dup", regex=False),
+        ],
+        ["SNP", "star_allele", "indel", "duplication"],
+        "unknown",
+    )
+
+    return pd.DataFrame(
+        {
+            "pharmacogenomic_score": np.minimum(score, 100.0),
+            "evidence_level": evidence_level,
+            "metabolizer_phenotype": np.select(conditions, phenotypes, "unknown"),
+            "metabolizer_confidence": np.select(conditions, confidences, 0.0),
+            "clinical_actionability": actionability,
+            "variant_type": variant_type,
+        },
+        index=df.index,
+    )
+
 
 class PharmGKBAnnotationsProcessor(BaseProcessor):
     """Process pharmacogenomic annotations from PharmGKB."""
@@ -267,128 +449,48 @@ class PharmGKBAnnotationsProcessor(BaseProcessor):
                 f"Loaded {len(df):,} clinical annotation records from PharmGKB"
             )
 
-            # Group annotations by gene symbols
+            gene_symbols = parse_gene_symbol_column(df["Gene"])
+            evidence_level = _text_column(df, "Level of Evidence")
+            phenotype_category = _text_column(df, "Phenotype Category")
+            score = _numeric_column(df, "Score").astype(float)
+
+            records = pd.DataFrame(
+                {
+                    "annotation_id": _text_column(df, "Clinical Annotation ID"),
+                    "variant": _text_column(df, "Variant/Haplotypes"),
+                    "drug": _text_column(df, "Drug(s)"),
+                    "phenotype_category": phenotype_category,
+                    "phenotypes": _text_column(df, "Phenotype(s)"),
+                    "evidence_level": evidence_level,
+                    "level_modifiers": _text_column(df, "Level Modifiers"),
+                    "score": score,
+                    "evidence_score": evidence_level.map(EVIDENCE_LEVEL_SCORES)
+                    .fillna(0)
+                    .astype(int),
+                    "pmid_count": _numeric_column(df, "PMID Count").astype(int),
+                    "evidence_count": _numeric_column(df, "Evidence Count").astype(int),
+                    "url": _text_column(df, "URL"),
+                    "specialty_population": _text_column(df, "Specialty Population"),
+                    "source": "PharmGKB_Clinical_Annotations",
+                },
+                index=df.index,
+            )
+
+            # One annotation record per listed gene
             gene_annotation_mapping = defaultdict(list)
+            for symbols, record in zip(gene_symbols, records.to_dict("records")):
+                for gene_symbol in symbols:
+                    gene_annotation_mapping[gene_symbol].append(record)
 
             processing_stats = {
                 "total_annotations": len(df),
-                "annotations_with_genes": 0,
-                "unique_genes": set(),
-                "evidence_levels": Counter(),
-                "phenotype_categories": Counter(),
-                "scores": [],
+                "annotations_with_genes": int((gene_symbols.str.len() > 0).sum()),
+                "unique_genes": set(gene_annotation_mapping),
+                "evidence_levels": Counter(evidence_level),
+                "phenotype_categories": Counter(phenotype_category),
+                "scores": score.tolist(),
             }
 
-            progress_bar = get_progress_bar(
-                total=len(df),
-                desc="Processing clinical annotations",
-                module_name="pharmgkb_annotations",
-            )
-
-            try:
-                for _, row in df.iterrows():
-                    # Extract key fields based on actual column names
-                    annotation_id = (
-                        str(row.get("Clinical Annotation ID", ""))
-                        if pd.notna(row.get("Clinical Annotation ID"))
-                        else ""
-                    )
-                    gene_field = (
-                        row.get("Gene", "") if pd.notna(row.get("Gene")) else ""
-                    )
-                    variant = (
-                        str(row.get("Variant/Haplotypes", ""))
-                        if pd.notna(row.get("Variant/Haplotypes"))
-                        else ""
-                    )
-                    drug = (
-                        str(row.get("Drug(s)", ""))
-                        if pd.notna(row.get("Drug(s)"))
-                        else ""
-                    )
-                    phenotype_category = (
-                        str(row.get("Phenotype Category", ""))
-                        if pd.notna(row.get("Phenotype Category"))
-                        else ""
-                    )
-                    phenotypes = (
-                        str(row.get("Phenotype(s)", ""))
-                        if pd.notna(row.get("Phenotype(s)"))
-                        else ""
-                    )
-                    evidence_level = (
-                        str(row.get("Level of Evidence", ""))
-                        if pd.notna(row.get("Level of Evidence"))
-                        else ""
-                    )
-                    level_modifiers = (
-                        str(row.get("Level Modifiers", ""))
-                        if pd.notna(row.get("Level Modifiers"))
-                        else ""
-                    )
-                    score = row.get("Score", 0) if pd.notna(row.get("Score")) else 0
-                    pmid_count = (
-                        row.get("PMID Count", 0)
-                        if pd.notna(row.get("PMID Count"))
-                        else 0
-                    )
-                    evidence_count = (
-                        row.get("Evidence Count", 0)
-                        if pd.notna(row.get("Evidence Count"))
-                        else 0
-                    )
-                    url = str(row.get("URL", "")) if pd.notna(row.get("URL")) else ""
-                    specialty_population = (
-                        str(row.get("Specialty Population", ""))
-                        if pd.notna(row.get("Specialty Population"))
-                        else ""
-                    )
-
-                    # Parse gene symbols
-                    gene_symbols = self.parse_gene_symbols(gene_field)
-
-                    if gene_symbols:
-                        processing_stats["annotations_with_genes"] += 1
-                        processing_stats["unique_genes"].update(gene_symbols)
-
-                    processing_stats["evidence_levels"][evidence_level] += 1
-                    processing_stats["phenotype_categories"][phenotype_category] += 1
-                    if isinstance(score, (int, float)):
-                        processing_stats["scores"].append(score)
-
-                    # Create annotation record
-                    annotation_record = {
-                        "annotation_id": annotation_id,
-                        "variant": variant,
-                        "drug": drug,
-                        "phenotype_category": phenotype_category,
-                        "phenotypes": phenotypes,
-                        "evidence_level": evidence_level,
-                        "level_modifiers": level_modifiers,
-                        "score": float(score)
-                        if isinstance(score, (int, float))
-                        else 0.0,
-                        "evidence_score": EVIDENCE_LEVEL_SCORES.get(evidence_level, 0),
-                        "pmid_count": int(pmid_count)
-                        if isinstance(pmid_count, (int, float))
-                        else 0,
-                        "evidence_count": int(evidence_count)
-                        if isinstance(evidence_count, (int, float))
-                        else 0,
-                        "url": url,
-                        "specialty_population": specialty_population,
-                        "source": "PharmGKB_Clinical_Annotations",
-                    }
-
-                    # Add to gene mapping for each gene
-                    for gene_symbol in gene_symbols:
-                        gene_annotation_mapping[gene_symbol].append(annotation_record)
-
-                    progress_bar.update(1)
-
-            finally:
-                progress_bar.close()
-
             # Log processing statistics
             self.logger.info(f"PharmGKB clinical annotations processing statistics:")
             self.logger.info(
@@ -894,130 +996,60 @@ class PharmGKBAnnotationsProcessor(BaseProcessor):
                 f"Loaded {len(df):,} variant annotation records from PharmGKB"
             )
 
-            gene_variant_mapping = defaultdict(list)
-            processing_stats = {
-                "total_records": len(df),
-                "processed_records": 0,
-                "genes_with_variants": set(),
-                "phenotype_categories": Counter(),
-                "significance_levels": Counter(),
-                "variant_types": Counter(),
-                "drug_associations": Counter(),
-            }
+            total_records = len(df)
+            gene_symbols = _text_column(df, "Gene").str.strip()
+            df = df[gene_symbols != ""]
+            gene_symbols = gene_symbols[df.index]
+            scores = score_variant_annotations(df)
 
-            progress_bar = get_progress_bar(
-                total=len(df),
-                desc="Processing variant annotations",
-                module_name="pharmgkb_variants",
+            drugs = _text_column(df, "Drug(s)").map(
+                lambda value: [d.strip() for d in value.split(",") if d.strip()]
+            )
+            records = pd.DataFrame(
+                {
+                    "variant_annotation_id": _text_column(df, "Variant Annotation ID"),
+                    "variant_identifier": _text_column(df, "Variant/Haplotypes"),
+                    "variant_type": scores["variant_type"],
+                    "drugs": drugs,
+                    "phenotype_category": _text_column(df, "Phenotype Category"),
+                    "significance": _text_column(df, "Significance"),
+                    "direction_of_effect": _text_column(df, "Direction of effect"),
+                    "pmid": _text_column(df, "PMID"),
+                    "clinical_sentence": _text_column(df, "Sentence"),
+                    "specialty_population": _text_column(df, "Specialty Population"),
+                    "pharmacogenomic_score": scores["pharmacogenomic_score"],
+                    "evidence_level": scores["evidence_level"],
+                    "clinical_actionability": scores["clinical_actionability"],
+                    "source": "PharmGKB_Variant_Annotations",
+                },
+                index=df.index,
             )
 
-            try:
-                for _, row in df.iterrows():
-                    # Extract key fields
-                    gene_symbol = str(row.get("Gene", "")).strip()
-                    if not gene_symbol:
-                        progress_bar.update(1)
-                        continue
-
-                    variant_id = (
-                        str(row.get("Variant Annotation ID", ""))
-                        if pd.notna(row.get("Variant Annotation ID"))
-                        else ""
-                    )
-                    variant_identifier = (
-                        str(row.get("Variant/Haplotypes", ""))
-                        if pd.notna(row.get("Variant/Haplotypes"))
-                        else ""
-                    )
-                    drugs_str = (
-                        str(row.get("Drug(s)", ""))
-                        if pd.notna(row.get("Drug(s)"))
-                        else ""
-                    )
-                    phenotype_category = (
-                        str(row.get("Phenotype Category", ""))
-                        if pd.notna(row.get("Phenotype Category"))
-                        else ""
-                    )
-                    significance = (
-                        str(row.get("Significance", ""))
-                        if pd.notna(row.get("Significance"))
-                        else ""
-                    )
-                    pmid = str(row.get("PMID", "")) if pd.notna(row.get("PMID")) else ""
-
-                    # Parse drug list
-                    drugs = []
-                    if drugs_str:
-                        drugs = [
-                            drug.strip()
-                            for drug in drugs_str.split(",")
-                            if drug.strip()
-                        ]
-
-                    # Calculate pharmacogenomic score
-                    pharmacogenomic_score = self._calculate_variant_score(row)
-
-                    # Determine variant type
-                    variant_type = "unknown"
-                    if variant_identifier:
-                        if variant_identifier.startswith("rs"):
-                            variant_type = "SNP"
-                        elif "*" in variant_identifier:
-                            variant_type = "star_allele"
-                        elif (
-                            "del" in variant_identifier.lower()
-                            or "ins" in variant_identifier.lower()
-                        ):
-                            variant_type = "indel"
-                        elif "dup" in variant_identifier.lower():
-                            variant_type = "duplication"
-
-                    # Build variant record
-                    variant_record = {
-                        "variant_annotation_id": variant_id,
-                        "variant_identifier": variant_identifier,
-                        "variant_type": variant_type,
-                        "drugs": drugs,
-                        "phenotype_category": phenotype_category,
-                        "significance": significance,
-                        "direction_of_effect": str(row.get("Direction of effect", ""))
-                        if pd.notna(row.get("Direction of effect"))
-                        else "",
-                        "pmid": pmid,
-                        "clinical_sentence": str(row.get("Sentence", ""))
-                        if pd.notna(row.get("Sentence"))
-                        else "",
-                        "specialty_population": str(row.get("Specialty Population", ""))
-                        if pd.notna(row.get("Specialty Population"))
-                        else "",
-                        "pharmacogenomic_score": pharmacogenomic_score,
-                        "evidence_level": self._assess_variant_evidence_level(row),
-                        "metabolizer_prediction": self._extract_metabolizer_info(
-                            variant_identifier, phenotype_category
-                        ),
-                        "clinical_actionability": self._assess_clinical_actionability(
-                            significance, phenotype_category
-                        ),
-                        "source": "PharmGKB_Variant_Annotations",
-                    }
-
-                    gene_variant_mapping[gene_symbol].append(variant_record)
-
-                    # Update statistics
-                    processing_stats["processed_records"] += 1
-                    processing_stats["genes_with_variants"].add(gene_symbol)
-                    processing_stats["phenotype_categories"][phenotype_category] += 1
-                    processing_stats["significance_levels"][significance] += 1
-                    processing_stats["variant_types"][variant_type] += 1
-
-                    for drug in drugs:
-                        processing_stats["drug_associations"][drug] += 1
-
-                    progress_bar.update(1)
+            gene_variant_mapping = defaultdict(list)
+            metabolizer = zip(
+                scores["metabolizer_phenotype"], scores["metabolizer_confidence"]
+            )
+            for gene_symbol, record, (phenotype, confidence) in zip(
+                gene_symbols, records.to_dict("records"), metabolizer
+            ):
+                record["metabolizer_prediction"] = {
+                    "phenotype": phenotype,
+                    "confidence": confidence,
+                    "basis": "variant_annotation",
+                }
+                gene_variant_mapping[gene_symbol].append(record)
 
-            finally:
-                progress_bar.close()
+            processing_stats = {
+                "total_records": total_records,
+                "processed_records": len(records),
+                "genes_with_variants": set(gene_variant_mapping),
+                "phenotype_categories": Counter(records["phenotype_category"]),
+                "significance_levels": Counter(records["significance"]),
+                "variant_types": Counter(records["variant_type"]),
+                "drug_associations": Counter(
+                    drug for row_drugs in drugs for drug in row_drugs
+                ),
+            }
 
             # Log processing statistics
             self.logger.info(f"PharmGKB variant annotation processing statistics:")
@@ -1056,140 +1088,6 @@ class PharmGKBAnnotationsProcessor(BaseProcessor):
                 f"Failed to process PharmGKB variant annotations: {e}"
             )
 
-    def _calculate_variant_score(self, row: pd.Series) -> float:
-        """Calculate pharmacogenomic importance score for a variant."""
-        base_score = 0.0
-
-        # Clinical significance scoring
-        significance = str(row.get("Significance", "")).lower()
-        if "yes" in significance:
-            base_score += 30.0
-        elif "no" in significance:
-            base_score += 10.0
-        elif significance:  # Any other non-empty significance
-            base_score += 5.0
-
-        # Phenotype category weighting
-        category = str(row.get("Phenotype Category", "")).lower()
-        if "efficacy" in category:
-            base_score += 25.0
-        elif "toxicity" in category:
-            base_score += 20.0
-        elif "metabolism" in category or "pk" in category:
-            base_score += 15.0
-        elif "dosage" in category:
-            base_score += 10.0
-
-        # Direction of effect bonus
-        direction = str(row.get("Direction of effect", "")).lower()
-        if any(term in direction for term in ["increased", "decreased", "affected"]):
-            base_score += 15.0
-
-        # PMID evidence bonus
-        pmid = str(row.get("PMID", ""))
-        if pmid and pmid.strip() and pmid != "nan":
-            base_score += 10.0
-
-        # Special population bonus
-        specialty_pop = str(row.get("Specialty Population", ""))
-        if specialty_pop and specialty_pop.strip() and specialty_pop != "nan":
-            base_score += 5.0
-
-        return min(base_score, 100.0)
-
-    def _assess_variant_evidence_level(self, row: pd.Series) -> str:
-        """Assess evidence level for variant annotation."""
-        significance = str(row.get("Significance", "")).lower()
-        pmid = str(row.get("PMID", ""))
-        category = str(row.get("Phenotype Category", "")).lower()
-
-        # High evidence: clinical significance with PMID and efficacy/toxicity
-        if (
-            "yes" in significance
-            and pmid
-            and pmid.strip()
-            and any(cat in category for cat in ["efficacy", "toxicity"])
-        ):
-            return "high"
-        # Moderate evidence: clinical significance or strong category with PMID
-        elif (
-            (
-                "yes" in significance
-                or any(cat in category for cat in ["efficacy", "toxicity"])
-            )
-            and pmid
-            and pmid.strip()
-        ):
-            return "moderate"
-        # Low evidence: some significance or PMID
-        elif significance or (pmid and pmid.strip()):
-            return "low"
-        else:
-            return "insufficient"
-
-    def _extract_metabolizer_info(
-        self, variant_identifier: str, phenotype_category: str
-    ) -> Dict[str, Any]:
-        """Extract metabolizer phenotype information from variant data."""
-        metabolizer_info = {
-            "phenotype": "unknown",
-            "confidence": 0.0,
-            "basis": "variant_annotation",
-        }
-
-        # Check for known CYP450 star alleles and their metabolizer implications
-        if "*" in variant_identifier:
-            gene_allele = variant_identifier.lower()
-
-            # CYP2D6 metabolizer predictions
-            if "cyp2d6" in phenotype_category.lower():
-                if any(allele in gene_allele for allele in ["*4", "*5", "*6", "*10"]):
-                    metabolizer_info.update(
-                        {"phenotype": "poor_metabolizer", "confidence": 0.85}
-                    )
-                elif any(allele in gene_allele for allele in ["*9", "*41"]):
-                    metabolizer_info.update(
-                        {"phenotype": "intermediate_metabolizer", "confidence": 0.80}
-                    )
-                elif any(allele in gene_allele for allele in ["*1", "*2"]):
-                    metabolizer_info.update(
-                        {"phenotype": "extensive_metabolizer", "confidence": 0.75}
-                    )
-
-            # CYP2C19 metabolizer predictions
-            elif "cyp2c19" in phenotype_category.lower():
-                if any(allele in gene_allele for allele in ["*2", "*3"]):
-                    metabolizer_info.update(
-                        {"phenotype": "poor_metabolizer", "confidence": 0.85}
-                    )
-                elif "*17" in gene_allele:
-                    metabolizer_info.update(
-                        {"phenotype": "ultrarapid_metabolizer", "confidence": 0.80}
-                    )
-
-        return metabolizer_info
-
-    def _assess_clinical_actionability(
-        self, significance: str, phenotype_category: str
-    ) -> str:
-        """Assess clinical actionability of variant annotation."""
-        significance = significance.lower()
-        category = phenotype_category.lower()
-
-        # High actionability: clinically significant with dosage/efficacy/toxicity implications
-        if "yes" in significance and any(
-            cat in category for cat in ["dosage", "efficacy", "toxicity"]
-        ):
-            return "high"
-        # Moderate actionability: clinical significance with metabolism implications
-        elif "yes" in significance and "metabolism" in category:
-            return "moderate"
-        # Low actionability: some significance but unclear clinical impact
-        elif significance and significance != "no":
-            return "low"
-        else:
-            return "research_only"
-
     def extract_publication_references(
         self,
         gene_annotation_mapping: Dict[str, List[Dict[str, Any]]],
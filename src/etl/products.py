@@ -10,12 +10,16 @@ import json
 import gzip
 import os
 import re
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Set, Tuple, Iterator
+from typing import BinaryIO, Deque, Dict, List, Any, Set, Tuple, Iterator
 from datetime import datetime, timedelta
 
 # Third party imports
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import requests
 from tqdm import tqdm
 from psycopg2.extras import execute_batch
@@ -57,6 +61,113 @@ DEFAULT_PRODUCT_TYPES = [
     "regulatory_protein",
 ]
 
+# UniProt parsing
+UNIPROT_FEATURE_TYPES = ("DOMAIN", "REGION", "MOTIF")
+UNIPROT_BLOCK_BYTES = 32 * 1024 * 1024  # decompressed bytes per worker task
+UNIPROT_FEATURES_SCHEMA = pa.schema(
+    [
+        ("gene_symbol", pa.string()),
+        ("kind", pa.string()),  # feature, go, keyword or function
+        ("key", pa.string()),
+        ("value", pa.string()),
+    ]
+)
+
+
+def parse_uniprot_block(block: bytes) -> Dict[str, List[str]]:
+    """Parse a block of complete UniProt entries into columns.
+
+    Lines of one accession are grouped into an entry; the entry's features,
+    GO terms, keywords and function descriptions are attributed to its first
+    Gene_Name. Entries without a gene name are dropped.
+
+    Args:
+        block: Tab-separated lines (accession, type, value); an accession's
+            lines must not be split across blocks
+
+    Returns:
+        Columns of UNIPROT_FEATURES_SCHEMA
+    """
+    columns: Dict[str, List[str]] = {name: [] for name in UNIPROT_FEATURES_SCHEMA.names}
+    accession = None
+    gene_symbol = None
+    pending: List[Tuple[str, str, str]] = []
+
+    def flush() -> None:
+        if gene_symbol:
+            for kind, key, value in pending:
+                columns["gene_symbol"].append(gene_symbol)
+                columns["kind"].append(kind)
+                columns["key"].append(key)
+                columns["value"].append(value)
+
+    for line in block.decode("utf-8", errors="replace").splitlines():
+        parts = line.split("\t")
+        if len(parts) < 3:
+            continue
+
+        if parts[0] != accession:
+            flush()
+            accession, gene_symbol, pending = parts[0], None, []
+
+        id_type, value = parts[1], parts[2].strip()
+        if id_type == "Gene_Name":
+            gene_symbol = gene_symbol or value.upper()
+        elif id_type in UNIPROT_FEATURE_TYPES:
+            pending.append(("feature", id_type.lower(), value))
+        elif id_type == "GO" and ":" in value:
+            go_parts = value.split(";")
+            go_id = go_parts[0].strip()
+            if go_id.startswith("GO:"):
+                go_desc = go_parts[1].strip() if len(go_parts) > 1 else ""
+                pending.append(("go", go_id, go_desc))
+        elif id_type == "KEYWORDS":
+            pending.extend(
+                ("keyword", "", keyword.strip())
+                for keyword in value.split(";")
+                if keyword.strip()
+            )
+        elif id_type == "FUNCTION":
+            pending.append(("function", "", value))
+
+    flush()
+    return columns
+
+
+def iter_uniprot_blocks(
+    handle: BinaryIO, block_bytes: int = UNIPROT_BLOCK_BYTES
+) -> Iterator[bytes]:
+    """Split a decompressed UniProt stream into blocks at accession boundaries.
+
+    Args:
+        handle: Binary stream of tab-separated lines
+        block_bytes: Approximate block size
+
+    Yields:
+        Blocks of complete lines; no accession spans two blocks
+    """
+    buffer = b""
+    while True:
+        chunk = handle.read(block_bytes)
+        if not chunk:
+            break
+        buffer += chunk
+
+        # Hold back the last (possibly incomplete) accession
+        last_line = buffer[buffer.rfind(b"\n", 0, len(buffer) - 1) + 1 :]
+        if b"\t" not in last_line:
+            continue
+        last_accession = last_line.split(b"\t", 1)[0]
+        if buffer.startswith(last_accession + b"\t"):
+            continue
+        cut = buffer.find(b"\n" + last_accession + b"\t") + 1
+        if cut > 0:
+            yield buffer[:cut]
+            buffer = buffer[cut:]
+
+    if buffer:
+        yield buffer
+
 
 class ProductClassifier(BaseProcessor):
     """Classifies gene products based on features, GO terms, and annotations."""
@@ -79,6 +190,12 @@ class ProductClassifier(BaseProcessor):
             "https://ftp.uniprot.org/pub/databases/uniprot/current_release/knowledgebase/idmapping/by_organism/HUMAN_9606_idmapping.dat.gz",
         )
 
+        # Parallel parsing
+        self.max_workers = config.get("max_workers", 4)
+        self.uniprot_block_bytes = config.get(
+            "uniprot_block_bytes", UNIPROT_BLOCK_BYTES
+        )
+
         # Features mapping
         self.feature_to_type = {
             "kinase": ["kinase"],
@@ -153,6 +270,10 @@ class ProductClassifier(BaseProcessor):
     def parse_uniprot_data(self, uniprot_file: Path) -> Dict[str, Dict[str, Any]]:
         """Parse UniProt data file to extract features and GO terms.
 
+        The file is decompressed once; blocks of whole entries are parsed by
+        worker processes into a columnar Parquet intermediate next to the
+        download, which later runs reuse until the download changes.
+
         Args:
             uniprot_file: Path to the UniProt data file
 
@@ -163,153 +284,32 @@ class ProductClassifier(BaseProcessor):
             ProcessingError: If parsing fails
         """
         try:
-            self.logger.info("Parsing UniProt data to extract features and GO terms")
-
-            # Initialize mapping from gene symbols to features and GO terms
-            gene_data: Dict[str, Dict[str, Any]] = {}
-
-            # Track statistics for reporting
-            stats = {
-                "total_entries": 0,
-                "with_gene_symbol": 0,
-                "with_features": 0,
-                "with_go_terms": 0,
-                "with_keywords": 0,
-                "with_function": 0,
-            }
-
-            # Process the file with a progress bar
-            with gzip.open(uniprot_file, "rt") as f:
-                # First count lines for progress bar
-                self.logger.info("Counting lines in UniProt file...")
-                line_count = sum(1 for _ in f)
-                f.seek(0)  # Reset file pointer
-
-                self.logger.info(f"Processing {line_count:,} UniProt entries")
-
-                # Track current entry being processed
-                current_entry = {
-                    "gene_symbol": None,
-                    "features": {},
-                    "go_terms": {},
-                    "keywords": [],
-                    "function": "",
-                }
+            features_file = self.products_dir / "uniprot_features.parquet"
+            if (
+                self.force_download
+                or not features_file.exists()
+                or features_file.stat().st_mtime < uniprot_file.stat().st_mtime
+            ):
+                self._write_uniprot_features(uniprot_file, features_file)
+            else:
+                self.logger.info(f"Using parsed UniProt features from {features_file}")
 
-                # Use progress bar to show processing status
-                for line in tqdm(f, total=line_count, desc="Parsing UniProt data"):
-                    stats["total_entries"] += 1
-
-                    parts = line.strip().split("\t")
-                    if len(parts) < 3:
-                        continue
-
-                    uniprot_id, id_type, value = parts[0], parts[1], parts[2]
-
-                    # Extract gene symbol
-                    if id_type == "Gene_Name":
-                        current_entry["gene_symbol"] = value.upper()
-                        stats["with_gene_symbol"] += 1
-
-                    # Extract features based on various UniProt fields
-                    if id_type == "DOMAIN" or id_type == "REGION" or id_type == "MOTIF":
-                        current_entry["features"][
-                            f"{id_type.lower()}_{len(current_entry['features'])}"
-                        ] = value
-                        stats["with_features"] += 1
-
-                    # Extract GO terms
-                    if id_type == "GO" and ":" in value:
-                        go_parts = value.split(";")
-                        if len(go_parts) >= 1:
-                            go_id = go_parts[0].strip()
-                            # Make sure it's a proper GO ID format
-                            if go_id.startswith("GO:"):
-                                go_desc = (
-                                    go_parts[1].strip() if len(go_parts) > 1 else ""
-                                )
-                                current_entry["go_terms"][go_id] = go_desc
-                                stats["with_go_terms"] += 1
-
-                    # Extract keywords
-                    if id_type == "KEYWORDS":
-                        keywords = [k.strip() for k in value.split(";") if k.strip()]
-                        current_entry["keywords"].extend(keywords)
-                        stats["with_keywords"] += 1
-
-                    # Extract function descriptions
-                    if id_type == "FUNCTION":
-                        current_entry["function"] = value
-                        stats["with_function"] += 1
-
-                    # Store completed entry when we encounter a new gene symbol
-                    if current_entry["gene_symbol"] and (
-                        id_type == "Gene_Name" or stats["total_entries"] % 1000 == 0
-                    ):
-                        gene_symbol = current_entry["gene_symbol"]
-
-                        # Merge with existing data if this gene already has an entry
-                        if gene_symbol in gene_data:
-                            existing = gene_data[gene_symbol]
-
-                            # Merge features
-                            existing["features"].update(current_entry["features"])
-
-                            # Merge GO terms
-                            existing["go_terms"].update(current_entry["go_terms"])
-
-                            # Merge keywords (avoid duplicates)
-                            for keyword in current_entry["keywords"]:
-                                if keyword not in existing["keywords"]:
-                                    existing["keywords"].append(keyword)
-
-                            # Append function descriptions
-                            if current_entry["function"]:
-                                if existing["function"]:
-                                    existing["function"] += (
-                                        "; " + current_entry["function"]
-                                    )
-                                else:
-                                    existing["function"] = current_entry["function"]
-                        else:
-                            # Create new entry for this gene
-                            gene_data[gene_symbol] = {
-                                "features": current_entry["features"].copy(),
-                                "go_terms": current_entry["go_terms"].copy(),
-                                "keywords": current_entry["keywords"].copy(),
-                                "function": current_entry["function"],
-                            }
-
-                        # Reset current entry
-                        if id_type == "Gene_Name":
-                            current_entry = {
-                                "gene_symbol": value.upper(),
-                                "features": {},
-                                "go_terms": {},
-                                "keywords": [],
-                                "function": "",
-                            }
-                        else:
-                            current_entry = {
-                                "gene_symbol": None,
-                                "features": {},
-                                "go_terms": {},
-                                "keywords": [],
-                                "function": "",
-                            }
+            table = pq.read_table(features_file)
+            gene_data = self._build_gene_data(table)
 
             # Log statistics
-            self.logger.info(f"UniProt parsing statistics:")
-            self.logger.info(f"- Total entries processed: {stats['total_entries']:,}")
-            self.logger.info(
-                f"- Entries with gene symbols: {stats['with_gene_symbol']:,}"
-            )
-            self.logger.info(f"- Entries with features: {stats['with_features']:,}")
-            self.logger.info(f"- Entries with GO terms: {stats['with_go_terms']:,}")
-            self.logger.info(f"- Entries with keywords: {stats['with_keywords']:,}")
-            self.logger.info(
-                f"- Entries with function descriptions: {stats['with_function']:,}"
+            kind_counts = table.group_by("kind").aggregate([("kind", "count")])
+            counts = dict(
+                zip(
+                    kind_counts.column("kind").to_pylist(),
+                    kind_counts.column("kind_count").to_pylist(),
+                )
             )
+            self.logger.info(f"UniProt parsing statistics:")
+            self.logger.info(f"- Features: {counts.get('feature', 0):,}")
+            self.logger.info(f"- GO terms: {counts.get('go', 0):,}")
+            self.logger.info(f"- Keywords: {counts.get('keyword', 0):,}")
+            self.logger.info(f"- Function descriptions: {counts.get('function', 0):,}")
             self.logger.info(f"- Total genes with data: {len(gene_data):,}")
 
             return gene_data
@@ -317,6 +317,93 @@ class ProductClassifier(BaseProcessor):
         except Exception as e:
             raise ProcessingError(f"Failed to parse UniProt data: {e}")
 
+    def _write_uniprot_features(self, uniprot_file: Path, features_file: Path) -> None:
+        """Parse the UniProt file in parallel into a Parquet file.
+
+        Progress is reported from the compressed byte offset, so no counting
+        pass is needed.
+
+        Args:
+            uniprot_file: Gzipped UniProt file
+            features_file: Parquet output (UNIPROT_FEATURES_SCHEMA)
+        """
+        self.logger.info(
+            f"Parsing UniProt data with {self.max_workers} workers "
+            "to extract features and GO terms"
+        )
+        tmp_file = features_file.with_name(f".{features_file.name}.tmp")
+
+        with open(uniprot_file, "rb") as raw, gzip.GzipFile(
+            fileobj=raw
+        ) as f, ProcessPoolExecutor(
+            max_workers=self.max_workers
+        ) as executor, pq.ParquetWriter(
+            tmp_file, UNIPROT_FEATURES_SCHEMA
+        ) as writer, tqdm(
+            total=os.path.getsize(uniprot_file),
+            unit="B",
+            unit_scale=True,
+            desc="Parsing UniProt data",
+        ) as progress:
+            pending: Deque[Future] = deque()
+
+            def write_next() -> None:
+                columns = pending.popleft().result()
+                writer.write_table(pa.table(columns, schema=UNIPROT_FEATURES_SCHEMA))
+
+            for block in iter_uniprot_blocks(f, self.uniprot_block_bytes):
+                pending.append(executor.submit(parse_uniprot_block, block))
+                progress.update(raw.tell() - progress.n)
+                # Bound the decompressed blocks held in memory
+                if len(pending) >= 2 * self.max_workers:
+                    write_next()
+            while pending:
+                write_next()
+            progress.update(progress.total - progress.n)
+
+        os.replace(tmp_file, features_file)
+
+    def _build_gene_data(self, table: pa.Table) -> Dict[str, Dict[str, Any]]:
+        """Pivot the columnar UniProt features into per-gene records.
+
+        Args:
+            table: Table with UNIPROT_FEATURES_SCHEMA
+
+        Returns:
+            Dictionary mapping gene symbols to features, GO terms, keywords
+            and function descriptions
+        """
+        gene_data: Dict[str, Dict[str, Any]] = {}
+        seen_keywords: Dict[str, Set[str]] = {}
+
+        for gene_symbol, kind, key, value in zip(
+            *(table.column(name).to_pylist() for name in UNIPROT_FEATURES_SCHEMA.names)
+        ):
+            entry = gene_data.get(gene_symbol)
+            if entry is None:
+                entry = gene_data[gene_symbol] = {
+                    "features": {},
+                    "go_terms": {},
+                    "keywords": [],
+                    "function": "",
+                }
+                seen_keywords[gene_symbol] = set()
+
+            if kind == "feature":
+                entry["features"][f"{key}_{len(entry['features'])}"] = value
+            elif kind == "go":
+                entry["go_terms"][key] = value
+            elif kind == "keyword":
+                if value not in seen_keywords[gene_symbol]:
+                    seen_keywords[gene_symbol].add(value)
+                    entry["keywords"].append(value)
+            elif kind == "function":
+                entry["function"] = (
+                    f"{entry['function']}; {value}" if entry["function"] else value
+                )
+
+        return gene_data
+
     def update_gene_features(self, gene_data: Dict[str, Dict[str, Any]]) -> None:
         """Update genes in the database with features and GO terms.
 
@@ -12,18 +12,24 @@ Update Frequency: Monthly
 
 # Standard library imports
 import gzip
+import io
+import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Set, Tuple, DefaultDict
 from collections import defaultdict
 from datetime import datetime
 
 # Third party imports
+import psycopg2
+from psycopg2 import sql
 from tqdm import tqdm
 from rich.console import Console
 from rich.table import Table
 
 # Local imports
 from .base_processor import BaseProcessor, DownloadError, ProcessingError, DatabaseError
+from ..utils.id_mapping import get_gene_id_map
 from ..utils.logging import get_progress_bar
 
 # Constants
@@ -31,6 +37,8 @@ PUBTATOR_URL = (
     "https://ftp.ncbi.nlm.nih.gov/pub/lu/PubTatorCentral/gene2pubtatorcentral.gz"
 )
 EXPECTED_COLUMNS = 5  # PMID, Type, GeneID, Mention, Method
+PUBLICATIONS_TABLE = "gene_publications"
+HASH_BOUND_PATTERN = re.compile(r"modulus (\d+), remainder (\d+)", re.IGNORECASE)
 
 
 class PubTatorProcessor(BaseProcessor):
@@ -42,6 +50,7 @@ class PubTatorProcessor(BaseProcessor):
     3. Maps NCBI Gene IDs to internal gene_ids
     4. Aggregates mentions per gene-publication pair
     5. Stores in gene_publications table for LLM-assisted queries
+    6. Maintains the gene_literature_stats per-gene rollup
     """
 
     def __init__(self, config: Dict[str, Any]) -> None:
@@ -59,6 +68,9 @@ class PubTatorProcessor(BaseProcessor):
         # Source URL
         self.pubtator_url = config.get("pubtator_url", PUBTATOR_URL)
 
+        # Number of partitions written concurrently (one connection each)
+        self.max_workers = config.get("max_workers", 4)
+
         # Processing statistics
         self.stats: Dict[str, int] = {
             "total_lines": 0,
@@ -104,8 +116,8 @@ class PubTatorProcessor(BaseProcessor):
     def _load_gene_id_mapping(self) -> Dict[str, str]:
         """Load mapping from NCBI Gene IDs to internal gene_ids.
 
-        Queries gene_cross_references table for GeneID entries to map
-        external NCBI Gene IDs to our internal gene_id values.
+        Uses the shared gene ID map (built once from gene_cross_references)
+        to map external NCBI Gene IDs to our internal gene_id values.
 
         Returns:
             Dictionary mapping NCBI Gene ID (string) to internal gene_id
@@ -114,25 +126,16 @@ class PubTatorProcessor(BaseProcessor):
             DatabaseError: If query fails
         """
         try:
-            self.logger.info("Loading NCBI Gene ID mappings from database")
-
-            query = """
-                SELECT DISTINCT external_id, gene_id
-                FROM gene_cross_references
-                WHERE external_db = 'GeneID'
-                ORDER BY gene_id
-            """
+            self.logger.info("Loading NCBI Gene ID mappings")
 
             if not self.ensure_connection() or not self.db_manager.cursor:
                 raise DatabaseError(
                     "Cannot load gene ID mapping: no database connection"
                 )
 
-            self.db_manager.cursor.execute(query)
-            results = self.db_manager.cursor.fetchall()
-
-            # Build mapping dictionary: external_id (NCBI Gene ID) -> gene_id
-            id_mapping = {row[0]: row[1] for row in results}
+            id_mapping = get_gene_id_map(self.cache_dir, self.db_manager).as_dict(
+                "ncbi"
+            )
 
             self.logger.info(f"Loaded {len(id_mapping):,} NCBI Gene ID mappings")
             return id_mapping
@@ -267,13 +270,178 @@ class PubTatorProcessor(BaseProcessor):
         # 3. Parse from full PubTator Central JSON files
         return None
 
+    def _get_publication_partitions(self) -> Dict[str, Tuple[int, int]]:
+        """Look up the hash partitions of the gene_publications table.
+
+        Returns:
+            Dictionary mapping partition table name to (modulus, remainder).
+            Empty if gene_publications is not partitioned (pre-partitioning schema).
+
+        Raises:
+            DatabaseError: If the catalog query fails
+        """
+        if not self.ensure_connection() or not self.db_manager.cursor:
+            raise DatabaseError("No database cursor available")
+
+        self.db_manager.cursor.execute(
+            """
+            SELECT c.relname, pg_get_expr(c.relpartbound, c.oid)
+            FROM pg_inherits i
+            JOIN pg_class c ON c.oid = i.inhrelid
+            WHERE i.inhparent = %s::regclass
+            ORDER BY c.relname
+            """,
+            (PUBLICATIONS_TABLE,),
+        )
+
+        partitions: Dict[str, Tuple[int, int]] = {}
+        for relname, bound in self.db_manager.cursor.fetchall():
+            match = HASH_BOUND_PATTERN.search(bound or "")
+            if match:
+                partitions[relname] = (int(match.group(1)), int(match.group(2)))
+        return partitions
+
+    def _assign_partitions(
+        self, gene_ids: List[str], partitions: Dict[str, Tuple[int, int]]
+    ) -> Dict[str, str]:
+        """Resolve the partition each gene_id hashes to.
+
+        Uses PostgreSQL's own partition hash (satisfies_hash_partition) so rows
+        can be written straight into the leaf tables without re-routing.
+
+        Args:
+            gene_ids: Internal gene IDs to place
+            partitions: Partition name -> (modulus, remainder)
+
+        Returns:
+            Dictionary mapping gene_id to partition table name
+        """
+        if not self.ensure_connection() or not self.db_manager.cursor:
+            raise DatabaseError("No database cursor available")
+
+        names = list(partitions.keys())
+        self.db_manager.cursor.execute(
+            """
+            SELECT g.gene_id, p.partition_name
+            FROM unnest(%s::varchar[]) AS g(gene_id)
+            JOIN unnest(%s::text[], %s::int[], %s::int[])
+                AS p(partition_name, modulus, remainder)
+              ON satisfies_hash_partition(
+                     %s::regclass, p.modulus, p.remainder, g.gene_id
+                 )
+            """,
+            (
+                gene_ids,
+                names,
+                [partitions[n][0] for n in names],
+                [partitions[n][1] for n in names],
+                PUBLICATIONS_TABLE,
+            ),
+        )
+        return {gene_id: partition for gene_id, partition in self.db_manager.cursor}
+
+    def _load_partition(
+        self, table_name: str, rows: List[Tuple[str, str, int, Optional[int]]]
+    ) -> int:
+        """Bulk-load rows into a single gene_publications partition.
+
+        Runs on its own connection so partitions can be written concurrently:
+        COPY into a temp staging table, one upsert into the partition, a refresh
+        of gene_literature_stats for the staged genes, then VACUUM (ANALYZE) so
+        the visibility map allows index-only scans.
+
+        Args:
+            table_name: Partition (or unpartitioned table) to write
+            rows: (gene_id, pmid, mention_count, first_seen_year) tuples
+
+        Returns:
+            Number of rows inserted or updated
+        """
+        buffer = io.StringIO()
+        for gene_id, pmid, mention_count, first_seen_year in sorted(rows):
+            year = "\\N" if first_seen_year is None else str(first_seen_year)
+            buffer.write(f"{gene_id}\t{pmid}\t{mention_count}\t{year}\n")
+        buffer.seek(0)
+
+        conn = psycopg2.connect(**self.db_manager.db_config)
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute(
+                    """
+                    CREATE TEMP TABLE gene_publications_stage (
+                        gene_id VARCHAR(50),
+                        pmid VARCHAR(20),
+                        mention_count INTEGER,
+                        first_seen_year INTEGER
+                    ) ON COMMIT DROP
+                    """
+                )
+                cursor.copy_expert("COPY gene_publications_stage FROM STDIN", buffer)
+                cursor.execute(
+                    sql.SQL(
+                        """
+                        INSERT INTO {} (gene_id, pmid, mention_count, first_seen_year)
+                        SELECT gene_id, pmid, mention_count, first_seen_year
+                        FROM gene_publications_stage
+                        ON CONFLICT (gene_id, pmid)
+                        DO UPDATE SET
+                            mention_count = EXCLUDED.mention_count,
+                            first_seen_year = EXCLUDED.first_seen_year,
+                            last_updated = CURRENT_TIMESTAMP
+                        """
+                    ).format(sql.Identifier(table_name))
+                )
+                written = cursor.rowcount
+
+                # Incrementally refresh the per-gene rollup for genes in this batch.
+                # Partitions hold disjoint genes, so workers never touch the same rows.
+                cursor.execute(
+                    sql.SQL(
+                        """
+                        INSERT INTO gene_literature_stats (
+                            gene_id, publication_count, total_mentions,
+                            first_year, last_year
+                        )
+                        SELECT
+                            gp.gene_id,
+                            COUNT(*),
+                            COALESCE(SUM(gp.mention_count), 0),
+                            MIN(gp.first_seen_year),
+                            MAX(gp.first_seen_year)
+                        FROM {} gp
+                        WHERE gp.gene_id IN (
+                            SELECT DISTINCT gene_id FROM gene_publications_stage
+                        )
+                        GROUP BY gp.gene_id
+                        ON CONFLICT (gene_id)
+                        DO UPDATE SET
+                            publication_count = EXCLUDED.publication_count,
+                            total_mentions = EXCLUDED.total_mentions,
+                            first_year = EXCLUDED.first_year,
+                            last_year = EXCLUDED.last_year,
+                            last_updated = CURRENT_TIMESTAMP
+                        """
+                    ).format(sql.Identifier(table_name))
+                )
+            conn.commit()
+
+            conn.autocommit = True
+            with conn.cursor() as cursor:
+                cursor.execute(
+                    sql.SQL("VACUUM (ANALYZE) {}").format(sql.Identifier(table_name))
+                )
+            return written
+        finally:
+            conn.close()
+
     def insert_gene_publications(
         self, gene_publications: Dict[Tuple[str, str], Dict[str, Any]]
     ) -> None:
         """Insert gene-publication associations into database.
 
-        Uses batch inserts for efficiency with ON CONFLICT handling to enable
-        reprocessing without duplicates.
+        Rows are grouped by the hash partition their gene_id falls into and each
+        partition is bulk-loaded on its own connection, up to max_workers at a
+        time. ON CONFLICT handling keeps reprocessing idempotent.
 
         Args:
             gene_publications: Dictionary of (gene_id, pmid) -> metadata
@@ -284,50 +452,54 @@ class PubTatorProcessor(BaseProcessor):
         try:
             self.logger.info("Inserting gene-publication associations into database")
 
-            # Prepare batch data
-            batch_data = []
-            for (gene_id, pmid), mention_count in gene_publications.items():
-                first_seen_year = self._extract_publication_year(pmid)
-
-                batch_data.append((gene_id, pmid, mention_count, first_seen_year))
-
-            # Insert in batches
-            insert_query = """
-                INSERT INTO gene_publications (gene_id, pmid, mention_count, first_seen_year)
-                VALUES (%s, %s, %s, %s)
-                ON CONFLICT (gene_id, pmid)
-                DO UPDATE SET
-                    mention_count = EXCLUDED.mention_count,
-                    first_seen_year = EXCLUDED.first_seen_year,
-                    last_updated = CURRENT_TIMESTAMP
-            """
+            partitions = self._get_publication_partitions()
+            gene_ids = sorted({gene_id for gene_id, _ in gene_publications})
 
-            # Ensure database connection is available
-            if not self.ensure_connection() or not self.db_manager.cursor:
-                raise DatabaseError("No database cursor available")
-
-            # Use progress bar for batch inserts
-            total_batches = (len(batch_data) + self.batch_size - 1) // self.batch_size
+            if partitions:
+                partition_of = self._assign_partitions(gene_ids, partitions)
+            else:
+                self.logger.warning(
+                    "gene_publications is not partitioned; loading into a single table"
+                )
+                partition_of = {gene_id: PUBLICATIONS_TABLE for gene_id in gene_ids}
 
-            with tqdm(
-                total=len(batch_data), desc="Inserting publications", unit=" records"
-            ) as pbar:
-                for i in range(0, len(batch_data), self.batch_size):
-                    batch = batch_data[i : i + self.batch_size]
+            # Group rows by target partition
+            partition_rows: DefaultDict[
+                str, List[Tuple[str, str, int, Optional[int]]]
+            ] = defaultdict(list)
+            for (gene_id, pmid), mention_count in gene_publications.items():
+                partition_rows[partition_of[gene_id]].append(
+                    (
+                        gene_id,
+                        pmid,
+                        mention_count,
+                        self._extract_publication_year(pmid),
+                    )
+                )
 
-                    self.db_manager.cursor.executemany(insert_query, batch)
-                    if self.db_manager.conn and not self.db_manager.conn.closed:
-                        self.db_manager.conn.commit()
+            self.logger.info(
+                f"Loading {len(gene_publications):,} associations into "
+                f"{len(partition_rows)} partitions with {self.max_workers} workers"
+            )
 
-                    pbar.update(len(batch))
-                    self.stats["inserted_publications"] += len(batch)
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor, tqdm(
+                total=len(gene_publications),
+                desc="Inserting publications",
+                unit=" records",
+            ) as pbar:
+                futures = {
+                    executor.submit(self._load_partition, table_name, rows): len(rows)
+                    for table_name, rows in partition_rows.items()
+                }
+                for future in as_completed(futures):
+                    self.stats["inserted_publications"] += future.result()
+                    pbar.update(futures[future])
 
             self.logger.info(
                 f"Successfully inserted {self.stats['inserted_publications']:,} gene-publication associations"
             )
 
         except Exception as e:
-            self.db_manager.conn.rollback()
             raise DatabaseError(f"Failed to insert gene publications: {e}")
 
     def _display_summary_statistics(self) -> None:
@@ -361,26 +533,20 @@ class PubTatorProcessor(BaseProcessor):
         try:
             self.logger.info("Verifying gene_publications table")
 
+            # Per-gene figures come from the gene_literature_stats rollup
+            # instead of re-aggregating gene_publications
             verification_queries = {
                 "total_associations": "SELECT COUNT(*) FROM gene_publications",
-                "unique_genes": "SELECT COUNT(DISTINCT gene_id) FROM gene_publications",
+                "unique_genes": "SELECT COUNT(*) FROM gene_literature_stats",
                 "unique_pmids": "SELECT COUNT(DISTINCT pmid) FROM gene_publications",
                 "avg_mentions_per_gene": """
-                    SELECT ROUND(AVG(pub_count)::numeric, 1)
-                    FROM (
-                        SELECT gene_id, COUNT(*) as pub_count
-                        FROM gene_publications
-                        GROUP BY gene_id
-                    ) AS gene_counts
+                    SELECT ROUND(AVG(publication_count)::numeric, 1)
+                    FROM gene_literature_stats
                 """,
                 "genes_with_high_literature": """
                     SELECT COUNT(*)
-                    FROM (
-                        SELECT gene_id, COUNT(*) as pub_count
-                        FROM gene_publications
-                        GROUP BY gene_id
-                        HAVING COUNT(*) >= 100
-                    ) AS high_lit_genes
+                    FROM gene_literature_stats
+                    WHERE publication_count >= 100
                 """,
             }
 
@@ -408,7 +574,7 @@ class PubTatorProcessor(BaseProcessor):
         1. Download gene2pubtatorcentral.gz (~5GB)
         2. Load gene ID mappings from database
         3. Parse and aggregate gene-publication associations
-        4. Insert into gene_publications table
+        4. Insert into gene_publications table (refreshing gene_literature_stats)
         5. Verify and display statistics
 
         Raises:
@@ -6,7 +6,6 @@ for cancer research applications.
 """
 
 import json
-import statistics
 import numpy as np
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple, Any, Union
@@ -15,9 +14,67 @@ from collections import defaultdict, Counter
 import pandas as pd
 
 from .base_processor import BaseProcessor, DatabaseError
-from .evidence_scoring import UseCase, EvidenceType
 from ..utils.logging import setup_logging
 
+# Component score -> (analytics metric, maximum component score)
+COMPONENT_METRICS = {
+    "clinical": ("clinical_strength", 30.0),
+    "mechanistic": ("mechanistic_depth", 25.0),
+    "publication": ("publication_support", 20.0),
+    "genomic": ("genomic_relevance", 15.0),
+    "safety": ("safety_profile", 10.0),
+}
+
+# Evidence rows of the requested genes, with each gene's number of evidence
+# sources and the details of each row's drug taken from one transcript
+GENE_EVIDENCE_QUERY = """
+WITH ctb AS (
+    SELECT DISTINCT ON (gene_symbol)
+        gene_symbol, drugs, pathways, go_terms, source_references
+    FROM cancer_transcript_base
+    WHERE gene_symbol = ANY(%(genes)s)
+    ORDER BY gene_symbol, transcript_id
+)
+SELECT
+    esm.gene_symbol,
+    esm.use_case,
+    esm.drug_id,
+    esm.evidence_count,
+    COALESCE((esm.evidence_score->>'overall_score')::float, 0) AS overall_score,
+    {components},
+    ctb.drugs -> esm.drug_id AS drug_info,
+    (
+        SELECT COUNT(DISTINCT source) FROM (
+            SELECT jsonb_object_keys(ctb.source_references) AS source
+            WHERE jsonb_typeof(ctb.source_references) = 'object'
+            UNION ALL SELECT 'drugs' WHERE ctb.drugs NOT IN ({empty})
+            UNION ALL SELECT 'pathways' WHERE cardinality(ctb.pathways) > 0
+            UNION ALL SELECT 'go_terms' WHERE ctb.go_terms NOT IN ({empty})
+        ) sources
+    ) AS evidence_sources
+FROM evidence_scoring_metadata esm
+JOIN ctb USING (gene_symbol)
+WHERE esm.gene_symbol = ANY(%(genes)s)
+ORDER BY esm.gene_symbol, esm.drug_id NULLS LAST, esm.use_case
+""".format(
+    empty="'{}'::jsonb, '[]'::jsonb, 'null'::jsonb",
+    components=",\n    ".join(
+        f"CASE WHEN esm.evidence_score->'component_scores' ? '{name}' THEN COALESCE("
+        f"(esm.evidence_score->'component_scores'->>'{name}')::float, 0) END AS {name}"
+        for name in COMPONENT_METRICS
+    ),
+)
+GENE_EVIDENCE_COLUMNS = [
+    "gene_symbol",
+    "use_case",
+    "drug_id",
+    "evidence_count",
+    "overall_score",
+    *COMPONENT_METRICS,
+    "drug_info",
+    "evidence_sources",
+]
+
 
 @dataclass
 class ScoringAnalytics:
@@ -77,212 +134,182 @@ class ScoringAnalyticsProcessor(BaseProcessor):
         Returns:
             ScoringAnalytics object with comprehensive analysis
         """
-        if not self.ensure_connection() or not self.db_manager.cursor:
-            return None
+        return self.analyze_gene_evidence_profiles([gene_symbol]).get(gene_symbol)
 
-        try:
-            # Get evidence scoring data
-            self.db_manager.cursor.execute(
-                """
-                SELECT 
-                    esm.evidence_score,
-                    esm.evidence_count,
-                    esm.evidence_quality,
-                    esm.use_case,
-                    esm.drug_id,
-                    ctb.drugs,
-                    ctb.pathways,
-                    ctb.go_terms,
-                    ctb.source_references
-                FROM evidence_scoring_metadata esm
-                JOIN cancer_transcript_base ctb ON esm.gene_symbol = ctb.gene_symbol
-                WHERE esm.gene_symbol = %s
-            """,
-                (gene_symbol,),
-            )
+    def analyze_gene_evidence_profiles(
+        self, gene_list: List[str]
+    ) -> Dict[str, ScoringAnalytics]:
+        """Analyze the evidence profiles of many genes in one query.
 
-            records = self.db_manager.cursor.fetchall()
-            if not records:
-                self.logger.warning(f"No evidence scoring data found for {gene_symbol}")
-                return None
-
-            # Aggregate data across use cases and drugs
-            all_evidence_scores = []
-            use_case_scores = {}
-            drug_scores = defaultdict(list)
-            total_evidence_items = 0
-
-            for record in records:
-                (
-                    evidence_score,
-                    evidence_count,
-                    evidence_quality,
-                    use_case,
-                    drug_id,
-                ) = record[:5]
-                drugs, pathways, go_terms, source_references = record[5:]
-
-                all_evidence_scores.append(evidence_score)
-                use_case_scores[use_case] = evidence_score.get("overall_score", 0)
-
-                if drug_id:
-                    drug_scores[drug_id].append(evidence_score.get("overall_score", 0))
-
-                total_evidence_items = max(total_evidence_items, evidence_count or 0)
-
-            # Calculate analytics metrics
-            analytics = self._calculate_analytics_metrics(
-                gene_symbol,
-                all_evidence_scores,
-                use_case_scores,
-                drug_scores,
-                total_evidence_items,
-                drugs,
-                pathways,
-                go_terms,
-                source_references,
-            )
+        All evidence rows of the genes are fetched at once and the metrics
+        computed per gene with grouped DataFrame operations.
 
-            return analytics
+        Args:
+            gene_list: Gene symbols to analyze
 
+        Returns:
+            ScoringAnalytics per gene with evidence data, in gene_list order
+        """
+        genes = list(dict.fromkeys(gene_list))
+        if not genes or not self.ensure_connection() or not self.db_manager.cursor:
+            return {}
+
+        try:
+            self.db_manager.cursor.execute(GENE_EVIDENCE_QUERY, {"genes": genes})
+            rows = pd.DataFrame(
+                self.db_manager.cursor.fetchall(), columns=GENE_EVIDENCE_COLUMNS
+            )
         except Exception as e:
-            self.logger.error(
-                f"Error analyzing evidence profile for {gene_symbol}: {e}"
+            self.logger.error(f"Error loading evidence profiles: {e}")
+            return {}
+
+        missing = [gene for gene in genes if gene not in set(rows["gene_symbol"])]
+        if missing:
+            self.logger.warning(
+                f"No evidence scoring data found for {len(missing)} genes: "
+                f"{', '.join(missing[:10])}"
+            )
+        if rows.empty:
+            return {}
+
+        metrics = self._calculate_analytics_metrics(rows)
+        metrics = metrics.reindex([gene for gene in genes if gene in metrics.index])
+        use_case_rankings = self._rank_use_cases(rows)
+        top_drugs = self._top_drugs(rows)
+
+        gene_analytics = {}
+        for gene, row in zip(metrics.index, metrics.to_dict("records")):
+            evidence_gaps = self._identify_evidence_gaps(
+                row["evidence_diversity_score"],
+                row["clinical_strength"],
+                row["mechanistic_depth"],
+                row["publication_support"],
+                row["genomic_relevance"],
+                row["safety_profile"],
+            )
+            recommendations = self._generate_recommendations(
+                gene,
+                use_case_rankings[gene],
+                evidence_gaps,
+                row["clinical_strength"],
+                row["recommendation_confidence"],
+            )
+            gene_analytics[gene] = ScoringAnalytics(
+                gene_symbol=gene,
+                total_evidence_items=int(row["total_evidence_items"]),
+                evidence_diversity_score=round(row["evidence_diversity_score"], 3),
+                clinical_strength=round(row["clinical_strength"], 3),
+                mechanistic_depth=round(row["mechanistic_depth"], 3),
+                publication_support=round(row["publication_support"], 3),
+                genomic_relevance=round(row["genomic_relevance"], 3),
+                safety_profile=round(row["safety_profile"], 3),
+                cross_validation_score=round(row["cross_validation_score"], 3),
+                recommendation_confidence=round(row["recommendation_confidence"], 3),
+                use_case_rankings=use_case_rankings[gene],
+                top_drugs=top_drugs.get(gene, []),
+                evidence_gaps=evidence_gaps,
+                recommendations=recommendations,
             )
-            return None
 
-    def _calculate_analytics_metrics(
-        self,
-        gene_symbol: str,
-        evidence_scores: List[Dict[str, Any]],
-        use_case_scores: Dict[str, float],
-        drug_scores: Dict[str, List[float]],
-        total_evidence_items: int,
-        drugs: Dict[str, Any],
-        pathways: List[str],
-        go_terms: Dict[str, Any],
-        source_references: Dict[str, Any],
-    ) -> ScoringAnalytics:
-        """Calculate comprehensive analytics metrics."""
-
-        # Evidence diversity score (0-1)
-        evidence_sources = set()
-        if drugs:
-            evidence_sources.add("drugs")
-        if pathways:
-            evidence_sources.add("pathways")
-        if go_terms:
-            evidence_sources.add("go_terms")
-        if source_references:
-            evidence_sources.update(source_references.keys())
-
-        evidence_diversity_score = min(
-            len(evidence_sources) / 6.0, 1.0
-        )  # Normalize to max 6 sources
-
-        # Component strength scores from evidence data
-        component_scores = {}
-        for score_data in evidence_scores:
-            components = score_data.get("component_scores", {})
-            for component, value in components.items():
-                if component not in component_scores:
-                    component_scores[component] = []
-                component_scores[component].append(value or 0)
-
-        # Average component scores
-        clinical_strength = (
-            statistics.mean(component_scores.get("clinical", [0])) / 30.0
-        )  # Normalize to 0-1
-        mechanistic_depth = (
-            statistics.mean(component_scores.get("mechanistic", [0])) / 25.0
+        return gene_analytics
+
+    def _calculate_analytics_metrics(self, rows: pd.DataFrame) -> pd.DataFrame:
+        """Calculate the per-gene analytics metrics from evidence rows.
+
+        Args:
+            rows: Evidence rows (GENE_EVIDENCE_COLUMNS)
+
+        Returns:
+            Unrounded metrics, one row per gene
+        """
+        by_gene = rows.groupby("gene_symbol", sort=False)
+        metrics = pd.DataFrame(
+            {
+                # Normalize to max 6 sources
+                "evidence_diversity_score": np.minimum(
+                    by_gene["evidence_sources"].first().astype(float) / 6.0, 1.0
+                ),
+                "total_evidence_items": rows["evidence_count"]
+                .fillna(0)
+                .groupby(rows["gene_symbol"], sort=False)
+                .max()
+                .clip(lower=0),
+            }
         )
-        publication_support = (
-            statistics.mean(component_scores.get("publication", [0])) / 20.0
+
+        # Average component scores, normalized to 0-1
+        component_means = by_gene[list(COMPONENT_METRICS)].mean().fillna(0.0)
+        for component, (metric, max_score) in COMPONENT_METRICS.items():
+            metrics[metric] = component_means[component] / max_score
+
+        # Cross-validation score based on consistency across evidence rows:
+        # penalize high variance, neutral score for single evidence
+        overall = by_gene["overall_score"]
+        metrics["cross_validation_score"] = np.where(
+            overall.count() > 1, np.maximum(0.0, 1.0 - overall.var() / 1000), 0.5
         )
-        genomic_relevance = statistics.mean(component_scores.get("genomic", [0])) / 15.0
-        safety_profile = statistics.mean(component_scores.get("safety", [0])) / 10.0
-
-        # Cross-validation score based on consistency across evidence types
-        all_scores = []
-        for score_data in evidence_scores:
-            all_scores.append(score_data.get("overall_score", 0))
-
-        if len(all_scores) > 1:
-            score_variance = statistics.variance(all_scores)
-            cross_validation_score = max(
-                0, 1.0 - (score_variance / 1000)
-            )  # Penalize high variance
-        else:
-            cross_validation_score = 0.5  # Neutral score for single evidence
 
         # Recommendation confidence based on multiple factors
-        confidence_factors = [
-            evidence_diversity_score,
-            min(total_evidence_items / 10.0, 1.0),  # Evidence quantity
-            clinical_strength,
-            cross_validation_score,
-        ]
-        recommendation_confidence = statistics.mean(confidence_factors)
-
-        # Rank use cases by scores
-        use_case_rankings = dict(
-            sorted(use_case_scores.items(), key=lambda x: x[1], reverse=True)
+        metrics["recommendation_confidence"] = (
+            metrics["evidence_diversity_score"]
+            + np.minimum(metrics["total_evidence_items"] / 10.0, 1.0)
+            + metrics["clinical_strength"]
+            + metrics["cross_validation_score"]
+        ) / 4
+
+        return metrics
+
+    @staticmethod
+    def _rank_use_cases(rows: pd.DataFrame) -> Dict[str, Dict[str, float]]:
+        """Rank each gene's use cases by score (gene-level rows take precedence)."""
+        scores = rows.drop_duplicates(["gene_symbol", "use_case"], keep="last")
+        scores = scores.sort_values(
+            ["gene_symbol", "overall_score"], ascending=[True, False], kind="stable"
         )
 
-        # Top drugs analysis
-        top_drugs = []
-        for drug_id, scores in drug_scores.items():
-            avg_score = statistics.mean(scores)
-            drug_info = drugs.get(drug_id, {}) if drugs else {}
+        rankings: Dict[str, Dict[str, float]] = defaultdict(dict)
+        for gene, use_case, score in zip(
+            scores["gene_symbol"], scores["use_case"], scores["overall_score"]
+        ):
+            rankings[gene][use_case] = float(score)
+        return rankings
 
-            top_drugs.append(
+    @staticmethod
+    def _top_drugs(
+        rows: pd.DataFrame, limit: int = 5
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Return each gene's top drugs by average evidence score."""
+        drug_rows = rows[rows["drug_id"].notna()]
+        if drug_rows.empty:
+            return {}
+
+        drugs = (
+            drug_rows.groupby(["gene_symbol", "drug_id"], sort=False)
+            .agg(avg_score=("overall_score", "mean"), drug_info=("drug_info", "first"))
+            .reset_index()
+        )
+        drugs["avg_score"] = [round(score, 2) for score in drugs["avg_score"]]
+        drugs = drugs.sort_values("avg_score", ascending=False, kind="stable")
+        drugs = drugs.groupby("gene_symbol", sort=False).head(limit)
+
+        top_drugs: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        for gene, drug_id, avg_score, drug_info in zip(
+            drugs["gene_symbol"],
+            drugs["drug_id"],
+            drugs["avg_score"],
+            drugs["drug_info"],
+        ):
+            drug_info = drug_info if isinstance(drug_info, dict) else {}
+            top_drugs[gene].append(
                 {
                     "drug_id": drug_id,
                     "name": drug_info.get("name", "Unknown"),
-                    "avg_score": round(avg_score, 2),
+                    "avg_score": avg_score,
                     "max_phase": drug_info.get("max_phase", 0),
                     "mechanism": drug_info.get("mechanism", "Unknown"),
                 }
             )
-
-        top_drugs.sort(key=lambda x: x["avg_score"], reverse=True)
-        top_drugs = top_drugs[:5]  # Top 5 drugs
-
-        # Identify evidence gaps
-        evidence_gaps = self._identify_evidence_gaps(
-            evidence_diversity_score,
-            clinical_strength,
-            mechanistic_depth,
-            publication_support,
-            genomic_relevance,
-            safety_profile,
-        )
-
-        # Generate recommendations
-        recommendations = self._generate_recommendations(
-            gene_symbol,
-            use_case_rankings,
-            evidence_gaps,
-            clinical_strength,
-            recommendation_confidence,
-        )
-
-        return ScoringAnalytics(
-            gene_symbol=gene_symbol,
-            total_evidence_items=total_evidence_items,
-            evidence_diversity_score=round(evidence_diversity_score, 3),
-            clinical_strength=round(clinical_strength, 3),
-            mechanistic_depth=round(mechanistic_depth, 3),
-            publication_support=round(publication_support, 3),
-            genomic_relevance=round(genomic_relevance, 3),
-            safety_profile=round(safety_profile, 3),
-            cross_validation_score=round(cross_validation_score, 3),
-            recommendation_confidence=round(recommendation_confidence, 3),
-            use_case_rankings=use_case_rankings,
-            top_drugs=top_drugs,
-            evidence_gaps=evidence_gaps,
-            recommendations=recommendations,
-        )
+        return top_drugs
 
     def _identify_evidence_gaps(
         self,
@@ -410,202 +437,158 @@ class ScoringAnalyticsProcessor(BaseProcessor):
             Comprehensive comparative analysis
         """
         try:
-            gene_analytics = {}
-
-            # Analyze each gene
-            for gene_symbol in gene_list:
-                analytics = self.analyze_gene_evidence_profile(gene_symbol)
-                if analytics:
-                    gene_analytics[gene_symbol] = analytics
-
-            if not gene_analytics:
-                return {"error": "No valid analytics data found for provided genes"}
-
-            # Comparative metrics
-            comparison = {
-                "total_genes_analyzed": len(gene_analytics),
-                "analysis_date": datetime.now().isoformat(),
-                "gene_rankings": self._rank_genes_by_metrics(gene_analytics),
-                "use_case_comparison": self._compare_use_cases(gene_analytics),
-                "evidence_quality_distribution": self._analyze_evidence_quality(
-                    gene_analytics
-                ),
-                "clinical_readiness_assessment": self._assess_clinical_readiness(
-                    gene_analytics
-                ),
-                "research_priorities": self._prioritize_research_opportunities(
-                    gene_analytics
-                ),
-                "portfolio_recommendations": self._generate_portfolio_recommendations(
-                    gene_analytics
-                ),
-            }
-
-            return comparison
-
+            return self._comparative_analysis(
+                self.analyze_gene_evidence_profiles(gene_list)
+            )
         except Exception as e:
             self.logger.error(f"Error generating comparative analysis: {e}")
             return {"error": str(e)}
 
-    def _rank_genes_by_metrics(
+    def _comparative_analysis(
         self, gene_analytics: Dict[str, ScoringAnalytics]
-    ) -> Dict[str, List[Dict[str, Any]]]:
-        """Rank genes by various metrics."""
-        rankings = {}
-
-        # Overall confidence ranking
-        confidence_ranking = sorted(
-            gene_analytics.items(),
-            key=lambda x: x[1].recommendation_confidence,
-            reverse=True,
-        )
-        rankings["by_confidence"] = [
-            {
-                "gene": gene,
-                "confidence": analytics.recommendation_confidence,
-                "evidence_items": analytics.total_evidence_items,
-            }
-            for gene, analytics in confidence_ranking[:20]  # Top 20
-        ]
+    ) -> Dict[str, Any]:
+        """Compare already analyzed genes."""
+        if not gene_analytics:
+            return {"error": "No valid analytics data found for provided genes"}
 
-        # Clinical strength ranking
-        clinical_ranking = sorted(
-            gene_analytics.items(), key=lambda x: x[1].clinical_strength, reverse=True
-        )
-        rankings["by_clinical_strength"] = [
-            {
-                "gene": gene,
-                "clinical_strength": analytics.clinical_strength,
-                "top_drugs_count": len(analytics.top_drugs),
-            }
-            for gene, analytics in clinical_ranking[:20]
-        ]
+        metrics = self._analytics_frame(gene_analytics)
+        return {
+            "total_genes_analyzed": len(gene_analytics),
+            "analysis_date": datetime.now().isoformat(),
+            "gene_rankings": self._rank_genes_by_metrics(metrics),
+            "use_case_comparison": self._compare_use_cases(gene_analytics, metrics),
+            "evidence_quality_distribution": self._analyze_evidence_quality(metrics),
+            "clinical_readiness_assessment": self._assess_clinical_readiness(metrics),
+            "research_priorities": self._prioritize_research_opportunities(
+                gene_analytics
+            ),
+            "portfolio_recommendations": self._generate_portfolio_recommendations(
+                gene_analytics
+            ),
+        }
 
-        # Evidence diversity ranking
-        diversity_ranking = sorted(
-            gene_analytics.items(),
-            key=lambda x: x[1].evidence_diversity_score,
-            reverse=True,
-        )
-        rankings["by_evidence_diversity"] = [
+    @staticmethod
+    def _analytics_frame(gene_analytics: Dict[str, ScoringAnalytics]) -> pd.DataFrame:
+        """Collect the comparison metrics of analyzed genes, one row per gene."""
+        analytics = list(gene_analytics.values())
+        return pd.DataFrame(
             {
-                "gene": gene,
-                "diversity_score": analytics.evidence_diversity_score,
-                "evidence_gaps_count": len(analytics.evidence_gaps),
-            }
-            for gene, analytics in diversity_ranking[:20]
-        ]
+                "confidence": [a.recommendation_confidence for a in analytics],
+                "evidence_items": [a.total_evidence_items for a in analytics],
+                "clinical_strength": [a.clinical_strength for a in analytics],
+                "top_drugs_count": [len(a.top_drugs) for a in analytics],
+                "diversity_score": [a.evidence_diversity_score for a in analytics],
+                "evidence_gaps_count": [len(a.evidence_gaps) for a in analytics],
+            },
+            index=pd.Index(list(gene_analytics), name="gene"),
+        )
 
-        return rankings
+    def _rank_genes_by_metrics(
+        self, metrics: pd.DataFrame, limit: int = 20
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Rank genes by various metrics (top 20 each)."""
+
+        def top(column: str, fields: List[str]) -> List[Dict[str, Any]]:
+            ranked = metrics.sort_values(column, ascending=False, kind="stable")
+            return ranked[fields].head(limit).reset_index().to_dict("records")
+
+        return {
+            "by_confidence": top("confidence", ["confidence", "evidence_items"]),
+            "by_clinical_strength": top(
+                "clinical_strength", ["clinical_strength", "top_drugs_count"]
+            ),
+            "by_evidence_diversity": top(
+                "diversity_score", ["diversity_score", "evidence_gaps_count"]
+            ),
+        }
 
     def _compare_use_cases(
-        self, gene_analytics: Dict[str, ScoringAnalytics]
+        self, gene_analytics: Dict[str, ScoringAnalytics], metrics: pd.DataFrame
     ) -> Dict[str, Any]:
         """Compare performance across different use cases."""
-        use_case_data = defaultdict(list)
-
-        for gene, analytics in gene_analytics.items():
-            for use_case, score in analytics.use_case_rankings.items():
-                use_case_data[use_case].append(
-                    {
-                        "gene": gene,
-                        "score": score,
-                        "confidence": analytics.recommendation_confidence,
-                    }
-                )
+        use_case_scores = pd.DataFrame(
+            [
+                (gene, use_case, score)
+                for gene, analytics in gene_analytics.items()
+                for use_case, score in analytics.use_case_rankings.items()
+            ],
+            columns=["gene", "use_case", "score"],
+        )
+        use_case_scores["confidence"] = use_case_scores["gene"].map(
+            metrics["confidence"]
+        )
 
         comparison = {}
-        for use_case, data in use_case_data.items():
-            # Sort by score
-            sorted_data = sorted(data, key=lambda x: x["score"], reverse=True)
-
-            scores = [item["score"] for item in data]
+        for use_case, data in use_case_scores.groupby("use_case", sort=False):
+            scores = data["score"]
+            top_genes = data.sort_values("score", ascending=False, kind="stable")
             comparison[use_case] = {
                 "gene_count": len(data),
-                "avg_score": round(statistics.mean(scores), 2),
-                "std_score": round(
-                    statistics.stdev(scores) if len(scores) > 1 else 0, 2
-                ),
-                "top_genes": sorted_data[:10],
+                "avg_score": round(float(scores.mean()), 2),
+                "std_score": round(float(scores.std()) if len(scores) > 1 else 0, 2),
+                "top_genes": top_genes[["gene", "score", "confidence"]]
+                .head(10)
+                .to_dict("records"),
                 "score_distribution": {
-                    "high (>70)": len([s for s in scores if s > 70]),
-                    "medium (50-70)": len([s for s in scores if 50 <= s <= 70]),
-                    "low (<50)": len([s for s in scores if s < 50]),
+                    "high (>70)": int((scores > 70).sum()),
+                    "medium (50-70)": int(scores.between(50, 70).sum()),
+                    "low (<50)": int((scores < 50).sum()),
                 },
             }
 
         return comparison
 
-    def _analyze_evidence_quality(
-        self, gene_analytics: Dict[str, ScoringAnalytics]
-    ) -> Dict[str, Any]:
+    def _analyze_evidence_quality(self, metrics: pd.DataFrame) -> Dict[str, Any]:
         """Analyze evidence quality distribution."""
-        confidence_scores = [
-            analytics.recommendation_confidence for analytics in gene_analytics.values()
-        ]
-        diversity_scores = [
-            analytics.evidence_diversity_score for analytics in gene_analytics.values()
-        ]
-        evidence_counts = [
-            analytics.total_evidence_items for analytics in gene_analytics.values()
-        ]
+        confidence = metrics["confidence"]
+        diversity = metrics["diversity_score"]
+        evidence_items = metrics["evidence_items"]
 
         return {
             "confidence_distribution": {
-                "mean": round(statistics.mean(confidence_scores), 3),
-                "median": round(statistics.median(confidence_scores), 3),
-                "std": round(
-                    statistics.stdev(confidence_scores)
-                    if len(confidence_scores) > 1
-                    else 0,
-                    3,
+                "mean": round(float(confidence.mean()), 3),
+                "median": round(float(confidence.median()), 3),
+                "std": round(float(confidence.std()) if len(confidence) > 1 else 0, 3),
+                "high_confidence_count": int((confidence >= 0.8).sum()),
+                "medium_confidence_count": int(
+                    ((confidence >= 0.5) & (confidence < 0.8)).sum()
                 ),
-                "high_confidence_count": len(
-                    [c for c in confidence_scores if c >= 0.8]
-                ),
-                "medium_confidence_count": len(
-                    [c for c in confidence_scores if 0.5 <= c < 0.8]
-                ),
-                "low_confidence_count": len([c for c in confidence_scores if c < 0.5]),
+                "low_confidence_count": int((confidence < 0.5).sum()),
             },
             "diversity_distribution": {
-                "mean": round(statistics.mean(diversity_scores), 3),
-                "median": round(statistics.median(diversity_scores), 3),
-                "high_diversity_count": len([d for d in diversity_scores if d >= 0.7]),
+                "mean": round(float(diversity.mean()), 3),
+                "median": round(float(diversity.median()), 3),
+                "high_diversity_count": int((diversity >= 0.7).sum()),
             },
             "evidence_volume": {
-                "mean_evidence_items": round(statistics.mean(evidence_counts), 1),
-                "median_evidence_items": round(statistics.median(evidence_counts), 1),
-                "well_evidenced_count": len([e for e in evidence_counts if e >= 5]),
+                "mean_evidence_items": round(float(evidence_items.mean()), 1),
+                "median_evidence_items": round(float(evidence_items.median()), 1),
+                "well_evidenced_count": int((evidence_items >= 5).sum()),
             },
         }
 
-    def _assess_clinical_readiness(
-        self, gene_analytics: Dict[str, ScoringAnalytics]
-    ) -> Dict[str, List[str]]:
+    def _assess_clinical_readiness(self, metrics: pd.DataFrame) -> Dict[str, List[str]]:
         """Assess clinical development readiness."""
-        readiness_categories = {
-            "ready_for_clinical": [],
-            "ready_for_preclinical": [],
-            "requires_basic_research": [],
-            "insufficient_evidence": [],
-        }
-
-        for gene, analytics in gene_analytics.items():
-            clinical_score = analytics.clinical_strength
-            confidence = analytics.recommendation_confidence
-            evidence_count = analytics.total_evidence_items
-
-            if clinical_score >= 0.7 and confidence >= 0.8 and evidence_count >= 5:
-                readiness_categories["ready_for_clinical"].append(gene)
-            elif clinical_score >= 0.4 and confidence >= 0.6 and evidence_count >= 3:
-                readiness_categories["ready_for_preclinical"].append(gene)
-            elif evidence_count >= 2:
-                readiness_categories["requires_basic_research"].append(gene)
-            else:
-                readiness_categories["insufficient_evidence"].append(gene)
-
-        return readiness_categories
+        clinical = metrics["clinical_strength"]
+        confidence = metrics["confidence"]
+        evidence_items = metrics["evidence_items"]
+
+        categories = [
+            "ready_for_clinical",
+            "ready_for_preclinical",
+            "requires_basic_research",
+            "insufficient_evidence",
+        ]
+        category = np.select(
+            [
+                (clinical >= 0.7) & (confidence >= 0.8) & (evidence_items >= 5),
+                (clinical >= 0.4) & (confidence >= 0.6) & (evidence_items >= 3),
+                evidence_items >= 2,
+            ],
+            categories[:3],
+            default=categories[3],
+        )
+        return {name: metrics.index[category == name].tolist() for name in categories}
 
     def _prioritize_research_opportunities(
         self, gene_analytics: Dict[str, ScoringAnalytics]
@@ -732,8 +715,9 @@ class ScoringAnalyticsProcessor(BaseProcessor):
     def export_analytics_report(self, gene_list: List[str], output_file: str) -> bool:
         """Export comprehensive analytics report."""
         try:
-            # Generate comparative analysis
-            analysis = self.generate_comparative_analysis(gene_list)
+            # Analyze all genes once and compare them
+            gene_profiles = self.analyze_gene_evidence_profiles(gene_list)
+            analysis = self._comparative_analysis(gene_profiles)
 
             if "error" in analysis:
                 self.logger.error(f"Analysis failed: {analysis['error']}")
@@ -758,21 +742,19 @@ class ScoringAnalyticsProcessor(BaseProcessor):
             }
 
             # Add individual gene profiles
-            for gene_symbol in gene_list:
-                gene_analytics = self.analyze_gene_evidence_profile(gene_symbol)
-                if gene_analytics:
-                    report["individual_gene_profiles"][gene_symbol] = {
-                        "summary_metrics": {
-                            "confidence": gene_analytics.recommendation_confidence,
-                            "clinical_strength": gene_analytics.clinical_strength,
-                            "evidence_diversity": gene_analytics.evidence_diversity_score,
-                            "total_evidence": gene_analytics.total_evidence_items,
-                        },
-                        "use_case_rankings": gene_analytics.use_case_rankings,
-                        "top_drugs": gene_analytics.top_drugs,
-                        "evidence_gaps": gene_analytics.evidence_gaps,
-                        "recommendations": gene_analytics.recommendations,
-                    }
+            for gene_symbol, gene_analytics in gene_profiles.items():
+                report["individual_gene_profiles"][gene_symbol] = {
+                    "summary_metrics": {
+                        "confidence": gene_analytics.recommendation_confidence,
+                        "clinical_strength": gene_analytics.clinical_strength,
+                        "evidence_diversity": gene_analytics.evidence_diversity_score,
+                        "total_evidence": gene_analytics.total_evidence_items,
+                    },
+                    "use_case_rankings": gene_analytics.use_case_rankings,
+                    "top_drugs": gene_analytics.top_drugs,
+                    "evidence_gaps": gene_analytics.evidence_gaps,
+                    "recommendations": gene_analytics.recommendations,
+                }
 
             # Write report to file
             with open(output_file, "w") as f:
@@ -0,0 +1,267 @@
+"""Rate-limited, cached HTTP client for JSON REST APIs.
+
+ETL enrichment steps (ChEMBL, ClinicalTrials.gov, ...) issue many small JSON
+requests, most of which return the same answer on the next run. This module
+provides:
+
+- RateLimiter: thread-safe minimum interval between request starts
+- AsyncRateLimiter: the same for coroutines sharing one event loop
+- ResponseCache: on-disk JSON response store keyed by endpoint + params, with TTL
+- CachedAPIClient: pooled ``requests.Session`` with retries, the limiter and the
+  cache, plus ``get_many`` for bounded concurrent fan-out
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .logging import setup_logging
+
+logger = setup_logging(module_name=__name__)
+
+# One request: (endpoint, params)
+APIRequest = Tuple[str, Optional[Dict[str, Any]]]
+
+
+class APIRequestError(Exception):
+    """Raised when an API request fails after retries."""
+
+
+class RateLimiter:
+    """Enforce a minimum interval between request starts across threads."""
+
+    def __init__(self, min_interval: float) -> None:
+        """Initialize the limiter.
+
+        Args:
+            min_interval: Seconds between consecutive requests (0 disables)
+        """
+        self.min_interval = max(0.0, min_interval)
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def wait(self) -> None:
+        """Block until the caller may issue its request."""
+        if self.min_interval <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.min_interval
+        delay = slot - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+
+class AsyncRateLimiter:
+    """Enforce a minimum interval between request starts across coroutines."""
+
+    def __init__(self, min_interval: float) -> None:
+        """Initialize the limiter.
+
+        Args:
+            min_interval: Seconds between consecutive requests (0 disables)
+        """
+        self.min_interval = max(0.0, min_interval)
+        self._next_slot = 0.0
+
+    async def wait(self) -> None:
+        """Sleep until the caller may issue its request."""
+        if self.min_interval <= 0:
+            return
+        loop = asyncio.get_running_loop()
+        # Slots are reserved synchronously, so no lock is needed on one loop
+        slot = max(loop.time(), self._next_slot)
+        self._next_slot = slot + self.min_interval
+        delay = slot - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class ResponseCache:
+    """On-disk cache of JSON responses keyed by endpoint and parameters."""
+
+    def __init__(self, cache_dir: Union[str, Path], ttl: int) -> None:
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory for cached responses
+            ttl: Time to live in seconds (0 or less disables reads)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+
+    @staticmethod
+    def make_key(endpoint: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """Build a stable cache key for a request."""
+        payload = json.dumps(
+            {"endpoint": endpoint, "params": params or {}}, sort_keys=True, default=str
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return a cached response if present and not expired."""
+        if self.ttl <= 0:
+            return None
+        path = self._path(key)
+        try:
+            if time.time() - path.stat().st_mtime > self.ttl:
+                return None
+            with open(path) as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def set(self, key: str, data: Any) -> None:
+        """Store a response atomically."""
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.{threading.get_ident()}.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+
+
+class CachedAPIClient:
+    """JSON REST client with connection pooling, rate limiting and a response cache."""
+
+    def __init__(
+        self,
+        base_url: str,
+        cache_dir: Union[str, Path],
+        cache_ttl: int = 30 * 24 * 60 * 60,
+        rate_limit: float = 0.2,
+        max_workers: int = 4,
+        timeout: int = 60,
+        max_retries: int = 3,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """Initialize the client.
+
+        Args:
+            base_url: API base URL; endpoints are appended with a slash
+            cache_dir: Directory for the on-disk response cache
+            cache_ttl: Seconds a cached response stays valid
+            rate_limit: Minimum seconds between requests sent to the server
+            max_workers: Concurrent requests used by get_many
+            timeout: Request timeout in seconds
+            max_retries: Retries for connection errors, 429 and 5xx responses
+            headers: Extra headers sent with every request
+        """
+        self.base_url = base_url.rstrip("/")
+        self.cache = ResponseCache(cache_dir, cache_ttl)
+        self.limiter = RateLimiter(rate_limit)
+        self.max_workers = max(1, max_workers)
+        self.timeout = timeout
+
+        self.session = requests.Session()
+        retry = Retry(
+            total=max_retries,
+            backoff_factor=1.0,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=("GET",),
+            respect_retry_after_header=True,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=self.max_workers,
+            pool_maxsize=self.max_workers,
+            max_retries=retry,
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({"Accept": "application/json", **(headers or {})})
+
+        self.stats = {"requests": 0, "cache_hits": 0}
+        self._stats_lock = threading.Lock()
+
+    def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """GET an endpoint, serving from the cache when possible.
+
+        Args:
+            endpoint: Endpoint path relative to the base URL
+            params: Query parameters
+
+        Returns:
+            Decoded JSON response
+
+        Raises:
+            APIRequestError: If the request fails
+        """
+        key = ResponseCache.make_key(endpoint, params)
+        cached = self.cache.get(key)
+        if cached is not None:
+            self._count("cache_hits")
+            return cached
+
+        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        self.limiter.wait()
+        self._count("requests")
+        try:
+            response = self.session.get(url, params=params, timeout=self.timeout)
+            response.raise_for_status()
+            data = response.json()
+        except (requests.RequestException, ValueError) as e:
+            raise APIRequestError(f"GET {url} failed: {e}") from e
+
+        self.cache.set(key, data)
+        return data
+
+    def get_many(
+        self, requests_: Sequence[APIRequest], return_exceptions: bool = False
+    ) -> List[Any]:
+        """Issue several GETs concurrently (bounded by max_workers).
+
+        Duplicate requests are sent once. Results keep the input order.
+
+        Args:
+            requests_: Sequence of (endpoint, params)
+            return_exceptions: Return APIRequestError instances instead of raising
+
+        Returns:
+            List of decoded responses (or exceptions)
+        """
+        unique: Dict[str, APIRequest] = {}
+        keys = []
+        for endpoint, params in requests_:
+            key = ResponseCache.make_key(endpoint, params)
+            keys.append(key)
+            unique.setdefault(key, (endpoint, params))
+
+        def fetch(item: Tuple[str, APIRequest]) -> Tuple[str, Any]:
+            key, (endpoint, params) = item
+            try:
+                return key, self.get(endpoint, params)
+            except APIRequestError as e:
+                if not return_exceptions:
+                    raise
+                return key, e
+
+        if len(unique) == 1 or self.max_workers == 1:
+            results = dict(map(fetch, unique.items()))
+        else:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                results = dict(executor.map(fetch, unique.items()))
+
+        return [results[key] for key in keys]
+
+    def close(self) -> None:
+        """Close pooled connections."""
+        self.session.close()
+
+    def _count(self, name: str) -> None:
+        with self._stats_lock:
+            self.stats[name] += 1
@@ -0,0 +1,458 @@
+"""Patients x transcripts fold change matrix cached outside Postgres.
+
+ML and analytics code needs all patients' expression data as one matrix, and
+used to rebuild it from every ``patient_<ID>.expression_data`` table.
+``CohortMatrix`` keeps it as one sparse CSR matrix (patients x transcripts):
+
+- Only stored fold changes are entries; baseline (1.0) is implicit, as in the
+  patient schemas. ``select()`` returns log2 fold changes, whose implicit
+  zeros are exactly the baseline.
+- Transcript columns are ``transcripts`` sorted by ID; each column knows its
+  gene row in the gene ID map (``src.utils.id_mapping``), so columns are
+  selected by gene lists in any of its namespaces or by gene sets.
+
+The matrix is written under ``<cache_dir>/cohort_matrix`` in a directory named
+by a fingerprint of ``transcripts`` and the gene ID map snapshot, as ``.npy``
+arrays opened with ``mmap_mode="r"``. ``get_cohort_matrix`` keeps it in sync
+per patient: a patient's rows are reloaded only when the row count or latest
+``updated_at`` of its expression_data changed; other rows are copied from the
+snapshot without touching Postgres.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from ..db.cohort_expression import get_cohort_patient_id
+from ..db.patient_schema import (
+    SchemaNotFoundError,
+    get_expression_state,
+    get_schema_name,
+    list_patient_schemas,
+)
+from .id_mapping import GeneIDMap, _to_bytes, get_gene_id_map
+from .logging import setup_logging
+
+logger = setup_logging(module_name=__name__)
+
+SNAPSHOT_PREFIX = "snapshot_"
+META_FILE = "meta.json"
+# Bump when the snapshot layout changes
+FORMAT_VERSION = 1
+
+# Snapshots already opened by this process, by directory
+_open_cohorts: Dict[Path, "CohortMatrix"] = {}
+
+
+def _state_key(state: Tuple[int, Optional[datetime]]) -> List[Any]:
+    """Encode a patient's expression state as stored in the metadata."""
+    row_count, updated_at = state
+    return [row_count, updated_at.isoformat() if updated_at else None]
+
+
+class CohortMatrix:
+    """Read-only patients x transcripts fold changes backed by memory-mapped arrays."""
+
+    def __init__(self, directory: Union[str, Path], gene_map: GeneIDMap) -> None:
+        """Open a snapshot.
+
+        Args:
+            directory: Snapshot directory written by build() or update()
+            gene_map: Gene ID map the snapshot's transcript genes refer to
+        """
+        self.directory = Path(directory)
+        self.gene_map = gene_map
+        with open(self.directory / META_FILE) as f:
+            self.meta = json.load(f)
+
+        self.transcript_ids = np.load(
+            self.directory / "transcript_id.npy", mmap_mode="r"
+        )
+        # Gene ID map row of each transcript (-1 if the gene is unknown)
+        self.transcript_genes = np.load(
+            self.directory / "transcript_gene.npy", mmap_mode="r"
+        )
+        self.patient_ids: List[str] = self.meta["patients"]
+        self.states: Dict[str, List[Any]] = self.meta["states"]
+        self.matrix = sparse.csr_matrix(
+            (
+                np.load(self.directory / "data.npy", mmap_mode="r"),
+                np.load(self.directory / "indices.npy", mmap_mode="r"),
+                np.load(self.directory / "indptr.npy", mmap_mode="r"),
+            ),
+            shape=(len(self.patient_ids), len(self.transcript_ids)),
+        )
+        self._patient_rows = {p: i for i, p in enumerate(self.patient_ids)}
+
+    @classmethod
+    def build(
+        cls,
+        transcripts: Sequence[Tuple[str, str]],
+        gene_map: GeneIDMap,
+        directory: Union[str, Path],
+        fingerprint: str = "",
+    ) -> "CohortMatrix":
+        """Write a snapshot without patients and open it.
+
+        Args:
+            transcripts: (transcript_id, gene_id) rows
+            gene_map: Gene ID map the transcript genes are resolved with
+            directory: Snapshot directory (replaced atomically)
+            fingerprint: Source fingerprint recorded in the metadata
+
+        Returns:
+            The opened matrix
+        """
+        frame = (
+            pd.DataFrame(list(transcripts), columns=["transcript_id", "gene_id"])
+            .drop_duplicates("transcript_id")
+            .sort_values("transcript_id", ignore_index=True)
+        )
+        meta = {
+            "fingerprint": fingerprint,
+            "format_version": FORMAT_VERSION,
+            "gene_map": gene_map.directory.name,
+            "patients": [],
+            "states": {},
+        }
+        _write(
+            Path(directory),
+            meta,
+            {
+                "transcript_id": _to_bytes(frame["transcript_id"]),
+                "transcript_gene": gene_map.lookup("ensembl", frame["gene_id"]),
+            },
+            [],
+        )
+        return cls(directory, gene_map)
+
+    def update(
+        self,
+        changed: Dict[str, Tuple[pd.Series, Tuple[int, Optional[datetime]]]],
+        removed: Iterable[str] = (),
+    ) -> "CohortMatrix":
+        """Replace, add or remove patient rows and reopen the snapshot.
+
+        Rows of other patients are copied from the current snapshot, so only
+        the changed patients need to be read from the database.
+
+        Args:
+            changed: Patient ID -> (fold change by transcript ID, expression
+                state); existing patients keep their row, new ones are appended
+            removed: Patients to remove
+
+        Returns:
+            The reopened matrix
+        """
+        removed = set(removed)
+        patients = [p for p in self.patient_ids if p not in removed]
+        patients += [p for p in changed if p not in self._patient_rows]
+
+        rows = []
+        for patient_id in patients:
+            if patient_id in changed:
+                rows.append(self._row(changed[patient_id][0], patient_id))
+            else:
+                row = self._patient_rows[patient_id]
+                start, end = self.matrix.indptr[row], self.matrix.indptr[row + 1]
+                rows.append(
+                    (self.matrix.indices[start:end], self.matrix.data[start:end])
+                )
+
+        meta = dict(self.meta, patients=patients)
+        meta["states"] = {
+            p: (_state_key(changed[p][1]) if p in changed else self.states[p])
+            for p in patients
+        }
+        axis = {
+            "transcript_id": np.asarray(self.transcript_ids),
+            "transcript_gene": np.asarray(self.transcript_genes),
+        }
+        _write(self.directory, meta, axis, rows)
+        return type(self)(self.directory, self.gene_map)
+
+    def _row(self, fold_changes: pd.Series, patient_id: str) -> Tuple[Any, Any]:
+        """Convert a patient's fold changes to sorted (columns, values)."""
+        columns = self.transcript_columns(fold_changes.index)
+        known = columns >= 0
+        if not known.all():
+            logger.warning(
+                f"{patient_id}: {int((~known).sum()):,} transcripts not in "
+                "transcripts were skipped"
+            )
+        values = fold_changes.to_numpy(dtype=np.float64)[known]
+        columns = columns[known]
+        order = np.argsort(columns, kind="stable")
+        keep = values[order] != 1.0
+        return columns[order][keep], values[order][keep]
+
+    def patient_rows(self, patient_ids: Iterable[str]) -> np.ndarray:
+        """Resolve patient IDs to matrix rows.
+
+        Raises:
+            KeyError: If a patient is not in the matrix
+        """
+        keys = [get_cohort_patient_id(p) for p in patient_ids]
+        missing = [p for p in keys if p not in self._patient_rows]
+        if missing:
+            raise KeyError(f"Patients not in the cohort matrix: {', '.join(missing)}")
+        return np.array([self._patient_rows[p] for p in keys], dtype=np.int64)
+
+    def transcript_columns(self, transcript_ids: Iterable[Any]) -> np.ndarray:
+        """Resolve transcript IDs to matrix columns (-1 where unknown)."""
+        query = _to_bytes(transcript_ids)
+        if not len(self.transcript_ids) or not len(query):
+            return np.full(len(query), -1, dtype=np.int64)
+
+        positions = np.searchsorted(self.transcript_ids, query)
+        positions = np.minimum(positions, len(self.transcript_ids) - 1)
+        found = self.transcript_ids[positions] == query
+        return np.where(found, positions, -1).astype(np.int64)
+
+    def gene_columns(
+        self, genes: Iterable[Any], namespace: str = "symbol"
+    ) -> np.ndarray:
+        """Return the columns of all transcripts of the given genes.
+
+        Args:
+            genes: Gene keys (unknown genes are ignored)
+            namespace: Gene ID map namespace of the keys (symbol, ensembl, ...)
+
+        Returns:
+            Sorted column indices
+        """
+        rows = self.gene_map.lookup(namespace, list(genes))
+        return np.flatnonzero(np.isin(self.transcript_genes, rows[rows >= 0]))
+
+    def select(
+        self,
+        patient_ids: Optional[Iterable[str]] = None,
+        genes: Optional[Iterable[Any]] = None,
+        namespace: str = "symbol",
+        transcript_ids: Optional[Iterable[str]] = None,
+        log2: bool = True,
+    ) -> sparse.csr_matrix:
+        """Return a patients x transcripts sub-matrix.
+
+        Args:
+            patient_ids: Rows in this order (default: all patients)
+            genes: Keep the transcripts of these genes (e.g. a gene set's
+                members); combined with transcript_ids if both are given
+            namespace: Gene ID map namespace of ``genes``
+            transcript_ids: Keep these transcripts, in this order
+            log2: Return log2 fold changes, so that implicit zeros are the
+                baseline; with False the stored linear fold changes are
+                returned and implicit zeros mean 1.0, not 0.0
+
+        Returns:
+            Sparse matrix; its columns are ``columns(...)`` for the same
+            arguments. Only with log2=True can it be used in arithmetic
+            as is.
+        """
+        matrix = self.matrix
+        if patient_ids is not None:
+            matrix = matrix[self.patient_rows(patient_ids)]
+        columns = self.columns(genes, namespace, transcript_ids)
+        if columns is not None:
+            matrix = matrix[:, columns]
+        matrix = sparse.csr_matrix(matrix, copy=True)
+        if log2:
+            matrix.data = np.log2(matrix.data)
+        return matrix
+
+    def columns(
+        self,
+        genes: Optional[Iterable[Any]] = None,
+        namespace: str = "symbol",
+        transcript_ids: Optional[Iterable[str]] = None,
+    ) -> Optional[np.ndarray]:
+        """Return the columns select() keeps (None for all transcripts)."""
+        columns = None
+        if transcript_ids is not None:
+            columns = self.transcript_columns(transcript_ids)
+            columns = columns[columns >= 0]
+        if genes is not None:
+            gene_columns = self.gene_columns(genes, namespace)
+            if columns is None:
+                columns = gene_columns
+            else:
+                columns = columns[np.isin(columns, gene_columns)]
+        return columns
+
+    def to_frame(
+        self,
+        patient_ids: Optional[Iterable[str]] = None,
+        genes: Optional[Iterable[Any]] = None,
+        namespace: str = "symbol",
+        transcript_ids: Optional[Iterable[str]] = None,
+    ) -> pd.DataFrame:
+        """Return a dense patients x transcripts DataFrame with baseline 1.0.
+
+        Takes the same selection arguments as select(); meant for slices, as
+        the full cohort is mostly baseline.
+        """
+        patient_ids = list(self.patient_ids if patient_ids is None else patient_ids)
+        matrix = self.select(patient_ids, genes, namespace, transcript_ids, log2=False)
+        columns = self.columns(genes, namespace, transcript_ids)
+        if columns is None:
+            columns = np.arange(len(self.transcript_ids))
+
+        values = np.ones(matrix.shape)
+        coo = matrix.tocoo()
+        values[coo.row, coo.col] = coo.data
+        return pd.DataFrame(
+            values,
+            index=pd.Index(
+                [get_cohort_patient_id(p) for p in patient_ids], name="patient_id"
+            ),
+            columns=pd.Index(
+                np.char.decode(np.asarray(self.transcript_ids)[columns], "ascii"),
+                name="transcript_id",
+            ),
+        )
+
+
+def _write(
+    directory: Path,
+    meta: Dict[str, Any],
+    axis: Dict[str, np.ndarray],
+    rows: List[Tuple[np.ndarray, np.ndarray]],
+) -> None:
+    """Write a snapshot: transcript axis, CSR arrays and metadata."""
+    tmp_dir = directory.with_name(f".{directory.name}.tmp")
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    tmp_dir.mkdir(parents=True)
+
+    lengths = np.array([len(columns) for columns, _ in rows], dtype=np.int64)
+    nnz = int(lengths.sum())
+    # One index dtype for indices and indptr, so scipy uses the memmaps as-is
+    largest = max(nnz, len(axis["transcript_id"]))
+    index_dtype = np.int32 if largest < np.iinfo(np.int32).max else np.int64
+    indptr = np.concatenate([[0], np.cumsum(lengths)]).astype(index_dtype)
+    indices = np.empty(nnz, dtype=index_dtype)
+    data = np.empty(nnz, dtype=np.float64)
+    for (columns, values), start, end in zip(rows, indptr[:-1], indptr[1:]):
+        indices[start:end] = columns
+        data[start:end] = values
+
+    np.save(tmp_dir / "transcript_id.npy", axis["transcript_id"])
+    np.save(tmp_dir / "transcript_gene.npy", axis["transcript_gene"])
+    np.save(tmp_dir / "indptr.npy", indptr)
+    np.save(tmp_dir / "indices.npy", indices)
+    np.save(tmp_dir / "data.npy", data)
+    with open(tmp_dir / META_FILE, "w") as f:
+        json.dump(dict(meta, nnz=nnz), f)
+
+    # Processes with the old snapshot open keep reading the unlinked files
+    shutil.rmtree(directory, ignore_errors=True)
+    os.replace(tmp_dir, directory)
+
+
+def _fingerprint(cursor: Any) -> str:
+    """Fingerprint the transcript axis (row count and latest update)."""
+    cursor.execute("SELECT COUNT(*), MAX(updated_at) FROM transcripts")
+    return hashlib.sha256(repr(cursor.fetchone()).encode()).hexdigest()[:16]
+
+
+def _load_patient(cursor: Any, patient_id: str) -> pd.Series:
+    """Load a patient's stored fold changes by transcript ID."""
+    cursor.execute(
+        "SELECT transcript_id, expression_fold_change "
+        f"FROM {get_schema_name(patient_id)}.expression_data"
+    )
+    rows = cursor.fetchall()
+    return pd.Series(
+        [fold_change for _, fold_change in rows],
+        index=[transcript_id for transcript_id, _ in rows],
+        dtype=np.float64,
+    )
+
+
+def get_cohort_matrix(
+    cache_dir: Union[str, Path],
+    db_manager: Any,
+    patient_ids: Optional[Sequence[str]] = None,
+) -> CohortMatrix:
+    """Return the cohort matrix, updated for patients whose data changed.
+
+    Reuses a matrix already opened by this process or a snapshot on disk for
+    the current transcripts; otherwise writes a new one. Patients whose
+    expression state differs from the snapshot are reloaded, new patient
+    schemas are added and dropped ones removed.
+
+    Args:
+        cache_dir: Cache directory
+        db_manager: Database manager with an open cursor
+        patient_ids: Only check these patients for changes, e.g. after one
+            patient was re-imported (default: every patient schema)
+
+    Returns:
+        The cohort matrix
+
+    Raises:
+        SchemaNotFoundError: If one of patient_ids has no schema
+    """
+    gene_map = get_gene_id_map(cache_dir, db_manager)
+    root = Path(cache_dir) / "cohort_matrix"
+    root.mkdir(parents=True, exist_ok=True)
+
+    cursor = db_manager.cursor
+    fingerprint = hashlib.sha256(
+        f"{FORMAT_VERSION}:{gene_map.directory.name}:{_fingerprint(cursor)}".encode()
+    ).hexdigest()[:16]
+    directory = root / f"{SNAPSHOT_PREFIX}{fingerprint}"
+
+    cohort = _open_cohorts.get(directory)
+    if cohort is None and (directory / META_FILE).exists():
+        logger.info(f"Using cohort matrix snapshot {directory.name}")
+        cohort = CohortMatrix(directory, gene_map)
+    elif cohort is None:
+        logger.info("Building cohort matrix transcript axis from transcripts")
+        cursor.execute("SELECT transcript_id, gene_id FROM transcripts")
+        cohort = CohortMatrix.build(cursor.fetchall(), gene_map, directory, fingerprint)
+
+        # Drop snapshots of older transcript sets
+        for old in root.glob(f"{SNAPSHOT_PREFIX}*"):
+            if old != directory:
+                shutil.rmtree(old, ignore_errors=True)
+
+    existing = [schema["patient_id"] for schema in list_patient_schemas(db_manager)]
+    if patient_ids is None:
+        check = existing
+    else:
+        check = [get_cohort_patient_id(p) for p in patient_ids]
+        missing = sorted(set(check) - set(existing))
+        if missing:
+            raise SchemaNotFoundError(
+                f"Patient schemas not found: {', '.join(missing)}"
+            )
+
+    removed = sorted(set(cohort.patient_ids) - set(existing))
+    changed = {}
+    for patient_id in check:
+        # Read the state first: data written in between only triggers a reload
+        state = get_expression_state(patient_id, db_manager)
+        if cohort.states.get(patient_id) != _state_key(state):
+            changed[patient_id] = (_load_patient(cursor, patient_id), state)
+
+    if changed or removed:
+        cohort = cohort.update(changed, removed)
+        logger.info(
+            f"Cohort matrix: {len(changed)} patients loaded, {len(removed)} removed, "
+            f"{len(cohort.patient_ids)} patients x {len(cohort.transcript_ids):,} "
+            f"transcripts, {cohort.meta['nnz']:,} stored values"
+        )
+
+    # Release the memory maps of snapshots of older transcript sets
+    for old in [old for old in _open_cohorts if old.parent == root]:
+        del _open_cohorts[old]
+    _open_cohorts[directory] = cohort
+    return cohort
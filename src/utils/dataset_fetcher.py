@@ -0,0 +1,546 @@
+"""Parallel, resumable fetcher for multi-part remote datasets.
+
+Large releases such as the Open Targets Platform Parquet exports are published
+as a directory of part files. This module lists the parts of such a directory
+over FTP or HTTP(S), downloads them concurrently with resume support and keeps
+a JSON manifest next to the data recording each part's remote size, modification
+stamp and SHA-256 checksum. On refresh only parts whose remote size or stamp
+changed (or whose local copy no longer matches the manifest) are fetched again.
+
+Partial downloads and the manifest use dot-prefixed names so that Parquet
+readers (which ignore ``.``/``_`` prefixed files) never see incomplete data.
+"""
+
+import hashlib
+import json
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from ftplib import FTP, error_perm
+from pathlib import Path, PurePosixPath
+from typing import Callable, Dict, List, Optional, Tuple, Union
+from urllib.parse import unquote, urljoin, urlparse
+
+import requests
+from tqdm import tqdm
+
+from .logging import setup_logging
+
+logger = setup_logging(module_name=__name__)
+
+MANIFEST_NAME = ".fetch_manifest.json"
+PARTIAL_SUFFIX = ".part"
+CHUNK_SIZE = 1024 * 1024
+
+# Links in an HTTP directory index: href="name" or href="subdir/"
+HREF_PATTERN = re.compile(r'href="([^"?#]+)"', re.IGNORECASE)
+
+
+class FetchError(Exception):
+    """Raised when a dataset cannot be listed or downloaded completely."""
+
+
+@dataclass
+class RemotePart:
+    """A single file of a remote dataset."""
+
+    name: str  # Path relative to the dataset root, POSIX separators
+    size: Optional[int]
+    modified: Optional[str]
+
+
+@dataclass
+class FetchResult:
+    """Summary of a fetch run."""
+
+    downloaded: List[str]
+    skipped: List[str]
+    removed: List[str]
+    bytes_downloaded: int
+
+
+class DatasetFetcher:
+    """Download every part of a remote dataset directory into a local directory."""
+
+    def __init__(
+        self,
+        url: str,
+        destination: Union[str, Path],
+        max_workers: int = 4,
+        timeout: int = 120,
+        max_retries: int = 3,
+        include: Optional[Callable[[str], bool]] = None,
+    ) -> None:
+        """Initialize the fetcher.
+
+        Args:
+            url: ftp://, http:// or https:// URL of the dataset directory
+            destination: Local directory the parts are written to
+            max_workers: Number of parts downloaded concurrently
+            timeout: Socket timeout in seconds
+            max_retries: Attempts per part before giving up (each resumes)
+            include: Optional predicate on the relative part name; by default
+                every file not starting with ``.`` or ``_`` is fetched
+        """
+        self.url = url.rstrip("/") + "/"
+        self.parsed = urlparse(self.url)
+        if self.parsed.scheme not in ("ftp", "http", "https"):
+            raise ValueError(f"Unsupported URL scheme: {self.parsed.scheme}")
+
+        self.destination = Path(destination)
+        self.max_workers = max(1, max_workers)
+        self.timeout = timeout
+        self.max_retries = max(1, max_retries)
+        self.include = include or _default_include
+        self.manifest_path = self.destination / MANIFEST_NAME
+        self._manifest_lock = threading.Lock()
+        self._session: Optional[requests.Session] = None
+
+    # ------------------------------------------------------------------
+    # Manifest
+    # ------------------------------------------------------------------
+
+    def load_manifest(self) -> Dict[str, Dict]:
+        """Load the manifest of completed parts.
+
+        Returns:
+            Mapping of part name to {size, modified, sha256}; empty if absent
+        """
+        if not self.manifest_path.exists():
+            return {}
+        try:
+            with open(self.manifest_path) as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable manifest {self.manifest_path}: {e}")
+            return {}
+        if data.get("url") != self.url:
+            return {}
+        return data.get("parts", {})
+
+    def _save_manifest(self, parts: Dict[str, Dict], complete: bool) -> None:
+        """Atomically write the manifest."""
+        self.destination.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.manifest_path.with_name(MANIFEST_NAME + ".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(
+                {"url": self.url, "complete": complete, "parts": parts},
+                f,
+                indent=2,
+                sort_keys=True,
+            )
+        tmp_path.replace(self.manifest_path)
+
+    def is_complete(self, verify_checksums: bool = False) -> bool:
+        """Check that the last fetch finished and local parts match the manifest.
+
+        This needs no network access and is the cache-validity test for callers.
+
+        Args:
+            verify_checksums: Also recompute SHA-256 of every part
+
+        Returns:
+            True if every manifest part exists locally with the recorded size
+            (and checksum, if requested)
+        """
+        if not self.manifest_path.exists():
+            return False
+        try:
+            with open(self.manifest_path) as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable manifest {self.manifest_path}: {e}")
+            return False
+        if data.get("url") != self.url or not data.get("complete"):
+            return False
+        parts = data.get("parts", {})
+        if not parts:
+            return False
+        return all(
+            self._local_matches(name, entry, verify_checksums)
+            for name, entry in parts.items()
+        )
+
+    def _local_matches(self, name: str, entry: Dict, verify_checksum: bool) -> bool:
+        """Check a local part against its manifest entry."""
+        path = self._local_path(name)
+        if not path.is_file() or path.stat().st_size != entry.get("size"):
+            return False
+        if verify_checksum and entry.get("sha256"):
+            return _sha256_file(path) == entry["sha256"]
+        return True
+
+    # ------------------------------------------------------------------
+    # Fetch
+    # ------------------------------------------------------------------
+
+    def fetch(self, force: bool = False, verify_checksums: bool = False) -> FetchResult:
+        """List the remote dataset and download new or changed parts.
+
+        Args:
+            force: Download every part even if the local copy is current
+            verify_checksums: Rehash local parts before deciding to skip them
+
+        Returns:
+            FetchResult describing what was downloaded, skipped and removed
+
+        Raises:
+            FetchError: If listing fails or any part cannot be downloaded
+        """
+        self.destination.mkdir(parents=True, exist_ok=True)
+        remote_parts = self.list_parts()
+        if not remote_parts:
+            raise FetchError(f"No dataset parts found at {self.url}")
+
+        manifest = self.load_manifest()
+        to_fetch: List[RemotePart] = []
+        skipped: List[str] = []
+
+        for part in remote_parts:
+            entry = manifest.get(part.name)
+            if (
+                not force
+                and entry
+                and _same_remote(part, entry)
+                and self._local_matches(part.name, entry, verify_checksums)
+            ):
+                skipped.append(part.name)
+            else:
+                to_fetch.append(part)
+
+        # Parts that vanished from the remote (e.g. a re-partitioned release)
+        remote_names = {part.name for part in remote_parts}
+        removed = []
+        for name in list(manifest):
+            if name not in remote_names:
+                self._local_path(name).unlink(missing_ok=True)
+                manifest.pop(name)
+                removed.append(name)
+
+        logger.info(
+            f"{self.url}: {len(remote_parts)} parts, {len(to_fetch)} to download, "
+            f"{len(skipped)} unchanged"
+        )
+
+        # Record progress incrementally so an interrupted run is resumable
+        for part in to_fetch:
+            manifest.pop(part.name, None)
+        self._save_manifest(manifest, complete=False)
+
+        downloaded: List[str] = []
+        errors: List[str] = []
+        total_bytes = 0
+
+        if to_fetch:
+            total_size = sum(part.size or 0 for part in to_fetch)
+            with tqdm(
+                total=total_size or None,
+                unit="B",
+                unit_scale=True,
+                desc=PurePosixPath(self.parsed.path.rstrip("/")).name,
+            ) as pbar:
+                with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                    futures = {
+                        executor.submit(self._download_part, part, pbar): part
+                        for part in to_fetch
+                    }
+                    for future in as_completed(futures):
+                        part = futures[future]
+                        try:
+                            entry, nbytes = future.result()
+                        except Exception as e:
+                            logger.error(f"Failed to download {part.name}: {e}")
+                            errors.append(part.name)
+                            continue
+                        total_bytes += nbytes
+                        downloaded.append(part.name)
+                        with self._manifest_lock:
+                            manifest[part.name] = entry
+                            self._save_manifest(manifest, complete=False)
+
+        if errors:
+            raise FetchError(
+                f"{len(errors)} of {len(remote_parts)} parts failed for {self.url}: "
+                f"{', '.join(sorted(errors)[:5])}"
+            )
+
+        self._save_manifest(manifest, complete=True)
+        return FetchResult(
+            downloaded=sorted(downloaded),
+            skipped=sorted(skipped),
+            removed=sorted(removed),
+            bytes_downloaded=total_bytes,
+        )
+
+    def _download_part(self, part: RemotePart, pbar: tqdm) -> Tuple[Dict, int]:
+        """Download one part, resuming from an existing partial file.
+
+        Returns:
+            Tuple of (manifest entry, bytes transferred in this run)
+        """
+        final_path = self._local_path(part.name)
+        partial_path = final_path.with_name("." + final_path.name + PARTIAL_SUFFIX)
+        final_path.parent.mkdir(parents=True, exist_ok=True)
+
+        transferred = 0
+        last_error: Optional[Exception] = None
+
+        for attempt in range(1, self.max_retries + 1):
+            offset = partial_path.stat().st_size if partial_path.exists() else 0
+            if part.size is not None and offset > part.size:
+                partial_path.unlink()
+                offset = 0
+            try:
+                if self.parsed.scheme == "ftp":
+                    transferred += self._retrieve_ftp(part, partial_path, offset, pbar)
+                else:
+                    transferred += self._retrieve_http(part, partial_path, offset, pbar)
+                break
+            except (OSError, EOFError, requests.RequestException, error_perm) as e:
+                last_error = e
+                logger.debug(
+                    f"Attempt {attempt}/{self.max_retries} for {part.name} failed: {e}"
+                )
+        else:
+            raise FetchError(f"{part.name}: {last_error}")
+
+        size = partial_path.stat().st_size
+        if part.size is not None and size != part.size:
+            partial_path.unlink(missing_ok=True)
+            raise FetchError(
+                f"{part.name}: size mismatch (expected {part.size}, got {size})"
+            )
+
+        entry = {
+            "size": size,
+            "modified": part.modified,
+            "sha256": _sha256_file(partial_path),
+        }
+        partial_path.replace(final_path)
+        return entry, transferred
+
+    # ------------------------------------------------------------------
+    # Listing
+    # ------------------------------------------------------------------
+
+    def list_parts(self) -> List[RemotePart]:
+        """List every file below the dataset URL.
+
+        Returns:
+            Remote parts sorted by name
+
+        Raises:
+            FetchError: If the listing cannot be retrieved
+        """
+        try:
+            if self.parsed.scheme == "ftp":
+                parts = self._list_ftp()
+            else:
+                parts = self._list_http()
+        except (OSError, EOFError, requests.RequestException, error_perm) as e:
+            raise FetchError(f"Could not list {self.url}: {e}") from e
+        return sorted(
+            (part for part in parts if self.include(part.name)), key=lambda p: p.name
+        )
+
+    def _ftp_connect(self) -> FTP:
+        """Open an anonymous (or URL-authenticated) binary-mode FTP session."""
+        ftp = FTP(timeout=self.timeout)
+        ftp.connect(self.parsed.hostname, self.parsed.port or 21)
+        ftp.login(
+            unquote(self.parsed.username or "anonymous"),
+            unquote(self.parsed.password or ""),
+        )
+        ftp.voidcmd("TYPE I")
+        return ftp
+
+    def _list_ftp(self) -> List[RemotePart]:
+        """Recursively list the dataset directory over FTP."""
+        root = unquote(self.parsed.path)
+        ftp = self._ftp_connect()
+        try:
+            return self._list_ftp_dir(ftp, root, "")
+        finally:
+            _quit_quietly(ftp)
+
+    def _list_ftp_dir(self, ftp: FTP, root: str, prefix: str) -> List[RemotePart]:
+        """List one FTP directory, preferring MLSD and falling back to NLST/SIZE."""
+        directory = root + prefix
+        parts: List[RemotePart] = []
+        try:
+            entries = list(ftp.mlsd(directory, facts=["type", "size", "modify"]))
+        except error_perm:
+            entries = None
+
+        if entries is not None:
+            for name, facts in entries:
+                kind = facts.get("type")
+                if kind in ("cdir", "pdir") or name in (".", ".."):
+                    continue
+                if kind == "dir":
+                    parts.extend(self._list_ftp_dir(ftp, root, f"{prefix}{name}/"))
+                else:
+                    size = facts.get("size")
+                    parts.append(
+                        RemotePart(
+                            name=prefix + name,
+                            size=int(size) if size is not None else None,
+                            modified=facts.get("modify"),
+                        )
+                    )
+            return parts
+
+        for path in ftp.nlst(directory):
+            name = PurePosixPath(path).name
+            try:
+                size = ftp.size(f"{directory}{name}")
+            except error_perm:
+                # SIZE is refused for directories
+                parts.extend(self._list_ftp_dir(ftp, root, f"{prefix}{name}/"))
+                continue
+            try:
+                modified = ftp.voidcmd(f"MDTM {directory}{name}").split()[-1]
+            except error_perm:
+                modified = None
+            parts.append(RemotePart(name=prefix + name, size=size, modified=modified))
+        return parts
+
+    def _get_session(self) -> requests.Session:
+        """Return a shared HTTP session with a connection pool sized for the workers."""
+        if self._session is None:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=self.max_workers, pool_maxsize=self.max_workers
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            self._session = session
+        return self._session
+
+    def _list_http(self) -> List[RemotePart]:
+        """Recursively list an HTTP directory index and HEAD every file."""
+        session = self._get_session()
+        names: List[str] = []
+        pending = [""]
+        while pending:
+            prefix = pending.pop()
+            response = session.get(urljoin(self.url, prefix), timeout=self.timeout)
+            response.raise_for_status()
+            for href in HREF_PATTERN.findall(response.text):
+                link = urljoin(urljoin(self.url, prefix), href)
+                # Only follow links below the current directory
+                if not link.startswith(urljoin(self.url, prefix)) or link == urljoin(
+                    self.url, prefix
+                ):
+                    continue
+                relative = unquote(link[len(self.url) :])
+                if relative.endswith("/"):
+                    pending.append(relative)
+                elif relative not in names:
+                    names.append(relative)
+
+        def head(name: str) -> RemotePart:
+            response = session.head(
+                urljoin(self.url, name), timeout=self.timeout, allow_redirects=True
+            )
+            response.raise_for_status()
+            length = response.headers.get("Content-Length")
+            return RemotePart(
+                name=name,
+                size=int(length) if length is not None else None,
+                modified=response.headers.get("Last-Modified")
+                or response.headers.get("ETag"),
+            )
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(executor.map(head, names))
+
+    # ------------------------------------------------------------------
+    # Transfer
+    # ------------------------------------------------------------------
+
+    def _retrieve_ftp(
+        self, part: RemotePart, partial_path: Path, offset: int, pbar: tqdm
+    ) -> int:
+        """Retrieve one part over its own FTP connection using REST to resume."""
+        transferred = 0
+        ftp = self._ftp_connect()
+        try:
+            with open(partial_path, "ab") as f:
+
+                def write(chunk: bytes) -> None:
+                    nonlocal transferred
+                    f.write(chunk)
+                    transferred += len(chunk)
+                    pbar.update(len(chunk))
+
+                ftp.retrbinary(
+                    f"RETR {unquote(self.parsed.path)}{part.name}",
+                    write,
+                    blocksize=CHUNK_SIZE,
+                    rest=offset or None,
+                )
+        finally:
+            _quit_quietly(ftp)
+        return transferred
+
+    def _retrieve_http(
+        self, part: RemotePart, partial_path: Path, offset: int, pbar: tqdm
+    ) -> int:
+        """Retrieve one part over HTTP using a Range request to resume."""
+        headers = {"Range": f"bytes={offset}-"} if offset else {}
+        transferred = 0
+        with self._get_session().get(
+            urljoin(self.url, part.name),
+            headers=headers,
+            stream=True,
+            timeout=self.timeout,
+        ) as response:
+            if response.status_code == 416:
+                # Requested range starts at EOF: the partial file is complete
+                return 0
+            response.raise_for_status()
+            # A server that ignores Range sends the whole file again
+            mode = "ab" if offset and response.status_code == 206 else "wb"
+            with open(partial_path, mode) as f:
+                for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                    f.write(chunk)
+                    transferred += len(chunk)
+                    pbar.update(len(chunk))
+        return transferred
+
+    def _local_path(self, name: str) -> Path:
+        """Map a relative part name to its local path."""
+        return self.destination.joinpath(*PurePosixPath(name).parts)
+
+
+def _default_include(name: str) -> bool:
+    """Skip hidden files and markers such as _SUCCESS."""
+    return not any(segment.startswith((".", "_")) for segment in name.split("/"))
+
+
+def _same_remote(part: RemotePart, entry: Dict) -> bool:
+    """Check whether a remote part is unchanged since it was recorded."""
+    if part.size is not None and part.size != entry.get("size"):
+        return False
+    if part.modified and entry.get("modified") and part.modified != entry["modified"]:
+        return False
+    return True
+
+
+def _sha256_file(path: Path) -> str:
+    """Compute the SHA-256 checksum of a file."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _quit_quietly(ftp: FTP) -> None:
+    """Close an FTP session without masking the original error."""
+    try:
+        ftp.quit()
+    except Exception:
+        ftp.close()
@@ -0,0 +1,429 @@
+"""Gene set matrices and over-representation analysis.
+
+``GeneSetMatrix`` holds every gene set the database knows as one binary
+genes x sets CSR matrix:
+
+- ``pathways``: ``gene_pathways`` grouped by ``pathway_id``
+- ``go_<category>``: ``transcript_go_terms`` rolled up to genes, one collection
+  per GO category (biological_process, molecular_function, cellular_component)
+
+Gene rows are the rows of the gene ID map (``src.utils.id_mapping``), so gene
+lists are resolved with its vectorized lookups. The matrix is written under
+``<cache_dir>/gene_sets`` in a directory named by a fingerprint of the ETL
+state (latest schema version, source table stamps and the gene ID map
+snapshot) and opened with ``mmap_mode="r"``; later runs and API requests reuse
+it until an ETL run changes the sources.
+
+``enrich()`` runs a one-sided hypergeometric (Fisher's exact) test for every
+set at once and adjusts p-values with Benjamini-Hochberg. The universe of each
+collection is the set of genes annotated in that collection, optionally
+intersected with a background gene list.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+from scipy import sparse, stats
+from scipy.special import gammaln
+
+from .id_mapping import GeneIDMap, get_gene_id_map
+from .logging import setup_logging
+
+logger = setup_logging(module_name=__name__)
+
+SNAPSHOT_PREFIX = "snapshot_"
+META_FILE = "meta.json"
+# Bump when the snapshot layout or the set definitions change
+FORMAT_VERSION = 1
+
+GENE_SETS_QUERY = """
+    SELECT gene_id, pathway_id, pathway_name, 'pathways'
+    FROM gene_pathways
+    UNION
+    SELECT t.gene_id, tgo.go_id, tgo.go_term,
+           'go_' || COALESCE(tgo.go_category, 'unknown')
+    FROM transcript_go_terms tgo
+    JOIN transcripts t ON t.transcript_id = tgo.transcript_id
+"""
+
+RESULT_COLUMNS = [
+    "set_id",
+    "name",
+    "collection",
+    "set_size",
+    "overlap",
+    "expected",
+    "fold_enrichment",
+    "p_value",
+    "fdr",
+    "genes",
+]
+
+# Snapshots already opened by this process, by directory
+_open_matrices: Dict[Path, "GeneSetMatrix"] = {}
+
+
+def _log_pmf(
+    x: np.ndarray, total: np.ndarray, successes: np.ndarray, draws: np.ndarray
+) -> np.ndarray:
+    """Hypergeometric log-PMF from log-gamma terms."""
+    return (
+        gammaln(successes + 1)
+        - gammaln(x + 1)
+        - gammaln(successes - x + 1)
+        + gammaln(total - successes + 1)
+        - gammaln(draws - x + 1)
+        - gammaln(total - successes - draws + x + 1)
+        - gammaln(total + 1)
+        + gammaln(draws + 1)
+        + gammaln(total - draws + 1)
+    )
+
+
+def hypergeom_sf(
+    k: np.ndarray, total: np.ndarray, successes: np.ndarray, draws: np.ndarray
+) -> np.ndarray:
+    """P(X >= k) for X ~ Hypergeometric(total, successes, draws), per element.
+
+    Equal to ``scipy.stats.hypergeom.sf(k - 1, total, successes, draws)`` but
+    an order of magnitude faster on thousands of sets: the PMF at the start of
+    the shorter tail comes from log-gamma terms and the tail is summed with
+    the PMF recurrence, all sets in lockstep. Tails above the mode are summed
+    upwards; otherwise the lower tail is summed and subtracted from 1.
+    """
+    k, total, successes, draws = (
+        np.asarray(a, dtype=np.float64) for a in (k, total, successes, draws)
+    )
+    upper = k > np.floor((draws + 1) * (successes + 1) / (total + 2))
+    x = np.where(upper, k, k - 1)
+    low = np.maximum(0, draws - (total - successes))
+    high = np.minimum(successes, draws)
+    valid = (x >= low) & (x <= high)
+    term = np.where(
+        valid, np.exp(_log_pmf(np.clip(x, low, high), total, successes, draws)), 0.0
+    )
+    tail = term.copy()
+
+    active = valid & np.where(upper, x < high, x > low)
+    while active.any():
+        i = np.flatnonzero(active)
+        xi, up = x[i], upper[i]
+        big_k, n, big_n = successes[i], draws[i], total[i]
+        term[i] *= np.where(
+            up,
+            (big_k - xi) * (n - xi) / ((xi + 1) * (big_n - big_k - n + xi + 1)),
+            xi * (big_n - big_k - n + xi) / ((big_k - xi + 1) * (n - xi + 1)),
+        )
+        tail[i] += term[i]
+        x[i] = xi + np.where(up, 1, -1)
+        # Terms only shrink away from the mode: stop once they are negligible
+        done = (term[i] <= tail[i] * 1e-17) | np.where(
+            up, x[i] >= high[i], x[i] <= low[i]
+        )
+        active[i[done]] = False
+
+    return np.clip(np.where(upper, tail, 1.0 - tail), 0.0, 1.0)
+
+
+class GeneSetMatrix:
+    """Read-only genes x sets incidence matrix backed by memory-mapped arrays."""
+
+    def __init__(self, directory: Union[str, Path], gene_map: GeneIDMap) -> None:
+        """Open a snapshot.
+
+        Args:
+            directory: Snapshot directory written by build()
+            gene_map: Gene ID map the snapshot's gene rows refer to
+        """
+        self.directory = Path(directory)
+        self.gene_map = gene_map
+        with open(self.directory / META_FILE) as f:
+            self.meta = json.load(f)
+
+        indptr = np.load(self.directory / "indptr.npy", mmap_mode="r")
+        indices = np.load(self.directory / "indices.npy", mmap_mode="r")
+        self.matrix = sparse.csr_matrix(
+            (np.ones(len(indices), dtype=np.int32), indices, indptr),
+            shape=(self.meta["genes"], len(self.meta["set_ids"])),
+        )
+        # genes x collections: genes annotated in at least one set of each
+        self.universe = np.load(self.directory / "universe.npy", mmap_mode="r")
+
+        self.collections = self.meta["collections"]
+        self.set_ids = np.array(self.meta["set_ids"], dtype=object)
+        self.set_names = np.array(self.meta["set_names"], dtype=object)
+        self.set_collections = np.array(self.meta["set_collections"], dtype=np.int32)
+        self.set_sizes = np.asarray(self.matrix.sum(axis=0)).ravel()
+
+    @classmethod
+    def build(
+        cls,
+        rows: Sequence[Tuple[str, str, str, str]],
+        gene_map: GeneIDMap,
+        directory: Union[str, Path],
+        fingerprint: str = "",
+    ) -> "GeneSetMatrix":
+        """Write a snapshot and open it.
+
+        Args:
+            rows: (gene_id, set_id, set_name, collection) rows
+            gene_map: Gene ID map whose rows become the matrix rows
+            directory: Snapshot directory (replaced atomically)
+            fingerprint: Source fingerprint recorded in the metadata
+
+        Returns:
+            The opened matrix
+        """
+        directory = Path(directory)
+        tmp_dir = directory.with_name(f".{directory.name}.tmp")
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        tmp_dir.mkdir(parents=True)
+
+        members = pd.DataFrame(
+            list(rows), columns=["gene_id", "set_id", "name", "collection"]
+        )
+        members["gene"] = gene_map.lookup("ensembl", members["gene_id"])
+        members = members[members["gene"] >= 0]
+
+        # Sets ordered by collection and ID; the first name of a set is kept
+        sets = members.drop_duplicates(["collection", "set_id"]).sort_values(
+            ["collection", "set_id"], ignore_index=True
+        )
+        columns = pd.MultiIndex.from_frame(sets[["collection", "set_id"]]).get_indexer(
+            pd.MultiIndex.from_frame(members[["collection", "set_id"]])
+        )
+        n_genes = len(gene_map.gene_ids)
+        matrix = sparse.csr_matrix(
+            (np.ones(len(members), dtype=np.int32), (members["gene"], columns)),
+            shape=(n_genes, len(sets)),
+        )
+        matrix.sum_duplicates()
+
+        collection_codes, collections = pd.factorize(sets["collection"], sort=True)
+        universe = np.zeros((n_genes, len(collections)), dtype=bool)
+        coo = matrix.tocoo()
+        universe[coo.row, collection_codes[coo.col]] = True
+
+        np.save(tmp_dir / "indptr.npy", matrix.indptr.astype(np.int64))
+        np.save(tmp_dir / "indices.npy", matrix.indices.astype(np.int32))
+        np.save(tmp_dir / "universe.npy", universe)
+        with open(tmp_dir / META_FILE, "w") as f:
+            json.dump(
+                {
+                    "fingerprint": fingerprint,
+                    "format_version": FORMAT_VERSION,
+                    "gene_map": gene_map.directory.name,
+                    "genes": n_genes,
+                    "collections": list(collections),
+                    "set_ids": sets["set_id"].tolist(),
+                    "set_names": sets["name"].tolist(),
+                    "set_collections": collection_codes.tolist(),
+                },
+                f,
+            )
+
+        shutil.rmtree(directory, ignore_errors=True)
+        os.replace(tmp_dir, directory)
+        return cls(directory, gene_map)
+
+    def _rows(self, genes: Iterable[Any], namespace: str) -> np.ndarray:
+        """Resolve genes to unique gene rows (unknown genes are dropped)."""
+        rows = self.gene_map.lookup(namespace, list(genes))
+        return np.unique(rows[rows >= 0])
+
+    def members(self, set_id: str, namespace: str = "ensembl") -> List[str]:
+        """Return the genes of a set.
+
+        Args:
+            set_id: Set ID (first match if several collections use it)
+            namespace: 'ensembl' for gene IDs or 'symbol' for gene symbols
+
+        Returns:
+            Gene IDs or symbols in gene ID map order
+
+        Raises:
+            KeyError: If the set is unknown
+            ValueError: If namespace is not 'ensembl' or 'symbol'
+        """
+        values = {
+            "ensembl": self.gene_map.gene_ids,
+            "symbol": self.gene_map.gene_symbols,
+        }
+        if namespace not in values:
+            raise ValueError(
+                f"namespace must be 'ensembl' or 'symbol', got {namespace!r}"
+            )
+        columns = np.flatnonzero(self.set_ids == set_id)
+        if not len(columns):
+            raise KeyError(f"Unknown gene set: {set_id}")
+
+        rows = np.sort(self.matrix[:, columns[0]].nonzero()[0])
+        return np.char.decode(np.asarray(values[namespace])[rows], "ascii").tolist()
+
+    def enrich(
+        self,
+        genes: Iterable[Any],
+        namespace: str = "symbol",
+        collections: Optional[Iterable[str]] = None,
+        background: Optional[Iterable[Any]] = None,
+        min_size: int = 5,
+        max_size: int = 500,
+    ) -> pd.DataFrame:
+        """Test every gene set for over-representation of a gene list.
+
+        Sets are tested if their size (within the universe) is between
+        min_size and max_size and they contain at least one gene of the list.
+        FDR is Benjamini-Hochberg over all tested sets.
+
+        Args:
+            genes: Gene list (e.g. up-regulated genes of a patient)
+            namespace: Gene ID map namespace of the genes and background
+            collections: Collections to test (default: all)
+            background: Optional background genes; restricts every universe
+            min_size: Smallest set size tested
+            max_size: Largest set size tested
+
+        Returns:
+            DataFrame with RESULT_COLUMNS, sorted by p-value
+        """
+        universe = np.asarray(self.universe)
+        set_sizes = self.set_sizes
+        query = self._rows(genes, namespace)
+        if background is not None:
+            in_background = np.zeros(len(universe), dtype=bool)
+            in_background[self._rows(background, namespace)] = True
+            universe = universe & in_background[:, None]
+            query = query[in_background[query]]
+            set_sizes = np.asarray(
+                self.matrix.T @ in_background.astype(np.int32)
+            ).ravel()
+
+        # Per set: universe size N, list size n (both per collection), overlap k
+        universe_sizes = universe.sum(axis=0)[self.set_collections]
+        query_sizes = universe[query].sum(axis=0)[self.set_collections]
+        hits = self.matrix[query]
+        overlap = np.asarray(hits.sum(axis=0)).ravel()
+
+        tested = (overlap > 0) & (set_sizes >= min_size) & (set_sizes <= max_size)
+        if collections is not None:
+            wanted = set(collections)
+            tested &= np.isin(
+                self.set_collections,
+                [i for i, name in enumerate(self.collections) if name in wanted],
+            )
+        tested = np.flatnonzero(tested)
+        if not len(tested):
+            return pd.DataFrame(columns=RESULT_COLUMNS)
+
+        k, big_k = overlap[tested], set_sizes[tested]
+        big_n, n = universe_sizes[tested], query_sizes[tested]
+        p_values = hypergeom_sf(k, big_n, big_k, n)
+        expected = n * big_k / big_n
+
+        # Overlapping genes of each tested set
+        symbols = np.char.decode(
+            np.asarray(self.gene_map.gene_symbols)[query], "ascii"
+        ).astype(object)
+        hits = hits[:, tested].tocsc()
+        hits.sort_indices()
+        overlap_genes = [
+            genes.tolist()
+            for genes in np.split(symbols[hits.indices], hits.indptr[1:-1])
+        ]
+
+        result = pd.DataFrame(
+            {
+                "set_id": self.set_ids[tested],
+                "name": self.set_names[tested],
+                "collection": np.array(self.collections, dtype=object)[
+                    self.set_collections[tested]
+                ],
+                "set_size": big_k,
+                "overlap": k,
+                "expected": expected,
+                "fold_enrichment": k / expected,
+                "p_value": p_values,
+                "fdr": stats.false_discovery_control(p_values, method="bh"),
+                "genes": overlap_genes,
+            }
+        )
+        return result.sort_values(["p_value", "set_id"], ignore_index=True)
+
+
+def _fingerprint(cursor: Any) -> str:
+    """Fingerprint the ETL state (schema version, row counts and highest keys).
+
+    ETL loads insert new rows, which moves the highest keys; deletes lower
+    the row counts. Both are answered from the primary key indexes, so it is
+    cheap enough to run per API request.
+    """
+    cursor.execute(
+        """
+        SELECT
+            (SELECT MAX(version_name) FROM schema_version),
+            (SELECT COUNT(*) FROM gene_pathways),
+            (SELECT MAX(id) FROM gene_pathways),
+            (SELECT COUNT(*) FROM transcript_go_terms),
+            (SELECT MAX(id) FROM transcript_go_terms)
+        """
+    )
+    return hashlib.sha256(repr(cursor.fetchone()).encode()).hexdigest()[:16]
+
+
+def get_gene_set_matrix(cache_dir: Union[str, Path], db_manager: Any) -> GeneSetMatrix:
+    """Return the gene set matrix for the current database state.
+
+    Reuses a matrix already opened by this process or a snapshot on disk with
+    the same fingerprint; otherwise loads gene_pathways and
+    transcript_go_terms once and writes a new snapshot.
+
+    Args:
+        cache_dir: ETL cache directory
+        db_manager: Database manager with an open cursor
+
+    Returns:
+        The gene set matrix
+    """
+    gene_map = get_gene_id_map(cache_dir, db_manager)
+    root = Path(cache_dir) / "gene_sets"
+    root.mkdir(parents=True, exist_ok=True)
+
+    cursor = db_manager.cursor
+    fingerprint = hashlib.sha256(
+        f"{FORMAT_VERSION}:{gene_map.directory.name}:{_fingerprint(cursor)}".encode()
+    ).hexdigest()[:16]
+    directory = root / f"{SNAPSHOT_PREFIX}{fingerprint}"
+
+    if directory in _open_matrices:
+        return _open_matrices[directory]
+
+    if (directory / META_FILE).exists():
+        logger.info(f"Using gene set snapshot {directory.name}")
+        matrix = GeneSetMatrix(directory, gene_map)
+    else:
+        logger.info("Building gene set matrix from gene_pathways and GO terms")
+        cursor.execute(GENE_SETS_QUERY)
+        matrix = GeneSetMatrix.build(
+            cursor.fetchall(), gene_map, directory, fingerprint
+        )
+        logger.info(
+            f"Gene set matrix: {len(matrix.set_ids):,} sets, "
+            f"{matrix.matrix.nnz:,} memberships"
+        )
+
+        # Drop snapshots of older database states
+        for old in root.glob(f"{SNAPSHOT_PREFIX}*"):
+            if old != directory:
+                shutil.rmtree(old, ignore_errors=True)
+
+    # Release the memory maps of snapshots of older database states
+    for old in [old for old in _open_matrices if old.parent == root]:
+        del _open_matrices[old]
+    _open_matrices[directory] = matrix
+    return matrix
@@ -0,0 +1,299 @@
+"""Shared gene ID resolution for ETL modules.
+
+Several processors need the same lookups (NCBI Gene ID -> gene, Ensembl ->
+gene, symbol -> gene, ...) and used to each query ``genes`` and
+``gene_cross_references`` and build their own dicts. ``GeneIDMap`` loads those
+tables once into a snapshot of NumPy arrays:
+
+- one row per gene: ``gene_id`` and ``gene_symbol``
+- per namespace (symbol, ensembl, ncbi, hgnc, uniprot, refseq, havana): sorted
+  fixed-width keys and the index of the gene each key resolves to
+
+The snapshot is written under ``<cache_dir>/id_mapping`` in a directory named
+by a fingerprint of the source tables and opened with ``mmap_mode="r"``, so
+every process of a run shares the same page-cache pages and later runs reuse
+it until the tables change. Lookups are vectorized binary searches.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from .logging import setup_logging
+
+logger = setup_logging(module_name=__name__)
+
+# gene_cross_references.external_db -> namespace
+EXTERNAL_DB_NAMESPACES = {
+    "GeneID": "ncbi",
+    "NCBI": "ncbi",
+    "EntrezGene": "ncbi",
+    "HGNC": "hgnc",
+    "UniProt": "uniprot",
+    "RefSeq": "refseq",
+    "HAVANA": "havana",
+}
+NAMESPACES = ["symbol", "ensembl"] + sorted(set(EXTERNAL_DB_NAMESPACES.values()))
+SNAPSHOT_PREFIX = "snapshot_"
+META_FILE = "meta.json"
+
+# Snapshots already opened by this process, by directory
+_open_maps: Dict[Path, "GeneIDMap"] = {}
+
+
+def _to_bytes(values: Iterable[Any]) -> np.ndarray:
+    """Encode keys as a fixed-width bytes array (non-ASCII is replaced)."""
+    return np.array(
+        [str(value).encode("ascii", errors="replace") for value in values],
+        dtype=np.bytes_,
+    )
+
+
+class GeneIDMap:
+    """Read-only gene ID lookup tables backed by memory-mapped arrays."""
+
+    def __init__(self, directory: Union[str, Path]) -> None:
+        """Open a snapshot.
+
+        Args:
+            directory: Snapshot directory written by build()
+        """
+        self.directory = Path(directory)
+        with open(self.directory / META_FILE) as f:
+            self.meta = json.load(f)
+
+        self.gene_ids = np.load(self.directory / "gene_id.npy", mmap_mode="r")
+        self.gene_symbols = np.load(self.directory / "gene_symbol.npy", mmap_mode="r")
+        self._keys: Dict[str, np.ndarray] = {}
+        self._genes: Dict[str, np.ndarray] = {}
+        for namespace in self.meta["namespaces"]:
+            self._keys[namespace] = np.load(
+                self.directory / f"{namespace}_keys.npy", mmap_mode="r"
+            )
+            self._genes[namespace] = np.load(
+                self.directory / f"{namespace}_genes.npy", mmap_mode="r"
+            )
+
+    @classmethod
+    def build(
+        cls,
+        genes: Sequence[Tuple[str, str]],
+        cross_references: Sequence[Tuple[str, str, str]],
+        directory: Union[str, Path],
+        fingerprint: str = "",
+    ) -> "GeneIDMap":
+        """Write a snapshot and open it.
+
+        Args:
+            genes: (gene_id, gene_symbol) rows
+            cross_references: (gene_id, external_db, external_id) rows
+            directory: Snapshot directory (replaced atomically)
+            fingerprint: Source fingerprint recorded in the metadata
+
+        Returns:
+            The opened map
+        """
+        directory = Path(directory)
+        tmp_dir = directory.with_name(f".{directory.name}.tmp")
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        tmp_dir.mkdir(parents=True)
+
+        genes_df = (
+            pd.DataFrame(list(genes), columns=["gene_id", "gene_symbol"])
+            .drop_duplicates("gene_id")
+            .sort_values("gene_id", ignore_index=True)
+        )
+        gene_index = pd.Series(np.arange(len(genes_df)), index=genes_df["gene_id"])
+        np.save(tmp_dir / "gene_id.npy", _to_bytes(genes_df["gene_id"]))
+        np.save(
+            tmp_dir / "gene_symbol.npy", _to_bytes(genes_df["gene_symbol"].fillna(""))
+        )
+
+        xrefs = pd.DataFrame(
+            list(cross_references), columns=["gene_id", "external_db", "key"]
+        )
+        xrefs["namespace"] = xrefs["external_db"].map(EXTERNAL_DB_NAMESPACES)
+        xrefs["gene"] = xrefs["gene_id"].map(gene_index)
+        xrefs = xrefs.dropna(subset=["namespace", "gene", "key"])
+
+        tables = {
+            "ensembl": pd.DataFrame(
+                {"key": genes_df["gene_id"], "gene": np.arange(len(genes_df))}
+            ),
+            "symbol": pd.DataFrame(
+                {"key": genes_df["gene_symbol"], "gene": np.arange(len(genes_df))}
+            ).dropna(),
+        }
+        for namespace, group in xrefs.groupby("namespace"):
+            tables[namespace] = group[["key", "gene"]]
+
+        counts = {}
+        for namespace in NAMESPACES:
+            table = tables.get(namespace, pd.DataFrame({"key": [], "gene": []}))
+            table = table.assign(key=table["key"].astype(str)).drop_duplicates()
+            # Sorted by key, then gene: the first match of a key is deterministic
+            table = table.sort_values(["key", "gene"], kind="stable")
+            np.save(tmp_dir / f"{namespace}_keys.npy", _to_bytes(table["key"]))
+            np.save(
+                tmp_dir / f"{namespace}_genes.npy",
+                table["gene"].to_numpy(dtype=np.int32),
+            )
+            counts[namespace] = len(table)
+
+        with open(tmp_dir / META_FILE, "w") as f:
+            json.dump(
+                {
+                    "fingerprint": fingerprint,
+                    "genes": len(genes_df),
+                    "namespaces": NAMESPACES,
+                    "counts": counts,
+                },
+                f,
+            )
+
+        shutil.rmtree(directory, ignore_errors=True)
+        os.replace(tmp_dir, directory)
+        return cls(directory)
+
+    def lookup(self, namespace: str, keys: Iterable[Any]) -> np.ndarray:
+        """Resolve keys to gene row indices.
+
+        Args:
+            namespace: One of NAMESPACES
+            keys: Keys to resolve
+
+        Returns:
+            int32 array of gene indices, -1 where a key is unknown
+        """
+        sorted_keys = self._keys[namespace]
+        query = _to_bytes(keys)
+        if not len(sorted_keys) or not len(query):
+            return np.full(len(query), -1, dtype=np.int32)
+
+        positions = np.searchsorted(sorted_keys, query)
+        positions = np.minimum(positions, len(sorted_keys) - 1)
+        found = sorted_keys[positions] == query
+        return np.where(found, self._genes[namespace][positions], -1).astype(np.int32)
+
+    def to_gene_ids(self, namespace: str, keys: Iterable[Any]) -> List[Optional[str]]:
+        """Resolve keys to gene IDs (None where unknown)."""
+        return self._values(self.gene_ids, self.lookup(namespace, keys))
+
+    def to_symbols(self, namespace: str, keys: Iterable[Any]) -> List[Optional[str]]:
+        """Resolve keys to gene symbols (None where unknown)."""
+        return self._values(self.gene_symbols, self.lookup(namespace, keys))
+
+    def get(self, namespace: str, key: Any) -> Optional[str]:
+        """Resolve one key to a gene ID."""
+        return self.to_gene_ids(namespace, [key])[0]
+
+    def frame(self, namespace: str) -> pd.DataFrame:
+        """Return a namespace as a DataFrame of key, gene_id and gene_symbol."""
+        genes = np.asarray(self._genes[namespace])
+        return pd.DataFrame(
+            {
+                "key": np.char.decode(np.asarray(self._keys[namespace]), "ascii"),
+                "gene_id": np.char.decode(np.asarray(self.gene_ids)[genes], "ascii"),
+                "gene_symbol": np.char.decode(
+                    np.asarray(self.gene_symbols)[genes], "ascii"
+                ),
+            }
+        )
+
+    def as_dict(self, namespace: str, target: str = "gene_id") -> Dict[str, str]:
+        """Return a namespace as a plain dict (first match per key).
+
+        Args:
+            namespace: One of NAMESPACES
+            target: 'gene_id' or 'gene_symbol'
+
+        Returns:
+            Dictionary mapping keys to gene IDs or symbols
+        """
+        frame = self.frame(namespace).drop_duplicates("key")
+        return dict(zip(frame["key"], frame[target]))
+
+    @staticmethod
+    def _values(values: np.ndarray, indices: np.ndarray) -> List[Optional[str]]:
+        found = indices >= 0
+        decoded = np.full(len(indices), None, dtype=object)
+        if found.any():
+            decoded[found] = np.char.decode(np.asarray(values)[indices[found]], "ascii")
+        return decoded.tolist()
+
+
+def _fingerprint(cursor: Any) -> str:
+    """Fingerprint the source tables (row counts and highest keys/stamps)."""
+    cursor.execute(
+        """
+        SELECT
+            (SELECT COUNT(*) FROM genes),
+            (SELECT MAX(updated_at) FROM genes),
+            (SELECT COUNT(*) FROM gene_cross_references),
+            (SELECT MAX(id) FROM gene_cross_references)
+        """
+    )
+    return hashlib.sha256(repr(cursor.fetchone()).encode()).hexdigest()[:16]
+
+
+def get_gene_id_map(cache_dir: Union[str, Path], db_manager: Any) -> GeneIDMap:
+    """Return the gene ID map for the current database state.
+
+    Reuses a map already opened by this process or a snapshot on disk with
+    the same fingerprint; otherwise loads genes and gene_cross_references
+    once and writes a new snapshot.
+
+    Args:
+        cache_dir: ETL cache directory
+        db_manager: Database manager with an open cursor
+
+    Returns:
+        The gene ID map
+    """
+    root = Path(cache_dir) / "id_mapping"
+    root.mkdir(parents=True, exist_ok=True)
+
+    cursor = db_manager.cursor
+    fingerprint = _fingerprint(cursor)
+    directory = root / f"{SNAPSHOT_PREFIX}{fingerprint}"
+
+    if directory in _open_maps:
+        return _open_maps[directory]
+
+    if (directory / META_FILE).exists():
+        logger.info(f"Using gene ID map snapshot {directory.name}")
+        gene_map = GeneIDMap(directory)
+    else:
+        logger.info("Building gene ID map from genes and gene_cross_references")
+        cursor.execute("SELECT gene_id, gene_symbol FROM genes")
+        genes = cursor.fetchall()
+        cursor.execute(
+            """
+            SELECT gene_id, external_db, external_id
+            FROM gene_cross_references
+            WHERE external_id IS NOT NULL
+            """
+        )
+        cross_references = cursor.fetchall()
+        gene_map = GeneIDMap.build(genes, cross_references, directory, fingerprint)
+        logger.info(
+            f"Gene ID map: {gene_map.meta['genes']:,} genes, "
+            + ", ".join(
+                f"{namespace} {count:,}"
+                for namespace, count in gene_map.meta["counts"].items()
+            )
+        )
+
+        # Drop snapshots of older database states
+        for old in root.glob(f"{SNAPSHOT_PREFIX}*"):
+            if old != directory:
+                shutil.rmtree(old, ignore_errors=True)
+
+    _open_maps[directory] = gene_map
+    return gene_map
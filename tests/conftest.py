@@ -119,6 +119,24 @@ def test_db():
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             );
 
+            -- Gene literature statistics rollup
+            CREATE TABLE gene_literature_stats (
+                gene_id TEXT PRIMARY KEY REFERENCES genes(gene_id),
+                publication_count INTEGER NOT NULL DEFAULT 0,
+                total_mentions BIGINT NOT NULL DEFAULT 0,
+                first_year INTEGER,
+                last_year INTEGER,
+                evidence_tier TEXT GENERATED ALWAYS AS (
+                    CASE
+                        WHEN publication_count >= 100000 THEN 'Extensively studied'
+                        WHEN publication_count >= 10000 THEN 'Well-studied'
+                        WHEN publication_count >= 1000 THEN 'Moderate evidence'
+                        ELSE 'Limited publications'
+                    END
+                ) STORED,
+                last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            );
+
             -- Create indexes for performance
             CREATE INDEX idx_transcripts_gene_id ON transcripts(gene_id);
             CREATE INDEX idx_gene_annotations_gene_id ON gene_annotations(gene_id);
@@ -205,6 +223,9 @@ def test_db():
                 ('ENSG00000012048', 'DB09074', 'Olaparib', 'inhibitor', 'DrugBank'),
                 ('ENSG00000141510', 'DB11642', 'Nutlin-3', 'activator', 'DrugBank');
 
+            INSERT INTO gene_literature_stats (gene_id, publication_count, total_mentions)
+            VALUES ('ENSG00000141510', 12500, 48000);
+
             -- Refresh materialized views with seed data
             REFRESH MATERIALIZED VIEW gene_summary_view;
             REFRESH MATERIALIZED VIEW transcript_enrichment_view;
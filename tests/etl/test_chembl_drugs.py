@@ -0,0 +1,156 @@
+"""Tests for ChEMBL drug processing helpers."""
+
+from unittest.mock import Mock, patch
+
+from src.etl.chembl_drugs import ChemblDrugProcessor, build_restore_list
+
+SAMPLE_TOC = """;
+; Archive created at 2025-01-15 10:12:44 UTC
+;     dbname: chembl_35
+;
+; Selected TOC Entries:
+;
+4; 3079 16386 EXTENSION - pg_trgm
+5; 1247 16401 TYPE public chembl_id_type chembl
+220; 1259 16420 TABLE public activities chembl
+231; 1259 16490 TABLE public molecule_dictionary chembl
+240; 1259 16530 TABLE public drug_mechanism chembl
+5120; 0 16420 TABLE DATA public activities chembl
+5131; 0 16490 TABLE DATA public molecule_dictionary chembl
+5140; 0 16530 TABLE DATA public drug_mechanism chembl
+6001; 2606 17001 CONSTRAINT public molecule_dictionary pk_moldict_molregno chembl
+6002; 1259 17002 INDEX public idx_moldict_chembl_id chembl
+6003; 2606 17003 FK CONSTRAINT public drug_mechanism fk_drugmec_molregno chembl
+6004; 0 0 COMMENT public TABLE molecule_dictionary chembl
+"""
+
+
+def test_build_restore_list_keeps_selected_tables():
+    """Test that only selected table definitions and data are restored."""
+    restore_list = build_restore_list(
+        SAMPLE_TOC, ["molecule_dictionary", "drug_mechanism"]
+    ).splitlines()
+
+    assert restore_list == [
+        "4; 3079 16386 EXTENSION - pg_trgm",
+        "5; 1247 16401 TYPE public chembl_id_type chembl",
+        "231; 1259 16490 TABLE public molecule_dictionary chembl",
+        "240; 1259 16530 TABLE public drug_mechanism chembl",
+        "5131; 0 16490 TABLE DATA public molecule_dictionary chembl",
+        "5140; 0 16530 TABLE DATA public drug_mechanism chembl",
+    ]
+
+
+def test_clinical_phase_data_skips_mechanisms_below_cutoff(tmp_path):
+    """Test that mechanisms are only requested for molecules passing max_phase."""
+    with patch("src.etl.base_processor.get_db_manager") as mock:
+        mock.return_value = Mock()
+        processor = ChemblDrugProcessor(
+            {"cache_dir": str(tmp_path / "cache"), "max_phase_cutoff": 2}
+        )
+
+    responses = {
+        "target": {
+            "targets": [{"target_chembl_id": "CHEMBL1824", "pref_name": "ERBB2"}]
+        },
+        "activity": {
+            "activities": [
+                {"molecule_chembl_id": "CHEMBL1", "standard_type": "IC50"},
+                {"molecule_chembl_id": "CHEMBL2", "standard_type": "IC50"},
+                {"molecule_chembl_id": "CHEMBL3", "standard_type": "Ki"},
+            ]
+        },
+        "molecule": {
+            "CHEMBL1": {"molecules": [{"pref_name": "DRUG1", "max_phase": 4}]},
+            "CHEMBL2": {"molecules": [{"pref_name": "DRUG2", "max_phase": 1}]},
+            "CHEMBL3": {"molecules": [{"pref_name": "DRUG3", "max_phase": None}]},
+        },
+        "mechanism": {"mechanisms": [{"mechanism_of_action": "ERBB2 inhibitor"}]},
+    }
+    requests = []
+
+    def query_many(endpoint, params_list):
+        requests.extend((endpoint, params) for params in params_list)
+        if endpoint == "molecule":
+            return [
+                responses["molecule"][params["molecule_chembl_id"]]
+                for params in params_list
+            ]
+        return [responses[endpoint]] * len(params_list)
+
+    with patch.object(processor, "_query_chembl_api_many", side_effect=query_many):
+        drugs = processor.get_clinical_phase_data("ERBB2")
+
+    mechanism_requests = [
+        params["molecule_chembl_id"]
+        for endpoint, params in requests
+        if endpoint == "mechanism"
+    ]
+    assert mechanism_requests == ["CHEMBL1"]
+    assert [drug["molecule_chembl_id"] for drug in drugs] == ["CHEMBL1"]
+    assert drugs[0]["mechanisms"][0]["mechanism_of_action"] == "ERBB2 inhibitor"
+
+
+def test_clinical_phase_data_batches_requests_across_genes(tmp_path):
+    """Test that each API level is one batch for all genes, shared IDs once."""
+    with patch("src.etl.base_processor.get_db_manager") as mock:
+        mock.return_value = Mock()
+        processor = ChemblDrugProcessor(
+            {"cache_dir": str(tmp_path / "cache"), "include_mechanisms": False}
+        )
+
+    targets = {
+        "EGFR": {"targets": [{"target_chembl_id": "CHEMBL203", "pref_name": "EGFR"}]},
+        "ERBB1": {"targets": [{"target_chembl_id": "CHEMBL203", "pref_name": "EGFR"}]},
+        "KRAS": {"targets": []},
+    }
+    calls = []
+
+    def query_many(endpoint, params_list):
+        calls.append((endpoint, params_list))
+        if endpoint == "target":
+            return [targets[params["target_synonym"]] for params in params_list]
+        if endpoint == "activity":
+            return [{"activities": [{"molecule_chembl_id": "CHEMBL939"}]}]
+        return [{"molecules": [{"pref_name": "GEFITINIB", "max_phase": 4}]}]
+
+    with patch.object(processor, "_query_chembl_api_many", side_effect=query_many):
+        drugs = processor.get_clinical_phase_data_many(["EGFR", "ERBB1", "KRAS"])
+
+    assert [(endpoint, len(params_list)) for endpoint, params_list in calls] == [
+        ("target", 3),
+        ("activity", 1),
+        ("molecule", 1),
+    ]
+    assert [drug["pref_name"] for drug in drugs["EGFR"]] == ["GEFITINIB"]
+    assert [drug["pref_name"] for drug in drugs["ERBB1"]] == ["GEFITINIB"]
+    assert drugs["KRAS"] == []
+
+
+def test_drug_scores_keep_drug_keys_and_weights(tmp_path):
+    """Test scores are keyed like the drugs column and weighted per source."""
+    with patch("src.etl.base_processor.get_db_manager") as mock:
+        mock.return_value = Mock()
+        processor = ChemblDrugProcessor(
+            {"cache_dir": str(tmp_path / "cache"), "drug_pathway_weight": 2.0}
+        )
+    cursor = processor.db_manager.cursor
+    cursor.fetchone.return_value = (3,)
+
+    processor.calculate_drug_scores()
+
+    statements = [
+        (" ".join(call.args[0].split()), call.args[1:])
+        for call in cursor.execute.call_args_list
+    ]
+    drug_keys = next(sql for sql, _ in statements if "temp_gene_drugs ON" in sql)
+    assert "jsonb_object_keys(cb.drugs) AS d(drug_key)" in drug_keys
+    synergy, params = next(
+        (sql, params) for sql, params in statements if "temp_gene_synergy ON" in sql
+    )
+    assert "SELECT DISTINCT gene_id FROM temp_gene_drugs" in synergy
+    assert params == ((2.0, 1.0),)
+    update = statements[-1][0]
+    assert update.startswith("UPDATE cancer_transcript_base cb")
+    assert "jsonb_object_agg(gd.drug_key, gs.score)" in update
+    assert "FROM temp_gene_drugs gd JOIN temp_gene_synergy gs" in update
@@ -0,0 +1,295 @@
+"""Tests for the ClinicalTrials.gov harvester."""
+
+import json
+import threading
+import zipfile
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterator, List
+from unittest.mock import Mock, patch
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from src.etl.clinical_trials import (
+    ClinicalTrialsProcessor,
+    GeneSymbolMatcher,
+    iter_json_studies,
+    scan_studies,
+)
+
+
+def make_study(nct_id: str, condition: str = "Breast Cancer") -> Dict[str, Any]:
+    """Build a minimal study document."""
+    return {
+        "protocolSection": {
+            "identificationModule": {"nctId": nct_id, "briefTitle": f"Trial {nct_id}"},
+            "statusModule": {"overallStatus": "RECRUITING"},
+            "designModule": {"phases": ["PHASE2"]},
+            "conditionsModule": {"conditions": [condition]},
+        }
+    }
+
+
+STUDIES = {
+    "NCT00000001": make_study("NCT00000001"),
+    "NCT00000002": make_study("NCT00000002"),
+    "NCT00000003": make_study("NCT00000003"),
+    "NCT00000004": make_study("NCT00000004", condition="Hypertension"),
+}
+
+# Search results per gene; NCT00000002 is shared by both genes
+GENE_HITS = {
+    "EGFR": ["NCT00000001", "NCT00000002", "NCT00000004"],
+    "ERBB2": ["NCT00000002", "NCT00000003"],
+}
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Serve /studies searches and filter.ids lookups, one study per page."""
+
+    requests_seen: List[Dict[str, str]] = []
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        query = {k: v[0] for k, v in parse_qs(urlparse(self.path).query).items()}
+        self.requests_seen.append(query)
+
+        if "filter.ids" in query:
+            nct_ids = query["filter.ids"].split(",")
+            studies = [STUDIES[nct_id] for nct_id in nct_ids]
+        else:
+            gene = query["query.term"].strip('"')
+            studies = [
+                {"protocolSection": {"identificationModule": {"nctId": nct_id}}}
+                for nct_id in GENE_HITS.get(gene, [])
+            ]
+
+        page = int(query.get("pageToken", 0))
+        payload: Dict[str, Any] = {"studies": studies[page : page + 1]}
+        if page + 1 < len(studies):
+            payload["nextPageToken"] = str(page + 1)
+
+        body = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def api_url() -> Iterator[str]:
+    """Run the stub API on a free local port."""
+    StubHandler.requests_seen = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/api/v2"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def mock_db_manager():
+    """Mock database manager."""
+    with patch("src.etl.base_processor.get_db_manager") as mock:
+        db_manager = Mock()
+        db_manager.cursor = Mock()
+        db_manager.conn = Mock()
+        mock.return_value = db_manager
+        yield db_manager
+
+
+def make_processor(api_url: str, tmp_path, **config: Any) -> ClinicalTrialsProcessor:
+    """Create a processor with DB writes replaced by recorders."""
+    processor = ClinicalTrialsProcessor(
+        {
+            "cache_dir": str(tmp_path / "cache"),
+            "clinical_trials_api_base": api_url,
+            "clinical_trials_rate_limit": 0,
+            "clinical_trials_max_concurrency": 3,
+            **config,
+        }
+    )
+    processor._store_trials = Mock(side_effect=len)
+    processor._store_gene_trial_links = Mock()
+    return processor
+
+
+def test_shared_trials_are_fetched_once(api_url, tmp_path, mock_db_manager):
+    """Test pagination, per-NCT deduplication and relevance filtering."""
+    processor = make_processor(api_url, tmp_path)
+
+    gene_trials = processor.get_trials_for_genes(["EGFR", "ERBB2", "EGFR"])
+
+    assert {
+        gene: [t["nct_id"] for t in trials] for gene, trials in gene_trials.items()
+    } == {
+        "EGFR": ["NCT00000001", "NCT00000002"],
+        "ERBB2": ["NCT00000002", "NCT00000003"],
+    }
+    fetched = [
+        nct_id
+        for query in StubHandler.requests_seen
+        if "filter.ids" in query and "pageToken" not in query
+        for nct_id in query["filter.ids"].split(",")
+    ]
+    assert sorted(fetched) == sorted(STUDIES)
+
+    stored = [
+        s["protocolSection"]["identificationModule"]["nctId"]
+        for call in processor._store_trials.call_args_list
+        for s in call.args[0]
+    ]
+    assert sorted(stored) == sorted(STUDIES)
+    processor._store_gene_trial_links.assert_called_once_with(
+        gene_trials, match_source="search"
+    )
+
+
+def test_second_run_is_served_from_cache(api_url, tmp_path, mock_db_manager):
+    """Test that cached searches and documents avoid all API requests."""
+    first = make_processor(api_url, tmp_path).get_trials_for_genes(["EGFR", "ERBB2"])
+    StubHandler.requests_seen = []
+
+    processor = make_processor(api_url, tmp_path)
+    assert processor.get_trials_for_genes(["EGFR", "ERBB2"]) == first
+    assert StubHandler.requests_seen == []
+    assert processor.api_requests_made == 0
+
+
+def test_search_stops_at_max_results(api_url, tmp_path, mock_db_manager):
+    """Test that result pages are only followed up to max_results trials."""
+    processor = make_processor(api_url, tmp_path, clinical_trials_max_results=1)
+
+    gene_trials = processor.get_trials_for_genes(["EGFR"])
+
+    assert [t["nct_id"] for t in gene_trials["EGFR"]] == ["NCT00000001"]
+    searches = [query for query in StubHandler.requests_seen if "query.term" in query]
+    assert len(searches) == 1
+
+
+def test_gene_symbol_matcher_matches_whole_tokens():
+    """Test token matching, hyphenated mentions and short-symbol filtering."""
+    matcher = GeneSymbolMatcher(["EGFR", "HLA-A", "MET", "AR", "KRAS"])
+
+    assert matcher.find("Osimertinib in EGFR-mutant NSCLC with MET amplification") == {
+        "EGFR",
+        "MET",
+    }
+    assert matcher.find("HLA-A*02:01 restricted TCR; METHOD; egfr; AR") == {"HLA-A"}
+
+
+def test_trial_acronyms_are_not_gene_mentions():
+    """Test that acronyms colliding with gene symbols do not link trials."""
+    matcher = GeneSymbolMatcher(["MET", "REST", "CAT", "EGFR"])
+    studies = []
+    for nct_id, acronym in (
+        ("NCT00000001", "MET"),
+        ("NCT00000002", "REST"),
+        ("NCT00000003", "CAT"),
+    ):
+        study = make_study(nct_id)
+        study["protocolSection"]["identificationModule"]["acronym"] = acronym
+        studies.append(study)
+    studies[0]["protocolSection"]["conditionsModule"]["conditions"] = [
+        "EGFR-mutant Non-small Cell Lung Cancer"
+    ]
+
+    matches = scan_studies(studies, matcher, cancer_only=True, include_phase_0=False)
+
+    assert [
+        (study["protocolSection"]["identificationModule"]["nctId"], genes)
+        for study, genes in matches
+    ] == [("NCT00000001", ["EGFR"])]
+
+
+def test_iter_json_studies_streams_arrays(tmp_path):
+    """Test that JSON arrays spanning many read chunks are decoded per element."""
+    path = tmp_path / "studies.json"
+    path.write_text(json.dumps(list(STUDIES.values()), indent=2))
+
+    studies = list(iter_json_studies(path, chunk_size=64))
+
+    assert studies == list(STUDIES.values())
+
+
+def test_ingest_export_zip(tmp_path, mock_db_manager):
+    """Test offline ingestion of a per-study JSON ZIP export."""
+    studies = {
+        "NCT00000001": make_study("NCT00000001"),
+        "NCT00000002": make_study("NCT00000002"),
+        "NCT00000003": make_study("NCT00000003", condition="Hypertension"),
+    }
+    studies["NCT00000001"]["protocolSection"]["armsInterventionsModule"] = {
+        "interventions": [{"name": "Erlotinib", "otherNames": ["EGFR inhibitor"]}]
+    }
+    studies["NCT00000002"]["protocolSection"]["conditionsModule"]["keywords"] = [
+        "ERBB2",
+        "EGFR-TKI",
+    ]
+    studies["NCT00000003"]["protocolSection"]["conditionsModule"]["keywords"] = ["EGFR"]
+
+    export = tmp_path / "ctg-studies.json.zip"
+    with zipfile.ZipFile(export, "w") as archive:
+        for nct_id, study in studies.items():
+            archive.writestr(f"ctg-studies.json/{nct_id}.json", json.dumps(study))
+
+    processor = ClinicalTrialsProcessor(
+        {"cache_dir": str(tmp_path / "cache"), "max_workers": 2}
+    )
+    processor._get_gene_symbols = Mock(return_value=["EGFR", "ERBB2", "TP53"])
+    processor._upsert_trials = Mock(side_effect=len)
+    links = []
+    processor._store_gene_trial_links = Mock(
+        side_effect=lambda gene_trials, match_source: links.extend(
+            (gene, t["nct_id"], match_source)
+            for gene, trials in gene_trials.items()
+            for t in trials
+        )
+    )
+
+    gene_trials = processor.ingest_export(export)
+
+    # NCT00000003 is not cancer-related
+    assert sorted(links) == [
+        ("EGFR", "NCT00000001", "dump"),
+        ("EGFR", "NCT00000002", "dump"),
+        ("ERBB2", "NCT00000002", "dump"),
+    ]
+    assert sorted(gene_trials) == ["EGFR", "ERBB2"]
+
+
+def test_ingest_export_json_lines_in_batches(tmp_path, mock_db_manager):
+    """Test that a single JSON Lines export is matched by the pool in batches."""
+    export = tmp_path / "ctg-studies.jsonl"
+    export.write_text(
+        "\n".join(
+            json.dumps(study)
+            for study in (
+                make_study("NCT00000001", condition="EGFR-mutant lung cancer"),
+                make_study("NCT00000002", condition="Hypertension"),
+                make_study("NCT00000003", condition="ERBB2 positive breast cancer"),
+            )
+        )
+    )
+
+    processor = ClinicalTrialsProcessor(
+        {"cache_dir": str(tmp_path / "cache"), "max_workers": 1}
+    )
+    processor._get_gene_symbols = Mock(return_value=["EGFR", "ERBB2", "TP53"])
+    processor._upsert_trials = Mock(side_effect=len)
+    processor._store_gene_trial_links = Mock()
+
+    with patch("src.etl.clinical_trials.EXPORT_SCAN_BATCH", 1):
+        gene_trials = processor.ingest_export(export)
+
+    assert processor._upsert_trials.call_count == 3
+    assert {
+        gene: [t["nct_id"] for t in trials] for gene, trials in gene_trials.items()
+    } == {
+        "EGFR": ["NCT00000001"],
+        "ERBB2": ["NCT00000003"],
+    }
@@ -0,0 +1,319 @@
+"""Tests for the batch evidence scoring engine."""
+
+import pickle
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.etl.evidence_scoring import (
+    COMPONENT_COLUMNS,
+    CONFIDENCE_COLUMNS,
+    EVIDENCE_TYPES,
+    GENE_FEATURES,
+    USE_CASES,
+    EvidenceScore,
+    EvidenceScoringProcessor,
+    EvidenceType,
+    UseCase,
+    _score_partition_worker,
+    compute_component_scores,
+)
+
+
+@pytest.fixture
+def processor():
+    """Create a processor with a mocked database."""
+    with patch("src.etl.base_processor.get_db_manager") as mock:
+        mock.return_value = Mock()
+        return EvidenceScoringProcessor(
+            {"cache_dir": "/tmp/mediabase/test_cache", "max_workers": 1}
+        )
+
+
+def random_features(genes: int, seed: int) -> pd.DataFrame:
+    """Build a feature frame of random counts for GENE0, GENE1, ..."""
+    rng = np.random.default_rng(seed)
+    features = pd.DataFrame(
+        rng.integers(0, 30, size=(genes, len(GENE_FEATURES))), columns=GENE_FEATURES
+    )
+    features.insert(0, "gene_symbol", [f"GENE{i}" for i in range(genes)])
+    return features
+
+
+def in_partition(symbols, partition: int, partitions: int) -> list:
+    """Stand-in for the hashtext() partition filter of the feature query."""
+    return [zlib.crc32(s.encode()) % partitions == partition for s in symbols]
+
+
+def empty_component_cache() -> pd.DataFrame:
+    """Build an empty evidence_component_scores cache."""
+    return pd.DataFrame(
+        columns=["gene_symbol", "input_hash", "weights_hash"]
+        + COMPONENT_COLUMNS
+        + CONFIDENCE_COLUMNS
+        + ["evidence_count"]
+    ).set_index("gene_symbol")
+
+
+def stub_partition_worker(config, partition, partitions, full_rescore):
+    """Run the real partition worker in a pool process without a database."""
+    features = random_features(20, seed=2)
+
+    def load_features(self, limit_records, partition, partitions):
+        return features[in_partition(features["gene_symbol"], partition, partitions)]
+
+    with patch(
+        "src.etl.base_processor.get_db_manager", return_value=Mock()
+    ), patch.object(
+        EvidenceScoringProcessor, "_load_gene_features", load_features
+    ), patch.object(
+        EvidenceScoringProcessor,
+        "_load_component_cache",
+        lambda self, partition, partitions: empty_component_cache(),
+    ):
+        return _score_partition_worker(config, partition, partitions, full_rescore)
+
+
+def make_features(**genes) -> pd.DataFrame:
+    """Build a feature frame; unspecified features are 0."""
+    rows = [
+        {"gene_symbol": symbol, **{name: values.get(name, 0) for name in GENE_FEATURES}}
+        for symbol, values in genes.items()
+    ]
+    return pd.DataFrame(rows)
+
+
+def test_composite_matches_per_record_scoring(processor):
+    """Test the matrix composite against calculate_composite_score."""
+    rng = np.random.default_rng(0)
+    scores = rng.uniform(0, 30, size=(20, len(EVIDENCE_TYPES)))
+    confidence = rng.uniform(0, 0.9, size=scores.shape)
+    scores[0] = 0.0
+
+    composite = processor.score_components(scores, confidence)
+
+    for gene in range(len(scores)):
+        evidence = [
+            EvidenceScore(
+                score=scores[gene, i],
+                confidence=confidence[gene, i],
+                source=f"multiple_{evidence_type.value}",
+                evidence_type=evidence_type,
+                timestamp=datetime.now(),
+                metadata={},
+            )
+            for i, evidence_type in enumerate(EVIDENCE_TYPES)
+        ]
+        for column, use_case in enumerate(USE_CASES):
+            expected = processor.calculate_composite_score(evidence, use_case)
+            assert composite["overall"][gene, column] == pytest.approx(
+                expected.overall_score
+            )
+            assert (
+                composite["ci_lower"][gene, column],
+                composite["ci_upper"][gene, column],
+            ) == pytest.approx(expected.confidence_interval)
+            assert composite["evidence_quality"][gene] == pytest.approx(
+                expected.evidence_quality
+            )
+
+
+def test_component_scores_from_features():
+    """Test per-type scores, caps and confidence on a feature matrix."""
+    features = make_features(
+        EGFR={
+            "drug_count": 12,
+            "drugcentral_targets": 10,
+            "phase_4": 3,
+            "phase_2": 1,
+            "pgkb_annotations": 2,
+            "pgkb_level_1a": 1,
+            "pgkb_significance_high": 1,
+            "pgkb_toxicity": 1,
+            "pathways": 40,
+            "go_biological_process": 4,
+            "cancer_go_terms": 2,
+            "publications": 50,
+        },
+        NODATA={},
+    )
+
+    scores, confidence, evidence_count = compute_component_scores(features)
+
+    clinical, mechanistic, publication, genomic, safety = scores[0]
+    assert clinical == 30.0  # 3*12 + 4 + 8 + 2, capped
+    assert mechanistic == 15.0  # min(8, 20) + min(7, 15)
+    assert publication == pytest.approx(11.0)  # min(8, 15) + min(3, 3)
+    assert genomic == pytest.approx(0.8 + 1.0 + 1.6)
+    assert safety == pytest.approx(5.0 - 0.2 + 3.0 - 2.0)
+    assert confidence[0, 0] == 0.9
+    assert evidence_count[0] == 6 + 50 + 50 + 4 + 2
+
+    assert scores[1].tolist() == [0.0, 0.0, 0.0, 0.0, 5.0]
+    assert confidence[1].tolist() == [0.0, 0.0, 0.0, 0.0, 0.3]
+
+
+def test_only_changed_genes_are_rescored(processor):
+    """Test input-hash change tracking and composite-only weight updates."""
+    table = pd.DataFrame(
+        columns=["gene_symbol", "input_hash", "weights_hash"]
+        + COMPONENT_COLUMNS
+        + CONFIDENCE_COLUMNS
+        + ["evidence_count"]
+    ).set_index("gene_symbol")
+    writes = []
+
+    def write(genes, composite, weights_hash, stale):
+        nonlocal table
+        writes.append(sorted(genes["gene_symbol"]))
+        rows = genes.set_index("gene_symbol").assign(weights_hash=weights_hash)
+        kept = table.drop(list(rows.index) + list(stale), errors="ignore")
+        table = pd.concat([kept, rows]) if len(kept) else rows
+
+    processor._load_component_cache = lambda *args: table
+    processor._write_evidence_scores = write
+    features = make_features(
+        EGFR={"drug_count": 3, "phase_4": 1, "publications": 40},
+        ERBB2={"drug_count": 1, "pathways": 12},
+        TP53={"pgkb_annotations": 2, "pgkb_level_1a": 1},
+    )
+    processor._load_gene_features = lambda *args: features
+
+    first = processor.process_evidence_scoring()
+    assert first["genes_rescored"] == 3
+    assert processor.process_evidence_scoring()["genes_written"] == 0
+
+    features.loc[features["gene_symbol"] == "ERBB2", "pathways"] = 20
+    second = processor.process_evidence_scoring()
+    assert (second["genes_rescored"], writes[-1]) == (1, ["ERBB2"])
+
+    # New weights: composites of every gene change, components are reused
+    processor.use_case_weights[UseCase.PATHWAY_ANALYSIS][EvidenceType.GENOMIC] = 0.3
+    with patch("src.etl.evidence_scoring.compute_component_scores") as compute:
+        third = processor.rescore_composites()
+    compute.assert_not_called()
+    assert (third["genes_rescored"], third["genes_written"]) == (0, 3)
+    assert third["overall_statistics"] != second["overall_statistics"]
+
+    processor._load_gene_features = lambda *args: features.iloc[:2]
+    assert processor.process_evidence_scoring()["genes_removed"] == 1
+    assert sorted(table.index) == ["EGFR", "ERBB2"]
+
+
+def test_results_do_not_depend_on_worker_count(processor):
+    """Test that partitioned scoring merges to the same writes as one worker."""
+    features = random_features(50, seed=1)
+    loaded = []
+
+    def load_features(limit_records, partition, partitions):
+        loaded.append((partition, partitions))
+        return features[in_partition(features["gene_symbol"], partition, partitions)]
+
+    cache = empty_component_cache()
+    processor._load_gene_features = load_features
+    processor._load_component_cache = lambda partition, partitions: cache
+    processor._write_evidence_scores = Mock()
+
+    def worker(config, partition, partitions, full_rescore):
+        return processor._score_partition(partition, partitions, None, full_rescore)
+
+    def run(workers):
+        processor.max_workers = workers
+        processor._write_evidence_scores.reset_mock()
+        with patch(
+            "src.etl.evidence_scoring.ProcessPoolExecutor", ThreadPoolExecutor
+        ), patch("src.etl.evidence_scoring._score_partition_worker", worker):
+            stats = processor.process_evidence_scoring()
+        genes, composite = processor._write_evidence_scores.call_args.args[:2]
+        return stats, genes, composite
+
+    serial_stats, serial_genes, serial_composite = run(1)
+    stats, genes, composite = run(3)
+
+    assert sorted(loaded) == [(0, 1), (0, 3), (1, 3), (2, 3)]
+    assert stats == serial_stats
+    pd.testing.assert_frame_equal(genes, serial_genes)
+    for name, values in serial_composite.items():
+        np.testing.assert_array_equal(composite[name], values)
+
+
+class RecordingConnection:
+    """psycopg2-like connection that applies statements on commit only.
+
+    With autocommit on, every statement is applied as soon as it runs.
+    """
+
+    def __init__(self, fail_on: str) -> None:
+        self.autocommit = True
+        self.fail_on = fail_on
+        self.pending: list = []
+        self.applied: list = []
+
+    def cursor(self):
+        cursor = Mock()
+        cursor.execute.side_effect = self._execute
+        return cursor
+
+    def _execute(self, query, params=None):
+        if self.fail_on in query:
+            raise RuntimeError("insert failed")
+        self.pending.append(" ".join(query.split()))
+        if self.autocommit:
+            self.commit()
+
+    def commit(self):
+        self.applied.extend(self.pending)
+        self.pending.clear()
+
+    def rollback(self):
+        self.pending.clear()
+
+
+def test_failed_write_leaves_cache_unchanged(processor):
+    """Test the cache upsert is rolled back if the score insert fails."""
+    features = make_features(EGFR={"drug_count": 3}, KRAS={"pathways": 2})
+    processor._load_gene_features = lambda *args: features
+    processor._load_component_cache = lambda *args: empty_component_cache()
+    processor.connection = RecordingConnection(
+        fail_on="INSERT INTO evidence_scoring_metadata"
+    )
+
+    with pytest.raises(RuntimeError):
+        processor.process_evidence_scoring()
+
+    assert processor.connection.applied == []
+    assert processor.connection.autocommit is True
+
+
+def test_partitions_are_scored_in_worker_processes(processor):
+    """Test a real two-process pool against the in-process result."""
+    args = (processor.config, 1, 2, False)
+    assert pickle.loads(pickle.dumps((_score_partition_worker, args))) == (
+        _score_partition_worker,
+        args,
+    )
+
+    features = random_features(20, seed=2)
+    processor._load_gene_features = lambda limit_records, partition, partitions: (
+        features[in_partition(features["gene_symbol"], partition, partitions)]
+    )
+    processor._load_component_cache = lambda *args: empty_component_cache()
+    processor._write_evidence_scores = Mock()
+
+    processor.process_evidence_scoring()
+    serial_genes = processor._write_evidence_scores.call_args.args[0]
+
+    processor.max_workers = 2
+    with patch(
+        "src.etl.evidence_scoring._score_partition_worker", stub_partition_worker
+    ):
+        processor.process_evidence_scoring()
+    genes = processor._write_evidence_scores.call_args.args[0]
+
+    assert len(genes) == 20
+    pd.testing.assert_frame_equal(genes, serial_genes)
@@ -0,0 +1,122 @@
+"""Tests for UniProt ID mapping processing."""
+
+import gzip
+from unittest.mock import Mock, patch
+
+import pyarrow.parquet as pq
+import pytest
+
+from src.etl.id_enrichment import (
+    UNIPROT_MAPPING_FILE,
+    IDEnrichmentProcessor,
+    id_updates_to_copy,
+)
+
+IDMAPPING_LINES = [
+    "P04637\tUniProtKB-ID\tP53_HUMAN",
+    "P04637\tGene_Name\tTP53",
+    "P04637\tGeneID\t7157",
+    "P04637\tNCBI_TaxID\t9606",
+    "P04637\tEnsembl\tENSG00000141510",
+    "P04637\tEnsembl\tENST00000269305",
+    "P04637\tRefSeq\tNP_000537.3",
+    "P04637\tHGNC\tHGNC:11998",
+    "P04637\tPDB\t-",
+    "P04637-2\tGene_Name\tTP53",
+    "P04637-2\tNCBI_TaxID\t9606",
+    "P04637-2\tRefSeq\tNM_000546",
+    "P04637-2\tGeneID\t7157",
+    "malformed line",
+    "Q9Z0K0\tGene_Name\tTrp53",
+    "Q9Z0K0\tNCBI_TaxID\t10090",
+    "Q9Z0K0\tGeneID\t22059",
+]
+
+
+@pytest.fixture
+def processor(tmp_path):
+    """Create a processor with a mocked database."""
+    with patch("src.etl.base_processor.get_db_manager") as mock:
+        mock.return_value = Mock()
+        return IDEnrichmentProcessor({"cache_dir": str(tmp_path / "cache")})
+
+
+@pytest.fixture
+def mapping_file(tmp_path):
+    """Write a small gzipped idmapping.dat."""
+    path = tmp_path / "idmapping.dat.gz"
+    with gzip.open(path, "wt") as f:
+        f.write("\n".join(IDMAPPING_LINES) + "\n")
+    return path
+
+
+def test_filter_writes_human_parquet(processor, mapping_file):
+    """Test the vectorized human / ID-type filter."""
+    output = processor._filter_uniprot_mapping(mapping_file)
+
+    assert output.name == UNIPROT_MAPPING_FILE
+    rows = pq.read_table(output).to_pylist()
+    assert {row["uniprot_id"] for row in rows} == {"P04637", "P04637-2"}
+    assert {
+        "uniprot_id": "P04637",
+        "id_type": "ensembl_transcript_id",
+        "id_value": "ENST00000269305",
+    } in rows
+    assert not any(row["id_value"] == "-" for row in rows)
+    assert processor.filter_metadata["uniprot"]["total"] == len(IDMAPPING_LINES) - 1
+
+    # Cached result is reused
+    assert processor._filter_uniprot_mapping(mapping_file) == output
+
+
+def test_process_uniprot_mapping_pivots_by_gene(processor, mapping_file):
+    """Test the pivot from UniProt accessions to gene symbols."""
+    gene_mapping = processor.process_uniprot_mapping(mapping_file)
+
+    assert list(gene_mapping) == ["TP53"]
+    assert gene_mapping["TP53"] == {
+        "uniprot_ids": ["P04637", "P04637-2"],
+        "ncbi_id": ["7157"],
+        "ensembl_gene_id": ["ENSG00000141510"],
+        "ensembl_transcript_id": ["ENST00000269305"],
+        "refseq_protein_id": ["NP_000537.3"],
+        "hgnc_id": ["HGNC:11998"],
+        "refseq_mrna_id": ["NM_000546"],
+    }
+
+
+def test_id_updates_copy_buffer():
+    """Test COPY text escaping, array literals and per-symbol deduplication."""
+    buffer = id_updates_to_copy(
+        [
+            (["P1"], ["1"], [], "{}", "{}", "GENE1"),
+            (['P"2', "a\\b"], ["7157"], ["NM_1"], '{"HGNC": "x\ty"}', "{}", "TP53"),
+            (["P3"], ["2"], [], "{}", "{}", "GENE1"),
+        ]
+    )
+
+    assert buffer.read().splitlines() == [
+        'GENE1\t{"P3"}\t{"2"}\t{}\t{}\t{}',
+        'TP53\t{"P\\\\"2","a\\\\\\\\b"}\t{"7157"}\t{"NM_1"}\t{"HGNC": "x\\ty"}\t{}',
+    ]
+
+
+def test_update_id_batch_is_set_based(processor):
+    """Test that a batch is one COPY, one UPDATE and one cross-reference insert."""
+    cursor = processor.db_manager.cursor
+    processor.db_manager.conn.autocommit = False
+    cursor.rowcount = 500
+    updates = [([f"P{i}"], [str(i)], [], "{}", "{}", f"GENE{i}") for i in range(500)]
+
+    processor._update_id_batch(updates)
+
+    cursor.executemany.assert_not_called()
+    cursor.copy_expert.assert_called_once()
+    statements = [
+        " ".join(call.args[0].split()) for call in cursor.execute.call_args_list
+    ]
+    assert sum(s.startswith("UPDATE cancer_transcript_base") for s in statements) == 1
+    assert (
+        sum(s.startswith("INSERT INTO gene_cross_references") for s in statements) == 1
+    )
+    processor.db_manager.conn.commit.assert_called_once()
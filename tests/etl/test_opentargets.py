@@ -0,0 +1,117 @@
+"""Tests for Open Targets Platform processing module."""
+
+import pytest
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from pathlib import Path
+from unittest.mock import Mock, patch
+from typing import Dict, Any
+
+from src.etl.opentargets import OpenTargetsProcessor
+
+
+@pytest.fixture
+def mock_config(tmp_path) -> Dict[str, Any]:
+    """Provide test configuration."""
+    return {
+        "cache_dir": str(tmp_path / "cache"),
+        "batch_size": 10,
+        "opentargets_batch_rows": 2,
+        "host": "localhost",
+        "port": 5432,
+        "dbname": "test_db",
+        "user": "test_user",
+        "password": "test_pass",
+    }
+
+
+@pytest.fixture
+def mock_db_manager():
+    """Mock database manager."""
+    with patch("src.etl.base_processor.get_db_manager") as mock:
+        db_manager = Mock()
+        db_manager.cursor = Mock()
+        db_manager.conn = Mock()
+        mock.return_value = db_manager
+        yield db_manager
+
+
+@pytest.fixture
+def processor(mock_config, mock_db_manager):
+    """Create test processor instance."""
+    return OpenTargetsProcessor(mock_config)
+
+
+@pytest.fixture
+def associations_dataset(tmp_path) -> Path:
+    """Write a small two-part associations dataset."""
+    dataset_dir = tmp_path / "associationByOverallDirect"
+    dataset_dir.mkdir()
+
+    pq.write_table(
+        pa.table(
+            {
+                "diseaseId": ["EFO_0000305", "EFO_0000305", "EFO_0001360"],
+                "targetId": ["ENSG00000141736", "ENSG00000146648", "ENSG00000141736"],
+                "score": [0.91, 0.42, 0.77],
+                "evidenceCount": [120, 3, 45],
+            }
+        ),
+        dataset_dir / "part-00000.parquet",
+    )
+    pq.write_table(
+        pa.table(
+            {
+                "diseaseId": ["EFO_0000305", "MONDO_0005148", "EFO_0000305"],
+                "targetId": ["ENSG00000012048", "ENSG00000141736", "ENSG99999999999"],
+                "score": [0.65, 0.99, 0.80],
+                "evidenceCount": [60, 200, 1],
+            }
+        ),
+        dataset_dir / "part-00001.parquet",
+    )
+    return dataset_dir
+
+
+def test_read_parquet_dataset_pushdown(processor, associations_dataset):
+    """Test column projection and predicate pushdown on a partitioned dataset."""
+    df = processor._read_parquet_dataset(
+        associations_dataset,
+        columns=["targetId", "score"],
+        filter_expression=ds.field("score") >= 0.7,
+    )
+
+    assert list(df.columns) == ["targetId", "score"]
+    assert sorted(df["score"].tolist()) == [0.77, 0.8, 0.91, 0.99]
+
+
+def test_process_associations_filters_and_maps(processor, associations_dataset):
+    """Test that only cancer, above-threshold, mapped associations are inserted."""
+    processor._download_dataset = Mock(return_value=associations_dataset)
+    processor._get_cancer_disease_ids = Mock(
+        return_value=["EFO_0000305", "EFO_0001360"]
+    )
+    processor._get_gene_id_mapping = Mock(
+        return_value={
+            "ENSG00000141736": "ENSG00000141736",
+            "ENSG00000012048": "ENSG00000012048",
+        }
+    )
+    inserted = []
+    processor._batch_insert_associations = Mock(
+        side_effect=lambda records: inserted.extend(records)
+    )
+
+    count = processor._process_associations()
+
+    # 0.42 is below threshold, MONDO_0005148 is not cancer, ENSG999... is unmapped
+    assert count == 3
+    assert {(r["gene_id"], r["disease_id"]) for r in inserted} == {
+        ("ENSG00000141736", "EFO_0000305"),
+        ("ENSG00000141736", "EFO_0001360"),
+        ("ENSG00000012048", "EFO_0000305"),
+    }
+    assert all(r["is_direct"] is True for r in inserted)
+    assert all(r["metadata"] == {"datasources": []} for r in inserted)
+    assert all(isinstance(r["overall_score"], float) for r in inserted)
@@ -0,0 +1,124 @@
+"""Tests for Reactome pathway publication fetching."""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterator, List
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.etl.pathways import PathwayProcessor
+
+LITERATURE = {
+    "R-HSA-1": [
+        {"pubMedIdentifier": 111},
+        {"pubMedIdentifier": 222},
+        {"title": "Book"},
+    ],
+    "R-HSA-2": [{"pubMedIdentifier": 333}, {"pubMedIdentifier": 333}],
+}
+
+
+class ReactomeHandler(BaseHTTPRequestHandler):
+    """Serve the release number and pathway literature; unknown pathways 404."""
+
+    paths: List[str] = []
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self.paths.append(self.path)
+        if self.path.endswith("/data/database/version"):
+            body = b"89"
+        else:
+            pathway_id = self.path.split("/")[-2]
+            if pathway_id not in LITERATURE:
+                self.send_response(404)
+                self.end_headers()
+                return
+            body = json.dumps(LITERATURE[pathway_id]).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def reactome_url() -> Iterator[str]:
+    """Run the stub Content Service on a free local port."""
+    ReactomeHandler.paths = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ReactomeHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/ContentService"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def mock_db_manager():
+    """Mock database manager."""
+    with patch("src.etl.base_processor.get_db_manager") as mock:
+        db_manager = Mock()
+        mock.return_value = db_manager
+        yield db_manager
+
+
+def make_processor(tmp_path, **config) -> PathwayProcessor:
+    return PathwayProcessor(
+        {"cache_dir": str(tmp_path / "cache"), "reactome_rate_limit": 0, **config}
+    )
+
+
+def pmids(publications):
+    return {
+        pathway_id: [pub["pmid"] for pub in pubs]
+        for pathway_id, pubs in publications.items()
+    }
+
+
+def test_all_pathways_fetched_and_cached_per_release(
+    reactome_url, tmp_path, mock_db_manager
+):
+    """Test full coverage, PMID dedup, and that a rerun only asks for the release."""
+    pathway_to_genes = {f"R-HSA-{i}": {"TP53"} for i in range(1, 151)}
+
+    processor = make_processor(tmp_path, reactome_api_base=reactome_url)
+    publications = processor._fetch_reactome_publications(pathway_to_genes)
+
+    assert pmids(publications) == {"R-HSA-1": ["111", "222"], "R-HSA-2": ["333"]}
+    assert len(ReactomeHandler.paths) == 151
+    assert (processor.reactome_cache_dir / "release_89").is_dir()
+
+    ReactomeHandler.paths = []
+    rerun = make_processor(tmp_path, reactome_api_base=reactome_url)
+    assert pmids(rerun._fetch_reactome_publications(pathway_to_genes)) == pmids(
+        publications
+    )
+    assert ReactomeHandler.paths == ["/ContentService/data/database/version"]
+
+
+def test_literature_export_is_read_offline(tmp_path, mock_db_manager):
+    """Test that the bulk export is used without any API requests."""
+    export = tmp_path / "pathway_pmids.txt"
+    export.write_text(
+        "# stable_id\tpmid\n"
+        "R-HSA-1\t111\n"
+        "R-HSA-1\t111\n"
+        "R-HSA-2\t333\textra\n"
+        "R-HSA-9\t999\n"
+    )
+    processor = make_processor(
+        tmp_path,
+        reactome_api_base="http://127.0.0.1:9/unreachable",
+        reactome_literature_url=str(export),
+    )
+
+    publications = processor._fetch_reactome_publications(
+        {"R-HSA-1": {"TP53"}, "R-HSA-2": {"EGFR"}}
+    )
+
+    assert pmids(publications) == {"R-HSA-1": ["111"], "R-HSA-2": ["333"]}
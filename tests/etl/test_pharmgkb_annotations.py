@@ -0,0 +1,229 @@
+"""Tests for PharmGKB annotation processing."""
+
+from unittest.mock import Mock, patch
+
+import pandas as pd
+import pytest
+
+from src.etl.pharmgkb_annotations import PharmGKBAnnotationsProcessor
+
+VARIANT_COLUMNS = [
+    "Variant Annotation ID",
+    "Variant/Haplotypes",
+    "Gene",
+    "Drug(s)",
+    "PMID",
+    "Phenotype Category",
+    "Significance",
+    "Direction of effect",
+    "Sentence",
+    "Specialty Population",
+]
+VARIANT_ROWS = [
+    [
+        "1",
+        "rs1065852",
+        "CYP2D6",
+        "codeine, tramadol",
+        "12345",
+        "Metabolism/PK",
+        "yes",
+        "decreased",
+        "s1",
+        "",
+    ],
+    [
+        "2",
+        "CYP2D6*4",
+        "CYP2D6",
+        "tamoxifen",
+        "23456",
+        "Efficacy;CYP2D6",
+        "yes",
+        "",
+        "s2",
+        "Pediatric",
+    ],
+    ["3", "CYP2D6*41", "CYP2D6", "", "", "Dosage CYP2D6", "no", "increased", "", ""],
+    [
+        "4",
+        "CYP2C19*17",
+        "CYP2C19",
+        "clopidogrel",
+        "34567",
+        "Toxicity cyp2c19",
+        "not stated",
+        "affected",
+        "",
+        "",
+    ],
+    [
+        "5",
+        "CYP2C19*2",
+        "CYP2C19",
+        "clopidogrel,",
+        "",
+        "Efficacy CYP2C19",
+        "",
+        "",
+        "",
+        "",
+    ],
+    [
+        "6",
+        "c.1236del",
+        "DPYD",
+        "fluorouracil",
+        "45678",
+        "Toxicity",
+        "yes",
+        "Increased",
+        "",
+        "Other",
+    ],
+    ["7", "dup exon 2", "TPMT", "", "", "Other", "ambiguous", "", "", ""],
+    ["8", "", "UGT1A1", "irinotecan", "", "", "", "", "", ""],
+    ["9", "HLA-B*57:01", "HLA-B", "abacavir", "56789", "Toxicity", "yes", "", "", ""],
+    ["10", "CYP2D6*1", "CYP2D6", "", "   ", "PK CYP2D6", "Yes", "", "", ""],
+]
+
+# Results of the previous row-by-row implementation on VARIANT_ROWS:
+# id -> (score, evidence level, metabolizer phenotype, confidence, actionability, type)
+EXPECTED_VARIANT_SCORES = {
+    "1": (70.0, "moderate", "unknown", 0.0, "moderate", "SNP"),
+    "2": (70.0, "high", "poor_metabolizer", 0.85, "high", "star_allele"),
+    "3": (35.0, "low", "poor_metabolizer", 0.85, "research_only", "star_allele"),
+    "4": (55.0, "moderate", "ultrarapid_metabolizer", 0.8, "low", "star_allele"),
+    "5": (30.0, "moderate", "poor_metabolizer", 0.85, "research_only", "star_allele"),
+    "6": (80.0, "high", "unknown", 0.0, "high", "indel"),
+    "7": (5.0, "low", "unknown", 0.0, "low", "duplication"),
+    "8": (5.0, "low", "unknown", 0.0, "research_only", "unknown"),
+    "9": (60.0, "high", "unknown", 0.0, "high", "star_allele"),
+    "10": (45.0, "low", "extensive_metabolizer", 0.75, "low", "star_allele"),
+}
+
+CLINICAL_COLUMNS = [
+    "Clinical Annotation ID",
+    "Variant/Haplotypes",
+    "Gene",
+    "Level of Evidence",
+    "Level Modifiers",
+    "Score",
+    "Phenotype Category",
+    "PMID Count",
+    "Evidence Count",
+    "Drug(s)",
+    "Phenotype(s)",
+    "URL",
+    "Specialty Population",
+]
+CLINICAL_ROWS = [
+    [
+        "1449309937",
+        "rs1065852",
+        "CYP2D6",
+        "1A",
+        "",
+        "112.5",
+        "Metabolism/PK",
+        "12",
+        "20",
+        "codeine",
+        "Pain",
+        "https://www.pharmgkb.org/clinicalAnnotation/1449309937",
+        "",
+    ],
+    [
+        "1183621000",
+        "CYP2C19*2",
+        "CYP2C19; cyp2c9|x",
+        "2B",
+        "Tier 1 VIP",
+        "8",
+        "Efficacy",
+        "3",
+        "4",
+        "clopidogrel",
+        "",
+        "",
+        "Pediatric",
+    ],
+    ["981755803", "rs4244285", "", "3", "", "", "Toxicity", "", "", "", "", "", ""],
+    [
+        "655385012",
+        "HLA-B*57:01",
+        "HLA-B,HLA-B",
+        "4",
+        "",
+        "-1.25",
+        "Other",
+        "1",
+        "1",
+        "abacavir",
+        "",
+        "",
+        "",
+    ],
+]
+
+
+@pytest.fixture
+def processor(tmp_path):
+    """Create a processor with a mocked database."""
+    with patch("src.etl.base_processor.get_db_manager") as mock:
+        mock.return_value = Mock()
+        return PharmGKBAnnotationsProcessor({"cache_dir": str(tmp_path / "cache")})
+
+
+def write_tsv(path, columns, rows):
+    """Write rows as a PharmGKB-style TSV file."""
+    pd.DataFrame(rows, columns=columns).to_csv(path, sep="\t", index=False)
+    return path
+
+
+def test_variant_scores_match_previous_implementation(processor, tmp_path):
+    """Test that the vectorized scoring reproduces the per-row scores."""
+    variant_file = write_tsv(
+        tmp_path / "var_drug_ann.tsv", VARIANT_COLUMNS, VARIANT_ROWS
+    )
+
+    mapping = processor.process_variant_annotations(variant_file)
+
+    assert list(mapping) == ["CYP2D6", "CYP2C19", "DPYD", "TPMT", "UGT1A1", "HLA-B"]
+    scores = {
+        record["variant_annotation_id"]: (
+            record["pharmacogenomic_score"],
+            record["evidence_level"],
+            record["metabolizer_prediction"]["phenotype"],
+            record["metabolizer_prediction"]["confidence"],
+            record["clinical_actionability"],
+            record["variant_type"],
+        )
+        for records in mapping.values()
+        for record in records
+    }
+    assert scores == EXPECTED_VARIANT_SCORES
+    assert mapping["CYP2D6"][0]["drugs"] == ["codeine", "tramadol"]
+    assert mapping["CYP2C19"][1]["drugs"] == ["clopidogrel"]
+
+
+def test_clinical_annotations_by_gene(processor, tmp_path):
+    """Test gene symbol parsing and per-annotation evidence scores."""
+    clinical_file = write_tsv(
+        tmp_path / "clinical_annotations.tsv", CLINICAL_COLUMNS, CLINICAL_ROWS
+    )
+
+    mapping = processor.process_clinical_annotations(clinical_file)
+
+    assert {
+        gene: [
+            (r["annotation_id"], r["score"], r["evidence_score"], r["pmid_count"])
+            for r in records
+        ]
+        for gene, records in mapping.items()
+    } == {
+        "CYP2D6": [("1449309937", 112.5, 5, 12)],
+        "CYP2C19": [("1183621000", 8.0, 2, 3)],
+        "CYP2C9": [("1183621000", 8.0, 2, 3)],
+        "HLA-B": [("655385012", -1.25, 0, 1), ("655385012", -1.25, 0, 1)],
+    }
@@ -137,3 +137,63 @@ def test_database_update(test_config):
     }
     result = classifier.classify_gene(test_data)
     assert isinstance(result, list)
+
+
+UNIPROT_LINES = [
+    "P04637\tUniProtKB-ID\tP53_HUMAN",
+    "P04637\tGene_Name\tTP53",
+    "P04637\tDOMAIN\tDNA-binding",
+    "P04637\tGO\tGO:0003700; DNA-binding transcription factor activity",
+    "P04637\tKEYWORDS\tActivator; DNA-binding",
+    "P04637\tFUNCTION\tActs as a tumor suppressor",
+    "P28482\tGO\tGO:0004672; protein kinase activity",
+    "P28482\tGene_Name\tMAPK1",
+    "P28482\tKEYWORDS\tKinase; Transferase",
+    "Q00000\tDOMAIN\tOrphan domain",
+    "P04637-2\tGene_Name\tTP53",
+    "P04637-2\tKEYWORDS\tDNA-binding; Isoform",
+    "P04637-2\tFUNCTION\tIsoform 2",
+]
+
+
+def test_uniprot_blocks_keep_entries_whole():
+    """Test that blocks are cut only between accessions."""
+    import io
+
+    from src.etl.products import iter_uniprot_blocks
+
+    data = ("\n".join(UNIPROT_LINES) + "\n").encode()
+    blocks = list(iter_uniprot_blocks(io.BytesIO(data), block_bytes=50))
+
+    assert b"".join(blocks) == data
+    accessions = [
+        {line.split(b"\t")[0] for line in block.splitlines()} for block in blocks
+    ]
+    for first, second in zip(accessions, accessions[1:]):
+        assert not first & second
+
+
+def test_parse_uniprot_data_single_pass(tmp_path):
+    """Test the parallel parse and its Parquet intermediate."""
+    from unittest.mock import patch
+
+    uniprot_file = tmp_path / "human_uniprot.dat.gz"
+    with gzip.open(uniprot_file, "wt") as f:
+        f.write("\n".join(UNIPROT_LINES) + "\n")
+
+    with patch("src.etl.base_processor.get_db_manager"):
+        classifier = ProductClassifier(
+            {"cache_dir": str(tmp_path), "max_workers": 2, "uniprot_block_bytes": 64}
+        )
+    gene_data = classifier.parse_uniprot_data(uniprot_file)
+
+    assert sorted(gene_data) == ["MAPK1", "TP53"]
+    assert gene_data["TP53"] == {
+        "features": {"domain_0": "DNA-binding"},
+        "go_terms": {"GO:0003700": "DNA-binding transcription factor activity"},
+        "keywords": ["Activator", "DNA-binding", "Isoform"],
+        "function": "Acts as a tumor suppressor; Isoform 2",
+    }
+    assert gene_data["MAPK1"]["go_terms"] == {"GO:0004672": "protein kinase activity"}
+    assert "kinase" in classifier.classify_gene(gene_data["MAPK1"])
+    assert (tmp_path / "products" / "uniprot_features.parquet").exists()
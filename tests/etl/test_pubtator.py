@@ -0,0 +1,98 @@
+"""Tests for the partitioned PubTator gene_publications loader."""
+
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+from src.etl import pubtator
+from src.etl.pubtator import PubTatorProcessor
+
+PARTITIONS = {"gene_publications_p00": (16, 0), "gene_publications_p01": (16, 1)}
+GENE_PUBLICATIONS = {
+    ("ENSG02", "200"): 3,
+    ("ENSG01", "100"): 1,
+    ("ENSG02", "100"): 2,
+    ("ENSG03", "300"): 5,
+}
+
+
+@pytest.fixture
+def processor(tmp_path):
+    """Create a processor with a mocked database."""
+    with patch("src.etl.base_processor.get_db_manager") as mock:
+        mock.return_value = Mock()
+        return PubTatorProcessor(
+            {"cache_dir": str(tmp_path / "cache"), "max_workers": 2}
+        )
+
+
+def test_rows_are_loaded_per_partition(processor):
+    """Test rows are grouped by hash partition, or one table if unpartitioned."""
+    partition_of = {
+        "ENSG01": "gene_publications_p00",
+        "ENSG02": "gene_publications_p01",
+        "ENSG03": "gene_publications_p00",
+    }
+    loads = {}
+
+    def load_partition(table_name, rows):
+        loads[table_name] = sorted(rows)
+        return len(rows)
+
+    with patch.object(
+        processor, "_get_publication_partitions", return_value=PARTITIONS
+    ), patch.object(
+        processor, "_assign_partitions", return_value=partition_of
+    ) as assign, patch.object(
+        processor, "_load_partition", side_effect=load_partition
+    ):
+        processor.insert_gene_publications(GENE_PUBLICATIONS)
+
+    assert assign.call_args[0] == (["ENSG01", "ENSG02", "ENSG03"], PARTITIONS)
+    assert loads == {
+        "gene_publications_p00": [
+            ("ENSG01", "100", 1, None),
+            ("ENSG03", "300", 5, None),
+        ],
+        "gene_publications_p01": [
+            ("ENSG02", "100", 2, None),
+            ("ENSG02", "200", 3, None),
+        ],
+    }
+    assert processor.stats["inserted_publications"] == 4
+
+    loads.clear()
+    with patch.object(
+        processor, "_get_publication_partitions", return_value={}
+    ), patch.object(processor, "_load_partition", side_effect=load_partition):
+        processor.insert_gene_publications(GENE_PUBLICATIONS)
+
+    assert list(loads) == ["gene_publications"]
+    assert len(loads["gene_publications"]) == 4
+
+
+def test_load_partition_copies_upserts_and_vacuums(processor):
+    """Test one partition load: COPY, upsert, rollup refresh, then VACUUM."""
+    conn = MagicMock()
+    cursor = conn.cursor.return_value.__enter__.return_value
+    cursor.rowcount = 2
+    copied = []
+    cursor.copy_expert.side_effect = lambda query, buffer: copied.append(buffer.read())
+    processor.db_manager.db_config = {"dbname": "mbase"}
+
+    with patch.object(pubtator.psycopg2, "connect", return_value=conn) as connect:
+        written = processor._load_partition(
+            "gene_publications_p01",
+            [("ENSG02", "200", 3, None), ("ENSG02", "100", 2, 2020)],
+        )
+
+    assert written == 2
+    connect.assert_called_once_with(dbname="mbase")
+    assert copied == ["ENSG02\t100\t2\t2020\nENSG02\t200\t3\t\\N\n"]
+    statements = [repr(call.args[0]) for call in cursor.execute.call_args_list]
+    assert "Identifier('gene_publications_p01')" in statements[1]
+    assert "INSERT INTO gene_literature_stats" in statements[2]
+    assert "VACUUM (ANALYZE)" in statements[3]
+    conn.commit.assert_called_once()
+    assert conn.autocommit is True
+    conn.close.assert_called_once()
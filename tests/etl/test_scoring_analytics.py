@@ -0,0 +1,104 @@
+"""Tests for batch evidence scoring analytics."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.etl.scoring_analytics import ScoringAnalyticsProcessor
+
+COMPONENTS_HIGH = (30.0, 25.0, 20.0, 15.0, 10.0)
+COMPONENTS_MID = (15.0, 12.5, 10.0, 7.5, 5.0)
+COMPONENTS_NONE = (None, None, None, None, None)
+
+# Rows as returned by GENE_EVIDENCE_QUERY (gene-level rows after drug rows)
+EVIDENCE_ROWS = [
+    (
+        "EGFR",
+        "drug_repurposing",
+        "D1",
+        4,
+        60.0,
+        *COMPONENTS_HIGH,
+        {"name": "erlotinib", "max_phase": 4},
+        6,
+    ),
+    ("EGFR", "biomarker_discovery", None, 8, 70.0, *COMPONENTS_MID, None, 6),
+    ("EGFR", "drug_repurposing", None, 8, 50.0, *COMPONENTS_MID, None, 6),
+    ("KRAS", "pathway_analysis", None, None, 20.0, *COMPONENTS_NONE, None, 2),
+]
+
+
+@pytest.fixture
+def processor():
+    """Create a processor whose cursor returns EVIDENCE_ROWS."""
+    with patch("src.etl.base_processor.get_db_manager") as mock:
+        db_manager = Mock()
+        db_manager.ensure_connection.return_value = True
+        db_manager.cursor.fetchall.return_value = EVIDENCE_ROWS
+        mock.return_value = db_manager
+        return ScoringAnalyticsProcessor({"cache_dir": "/tmp/mediabase/test_cache"})
+
+
+def test_profiles_are_loaded_in_one_query(processor):
+    """Test per-gene metrics, use-case rankings and top drugs."""
+    profiles = processor.analyze_gene_evidence_profiles(["KRAS", "EGFR", "NOPE"])
+
+    processor.db_manager.cursor.execute.assert_called_once()
+    assert processor.db_manager.cursor.execute.call_args.args[1] == {
+        "genes": ["KRAS", "EGFR", "NOPE"]
+    }
+    assert list(profiles) == ["KRAS", "EGFR"]
+
+    egfr = profiles["EGFR"]
+    assert egfr.total_evidence_items == 8
+    assert egfr.evidence_diversity_score == 1.0
+    assert egfr.clinical_strength == pytest.approx(0.667)
+    assert egfr.cross_validation_score == 0.9  # variance 100
+    assert egfr.recommendation_confidence == pytest.approx(0.842)
+    # The gene-level row wins over the drug row of the same use case
+    assert egfr.use_case_rankings == {
+        "biomarker_discovery": 70.0,
+        "drug_repurposing": 50.0,
+    }
+    assert egfr.top_drugs == [
+        {
+            "drug_id": "D1",
+            "name": "erlotinib",
+            "avg_score": 60.0,
+            "max_phase": 4,
+            "mechanism": "Unknown",
+        }
+    ]
+
+    kras = profiles["KRAS"]
+    assert (kras.total_evidence_items, kras.clinical_strength) == (0, 0.0)
+    assert kras.cross_validation_score == 0.5
+    assert kras.recommendation_confidence == pytest.approx(0.208)
+
+
+def test_comparative_analysis(processor):
+    """Test rankings, quality distribution and readiness over the batch."""
+    analysis = processor.generate_comparative_analysis(["KRAS", "EGFR"])
+
+    assert analysis["total_genes_analyzed"] == 2
+    assert [r["gene"] for r in analysis["gene_rankings"]["by_confidence"]] == [
+        "EGFR",
+        "KRAS",
+    ]
+    assert analysis["gene_rankings"]["by_clinical_strength"][0] == {
+        "gene": "EGFR",
+        "clinical_strength": 0.667,
+        "top_drugs_count": 1,
+    }
+    assert analysis["use_case_comparison"]["drug_repurposing"]["top_genes"] == [
+        {"gene": "EGFR", "score": 50.0, "confidence": 0.842}
+    ]
+    quality = analysis["evidence_quality_distribution"]
+    assert quality["confidence_distribution"]["high_confidence_count"] == 1
+    assert quality["evidence_volume"]["mean_evidence_items"] == 4.0
+    assert analysis["clinical_readiness_assessment"] == {
+        "ready_for_clinical": [],
+        "ready_for_preclinical": ["EGFR"],
+        "requires_basic_research": [],
+        "insufficient_evidence": ["KRAS"],
+    }
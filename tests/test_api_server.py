@@ -7,9 +7,12 @@ normalized schema and materialized views.
 
 import pytest
 import os
+from unittest.mock import Mock, patch
 from fastapi.testclient import TestClient
 
-from src.api.server import app
+from src.api.server import app, get_database
+from src.utils.gene_sets import GeneSetMatrix
+from src.utils.id_mapping import GeneIDMap
 
 
 @pytest.mark.integration
@@ -86,6 +89,25 @@ class TestAPIServer:
         assert response.status_code == 404
         assert "not found" in response.json()["detail"]
 
+    def test_get_gene_literature(self, client: TestClient):
+        """Test literature statistics from the gene_literature_stats rollup."""
+        response = client.get("/api/v1/genes/TP53/literature")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["gene_id"] == "ENSG00000141510"
+        assert data["publication_count"] == 12500
+        assert data["evidence_tier"] == "Well-studied"
+
+        # Genes without a rollup row fall back to zero publications
+        response = client.get("/api/v1/genes/BRCA1/literature")
+        assert response.status_code == 200
+        assert response.json()["publication_count"] == 0
+        assert response.json()["evidence_tier"] == "Limited publications"
+
+        response = client.get("/api/v1/genes/NONEXISTENT/literature")
+        assert response.status_code == 404
+
     def test_database_stats(self, client: TestClient):
         """Test database statistics endpoint."""
         response = client.get("/api/v1/stats")
@@ -100,6 +122,7 @@ class TestAPIServer:
         assert data["genes_with_pathways"] == 2
         assert data["genes_with_product_types"] == 2
         assert data["transcripts_with_go_terms"] == 2
+        assert data["genes_with_publications"] == 1
         assert data["materialized_view_genes"] == 2
 
         # Verify coverage calculations
@@ -134,3 +157,49 @@ class TestAPIServer:
         transcript1 = response1.json()[0]["transcript_id"]
         transcript2 = response2.json()[0]["transcript_id"]
         assert transcript1 != transcript2
+
+
+def test_patient_enrichment(tmp_path):
+    """Test the enrichment endpoint against a small gene set matrix."""
+    genes = [(f"ENSG{i:011d}", f"GENE{i}") for i in range(40)]
+    gene_map = GeneIDMap.build(genes, [], tmp_path / "id_mapping")
+    rows = (
+        [(genes[gene][0], "R-HSA-1", "Signaling", "pathways") for gene in range(10)]
+        + [
+            (genes[gene][0], "R-HSA-2", "Metabolism", "pathways")
+            for gene in range(10, 40)
+        ]
+        + [
+            (genes[gene][0], "GO:0001", "Apoptosis", "go_biological_process")
+            for gene in range(20, 30)
+        ]
+    )
+    gene_sets = GeneSetMatrix.build(rows, gene_map, tmp_path / "gene_sets")
+    regulated = {"up": [genes[gene][0] for gene in range(8)], "down": []}
+
+    app.dependency_overrides[get_database] = lambda: Mock()
+    try:
+        with patch("src.api.server.schema_exists", return_value=True), patch(
+            "src.api.server.get_gene_set_matrix", return_value=gene_sets
+        ), patch("src.api.server.get_regulated_genes", return_value=regulated):
+            client = TestClient(app)
+            response = client.get(
+                "/api/v1/patients/PATIENT123/enrichment",
+                params={"direction": "both", "collections": ["pathways"]},
+            )
+            invalid = client.get("/api/v1/patients/PATIENT123/enrichment?direction=x")
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    up, down = response.json()
+    assert (up["direction"], up["gene_count"], up["tested_sets"]) == ("up", 8, 1)
+    assert [s["set_id"] for s in up["enriched_sets"]] == ["R-HSA-1"]
+    assert up["enriched_sets"][0]["overlap"] == 8
+    assert up["enriched_sets"][0]["genes"] == [f"GENE{i}" for i in range(8)]
+    assert (down["direction"], down["gene_count"], down["enriched_sets"]) == (
+        "down",
+        0,
+        [],
+    )
+    assert invalid.status_code == 400
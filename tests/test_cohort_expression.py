@@ -0,0 +1,116 @@
+"""Unit tests for the cohort expression table maintenance."""
+
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.db import cohort_expression
+from src.db.cohort_expression import (
+    find_recurrent_genes,
+    get_cohort_patient_id,
+    get_partition_name,
+    refresh_cohort_expression,
+)
+from src.db.patient_schema import SchemaNotFoundError
+
+UPDATED = datetime(2026, 1, 5, tzinfo=timezone.utc)
+
+
+class FakeCursor:
+    """Cursor recording statements and answering the refresh queries."""
+
+    def __init__(self, refresh_state, source_state):
+        self.refresh_state = refresh_state
+        self.source_state = source_state
+        self.statements = []
+        self.rowcount = 0
+
+    def execute(self, query, params=None):
+        self.query = " ".join(query.split())
+        self.params = params
+        self.statements.append(self.query)
+        if self.query.startswith("INSERT INTO patient_"):
+            self.rowcount = self.source_state[params[0]][0]
+
+    def fetchall(self):
+        if self.query.startswith("DELETE FROM public.expression_long_patients"):
+            return [(p,) for p in self.refresh_state if p not in self.params[0]]
+        return [(p, *state) for p, state in self.refresh_state.items()]
+
+    def fetchone(self):
+        schema = self.query.split("FROM ")[1].split(".")[0]
+        return self.source_state[schema[len("patient_") :]]
+
+
+@pytest.fixture
+def db_manager():
+    """Create a mock database manager."""
+    return MagicMock()
+
+
+def test_partition_lives_in_patient_schema():
+    """Test cohort patient IDs and partition names follow the schema name."""
+    assert get_cohort_patient_id("DEMO_HER2") == "demo_her2"
+    assert get_partition_name("DEMO_HER2") == "patient_demo_her2.expression_long"
+
+
+def test_refresh_only_changed_patients(db_manager):
+    """Test unchanged patients are skipped and dropped patients pruned."""
+    cursor = FakeCursor(
+        refresh_state={
+            "current": (10, UPDATED),
+            "stale": (5, UPDATED),
+            "gone": (1, None),
+        },
+        source_state={
+            "current": (10, UPDATED),
+            "stale": (6, UPDATED),
+            "new": (3, None),
+        },
+    )
+    db_manager.cursor = cursor
+    schemas = [{"patient_id": p} for p in ("current", "new", "stale")]
+
+    with patch.object(
+        cohort_expression, "list_patient_schemas", return_value=schemas
+    ), patch.object(cohort_expression, "schema_exists", return_value=True):
+        refreshed = refresh_cohort_expression(db_manager)
+
+    assert refreshed == {"new": 3, "stale": 6}
+    truncated = [s for s in cursor.statements if s.startswith("TRUNCATE")]
+    assert truncated == [
+        "TRUNCATE patient_new.expression_long",
+        "TRUNCATE patient_stale.expression_long",
+    ]
+
+    with patch.object(
+        cohort_expression, "list_patient_schemas", return_value=schemas
+    ), pytest.raises(SchemaNotFoundError):
+        refresh_cohort_expression(db_manager, patient_ids=["missing"])
+
+
+def test_find_recurrent_genes(db_manager):
+    """Test thresholds per direction, patient filters and result rows."""
+    cursor = db_manager.cursor
+    cursor.fetchall.return_value = [("G1", "ERBB2", 2, ["pt2", "pt1"], 0.2)]
+
+    genes = find_recurrent_genes(
+        db_manager, fold_change_threshold=4.0, direction="down", patient_ids=["PT1"]
+    )
+
+    query, params = cursor.execute.call_args[0]
+    assert "e.fold_change < %(threshold)s" in query
+    assert params == {"threshold": 0.25, "min_patients": 2, "patient_ids": ["pt1"]}
+    assert genes == [
+        {
+            "gene_id": "G1",
+            "gene_symbol": "ERBB2",
+            "patient_count": 2,
+            "patient_ids": ["pt1", "pt2"],
+            "extreme_fold_change": 0.2,
+        }
+    ]
+
+    with pytest.raises(ValueError):
+        find_recurrent_genes(db_manager, direction="sideways")
@@ -0,0 +1,192 @@
+"""Tests for the SOTA analysis on sparse annotation matrices."""
+
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from scripts import run_sota_analysis as sota
+
+# transcript_id, gene_id, gene_symbol, chromosome, start_position, fold change
+TRANSCRIPTS = [
+    ("T1", "G1", "EGFR", "chr7", 100, 4.0),
+    ("T2", "G1", "EGFR", "chr7", 100, 1.6),
+    ("T3", "G2", "KRAS", "chr12", 50, 1.0),
+    ("T4", "G3", "XIST", "chrX", 10, None),
+]
+ANNOTATIONS = {
+    "pathways": [
+        ("G1", "MAPK"),
+        ("G1", "PI3K"),
+        ("G1", "EGFR signaling"),
+        ("G2", "MAPK"),
+        ("G2", "PI3K"),
+        ("G9", "MAPK"),  # gene without transcripts
+    ],
+    "product_types": [("G1", "receptor"), ("G2", "enzyme")],
+    "molecular_functions": [("G1", "kinase"), ("G2", "GTPase")],
+    "cellular_locations": [("G1", "membrane"), ("G2", "membrane")],
+}
+DRUGS = [
+    ("G1", "erlotinib", "D1", "inhibitor", 0.0),
+    ("G1", "gefitinib", "D2", "inhibitor", 0.0),
+    ("G2", "sotorasib", "D3", "unknown", 0.0),
+]
+
+
+class FakeCursor:
+    """Cursor answering the analysis queries from the tables above."""
+
+    description = [
+        (name,)
+        for name in [
+            "transcript_id",
+            "gene_id",
+            "gene_symbol",
+            "chromosome",
+            "start_position",
+            "expression_fold_change",
+        ]
+    ]
+
+    def execute(self, query, params=None):
+        self.query = query
+
+    def fetchall(self):
+        if self.query is sota.TRANSCRIPTS_QUERY:
+            return TRANSCRIPTS
+        if self.query is sota.DRUGS_QUERY:
+            return DRUGS
+        if self.query is sota.GO_MOLECULAR_FUNCTIONS_QUERY:
+            return [("protein binding", 3)]
+        for name, query in sota.ANNOTATION_QUERIES.items():
+            if self.query is query:
+                return ANNOTATIONS[name]
+
+
+@pytest.fixture
+def analyzer():
+    """Create an analyzer with a mocked database."""
+    with patch("scripts.run_sota_analysis.get_db_manager"):
+        return sota.SOTAAnalyzer({})
+
+
+@pytest.fixture
+def data():
+    """Load the fake transcriptome."""
+    return sota.TranscriptomeData.load(FakeCursor())
+
+
+def test_pathway_counts_and_cooccurrence(analyzer, data):
+    """Test per-transcript pathway counts and the co-occurrence product."""
+    result = analyzer.analyze_pathway_enrichment(data)
+
+    assert result["total_pathways"] == 3
+    assert [
+        (p["pathway"], p["gene_count"], p["genes"]) for p in result["enriched_pathways"]
+    ] == [
+        ("MAPK", 3, ["EGFR", "KRAS"]),
+        ("PI3K", 3, ["EGFR", "KRAS"]),
+        ("EGFR signaling", 2, ["EGFR"]),
+    ]
+    assert result["pathway_cooccurrence_network"] == [
+        {"pathway1": "MAPK", "pathway2": "PI3K", "cooccurrence_count": 3},
+        {"pathway1": "EGFR signaling", "pathway2": "MAPK", "cooccurrence_count": 2},
+        {"pathway1": "EGFR signaling", "pathway2": "PI3K", "cooccurrence_count": 2},
+    ]
+
+
+def test_drugs_multimodal_and_biomarkers(analyzer, data):
+    """Test drug, multimodal and biomarker scores per transcript."""
+    drugs = analyzer.analyze_drug_gene_interactions(data)
+    assert drugs["total_drug_interactions"] == 5
+    assert drugs["druggable_genes_count"] == 2
+    assert drugs["mechanism_distribution"] == {"inhibitor": 4, "unknown": 1}
+
+    multimodal = analyzer.analyze_multimodal_integration(data)
+    assert [
+        (p["transcript_id"], p["multimodal_score"])
+        for p in multimodal["integrated_gene_profiles"]
+    ] == [("T1", 13), ("T2", 13), ("T3", 8), ("T4", 0)]
+    assert multimodal["pathway_drug_associations"][0] == {
+        "pathway": "EGFR signaling",
+        "drug_name": "erlotinib",
+        "association_strength": 2,
+    }
+
+    biomarkers = analyzer.analyze_clinical_biomarkers(data)
+    assert [
+        (b["transcript_id"], b["biomarker_score"], b["characteristics"])
+        for b in biomarkers["biomarker_candidates"]
+    ] == [
+        (
+            "T1",
+            60.0,
+            [
+                "drug_targetable",
+                "multi_pathway",
+                "high_expression_change",
+                "autosomal",
+            ],
+        ),
+        (
+            "T2",
+            50.0,
+            [
+                "drug_targetable",
+                "multi_pathway",
+                "moderate_expression_change",
+                "autosomal",
+            ],
+        ),
+        ("T3", 30.0, ["drug_targetable", "autosomal"]),
+        ("T4", 0.0, []),
+    ]
+    assert biomarkers["biomarker_categories"] == {
+        "high_potential": 0,
+        "moderate_potential": 2,
+        "emerging_biomarkers": 1,
+    }
+
+
+def test_batch_analysis_shares_reference_data(data):
+    """Test per-patient fold changes on shared reference data and the summary."""
+    fold_changes = {
+        "P001": pd.Series({"T3": 5.0, "T1": 0.2}),
+        "P002": pd.Series({"T3": 3.0}),
+    }
+
+    def load_fold_changes(cursor, patient_id):
+        if patient_id not in fold_changes:
+            raise RuntimeError("relation does not exist")
+        return fold_changes[patient_id]
+
+    with patch("scripts.run_sota_analysis.get_db_manager"), patch.object(
+        sota, "ProcessPoolExecutor", ThreadPoolExecutor
+    ), patch.object(
+        sota, "load_patient_fold_changes", side_effect=load_fold_changes
+    ), patch.object(
+        sota.SOTAAnalyzer, "load_transcriptome", return_value=data
+    ):
+        report = sota.SOTAAnalyzer({}).run_batch_analysis(
+            ["P001", "P002", "P003"], max_workers=1
+        )
+
+    assert list(report["patients"]) == ["P001", "P002"]
+    first = report["patients"]["P001"]
+    assert first["analysis_metadata"]["database"] == "patient_p001"
+    # Unlisted transcripts are at baseline, so only KRAS changed enough
+    assert [
+        (b["transcript_id"], b["biomarker_score"])
+        for b in first["clinical_biomarkers"]["biomarker_candidates"]
+    ] == [("T3", 50.0), ("T2", 40.0), ("T1", 40.0), ("T4", 0.0)]
+    # The shared reference data keeps its own fold changes
+    assert data.transcripts["expression_fold_change"].iat[0] == 4.0
+
+    cohort = report["cohort_summary"]
+    assert cohort["patients_analyzed"] == 2
+    assert list(cohort["failed_patients"]) == ["P003"]
+    assert cohort["recurrent_biomarker_genes"] == [
+        {"gene_symbol": "KRAS", "patients": 2}
+    ]
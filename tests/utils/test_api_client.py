@@ -0,0 +1,113 @@
+"""Tests for the cached, rate-limited API client."""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterator, List
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from src.utils.api_client import APIRequestError, CachedAPIClient, RateLimiter
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Echo the endpoint and query parameters as JSON; /missing returns 404."""
+
+    hits: List[str] = []
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        self.hits.append(self.path)
+        if parsed.path.endswith("/missing"):
+            self.send_response(404)
+            self.end_headers()
+            return
+        body = json.dumps(
+            {
+                "endpoint": parsed.path.rsplit("/", 1)[-1],
+                "params": {k: v[0] for k, v in parse_qs(parsed.query).items()},
+            }
+        ).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def stub_url() -> Iterator[str]:
+    """Run the stub API on a free local port."""
+    StubHandler.hits = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/api/data"
+    server.shutdown()
+    server.server_close()
+
+
+def test_responses_are_cached_on_disk(stub_url, tmp_path):
+    """Test that a second client reuses the on-disk response."""
+    client = CachedAPIClient(stub_url, tmp_path / "cache", rate_limit=0)
+    first = client.get("molecule", {"molecule_chembl_id": "CHEMBL25"})
+    assert first == {
+        "endpoint": "molecule",
+        "params": {"molecule_chembl_id": "CHEMBL25"},
+    }
+
+    second_client = CachedAPIClient(stub_url, tmp_path / "cache", rate_limit=0)
+    assert second_client.get("molecule", {"molecule_chembl_id": "CHEMBL25"}) == first
+    assert len(StubHandler.hits) == 1
+    assert second_client.stats == {"requests": 0, "cache_hits": 1}
+
+
+def test_expired_cache_is_refetched(stub_url, tmp_path):
+    """Test that a zero TTL always goes to the server."""
+    client = CachedAPIClient(stub_url, tmp_path / "cache", cache_ttl=0, rate_limit=0)
+    client.get("target", {"target_synonym": "EGFR"})
+    client.get("target", {"target_synonym": "EGFR"})
+    assert len(StubHandler.hits) == 2
+
+
+def test_get_many_deduplicates_and_keeps_order(stub_url, tmp_path):
+    """Test concurrent fan-out with duplicate requests and failures."""
+    client = CachedAPIClient(stub_url, tmp_path / "cache", rate_limit=0, max_workers=4)
+    requests_ = [("molecule", {"id": str(i % 3)}) for i in range(6)]
+    requests_.append(("missing", None))
+
+    results = client.get_many(requests_, return_exceptions=True)
+
+    assert [r["params"]["id"] for r in results[:6]] == ["0", "1", "2", "0", "1", "2"]
+    assert isinstance(results[6], APIRequestError)
+    assert len(StubHandler.hits) == 4
+
+    with pytest.raises(APIRequestError):
+        client.get_many([("missing", {"x": "1"})])
+
+
+def test_rate_limiter_spaces_requests():
+    """Test that the limiter enforces the minimum interval across threads."""
+    limiter = RateLimiter(0.05)
+    starts: List[float] = []
+    lock = threading.Lock()
+
+    def worker():
+        limiter.wait()
+        with lock:
+            starts.append(time.monotonic())
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    starts.sort()
+    gaps = [b - a for a, b in zip(starts, starts[1:])]
+    assert min(gaps) >= 0.04
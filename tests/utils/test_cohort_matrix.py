@@ -0,0 +1,120 @@
+"""Tests for the patients x transcripts cohort matrix cache."""
+
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.utils import cohort_matrix
+from src.utils.cohort_matrix import CohortMatrix, get_cohort_matrix
+from src.utils.id_mapping import GeneIDMap
+
+GENES = [("ENSG00000141736", "ERBB2"), ("ENSG00000133703", "KRAS")]
+TRANSCRIPTS = [
+    ("ENST0003", "ENSG00000133703"),
+    ("ENST0001", "ENSG00000141736"),
+    ("ENST0002", "ENSG00000141736"),
+    ("ENST0004", "ENSG99999999999"),
+]
+UPDATED = datetime(2026, 1, 5, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def gene_map(tmp_path):
+    """Build a gene ID map over the test genes."""
+    return GeneIDMap.build(GENES, [], tmp_path / "id_mapping")
+
+
+@pytest.fixture
+def cohort(gene_map, tmp_path):
+    """Build a cohort matrix with two patients."""
+    cohort = CohortMatrix.build(TRANSCRIPTS, gene_map, tmp_path / "cohort")
+    return cohort.update(
+        {
+            "pt1": (pd.Series({"ENST0001": 4.0, "ENST0003": 0.5}), (2, UPDATED)),
+            "pt2": (pd.Series({"ENST0002": 2.0, "ENST9999": 3.0}), (2, None)),
+        }
+    )
+
+
+def test_select_by_genes_and_patients(cohort):
+    """Test slices by gene list and patient subset, log2 and baseline fill."""
+    assert cohort.matrix.shape == (2, 4)
+    assert cohort.meta["nnz"] == 3  # unknown transcript skipped
+
+    erbb2 = cohort.select(patient_ids=["PT2", "pt1"], genes=["ERBB2"])
+    np.testing.assert_array_equal(erbb2.toarray(), [[0.0, 1.0], [2.0, 0.0]])
+    linear = cohort.select(patient_ids=["PT2", "pt1"], genes=["ERBB2"], log2=False)
+    np.testing.assert_array_equal(linear.toarray(), [[0.0, 2.0], [4.0, 0.0]])
+    kras = cohort.select(genes=["ENSG00000133703"], namespace="ensembl")
+    np.testing.assert_array_equal(kras.toarray(), [[-1.0], [0.0]])
+
+    frame = cohort.to_frame(genes=["ERBB2", "KRAS"], transcript_ids=["ENST0003"])
+    assert frame.to_dict() == {"ENST0003": {"pt1": 0.5, "pt2": 1.0}}
+    with pytest.raises(KeyError):
+        cohort.patient_rows(["pt3"])
+
+
+def test_update_keeps_unchanged_rows(cohort, gene_map):
+    """Test changed patients are replaced, new appended and removed dropped."""
+    updated = cohort.update(
+        {
+            "pt2": (pd.Series({"ENST0004": 8.0, "ENST0002": 1.0}), (1, UPDATED)),
+            "pt3": (pd.Series({"ENST0002": 0.25}), (1, UPDATED)),
+        },
+        removed=["pt1"],
+    )
+
+    assert updated.patient_ids == ["pt2", "pt3"]
+    assert updated.states["pt3"] == [1, UPDATED.isoformat()]
+    np.testing.assert_array_equal(
+        updated.to_frame().to_numpy(), [[1.0, 1.0, 1.0, 8.0], [1.0, 0.25, 1.0, 1.0]]
+    )
+    # The snapshot on disk is the updated one
+    reopened = CohortMatrix(updated.directory, gene_map)
+    assert (reopened.matrix != updated.matrix).nnz == 0
+
+
+def test_get_cohort_matrix_loads_changed_patients(gene_map, tmp_path):
+    """Test only patients whose expression state changed are read."""
+    db_manager = MagicMock()
+    db_manager.cursor.fetchone.return_value = (4, UPDATED)
+    db_manager.cursor.fetchall.return_value = TRANSCRIPTS
+    states = {"pt1": (2, UPDATED), "pt2": (1, None)}
+    loads = []
+
+    def load_patient(cursor, patient_id):
+        loads.append(patient_id)
+        return pd.Series({"ENST0001": float(states[patient_id][0] + 1)})
+
+    with patch.object(
+        cohort_matrix, "get_gene_id_map", return_value=gene_map
+    ), patch.object(
+        cohort_matrix,
+        "list_patient_schemas",
+        side_effect=lambda db: [{"patient_id": p} for p in states],
+    ), patch.object(
+        cohort_matrix, "get_expression_state", side_effect=lambda p, db: states[p]
+    ), patch.object(
+        cohort_matrix, "_load_patient", side_effect=load_patient
+    ), patch.dict(
+        cohort_matrix._open_cohorts, clear=True
+    ):
+        cohort = get_cohort_matrix(tmp_path, db_manager)
+        assert loads == ["pt1", "pt2"]
+
+        states["pt2"] = (3, UPDATED)
+        del states["pt1"]
+        cohort = get_cohort_matrix(tmp_path, db_manager, patient_ids=["PT2"])
+
+        assert loads == ["pt1", "pt2", "pt2"]
+        assert cohort.patient_ids == ["pt2"]
+        assert cohort.to_frame(genes=["ERBB2"]).loc["pt2", "ENST0001"] == 4.0
+
+        # A new transcript set starts a new snapshot and releases the old one
+        db_manager.cursor.fetchone.return_value = (5, UPDATED)
+        rebuilt = get_cohort_matrix(tmp_path, db_manager)
+        assert rebuilt.directory != cohort.directory
+        assert list(cohort_matrix._open_cohorts) == [rebuilt.directory]
@@ -0,0 +1,138 @@
+"""Tests for the parallel resumable dataset fetcher."""
+
+import functools
+import os
+import threading
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Iterator, List
+
+import pytest
+
+from src.utils.dataset_fetcher import DatasetFetcher, FetchError, MANIFEST_NAME
+
+
+class RangeRequestHandler(SimpleHTTPRequestHandler):
+    """Static file handler with single-range support, recording requests."""
+
+    requests_seen: List[str] = []
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self.requests_seen.append(f"GET {self.path} {self.headers.get('Range', '')}")
+        range_header = self.headers.get("Range")
+        path = Path(self.translate_path(self.path))
+        if not range_header or not path.is_file():
+            return super().do_GET()
+
+        start = int(range_header.split("=")[1].split("-")[0])
+        data = path.read_bytes()
+        if start >= len(data):
+            self.send_response(416)
+            self.end_headers()
+            return
+        self.send_response(206)
+        self.send_header("Content-Length", str(len(data) - start))
+        self.send_header("Content-Range", f"bytes {start}-{len(data) - 1}/{len(data)}")
+        self.end_headers()
+        self.wfile.write(data[start:])
+
+
+@pytest.fixture
+def remote_dir(tmp_path) -> Path:
+    """Remote dataset with two part files, a nested part and a marker file."""
+    root = tmp_path / "remote" / "associationByOverallDirect"
+    (root / "sub").mkdir(parents=True)
+    (root / "part-00000.parquet").write_bytes(os.urandom(300_000))
+    (root / "part-00001.parquet").write_bytes(os.urandom(120_000))
+    (root / "sub" / "part-00002.parquet").write_bytes(b"nested")
+    (root / "_SUCCESS").write_bytes(b"")
+    return root
+
+
+@pytest.fixture
+def server_url(remote_dir) -> Iterator[str]:
+    """Serve the remote dataset over HTTP on a free local port."""
+    RangeRequestHandler.requests_seen = []
+    handler = functools.partial(RangeRequestHandler, directory=str(remote_dir.parent))
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/{remote_dir.name}/"
+    server.shutdown()
+    server.server_close()
+
+
+def test_fetch_downloads_all_parts(server_url, remote_dir, tmp_path):
+    """Test that every part is listed, downloaded and recorded in the manifest."""
+    local = tmp_path / "local"
+    fetcher = DatasetFetcher(server_url, local, max_workers=3)
+
+    result = fetcher.fetch()
+
+    assert result.downloaded == [
+        "part-00000.parquet",
+        "part-00001.parquet",
+        "sub/part-00002.parquet",
+    ]
+    assert not (local / "_SUCCESS").exists()
+    for name in result.downloaded:
+        assert (local / name).read_bytes() == (remote_dir / name).read_bytes()
+    assert (local / MANIFEST_NAME).exists()
+    assert fetcher.is_complete(verify_checksums=True)
+
+
+def test_refresh_skips_unchanged_parts(server_url, remote_dir, tmp_path):
+    """Test that a refresh only downloads parts whose remote size changed."""
+    local = tmp_path / "local"
+    DatasetFetcher(server_url, local).fetch()
+
+    (remote_dir / "part-00001.parquet").write_bytes(os.urandom(50_000))
+    (remote_dir / "sub" / "part-00002.parquet").unlink()
+    result = DatasetFetcher(server_url, local).fetch()
+
+    assert result.downloaded == ["part-00001.parquet"]
+    assert result.skipped == ["part-00000.parquet"]
+    assert result.removed == ["sub/part-00002.parquet"]
+    assert not (local / "sub" / "part-00002.parquet").exists()
+    assert (local / "part-00001.parquet").read_bytes() == (
+        remote_dir / "part-00001.parquet"
+    ).read_bytes()
+
+
+def test_resume_partial_download(server_url, remote_dir, tmp_path):
+    """Test that an interrupted part resumes with a Range request."""
+    local = tmp_path / "local"
+    local.mkdir()
+    content = (remote_dir / "part-00000.parquet").read_bytes()
+    (local / ".part-00000.parquet.part").write_bytes(content[:100_000])
+
+    result = DatasetFetcher(server_url, local, max_workers=1).fetch()
+
+    assert (local / "part-00000.parquet").read_bytes() == content
+    assert not (local / ".part-00000.parquet.part").exists()
+    assert any("bytes=100000-" in r for r in RangeRequestHandler.requests_seen)
+    assert result.bytes_downloaded == len(content) - 100_000 + 120_000 + len(b"nested")
+
+
+def test_incomplete_cache_is_not_valid(server_url, tmp_path):
+    """Test that a missing or truncated part or manifest invalidates the cache."""
+    local = tmp_path / "local"
+    fetcher = DatasetFetcher(server_url, local)
+    assert not fetcher.is_complete()
+
+    fetcher.fetch()
+    (local / "part-00001.parquet").write_bytes(b"truncated")
+    assert not fetcher.is_complete()
+
+    fetcher.manifest_path.write_text('{"url": ')
+    assert not fetcher.is_complete()
+
+
+def test_missing_dataset_raises(server_url, tmp_path):
+    """Test that an unreachable dataset raises FetchError."""
+    fetcher = DatasetFetcher(server_url + "missing/", tmp_path / "local")
+    with pytest.raises(FetchError):
+        fetcher.fetch()
@@ -0,0 +1,123 @@
+"""Tests for gene set matrices and over-representation analysis."""
+
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pytest
+from scipy import stats
+
+from src.utils import gene_sets as gene_sets_module
+from src.utils.gene_sets import GeneSetMatrix, get_gene_set_matrix, hypergeom_sf
+from src.utils.id_mapping import GeneIDMap
+
+GENES = [(f"ENSG{i:011d}", f"GENE{i}") for i in range(40)]
+SETS = {
+    # set_id: (collection, member genes)
+    "R-HSA-1": ("pathways", range(0, 10)),
+    "R-HSA-2": ("pathways", range(5, 25)),
+    "R-HSA-3": ("pathways", range(30, 33)),  # too small to test
+    "GO:0001": ("go_biological_process", range(0, 8)),
+    "GO:0002": ("go_biological_process", range(10, 20)),
+}
+
+
+@pytest.fixture
+def gene_sets(tmp_path):
+    """Build a gene set matrix over the test genes."""
+    gene_map = GeneIDMap.build(GENES, [], tmp_path / "id_mapping")
+    rows = [
+        (GENES[gene][0], set_id, f"name {set_id}", collection)
+        for set_id, (collection, members) in SETS.items()
+        for gene in members
+    ]
+    rows.append(("ENSG99999999999", "R-HSA-1", "name R-HSA-1", "pathways"))
+    return GeneSetMatrix.build(rows, gene_map, tmp_path / "gene_sets")
+
+
+def test_hypergeometric_test_matches_fisher(gene_sets):
+    """Test p-values, FDR and overlap genes against scipy's Fisher test."""
+    query = [f"GENE{i}" for i in (0, 1, 2, 3, 4, 5, 6, 12)] + ["UNKNOWN"]
+
+    result = gene_sets.enrich(query, min_size=5)
+
+    assert result["set_id"].tolist() == ["R-HSA-1", "GO:0001", "R-HSA-2", "GO:0002"]
+    pathway = result.set_index("set_id").loc["R-HSA-1"]
+    assert (pathway["set_size"], pathway["overlap"]) == (10, 7)
+    assert pathway["genes"] == [f"GENE{i}" for i in range(7)]
+    # Pathway universe: genes 0-24 and 30-32 (28 genes), 8 query genes in it
+    table = [[7, 3], [1, 17]]
+    assert pathway["p_value"] == pytest.approx(
+        stats.fisher_exact(table, alternative="greater")[1]
+    )
+    assert pathway["expected"] == pytest.approx(8 * 10 / 28)
+    np.testing.assert_allclose(
+        result["fdr"], stats.false_discovery_control(result["p_value"])
+    )
+
+
+def test_collections_and_background(gene_sets):
+    """Test collection filters and a background that shrinks set sizes."""
+    query = ["GENE5", "GENE6", "GENE7"]
+
+    result = gene_sets.enrich(query, collections=["pathways"], min_size=5)
+    assert result["collection"].unique().tolist() == ["pathways"]
+
+    background = [f"GENE{i}" for i in range(0, 12)]
+    result = gene_sets.enrich(query, background=background, min_size=1).set_index(
+        "set_id"
+    )
+    assert result.loc["R-HSA-2", "set_size"] == 7
+    assert "GO:0002" not in result.index  # no query gene in the set
+    assert gene_sets.enrich([]).empty
+
+
+def test_hypergeom_sf_matches_scipy():
+    """Test the vectorized tail sum against scipy on both tails and edges."""
+    rng = np.random.default_rng(0)
+    total = rng.integers(20, 5000, 2000)
+    successes = rng.integers(1, total)
+    draws = rng.integers(1, total)
+    k = rng.integers(0, np.minimum(successes, draws) + 2)
+
+    expected = stats.hypergeom.sf(k - 1, total, successes, draws)
+    np.testing.assert_allclose(
+        hypergeom_sf(k, total, successes, draws), expected, rtol=1e-8, atol=1e-12
+    )
+
+
+def test_members(gene_sets):
+    """Test set members in both namespaces and unknown sets."""
+    assert gene_sets.members("R-HSA-3", namespace="symbol") == [
+        "GENE30",
+        "GENE31",
+        "GENE32",
+    ]
+    assert gene_sets.members("GO:0001")[0] == GENES[0][0]
+    with pytest.raises(KeyError):
+        gene_sets.members("R-HSA-404")
+
+
+def test_snapshots_follow_deletes_and_release_old_matrices(tmp_path):
+    """Test that deleted rows rebuild the matrix and the old one is released."""
+    gene_map = GeneIDMap.build(GENES, [], tmp_path / "id_mapping")
+    rows = [(GENES[gene][0], "R-HSA-1", "name", "pathways") for gene in range(10)]
+    db_manager = Mock()
+    cursor = db_manager.cursor
+    cursor.fetchall.side_effect = [rows, rows[:5]]
+
+    with patch.object(
+        gene_sets_module, "get_gene_id_map", return_value=gene_map
+    ), patch.dict(gene_sets_module._open_matrices, clear=True):
+        # Deleting rows keeps the highest id but lowers the row count
+        cursor.fetchone.return_value = ("v1.0.5", 10, 10, 0, None)
+        first = get_gene_set_matrix(tmp_path, db_manager)
+        assert get_gene_set_matrix(tmp_path, db_manager) is first
+        cursor.fetchone.return_value = ("v1.0.5", 5, 10, 0, None)
+        second = get_gene_set_matrix(tmp_path, db_manager)
+
+        assert second is not first
+        assert second.members("R-HSA-1") == [GENES[gene][0] for gene in range(5)]
+        assert list(gene_sets_module._open_matrices) == [second.directory]
+        assert [path.name for path in (tmp_path / "gene_sets").iterdir()] == [
+            second.directory.name
+        ]
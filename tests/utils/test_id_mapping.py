@@ -0,0 +1,82 @@
+"""Tests for the shared gene ID map."""
+
+from unittest.mock import Mock
+
+import numpy as np
+
+from src.utils import id_mapping
+from src.utils.id_mapping import GeneIDMap, get_gene_id_map
+
+GENES = [
+    ("ENSG00000141510", "TP53"),
+    ("ENSG00000146648", "EGFR"),
+    ("ENSG00000012048", "BRCA1"),
+]
+CROSS_REFERENCES = [
+    ("ENSG00000141510", "GeneID", "7157"),
+    ("ENSG00000146648", "EntrezGene", "1956"),
+    ("ENSG00000146648", "HGNC", "HGNC:3236"),
+    ("ENSG00000012048", "GeneID", "672"),
+    ("ENSG00000012048", "UniProt", "P38398"),
+    ("ENSG99999999999", "GeneID", "1"),  # unknown gene
+    ("ENSG00000141510", "PDB", "1TUP"),  # unused namespace
+]
+
+
+def test_lookups_are_vectorized(tmp_path):
+    """Test resolution across namespaces, including unknown keys."""
+    gene_map = GeneIDMap.build(GENES, CROSS_REFERENCES, tmp_path / "snapshot")
+
+    assert gene_map.to_gene_ids("ncbi", ["7157", "1956", "999", "672"]) == [
+        "ENSG00000141510",
+        "ENSG00000146648",
+        None,
+        "ENSG00000012048",
+    ]
+    assert gene_map.to_symbols("uniprot", ["P38398"]) == ["BRCA1"]
+    assert gene_map.to_symbols("ensembl", ["ENSG00000146648"]) == ["EGFR"]
+    assert gene_map.get("symbol", "TP53") == "ENSG00000141510"
+    assert gene_map.get("hgnc", "HGNC:0") is None
+    assert gene_map.lookup("refseq", ["NM_000546"]).tolist() == [-1]
+    assert gene_map.as_dict("ncbi") == {
+        "1956": "ENSG00000146648",
+        "672": "ENSG00000012048",
+        "7157": "ENSG00000141510",
+    }
+    assert isinstance(gene_map.gene_ids, np.memmap)
+
+
+def test_snapshot_is_reused_until_tables_change(tmp_path, monkeypatch):
+    """Test that the database is only read when its fingerprint changes."""
+    monkeypatch.setattr(id_mapping, "_open_maps", {})
+    state = {"fingerprint": (3, None, 7, 7)}
+
+    def execute(query, *args):
+        cursor.last_query = query
+
+    def fetchone():
+        return state["fingerprint"]
+
+    def fetchall():
+        return GENES if "FROM genes" in cursor.last_query else CROSS_REFERENCES
+
+    cursor = Mock(
+        execute=Mock(side_effect=execute), fetchone=fetchone, fetchall=fetchall
+    )
+    db_manager = Mock(cursor=cursor)
+
+    first = get_gene_id_map(tmp_path, db_manager)
+    assert get_gene_id_map(tmp_path, db_manager) is first
+
+    # A new process opens the snapshot without loading the tables
+    monkeypatch.setattr(id_mapping, "_open_maps", {})
+    cursor.execute.reset_mock()
+    reopened = get_gene_id_map(tmp_path, db_manager)
+    assert reopened.directory == first.directory
+    assert cursor.execute.call_count == 1
+
+    state["fingerprint"] = (3, None, 8, 8)
+    rebuilt = get_gene_id_map(tmp_path, db_manager)
+    assert rebuilt.directory != first.directory
+    assert not first.directory.exists()
+    assert len(list((tmp_path / "id_mapping").glob("snapshot_*"))) == 1